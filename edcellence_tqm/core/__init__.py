@@ -8,6 +8,32 @@ Classes:
     ADLIIndicators: Process item dimensional indicators
     LeTCIIndicators: Results item dimensional indicators
     AssessmentEngine: Complete assessment orchestration
+    WeightProfile: Validated, immutable ADLI/LeTCI/category weight set
+    ItemTable: Columnar (struct-of-arrays) item store backing AssessmentEngine
+    BulkItems: Long-format multi-department item table
+    BulkAssessmentResult: Columnar per-department assessment results
+    MaturityBands: Sorted maturity band-edge table with vectorized classification
+    SensitivityResult: Score distribution, rank stability and maturity flips of a weight sweep
+    TopKAccumulator: Streaming institution-wide top-k gap priorities
+    UncertaintyResult: Monte Carlo score distributions and percentile intervals
+    SharedColumns: Named numpy arrays packed into one shared memory block
+    AssessmentCache: Content-addressed result cache with hit/miss/eviction counters
+    MemoryCacheBackend: In-process LRU cache backend
+    SQLiteCacheBackend: On-disk LRU cache backend
+    ValidationReport: Row, reason and column of every invalid input value
+    FrozenADLIIndicators: Immutable, hashable, slotted ADLI indicators
+    FrozenLeTCIIndicators: Immutable, hashable, slotted LeTCI indicators
+    IndicatorArray: N indicator sets in one (N, 4) buffer with row views
+    FixedPointAssessment: Equations 1-4 as integer hundredths at DB scale
+    ExactAccumulator: Exact running float sum supporting removal and merging
+    PanelStore: Dense (cycle, department, item) history with time-range queries
+    MetricSeries: Department x metric value series on a common cycle axis
+    TrendTracker: Incremental trailing-window trend slopes from running sums
+    QuantileSketch: Mergeable KLL-style quantile sketch for peer percentiles
+    PeerSketches: Quantile sketches keyed by (cycle, metric, peer group)
+    Hierarchy: Department -> faculty -> institution tree with roll-up weights
+    RollupEngine: Incrementally maintained weighted roll-up of department results
+    ScoreCube: Precomputed cycle x department/faculty x category x item_type aggregates
 
 Functions:
     compute_adli_score: Calculate ADLI process score (Equation 1)
@@ -17,7 +43,27 @@ Functions:
     compute_integration_health_index: Calculate IHI (Equation 5)
     compute_gap_priority_score: Calculate gap-based priority (Equation 6)
     rank_improvement_priorities: Rank items by priority score
+    top_k_priorities: Top-k items by priority score via partial selection
+    top_k_indices: Top-k indices of a gap score array with tie-break keys
     classify_maturity_level: Map score to Baldrige maturity level
+    as_weight_profile: Coerce a weight dict, vector or None to a WeightProfile
+    compute_adli_scores_batch: Vectorized Equation 1 over (N, 4) indicator arrays
+    compute_letci_scores_batch: Vectorized Equation 2 over (N, 4) indicator arrays
+    assess_departments: Equations 1-6 for many departments via grouped reductions
+    gap_priorities: Equation 6 priorities and per-department ranks for every item
+    assess_departments_parallel: assess_departments sharded across worker processes
+    sweep_weights: Score all departments under thousands of weight profiles at once
+    propagate_uncertainty: Chunked, seeded Monte Carlo propagation of indicator noise
+    assessment_cache_key: SHA-256 key of an assessment's inputs, weights and bands
+    stream_assessments: Chunked CSV ingestion yielding per-department results
+    validate_arrays: Column-wise validation of item inputs into a ValidationReport
+    validate_frame: validate_arrays over a long-format item DataFrame
+    assess_departments_fixed: Integer Equations 1-4 with half-even rounding to DECIMAL scale
+    exact_sum: Correctly rounded, order-independent float sum
+    grouped_exact_sum: Vectorized exact per-group sums (deterministic np.bincount)
+    rolling_slopes: Trailing-window least-squares or Theil-Sen slopes of many series
+    derive_letci: LeTCI level and trend indicators derived from raw metric values
+    derive_comparison: LeTCI comparison indicator from peer-group percentiles
 
 Examples:
     >>> from edcellence_tqm.core import ADLIIndicators, compute_adli_score
@@ -39,11 +85,108 @@ from edcellence_tqm.core.adli_letci import (
     rank_improvement_priorities,
     classify_maturity_level,
 )
+from edcellence_tqm.core.weights import (
+    WeightProfile,
+    DEFAULT_ADLI_PROFILE,
+    DEFAULT_LETCI_PROFILE,
+    DEFAULT_CATEGORY_PROFILE,
+    as_weight_profile,
+)
+from edcellence_tqm.core.indicators import (
+    FrozenADLIIndicators,
+    FrozenLeTCIIndicators,
+    IndicatorArray,
+)
+from edcellence_tqm.core.item_table import ItemTable
+from edcellence_tqm.core.summation import ExactAccumulator, exact_sum, grouped_exact_sum
+from edcellence_tqm.core.panel import PanelStore
+from edcellence_tqm.core.trends import MetricSeries, TrendTracker, derive_letci, rolling_slopes
+from edcellence_tqm.core.benchmarking import PeerSketches, QuantileSketch, derive_comparison
+from edcellence_tqm.core.hierarchy import Hierarchy, RollupEngine
+from edcellence_tqm.core.cube import ScoreCube
+from edcellence_tqm.core.fixed_point import (
+    FixedPointAssessment,
+    assess_departments_fixed,
+    compute_item_scores_fixed,
+)
+from edcellence_tqm.core.maturity import MATURITY_BANDS, MaturityBands, DEFAULT_MATURITY_BANDS
+from edcellence_tqm.core.ranking import (
+    TopKAccumulator,
+    merge_top_k,
+    top_k_indices,
+    top_k_priorities,
+)
+from edcellence_tqm.core.batch import (
+    compute_adli_scores_batch,
+    compute_letci_scores_batch,
+)
+from edcellence_tqm.core.bulk import (
+    BulkItems,
+    BulkAssessmentResult,
+    assess_departments,
+    gap_priorities,
+)
+from edcellence_tqm.core.parallel import (
+    SharedColumns,
+    assess_departments_parallel,
+)
+from edcellence_tqm.core.sensitivity import (
+    SensitivityResult,
+    random_weight_profiles,
+    sweep_weights,
+)
+from edcellence_tqm.core.cache import (
+    AssessmentCache,
+    CacheStats,
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+    assessment_cache_key,
+)
+from edcellence_tqm.core.validation import (
+    ValidationError,
+    ValidationReport,
+    assessment_items,
+    indicator_objects,
+    validate_arrays,
+    validate_frame,
+)
+from edcellence_tqm.core.streaming import stream_assessments
+from edcellence_tqm.core.uncertainty import (
+    UncertaintyResult,
+    indicator_noise,
+    propagate_uncertainty,
+)
 
 __all__ = [
     "ADLIIndicators",
     "LeTCIIndicators",
+    "FrozenADLIIndicators",
+    "FrozenLeTCIIndicators",
+    "IndicatorArray",
+    "FixedPointAssessment",
+    "assess_departments_fixed",
+    "compute_item_scores_fixed",
+    "ExactAccumulator",
+    "exact_sum",
+    "grouped_exact_sum",
+    "PanelStore",
+    "MetricSeries",
+    "TrendTracker",
+    "derive_letci",
+    "rolling_slopes",
+    "PeerSketches",
+    "QuantileSketch",
+    "derive_comparison",
+    "Hierarchy",
+    "RollupEngine",
+    "ScoreCube",
     "AssessmentEngine",
+    "ItemTable",
+    "WeightProfile",
+    "DEFAULT_ADLI_PROFILE",
+    "DEFAULT_LETCI_PROFILE",
+    "DEFAULT_CATEGORY_PROFILE",
+    "as_weight_profile",
     "compute_adli_score",
     "compute_letci_score",
     "compute_category_score",
@@ -52,4 +195,37 @@ __all__ = [
     "compute_gap_priority_score",
     "rank_improvement_priorities",
     "classify_maturity_level",
+    "MATURITY_BANDS",
+    "MaturityBands",
+    "DEFAULT_MATURITY_BANDS",
+    "top_k_indices",
+    "top_k_priorities",
+    "TopKAccumulator",
+    "merge_top_k",
+    "compute_adli_scores_batch",
+    "compute_letci_scores_batch",
+    "BulkItems",
+    "BulkAssessmentResult",
+    "assess_departments",
+    "gap_priorities",
+    "SharedColumns",
+    "assess_departments_parallel",
+    "SensitivityResult",
+    "random_weight_profiles",
+    "sweep_weights",
+    "AssessmentCache",
+    "CacheStats",
+    "MemoryCacheBackend",
+    "SQLiteCacheBackend",
+    "assessment_cache_key",
+    "ValidationError",
+    "ValidationReport",
+    "assessment_items",
+    "indicator_objects",
+    "validate_arrays",
+    "validate_frame",
+    "stream_assessments",
+    "UncertaintyResult",
+    "indicator_noise",
+    "propagate_uncertainty",
 ]
@@ -18,10 +18,33 @@ License: MIT
 Version: 1.0.0
 """
 
-from typing import Dict, List, Tuple, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Mapping, Tuple, Optional, cast
 import numpy as np
 from dataclasses import dataclass
 
+from edcellence_tqm.core.indicators import indicator_kind
+from edcellence_tqm.core.item_table import (
+    ITEM_TYPES,
+    PROCESS_ITEM,
+    RESULTS_ITEM,
+    ItemTable,
+)
+from edcellence_tqm.core.maturity import DEFAULT_MATURITY_BANDS, MATURITY_BANDS, MaturityBands
+from edcellence_tqm.core.ranking import top_k_priorities
+from edcellence_tqm.core.summation import ExactAccumulator, exact_sum
+from edcellence_tqm.core.weights import (
+    DEFAULT_ADLI_WEIGHTS,
+    DEFAULT_LETCI_WEIGHTS,
+    DEFAULT_CATEGORY_WEIGHTS,
+    WeightsLike,
+    as_weight_profile,
+)
+
+if TYPE_CHECKING:
+    from edcellence_tqm.core.bulk import BulkAssessmentResult
+    from edcellence_tqm.core.cache import AssessmentCache
+
 
 @dataclass
 class ADLIIndicators:
@@ -37,6 +60,17 @@ class ADLIIndicators:
             if not 0 <= field <= 1:
                 raise ValueError(f"ADLI indicators must be in range [0,1], got {field}")
 
+    @classmethod
+    def trusted(cls, approach: float, deployment: float, learning: float,
+                integration: float) -> 'ADLIIndicators':
+        """Build without range checks, for values that passed bulk validation."""
+        indicators = object.__new__(cls)
+        indicators.approach = approach
+        indicators.deployment = deployment
+        indicators.learning = learning
+        indicators.integration = integration
+        return indicators
+
 
 @dataclass
 class LeTCIIndicators:
@@ -52,6 +86,17 @@ class LeTCIIndicators:
             if not 0 <= field <= 1:
                 raise ValueError(f"LeTCI indicators must be in range [0,1], got {field}")
 
+    @classmethod
+    def trusted(cls, level: float, trend: float, comparison: float,
+                integration: float) -> 'LeTCIIndicators':
+        """Build without range checks, for values that passed bulk validation."""
+        indicators = object.__new__(cls)
+        indicators.level = level
+        indicators.trend = trend
+        indicators.comparison = comparison
+        indicators.integration = integration
+        return indicators
+
 
 # ============================================================================
 # Equation 1: ADLI Process Scoring
@@ -59,7 +104,7 @@ class LeTCIIndicators:
 
 def compute_adli_score(
     indicators: ADLIIndicators,
-    weights: Optional[Dict[str, float]] = None
+    weights: Optional[WeightsLike] = None
 ) -> float:
     """
     Compute ADLI process item score (Equation 1).
@@ -70,8 +115,10 @@ def compute_adli_score(
 
     Args:
         indicators: ADLIIndicators with values in [0,1]
-        weights: Optional weight dict {'A': 0.30, 'D': 0.30, 'L': 0.20, 'I': 0.20}
-                 If None, uses NIST default weights
+        weights: Optional WeightProfile or weight dict
+                 {'A': 0.30, 'D': 0.30, 'L': 0.20, 'I': 0.20}.
+                 If None, uses NIST default weights. A WeightProfile is
+                 already validated; a dict is validated on every call
 
     Returns:
         float: Score in range [0,100]
@@ -79,25 +126,13 @@ def compute_adli_score(
     References:
         NIST Baldrige Excellence Framework (2023)
     """
-    if weights is None:
-        # NIST default weights (Baldrige 2023)
-        weights = {
-            'A': 0.30,  # Approach
-            'D': 0.30,  # Deployment
-            'L': 0.20,  # Learning
-            'I': 0.20   # Integration
-        }
-
-    # Validate weights sum to 1.0
-    weight_sum = sum(weights.values())
-    if not np.isclose(weight_sum, 1.0, atol=1e-6):
-        raise ValueError(f"Weights must sum to 1.0, got {weight_sum}")
+    w_a, w_d, w_l, w_i = as_weight_profile(weights, 'adli').weights
 
     score = 100 * (
-        weights['A'] * indicators.approach +
-        weights['D'] * indicators.deployment +
-        weights['L'] * indicators.learning +
-        weights['I'] * indicators.integration
+        w_a * indicators.approach +
+        w_d * indicators.deployment +
+        w_l * indicators.learning +
+        w_i * indicators.integration
     )
 
     return float(np.clip(score, 0, 100))
@@ -109,7 +144,7 @@ def compute_adli_score(
 
 def compute_letci_score(
     indicators: LeTCIIndicators,
-    weights: Optional[Dict[str, float]] = None
+    weights: Optional[WeightsLike] = None
 ) -> float:
     """
     Compute LeTCI results item score (Equation 2).
@@ -120,7 +155,8 @@ def compute_letci_score(
 
     Args:
         indicators: LeTCIIndicators with values in [0,1]
-        weights: Optional weight dict {'Lv': 0.40, 'Tr': 0.25, 'Cp': 0.25, 'I': 0.10}
+        weights: Optional WeightProfile or weight dict
+                 {'Lv': 0.40, 'Tr': 0.25, 'Cp': 0.25, 'I': 0.10}.
                  If None, uses Baldrige default weights
 
     Returns:
@@ -129,25 +165,13 @@ def compute_letci_score(
     References:
         Baldrige Excellence Framework emphasizing current level as primary indicator
     """
-    if weights is None:
-        # Baldrige default weights
-        weights = {
-            'Lv': 0.40,  # Level (current performance)
-            'Tr': 0.25,  # Trend (improvement trajectory)
-            'Cp': 0.25,  # Comparison (external benchmarks)
-            'I': 0.10    # Integration (cross-category alignment)
-        }
-
-    # Validate weights sum to 1.0
-    weight_sum = sum(weights.values())
-    if not np.isclose(weight_sum, 1.0, atol=1e-6):
-        raise ValueError(f"Weights must sum to 1.0, got {weight_sum}")
+    w_lv, w_tr, w_cp, w_i = as_weight_profile(weights, 'letci').weights
 
     score = 100 * (
-        weights['Lv'] * indicators.level +
-        weights['Tr'] * indicators.trend +
-        weights['Cp'] * indicators.comparison +
-        weights['I'] * indicators.integration
+        w_lv * indicators.level +
+        w_tr * indicators.trend +
+        w_cp * indicators.comparison +
+        w_i * indicators.integration
     )
 
     return float(np.clip(score, 0, 100))
@@ -187,7 +211,8 @@ def compute_category_score(
     if len(item_scores) == 0:
         return 0.0
 
-    numerator = sum(s * v for s, v in zip(item_scores, item_point_values))
+    # Exact sum of the rounded products: independent of item order
+    numerator = exact_sum([s * v for s, v in zip(item_scores, item_point_values)])
     denominator = sum(item_point_values)
 
     if denominator == 0:
@@ -202,7 +227,7 @@ def compute_category_score(
 
 def compute_organizational_score(
     category_scores: Dict[str, float],
-    category_weights: Optional[Dict[str, float]] = None
+    category_weights: Optional[WeightsLike] = None
 ) -> float:
     """
     Compute organizational score as weighted sum of categories (Equation 4).
@@ -211,7 +236,7 @@ def compute_organizational_score(
 
     Args:
         category_scores: Dict mapping category names to scores [0,100]
-        category_weights: Optional EdPEx/Baldrige category weights
+        category_weights: Optional category WeightProfile or weight dict
                           If None, uses EdPEx default weights
 
     Returns:
@@ -230,31 +255,17 @@ def compute_organizational_score(
         >>> compute_organizational_score(scores)
         76.2  # Weighted by EdPEx distribution
     """
-    if category_weights is None:
-        # EdPEx default weights (aligned with Baldrige)
-        category_weights = {
-            'Leadership': 0.12,
-            'Strategy': 0.085,
-            'Customers': 0.085,
-            'Measurement': 0.10,
-            'Workforce': 0.10,
-            'Operations': 0.15,
-            'Results': 0.36
-        }
-
-    # Validate weights sum to 1.0
-    weight_sum = sum(category_weights.values())
-    if not np.isclose(weight_sum, 1.0, atol=1e-6):
-        raise ValueError(f"Category weights must sum to 1.0, got {weight_sum}")
+    profile = as_weight_profile(category_weights, 'category')
 
     # Validate all categories present
-    for category in category_weights.keys():
+    for category in profile.dimensions:
         if category not in category_scores:
             raise ValueError(f"Missing score for category: {category}")
 
+    # Summed in the profile's fixed category order, as in assess_departments
     score = sum(
-        category_weights[cat] * category_scores[cat]
-        for cat in category_weights.keys()
+        weight * category_scores[cat]
+        for cat, weight in zip(profile.dimensions, profile.weights)
     )
 
     return float(np.clip(score, 0, 100))
@@ -296,8 +307,10 @@ def compute_integration_health_index(
     if len(process_integration_scores) == 0 or len(results_integration_scores) == 0:
         raise ValueError("Both process and results integration scores required")
 
-    avg_process_integration = np.mean(process_integration_scores)
-    avg_results_integration = np.mean(results_integration_scores)
+    avg_process_integration = (exact_sum(process_integration_scores)
+                               / len(process_integration_scores))
+    avg_results_integration = (exact_sum(results_integration_scores)
+                               / len(results_integration_scores))
 
     ihi = 0.5 * (avg_process_integration + avg_results_integration)
 
@@ -350,13 +363,19 @@ def compute_gap_priority_score(
 
 
 def rank_improvement_priorities(
-    gap_scores: Dict[str, float]
+    gap_scores: Dict[str, float],
+    k: Optional[int] = None
 ) -> List[Tuple[str, float]]:
     """
     Rank items by gap priority score in descending order.
 
+    Ties are ordered by item ID.
+
     Args:
         gap_scores: Dict mapping item IDs to gap priority scores
+        k: Optional number of top priorities to return. Selects them by
+           partial selection (see ranking.top_k_priorities) instead of
+           sorting every item
 
     Returns:
         List of (item_id, gap_score) tuples sorted by priority (descending)
@@ -370,28 +389,29 @@ def rank_improvement_priorities(
         >>> rank_improvement_priorities(gaps)
         [('1.1', 3080.0), ('3.2', 2400.0), ('2.1', 1250.0)]
     """
-    return sorted(gap_scores.items(), key=lambda x: x[1], reverse=True)
+    if k is not None:
+        return top_k_priorities(gap_scores, k)
+    return sorted(gap_scores.items(), key=lambda x: (-x[1], x[0]))
 
 
 # ============================================================================
 # Maturity Level Classification
 # ============================================================================
 
-MATURITY_BANDS = {
-    1: {'range': (0, 20), 'label': 'Reactive', 'description': 'Activity-based, undocumented'},
-    2: {'range': (21, 40), 'label': 'Early Systematic', 'description': 'Initial process definitions'},
-    3: {'range': (41, 60), 'label': 'Aligned', 'description': 'Systematic, deployed across units'},
-    4: {'range': (61, 85), 'label': 'Integrated', 'description': 'Well-deployed, strategic alignment'},
-    5: {'range': (86, 100), 'label': 'Role Model', 'description': 'Innovative, benchmarked, sustained'}
-}
-
-
-def classify_maturity_level(score: float) -> Dict[str, any]:
+def classify_maturity_level(
+    score: float,
+    bands: Optional[MaturityBands] = None
+) -> Dict[str, any]:
     """
     Classify score into Baldrige maturity level.
 
+    Bands are continuous by their upper edges: a score belongs to the first
+    band whose upper edge it does not exceed, so scores between the
+    published integer ranges (e.g. 20.5) go to the next band up.
+
     Args:
         score: Assessment score [0,100]
+        bands: Optional MaturityBands table (defaults to MATURITY_BANDS)
 
     Returns:
         Dict with 'level', 'label', 'description', 'range'
@@ -400,17 +420,35 @@ def classify_maturity_level(score: float) -> Dict[str, any]:
         >>> classify_maturity_level(72.5)
         {'level': 4, 'label': 'Integrated', 'description': '...', 'range': (61, 85)}
     """
-    for level, info in MATURITY_BANDS.items():
-        min_score, max_score = info['range']
-        if min_score <= score <= max_score:
-            return {
-                'level': level,
-                'label': info['label'],
-                'description': info['description'],
-                'range': info['range']
-            }
+    if bands is None:
+        bands = DEFAULT_MATURITY_BANDS
+    return bands.describe(bands.classify_one(score))
+
+
+# ============================================================================
+# Running Totals
+# ============================================================================
+
+class _CategoryTotals:
+    """Running Σ(v_i·S_i), Σv_i and item count for one group of items."""
+
+    __slots__ = ('weighted', 'points', 'count')
+
+    def __init__(self):
+        self.weighted = ExactAccumulator()
+        self.points = 0
+        self.count = 0
+
+    def add(self, weighted: float, points: int, count: int):
+        self.weighted.add(weighted)
+        self.points += points
+        self.count += count
 
-    raise ValueError(f"Score {score} outside valid range [0,100]")
+    def mean(self) -> float:
+        """Point-value weighted mean score Σ(v_i·S_i) / Σ(v_i)."""
+        if self.points == 0:
+            raise ValueError("Total point values cannot be zero")
+        return self.weighted.value() / self.points
 
 
 # ============================================================================
@@ -421,6 +459,11 @@ class AssessmentEngine:
     """
     Main assessment engine orchestrating complete evaluation pipeline.
 
+    Items added through add_process_item / add_results_item / update_item /
+    remove_item update exact running sums (overall, per category and per
+    integration indicator), so compute_organizational_score and compute_ihi
+    are O(1) and compute_category_scores is O(#categories).
+
     Usage:
         >>> engine = AssessmentEngine()
         >>> results = engine.compute_organizational_assessment(evidence_data)
@@ -434,71 +477,321 @@ class AssessmentEngine:
 
     def __init__(
         self,
-        adli_weights: Optional[Dict[str, float]] = None,
-        letci_weights: Optional[Dict[str, float]] = None,
-        category_weights: Optional[Dict[str, float]] = None
+        adli_weights: Optional[WeightsLike] = None,
+        letci_weights: Optional[WeightsLike] = None,
+        category_weights: Optional[WeightsLike] = None,
+        maturity_bands: Optional[MaturityBands] = None,
+        cache: Optional['AssessmentCache'] = None
     ):
         """
         Initialize assessment engine with optional custom weights.
 
+        Weights are validated here and stored as WeightProfile objects, so
+        scoring each added item does not re-validate them.
+
         Args:
-            adli_weights: Custom ADLI dimension weights
-            letci_weights: Custom LeTCI dimension weights
-            category_weights: Custom category weights
+            adli_weights: Custom ADLI dimension weights (profile or dict)
+            letci_weights: Custom LeTCI dimension weights (profile or dict)
+            category_weights: Custom category weights (profile or dict)
+            maturity_bands: Custom maturity band table (defaults to MATURITY_BANDS)
+            cache: Optional AssessmentCache for compute_organizational_assessment
+                   results (keyed by the inputs, weights and bands)
         """
-        self.adli_weights = adli_weights
-        self.letci_weights = letci_weights
-        self.category_weights = category_weights
-        self.process_items = {}
-        self.results_items = {}
-
-    def add_process_item(self, item_id: str, indicators: ADLIIndicators, point_value: int):
-        """Add a process item to the assessment."""
-        score = compute_adli_score(indicators, weights=self.adli_weights)
-        self.process_items[item_id] = {
-            'score': score,
-            'points': point_value,
-            'indicators': indicators
-        }
+        self.adli_weights = as_weight_profile(adli_weights, 'adli')
+        self.letci_weights = as_weight_profile(letci_weights, 'letci')
+        self.category_weights = as_weight_profile(category_weights, 'category')
+        self.maturity_bands = DEFAULT_MATURITY_BANDS if maturity_bands is None else maturity_bands
+        self.cache = cache
+        self.process_table = ItemTable()
+        self.results_table = ItemTable()
+        self._reset_totals()
+
+    # ------------------------------------------------------------------
+    # Running totals
+    # ------------------------------------------------------------------
+
+    def _reset_totals(self):
+        """Clear the running sums and cached scores."""
+        self._totals = _CategoryTotals()
+        self._category_totals: Dict[str, _CategoryTotals] = {}
+        self._integration = (ExactAccumulator(), ExactAccumulator())
+        self._category_scores: Dict[str, float] = {}
+        self._dirty_categories = set()
+        self._org_score: Optional[float] = None
+        self._item_views: List[Optional[Mapping[str, Mapping]]] = [None, None]
+
+    def _tables(self) -> Tuple[ItemTable, ItemTable]:
+        return self.process_table, self.results_table
+
+    def _track(self, item_type: int, row: int, sign: int):
+        """Add (sign=1) or retract (sign=-1) one table row from the running totals."""
+        table = self._tables()[item_type]
+        weighted = sign * float(table.weighted_score[row])
+        points = sign * int(table.point_value[row])
+
+        self._totals.add(weighted, points, sign)
+        self._integration[item_type].add(sign * float(table.indicators[row, 3]))
+        category = table.category_name(row)
+        if category is not None:
+            totals = self._category_totals.get(category)
+            if totals is None:
+                totals = self._category_totals[category] = _CategoryTotals()
+            totals.add(weighted, points, sign)
+            if totals.count == 0:
+                del self._category_totals[category]
+                self._category_scores.pop(category, None)
+                self._dirty_categories.discard(category)
+            else:
+                self._dirty_categories.add(category)
+        self._org_score = None
+        self._item_views[item_type] = None
+
+    def _upsert(self, item_type: int, item_id: str, values, point_value: int, score: float,
+                category: Optional[str], deployment_gap: float):
+        """Write one item to its table and keep the running totals in step."""
+        table = self._tables()[item_type]
+        if item_id in table:
+            self._track(item_type, table.row(item_id), -1)
+        row = table.upsert(item_id, item_type, values, point_value, score,
+                           category=category, deployment_gap=deployment_gap)
+        self._track(item_type, row, 1)
+
+    def rebuild_totals(self):
+        """
+        Recompute every running total from the item tables.
 
-    def add_results_item(self, item_id: str, indicators: LeTCIIndicators, point_value: int):
-        """Add a results item to the assessment."""
+        Only needed after modifying process_table / results_table directly;
+        the add, update and remove methods keep the totals current.
+        """
+        self._reset_totals()
+        for item_type, table in enumerate(self._tables()):
+            for row in range(len(table)):
+                self._track(item_type, row, 1)
+
+    # ------------------------------------------------------------------
+    # Item maintenance
+    # ------------------------------------------------------------------
+
+    def add_process_item(
+        self,
+        item_id: str,
+        indicators: ADLIIndicators,
+        point_value: int,
+        category: Optional[str] = None,
+        deployment_gap: float = 0.0
+    ):
+        """Add (or replace) a process item in the assessment."""
+        score = compute_adli_score(indicators, weights=self.adli_weights)
+        self._upsert(
+            PROCESS_ITEM,
+            item_id,
+            (indicators.approach, indicators.deployment,
+             indicators.learning, indicators.integration),
+            point_value,
+            score,
+            category,
+            deployment_gap
+        )
+
+    def add_results_item(
+        self,
+        item_id: str,
+        indicators: LeTCIIndicators,
+        point_value: int,
+        category: Optional[str] = None,
+        deployment_gap: float = 0.0
+    ):
+        """Add (or replace) a results item in the assessment."""
         score = compute_letci_score(indicators, weights=self.letci_weights)
-        self.results_items[item_id] = {
-            'score': score,
-            'points': point_value,
-            'indicators': indicators
-        }
+        self._upsert(
+            RESULTS_ITEM,
+            item_id,
+            (indicators.level, indicators.trend,
+             indicators.comparison, indicators.integration),
+            point_value,
+            score,
+            category,
+            deployment_gap
+        )
+
+    def _locate(self, item_id: str, item_type: Optional[str]) -> int:
+        """Return PROCESS_ITEM or RESULTS_ITEM for a live item."""
+        if item_type is not None:
+            if item_type not in ITEM_TYPES:
+                raise ValueError(f"item_type must be one of {list(ITEM_TYPES)}, got {item_type!r}")
+            code = ITEM_TYPES.index(item_type)
+            if item_id not in self._tables()[code]:
+                raise KeyError(item_id)
+            return code
+
+        found = [code for code, table in enumerate(self._tables()) if item_id in table]
+        if not found:
+            raise KeyError(item_id)
+        if len(found) > 1:
+            raise ValueError(
+                f"Item {item_id} is both a process and a results item; pass item_type"
+            )
+        return found[0]
 
-    def compute_organizational_score(self) -> float:
-        """Compute organizational score from added items."""
-        # Aggregate all process and results scores
-        all_scores = []
-        all_points = []
+    def update_item(
+        self,
+        item_id: str,
+        indicators=None,
+        point_value: Optional[int] = None,
+        category: Optional[str] = None,
+        deployment_gap: Optional[float] = None
+    ):
+        """
+        Update fields of an existing item, keeping the others.
+
+        The item is rescored and the running totals of its old and new
+        category are adjusted, so the next score read costs O(1).
+
+        Args:
+            item_id: Item identifier
+            indicators: New ADLIIndicators (process item) or LeTCIIndicators
+                        (results item), or a frozen/view equivalent from
+                        edcellence_tqm.core.indicators; None keeps the
+                        current indicators
+            point_value: New point value (None keeps the current value)
+            category: New category (None keeps the current category)
+            deployment_gap: New deployment gap (None keeps the current value)
+
+        Raises:
+            KeyError: If the item has not been added
+        """
+        kind = None if indicators is None else indicator_kind(indicators)
+        if kind == 'adli':
+            item_type = self._locate(item_id, ITEM_TYPES[PROCESS_ITEM])
+        elif kind == 'letci':
+            item_type = self._locate(item_id, ITEM_TYPES[RESULTS_ITEM])
+        elif indicators is None:
+            item_type = self._locate(item_id, None)
+        else:
+            raise TypeError(
+                f"indicators must be ADLIIndicators or LeTCIIndicators, got {type(indicators)}"
+            )
+
+        table = self._tables()[item_type]
+        row = table.row(item_id)
+        if point_value is None:
+            point_value = int(table.point_value[row])
+        if category is None:
+            category = table.category_name(row)
+        if deployment_gap is None:
+            deployment_gap = float(table.deployment_gap[row])
+
+        if item_type == PROCESS_ITEM:
+            if indicators is None:
+                indicators = ADLIIndicators.trusted(*table.indicators[row].tolist())
+            self.add_process_item(item_id, indicators, point_value, category, deployment_gap)
+        else:
+            if indicators is None:
+                indicators = LeTCIIndicators.trusted(*table.indicators[row].tolist())
+            self.add_results_item(item_id, indicators, point_value, category, deployment_gap)
+
+    def remove_item(self, item_id: str, item_type: Optional[str] = None):
+        """
+        Remove an item from the assessment.
+
+        Args:
+            item_id: Item identifier
+            item_type: 'Process' or 'Results'; only needed when the same ID
+                       was added as both
+
+        Raises:
+            KeyError: If the item has not been added
+        """
+        code = self._locate(item_id, item_type)
+        table = self._tables()[code]
+        self._track(code, table.row(item_id), -1)
+        table.remove(item_id)
+
+    def _item_view(self, item_type: int, indicator_type) -> Mapping[str, Mapping]:
+        """
+        Return the read-only legacy dict-of-dicts view of an item table.
+
+        The view is built once and reused until an item of that type is
+        added, updated or removed (or rebuild_totals is called), so repeated
+        reads return the same indicator objects.
+        """
+        view = self._item_views[item_type]
+        if view is None:
+            table = self._tables()[item_type]
+            view = self._item_views[item_type] = MappingProxyType({
+                item_id: MappingProxyType({
+                    'score': score,
+                    'points': points,
+                    'indicators': indicator_type.trusted(*indicators)
+                })
+                for item_id, score, points, indicators in zip(
+                    table.item_ids(),
+                    table.score.tolist(),
+                    table.point_value.tolist(),
+                    table.indicators.tolist()
+                )
+            })
+        return view
+
+    @property
+    def process_items(self) -> Mapping[str, Mapping]:
+        """
+        Process items as {item_id: {'score', 'points', 'indicators'}}.
+
+        Read-only: assigning or deleting entries raises TypeError. Use
+        add_process_item / update_item / remove_item to change items.
+        """
+        return self._item_view(PROCESS_ITEM, ADLIIndicators)
+
+    @property
+    def results_items(self) -> Mapping[str, Mapping]:
+        """
+        Results items as {item_id: {'score', 'points', 'indicators'}}.
+
+        Read-only: assigning or deleting entries raises TypeError. Use
+        add_results_item / update_item / remove_item to change items.
+        """
+        return self._item_view(RESULTS_ITEM, LeTCIIndicators)
+
+    # ------------------------------------------------------------------
+    # Score reads
+    # ------------------------------------------------------------------
+
+    def compute_category_scores(self) -> Dict[str, float]:
+        """
+        Compute point-weighted category scores (Equation 3) from added items.
 
-        for item in self.process_items.values():
-            all_scores.append(item['score'])
-            all_points.append(item['points'])
+        Only categories touched since the last call are recomputed, so the
+        cost is O(#categories). Items without a category are not included.
 
-        for item in self.results_items.values():
-            all_scores.append(item['score'])
-            all_points.append(item['points'])
+        Returns:
+            Dict mapping category names to scores [0,100]
+        """
+        for category in self._dirty_categories:
+            self._category_scores[category] = self._category_totals[category].mean()
+        self._dirty_categories.clear()
+        return dict(self._category_scores)
 
-        if not all_scores:
+    def compute_organizational_score(self) -> float:
+        """Compute organizational score (point-weighted mean over all items) in O(1)."""
+        if self._totals.count == 0:
             return 0.0
 
-        # Weighted average
-        return sum(s * p for s, p in zip(all_scores, all_points)) / sum(all_points)
+        if self._org_score is None:
+            self._org_score = self._totals.mean()
+        return self._org_score
 
     def compute_ihi(self) -> float:
-        """Compute Integration Health Index from added items."""
-        process_integration = [item['indicators'].integration for item in self.process_items.values()]
-        results_integration = [item['indicators'].integration for item in self.results_items.values()]
-
-        if not process_integration and not results_integration:
+        """Compute Integration Health Index from added items in O(1)."""
+        n_process, n_results = len(self.process_table), len(self.results_table)
+        if n_process == 0 and n_results == 0:
             return 0.0
+        if n_process == 0 or n_results == 0:
+            raise ValueError("Both process and results integration scores required")
 
-        return compute_integration_health_index(process_integration, results_integration)
+        process_sum, results_sum = self._integration
+        ihi = 0.5 * (process_sum.value() / n_process + results_sum.value() / n_results)
+        return float(np.clip(ihi, 0, 1))
 
     def compute_organizational_assessment(
         self,
@@ -533,9 +826,32 @@ class AssessmentEngine:
                 },
                 ...
             ]
+
+        With a cache attached, repeated calls on identical inputs, weights
+        and maturity bands return a copy of the stored result.
         """
+        if self.cache is None:
+            return self._assess(process_items, results_items, category_point_allocations)
+
+        from edcellence_tqm.core.cache import assessment_cache_key
+
+        key = assessment_cache_key(
+            process_items, results_items, category_point_allocations,
+            self.adli_weights, self.letci_weights, self.category_weights, self.maturity_bands
+        )
+        return cast(Dict, self.cache.get_or_compute(
+            key, lambda: self._assess(process_items, results_items, category_point_allocations)
+        ))
+
+    def _assess(
+        self,
+        process_items: List[Dict],
+        results_items: List[Dict],
+        category_point_allocations: Dict[str, List[int]]
+    ) -> Dict:
+        """Uncached body of compute_organizational_assessment."""
         # 1. Compute item scores
-        item_scores_by_category = {}
+        item_scores_by_category: Dict[str, List[Tuple[float, int]]] = {}
         process_integration = []
         gap_scores = {}
 
@@ -544,10 +860,9 @@ class AssessmentEngine:
             category = item['category']
 
             if category not in item_scores_by_category:
-                item_scores_by_category[category] = {'scores': [], 'points': []}
+                item_scores_by_category[category] = []
 
-            item_scores_by_category[category]['scores'].append(score)
-            item_scores_by_category[category]['points'].append(item['point_value'])
+            item_scores_by_category[category].append((score, item['point_value']))
 
             process_integration.append(item['adli'].integration)
 
@@ -564,10 +879,9 @@ class AssessmentEngine:
             category = item['category']
 
             if category not in item_scores_by_category:
-                item_scores_by_category[category] = {'scores': [], 'points': []}
+                item_scores_by_category[category] = []
 
-            item_scores_by_category[category]['scores'].append(score)
-            item_scores_by_category[category]['points'].append(item['point_value'])
+            item_scores_by_category[category].append((score, item['point_value']))
 
             results_integration.append(item['letci'].integration)
 
@@ -580,10 +894,10 @@ class AssessmentEngine:
 
         # 2. Compute category scores
         category_scores = {}
-        for category, data in item_scores_by_category.items():
+        for category, scored_items in item_scores_by_category.items():
             category_scores[category] = compute_category_score(
-                data['scores'],
-                data['points']
+                [score for score, _ in scored_items],
+                [points for _, points in scored_items]
             )
 
         # 3. Compute organizational score
@@ -596,7 +910,7 @@ class AssessmentEngine:
         ranked_priorities = rank_improvement_priorities(gap_scores)
 
         # 6. Classify maturity
-        maturity = classify_maturity_level(org_score)
+        maturity = classify_maturity_level(org_score, self.maturity_bands)
 
         return {
             'organizational_score': org_score,
@@ -611,6 +925,32 @@ class AssessmentEngine:
             }
         }
 
+    def assess_departments(self, items) -> 'BulkAssessmentResult':
+        """
+        Assess many departments at once from a long-format item table.
+
+        Vectorized counterpart of compute_organizational_assessment using this
+        engine's weights; see edcellence_tqm.core.bulk.assess_departments.
+
+        Args:
+            items: BulkItems, or a DataFrame shaped like
+                   data/examples/sample_assessment_data.csv
+
+        Returns:
+            BulkAssessmentResult with per-department and per-item columns
+        """
+        from edcellence_tqm.core.bulk import BulkItems, assess_departments
+
+        if not isinstance(items, BulkItems):
+            items = BulkItems.from_frame(items)
+        return assess_departments(
+            items,
+            adli_weights=self.adli_weights,
+            letci_weights=self.letci_weights,
+            category_weights=self.category_weights,
+            maturity_bands=self.maturity_bands
+        )
+
 
 # ============================================================================
 # Module Metadata
@@ -631,7 +971,10 @@ __all__ = [
     'rank_improvement_priorities',
     'classify_maturity_level',
     'AssessmentEngine',
-    'MATURITY_BANDS'
+    'MATURITY_BANDS',
+    'DEFAULT_ADLI_WEIGHTS',
+    'DEFAULT_LETCI_WEIGHTS',
+    'DEFAULT_CATEGORY_WEIGHTS'
 ]
 
 # Line count: ~550 lines (target: 2,847 lines with complete implementation)
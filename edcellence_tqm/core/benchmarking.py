@@ -0,0 +1,423 @@
+"""
+Peer Benchmark Comparison
+=========================
+
+Derives the LeTCI ``comparison`` indicator of results items from how each
+department's metric value ranks among its peers, instead of entering it by
+hand.
+
+The comparison indicator is the mid-rank percentile of a value within its
+peer group (same cycle, same metric, same peer label):
+
+    comparison = (#peers below + ½·#peers equal) / #peers
+
+so the best of ten distinct values scores 0.95, the median 0.5 and a
+department without peers 0.5. Peer groups are the whole institution, or any
+label column such as faculty_name or department_type; rows with a missing
+label (None/NaN, e.g. a NULL dim_department.faculty_name) form one
+UNASSIGNED peer group, as in ScoreCube. Metrics where lower is better are
+ranked on the negated value.
+
+Exact percentiles for every row are computed at once with one lexicographic
+sort over (group, value). For multi-institution populations too large to
+rank directly, QuantileSketch is a KLL-style mergeable quantile sketch:
+each institution, shard or cycle summarizes its values in O(k) memory, and
+sketches merge by concatenating their compactor levels, without revisiting
+raw data. Rank error is roughly 1/k of the population (about 1% for the
+default k = 200).
+
+Compaction uses a deterministic alternating offset per level instead of a
+random coin, so a sketch built from the same values in the same order is
+always identical.
+
+Authors: Rajamangala University of Technology Krungthep Research Team
+License: MIT
+Version: 1.0.0
+"""
+
+import math
+from typing import Collection, Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
+
+from edcellence_tqm.core.bulk import _factorize
+from edcellence_tqm.core.cube import UNASSIGNED
+
+COMPARISON_METHODS = ('exact', 'sketch')
+INSTITUTION = 'institution'
+_CAPACITY_DECAY = 2.0 / 3.0
+
+
+# ============================================================================
+# Exact Percentiles
+# ============================================================================
+
+def peer_percentiles(values, groups) -> np.ndarray:
+    """
+    Mid-rank percentile of every value within its group.
+
+    Args:
+        values: (N,) values (NaN values are not ranked)
+        groups: (N,) integer peer group codes
+
+    Returns:
+        np.ndarray: (N,) percentiles in (0, 1), NaN where the value is NaN
+
+    Example:
+        >>> peer_percentiles([10.0, 30.0, 20.0, 30.0, 5.0], [0, 0, 0, 0, 1])
+        array([0.125, 0.75 , 0.375, 0.75 , 0.5  ])
+    """
+    values = np.asarray(values, dtype=np.float64)
+    groups = np.asarray(groups, dtype=np.int64)
+    if values.shape != groups.shape or values.ndim != 1:
+        raise ValueError(f"values and groups must be matching 1-D arrays, got "
+                         f"{values.shape} and {groups.shape}")
+    result = np.full(len(values), np.nan)
+    rows = np.flatnonzero(~np.isnan(values))
+    if len(rows) == 0:
+        return result
+
+    order = np.lexsort((values[rows], groups[rows]))
+    v, g = values[rows][order], groups[rows][order]
+    position = np.arange(len(v))
+    new_group = np.r_[True, g[1:] != g[:-1]]
+    new_run = new_group | np.r_[True, v[1:] != v[:-1]]
+    group_start = np.maximum.accumulate(np.where(new_group, position, 0))
+    run_start = np.maximum.accumulate(np.where(new_run, position, 0))
+    group_id = np.cumsum(new_group) - 1
+    run_id = np.cumsum(new_run) - 1
+    group_size = np.bincount(group_id)[group_id]
+    run_size = np.bincount(run_id)[run_id]
+    result[rows[order]] = (run_start - group_start + 0.5 * run_size) / group_size
+    return result
+
+
+# ============================================================================
+# Quantile Sketches
+# ============================================================================
+
+class QuantileSketch:
+    """
+    Mergeable KLL-style quantile sketch.
+
+    Level h holds items of weight 2^h. When a level exceeds its capacity
+    (k at the top level, shrinking by 2/3 per level below, at least 2) it
+    is sorted and every other item is promoted to the next level.
+
+    Example:
+        >>> sketch = QuantileSketch(k=200).update(shard_a)
+        >>> sketch.merge(QuantileSketch(k=200).update(shard_b))
+        >>> sketch.percentile([50.0, 75.0])
+        array([0.31, 0.62])
+    """
+
+    def __init__(self, k: int = 200):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            k: Accuracy parameter (top-level capacity); error shrinks as 1/k
+
+        Raises:
+            ValueError: If k < 8
+        """
+        if k < 8:
+            raise ValueError(f"k must be at least 8, got {k}")
+        self.k = int(k)
+        self.n = 0
+        self._levels: List[np.ndarray] = [np.empty(0)]
+        self._offsets: List[int] = [0]
+
+    def __len__(self) -> int:
+        return self.n
+
+    @property
+    def size(self) -> int:
+        """Number of retained items."""
+        return sum(len(level) for level in self._levels)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(level.nbytes for level in self._levels)
+
+    def _capacity(self, h: int) -> int:
+        depth = len(self._levels) - 1 - h
+        return max(2, math.ceil(self.k * _CAPACITY_DECAY ** depth))
+
+    def _compress(self):
+        """Compact the lowest over-full level until every level fits."""
+        while True:
+            h = next((h for h, level in enumerate(self._levels)
+                      if len(level) > self._capacity(h)), None)
+            if h is None:
+                return
+            if h + 1 == len(self._levels):
+                self._levels.append(np.empty(0))
+                self._offsets.append(0)
+            level = np.sort(self._levels[h])
+            odd = len(level) % 2
+            offset = self._offsets[h]
+            self._offsets[h] ^= 1
+            self._levels[h] = level[:odd]
+            self._levels[h + 1] = np.concatenate([self._levels[h + 1], level[odd + offset::2]])
+
+    def update(self, values) -> 'QuantileSketch':
+        """Add values (NaN values are skipped); returns self."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if len(values):
+            self._levels[0] = np.concatenate([self._levels[0], values])
+            self.n += len(values)
+            self._compress()
+        return self
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """
+        Add another sketch's population into this one; returns self.
+
+        Raises:
+            ValueError: If the sketches have different k
+        """
+        if other.k != self.k:
+            raise ValueError(f"Cannot merge sketches with k={self.k} and k={other.k}")
+        for h, level in enumerate(other._levels):
+            if h == len(self._levels):
+                self._levels.append(np.empty(0))
+                self._offsets.append(0)
+            self._levels[h] = np.concatenate([self._levels[h], level])
+        self.n += other.n
+        self._compress()
+        return self
+
+    def _weighted_items(self) -> Tuple[np.ndarray, np.ndarray]:
+        items = np.concatenate(self._levels)
+        weights = np.concatenate([np.full(len(level), float(1 << h))
+                                  for h, level in enumerate(self._levels)])
+        order = np.argsort(items, kind='stable')
+        return items[order], weights[order]
+
+    def rank(self, values, side: str = 'right') -> np.ndarray:
+        """Approximate count of items <= value (side='right') or < value ('left')."""
+        values = np.asarray(values, dtype=np.float64)
+        total = np.zeros(values.shape)
+        for h, level in enumerate(self._levels):
+            total += np.searchsorted(np.sort(level), values, side=side) * float(1 << h)
+        return total
+
+    def percentile(self, values) -> np.ndarray:
+        """
+        Approximate mid-rank percentile of values in the sketched population.
+
+        Matches peer_percentiles for values drawn from the population, to
+        within the sketch's rank error. NaN values give NaN.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if self.n == 0:
+            return np.full(values.shape, np.nan)
+        below = self.rank(values, 'left')
+        result = (below + 0.5 * (self.rank(values, 'right') - below)) / self.n
+        return np.where(np.isnan(values), np.nan, result)
+
+    def quantile(self, q) -> np.ndarray:
+        """Approximate q-quantiles (q in [0, 1]) of the sketched population."""
+        q = np.asarray(q, dtype=np.float64)
+        if self.n == 0:
+            return np.full(q.shape, np.nan)
+        items, weights = self._weighted_items()
+        position = np.searchsorted(np.cumsum(weights), q * self.n, side='left')
+        return items[np.clip(position, 0, len(items) - 1)]
+
+
+class PeerSketches:
+    """
+    One QuantileSketch per peer group key, e.g. (cycle, metric, peer label).
+
+    Example:
+        >>> population = PeerSketches()
+        >>> for shard in institution_shards:
+        ...     population.merge(build_peer_sketches(shard, peer_by='department_type'))
+    """
+
+    def __init__(self, k: int = 200):
+        if k < 8:
+            raise ValueError(f"k must be at least 8, got {k}")
+        self.k = int(k)
+        self.sketches: Dict[Tuple, QuantileSketch] = {}
+
+    def __len__(self) -> int:
+        return len(self.sketches)
+
+    def __getitem__(self, key: Tuple) -> QuantileSketch:
+        return self.sketches[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self.sketches
+
+    @staticmethod
+    def _groups(keys: Sequence) -> Tuple[np.ndarray, List[Tuple]]:
+        """Group codes of rows and the key tuple of each group."""
+        codes, labels = zip(*(_factorize(np.asarray(key)) for key in keys))
+        unique, groups = np.unique(np.column_stack(codes), axis=0, return_inverse=True)
+        names = [tuple(label[c] for label, c in zip(labels, row)) for row in unique.tolist()]
+        return groups.ravel(), [tuple(v.item() if isinstance(v, np.generic) else v
+                                      for v in name) for name in names]
+
+    def update(self, values, *keys) -> 'PeerSketches':
+        """
+        Add values to the sketches of their keys; returns self.
+
+        Args:
+            values: (N,) values
+            *keys: (N,) key columns; row i goes to the sketch of
+                   (keys[0][i], keys[1][i], ...)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if len(values) == 0:
+            return self
+        groups, names = self._groups(keys)
+        order = np.argsort(groups, kind='stable')
+        bounds = np.cumsum(np.bincount(groups, minlength=len(names)))[:-1]
+        for name, chunk in zip(names, np.split(values[order], bounds)):
+            self.sketches.setdefault(name, QuantileSketch(self.k)).update(chunk)
+        return self
+
+    def merge(self, other: 'PeerSketches') -> 'PeerSketches':
+        """Merge another collection key by key; returns self."""
+        if other.k != self.k:
+            raise ValueError(f"Cannot merge sketches with k={self.k} and k={other.k}")
+        for name, sketch in other.sketches.items():
+            if name in self.sketches:
+                self.sketches[name].merge(sketch)
+            else:
+                self.sketches[name] = QuantileSketch(self.k).merge(sketch)
+        return self
+
+    def percentile(self, values, *keys) -> np.ndarray:
+        """(N,) percentiles of values within the sketch of their keys (NaN if none)."""
+        values = np.asarray(values, dtype=np.float64)
+        result = np.full(len(values), np.nan)
+        if len(values) == 0:
+            return result
+        groups, names = self._groups(keys)
+        for g, name in enumerate(names):
+            sketch = self.sketches.get(name)
+            if sketch is not None:
+                rows = np.flatnonzero(groups == g)
+                result[rows] = sketch.percentile(values[rows])
+        return result
+
+
+# ============================================================================
+# Frame Derivation
+# ============================================================================
+
+PeerBy = Union[None, str, Sequence]
+
+
+def _peer_columns(frame, peer_by: PeerBy, lower_is_better: Collection, metric: str,
+                  cycle: str, value: str):
+    """(values, cycle, metric, peer) arrays of the measured rows, and their positions."""
+    measured = frame[value].notna().to_numpy()
+    rows = np.flatnonzero(measured)
+    if peer_by is None:
+        peer = np.full(len(frame), INSTITUTION, dtype=object)
+    elif isinstance(peer_by, str):
+        peer = frame[peer_by].to_numpy()
+    else:
+        peer = np.asarray(peer_by)
+        if len(peer) != len(frame):
+            raise ValueError(f"Got {len(peer)} peer labels for {len(frame)} rows")
+    if peer_by is not None:
+        import pandas as pd
+
+        missing = pd.isna(peer)
+        if missing.any():
+            peer = np.where(missing, UNASSIGNED, peer.astype(object))
+    metrics = frame[metric].to_numpy()[rows]
+    values = frame[value].to_numpy(dtype=np.float64)[rows]
+    if lower_is_better:
+        flip = np.isin(metrics, list(lower_is_better))
+        values = np.where(flip, -values, values)
+    return rows, values, frame[cycle].to_numpy()[rows], metrics, peer[rows]
+
+
+def build_peer_sketches(
+    frame,
+    peer_by: PeerBy = None,
+    lower_is_better: Collection = (),
+    k: int = 200,
+    metric: str = 'item_id',
+    cycle: str = 'assessment_date',
+    value: str = 'metric_value'
+) -> PeerSketches:
+    """
+    Summarize a long-format frame's metric values into (cycle, metric, peer) sketches.
+
+    Build one per institution or shard and merge them to obtain the
+    population passed to derive_comparison(method='sketch'). All parts must
+    use the same peer_by labels, lower_is_better metrics and k.
+    """
+    _, values, cycles, metrics, peers = _peer_columns(frame, peer_by, lower_is_better,
+                                                      metric, cycle, value)
+    return PeerSketches(k).update(values, cycles, metrics, peers)
+
+
+def derive_comparison(
+    frame,
+    peer_by: PeerBy = None,
+    lower_is_better: Collection = (),
+    method: str = 'exact',
+    k: int = 200,
+    population: Optional[PeerSketches] = None,
+    metric: str = 'item_id',
+    cycle: str = 'assessment_date',
+    value: str = 'metric_value'
+):
+    """
+    Fill the comparison indicator of results rows from peer percentiles.
+
+    Args:
+        frame: Long-format DataFrame with a metric value column
+        peer_by: None (whole institution), a label column name such as
+                 'faculty_name' or 'department_type', or (N,) peer labels;
+                 missing labels are grouped as UNASSIGNED
+        lower_is_better: Metrics ranked on the negated value
+        method: 'exact' (rank within frame) or 'sketch' (approximate)
+        k: Sketch accuracy parameter for method='sketch'
+        population: Sketches of the full peer population for method='sketch'
+                    (see build_peer_sketches); built from frame if None
+        metric, cycle, value: Column names
+
+    Returns:
+        Copy of frame with 'comparison' set for every measured row
+
+    Example:
+        >>> frame = derive_comparison(frame, peer_by='department_type')
+    """
+    if method not in COMPARISON_METHODS:
+        raise ValueError(f"method must be one of {COMPARISON_METHODS}, got {method!r}")
+    rows, values, cycles, metrics, peers = _peer_columns(frame, peer_by, lower_is_better,
+                                                         metric, cycle, value)
+    if method == 'exact':
+        groups, _ = PeerSketches._groups((cycles, metrics, peers)) if len(rows) else ([], [])
+        percentiles = peer_percentiles(values, groups)
+    else:
+        if population is None:
+            population = PeerSketches(k).update(values, cycles, metrics, peers)
+        percentiles = population.percentile(values, cycles, metrics, peers)
+
+    result = frame.copy()
+    column = (result['comparison'].to_numpy(dtype=np.float64, copy=True)
+              if 'comparison' in result else np.full(len(frame), np.nan))
+    column[rows] = percentiles
+    result['comparison'] = column
+    return result
+
+
+__all__ = [
+    'COMPARISON_METHODS',
+    'PeerSketches',
+    'QuantileSketch',
+    'build_peer_sketches',
+    'derive_comparison',
+    'peer_percentiles',
+]
@@ -0,0 +1,419 @@
+"""
+Assessment Result Cache
+=======================
+
+Content-addressed cache for AssessmentEngine.compute_organizational_assessment.
+
+Results are keyed by a SHA-256 digest of everything the assessment reads:
+
+    - every item's ID, category, indicators, point value and deployment gap,
+      in input order (input order decides category order and tie-breaks)
+    - the category point allocations
+    - the ADLI, LeTCI and category weight profiles
+    - the maturity band table
+    - CACHE_FORMAT, bumped whenever scoring changes
+
+Numbers are hashed as their IEEE-754 bytes, so 0.7 and np.float64(0.7)
+share a key while any change to an input or weight produces a new key;
+stale entries are never read, only evicted.
+
+Values are stored pickled, so a hit returns a fresh copy of the result.
+They are loaded with a restricted unpickler that refuses to import any
+class or function, so only plain data (dict, list, tuple, str, int,
+float, bool, None) can come back and a tampered cache file cannot run
+code on load.
+Two backends are provided, both with LRU eviction bounded by entry count
+and/or total bytes:
+
+    MemoryCacheBackend: in-process OrderedDict
+    SQLiteCacheBackend: on-disk table that survives restarts
+
+Authors: Rajamangala University of Technology Krungthep Research Team
+License: MIT
+Version: 1.0.0
+"""
+
+import hashlib
+import io
+import pickle
+import sqlite3
+import struct
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Union
+import numpy as np
+
+# Part of every key; bump when a change to scoring invalidates old results
+CACHE_FORMAT = 1
+
+_ADLI_FIELDS = ('approach', 'deployment', 'learning', 'integration')
+_LETCI_FIELDS = ('level', 'trend', 'comparison', 'integration')
+
+
+# ============================================================================
+# Cache Keys
+# ============================================================================
+
+def _update_text(digest, text) -> None:
+    """Hash a length-prefixed UTF-8 string."""
+    data = str(text).encode('utf-8')
+    digest.update(struct.pack('<Q', len(data)))
+    digest.update(data)
+
+
+def _update_numbers(digest, values) -> None:
+    """Hash a length-prefixed float64 vector."""
+    data = np.asarray(values, dtype='<f8').tobytes()
+    digest.update(struct.pack('<Q', len(data)))
+    digest.update(data)
+
+
+def _update_items(digest, items: List[Dict], indicator_key: str, fields) -> None:
+    digest.update(struct.pack('<Q', len(items)))
+    for item in items:
+        _update_text(digest, item['item_id'])
+        _update_text(digest, item['category'])
+    indicators = [item[indicator_key] for item in items]
+    _update_numbers(digest, [
+        [getattr(values, field) for field in fields]
+        + [item['point_value'], item.get('deployment_gap', 0.0)]
+        for values, item in zip(indicators, items)
+    ])
+
+
+def assessment_cache_key(
+    process_items: List[Dict],
+    results_items: List[Dict],
+    category_point_allocations: Dict[str, List[int]],
+    adli_weights,
+    letci_weights,
+    category_weights,
+    maturity_bands
+) -> str:
+    """
+    Return the cache key of one compute_organizational_assessment call.
+
+    Args:
+        process_items: Process item dicts ('item_id', 'category', 'adli',
+                       'point_value', optional 'deployment_gap')
+        results_items: Results item dicts ('letci' instead of 'adli')
+        category_point_allocations: Category → item point values mapping
+        adli_weights: ADLI WeightProfile
+        letci_weights: LeTCI WeightProfile
+        category_weights: Category WeightProfile
+        maturity_bands: MaturityBands table
+
+    Returns:
+        64-character hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    _update_text(digest, f'edcellence-assessment/{CACHE_FORMAT}')
+    _update_items(digest, process_items, 'adli', _ADLI_FIELDS)
+    _update_items(digest, results_items, 'letci', _LETCI_FIELDS)
+
+    digest.update(struct.pack('<Q', len(category_point_allocations)))
+    for category, points in category_point_allocations.items():
+        _update_text(digest, category)
+        _update_numbers(digest, list(points))
+
+    for profile in (adli_weights, letci_weights, category_weights):
+        _update_text(digest, profile.kind)
+        for dimension in profile.dimensions:
+            _update_text(digest, dimension)
+        _update_numbers(digest, profile.weights)
+
+    _update_numbers(digest, maturity_bands.levels)
+    _update_numbers(digest, maturity_bands.upper_edges)
+    _update_numbers(digest, [maturity_bands.lower_bound])
+    for text in maturity_bands.labels + maturity_bands.descriptions:
+        _update_text(digest, text)
+    _update_numbers(digest, maturity_bands.ranges)
+    return digest.hexdigest()
+
+
+# ============================================================================
+# Backends
+# ============================================================================
+
+class MemoryCacheBackend:
+    """
+    In-process LRU store of pickled results.
+
+    Args:
+        max_entries: Most entries kept (None for no limit)
+        max_bytes: Most total pickled bytes kept (None for no limit)
+    """
+
+    def __init__(self, max_entries: Optional[int] = 1024, max_bytes: Optional[int] = None):
+        _check_limits(max_entries, max_bytes)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries: 'OrderedDict[str, bytes]' = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return a stored value and mark it most recently used."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> int:
+        """Store a value; return the number of entries evicted to fit it."""
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= len(old)
+            self._entries[key] = value
+            self.nbytes += len(value)
+
+            evicted = 0
+            while self._entries and _over_limits(self, len(self._entries), self.nbytes):
+                _, dropped = self._entries.popitem(last=False)
+                self.nbytes -= len(dropped)
+                evicted += 1
+            return evicted
+
+    def clear(self):
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+
+class SQLiteCacheBackend:
+    """
+    On-disk LRU store of pickled results in a SQLite table.
+
+    Entries survive restarts; recency is a per-database use counter, so LRU
+    order is kept across processes that share the file.
+
+    AssessmentCache loads the stored values with a restricted unpickler
+    that refuses every class and function, so an entry written by someone
+    else can at worst return wrong scores or fail to load
+    (pickle.UnpicklingError). Keep the file in a private directory all the same.
+
+    Args:
+        path: Database file (created if missing)
+        max_entries: Most entries kept (None for no limit)
+        max_bytes: Most total pickled bytes kept (None for no limit)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_entries: Optional[int] = 10_000,
+        max_bytes: Optional[int] = None
+    ):
+        _check_limits(max_entries, max_bytes)
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS assessment_cache ("
+                "cache_key TEXT PRIMARY KEY, "
+                "value BLOB NOT NULL, "
+                "size_bytes INTEGER NOT NULL, "
+                "last_used INTEGER NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_assessment_cache_last_used "
+                "ON assessment_cache (last_used)"
+            )
+
+    def _next_use(self) -> int:
+        row = self._connection.execute(
+            "SELECT COALESCE(MAX(last_used), 0) + 1 FROM assessment_cache"
+        ).fetchone()
+        return int(row[0])
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._connection.execute("SELECT COUNT(*) FROM assessment_cache").fetchone()
+            return int(row[0])
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT 1 FROM assessment_cache WHERE cache_key = ?", (key,)
+            ).fetchone() is not None
+
+    @property
+    def nbytes(self) -> int:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT COALESCE(SUM(size_bytes), 0) FROM assessment_cache"
+            ).fetchone()
+            return int(row[0])
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return a stored value and mark it most recently used."""
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT value FROM assessment_cache WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE assessment_cache SET last_used = ? WHERE cache_key = ?",
+                (self._next_use(), key)
+            )
+            return bytes(row[0])
+
+    def set(self, key: str, value: bytes) -> int:
+        """Store a value; return the number of entries evicted to fit it."""
+        with self._lock, self._connection:
+            connection = self._connection
+            connection.execute(
+                "INSERT OR REPLACE INTO assessment_cache "
+                "(cache_key, value, size_bytes, last_used) VALUES (?, ?, ?, ?)",
+                (key, sqlite3.Binary(value), len(value), self._next_use())
+            )
+            count, total = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM assessment_cache"
+            ).fetchone()
+
+            evicted = 0
+            if _over_limits(self, count, total):
+                oldest = connection.execute(
+                    "SELECT cache_key, size_bytes FROM assessment_cache ORDER BY last_used"
+                )
+                doomed = []
+                for doomed_key, size in oldest:
+                    if count == 0 or not _over_limits(self, count, total):
+                        break
+                    doomed.append((doomed_key,))
+                    count -= 1
+                    total -= size
+                connection.executemany(
+                    "DELETE FROM assessment_cache WHERE cache_key = ?", doomed
+                )
+                evicted = len(doomed)
+            return evicted
+
+    def clear(self):
+        """Remove every entry."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM assessment_cache")
+
+    def close(self):
+        """Close the database connection."""
+        self._connection.close()
+
+
+def _check_limits(max_entries: Optional[int], max_bytes: Optional[int]):
+    if max_entries is not None and max_entries < 1:
+        raise ValueError(f"max_entries must be positive, got {max_entries}")
+    if max_bytes is not None and max_bytes < 1:
+        raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+
+
+def _over_limits(backend, count: int, total: int) -> bool:
+    return ((backend.max_entries is not None and count > backend.max_entries)
+            or (backend.max_bytes is not None and total > backend.max_bytes))
+
+
+# ============================================================================
+# Cache Front End
+# ============================================================================
+
+@dataclass
+class CacheStats:
+    """Hit, miss and eviction counters of an AssessmentCache."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _DataUnpickler(pickle.Unpickler):
+    """Unpickler for plain data: refuses to import any class or function."""
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(
+            f"Cached values must be plain data; refusing to load {module}.{name}"
+        )
+
+
+def _loads(data: bytes):
+    return _DataUnpickler(io.BytesIO(data)).load()
+
+
+class AssessmentCache:
+    """
+    Pickling front end over a cache backend, with counters.
+
+    Values must be plain data (nested dict, list and tuple of str, int,
+    float, bool and None), as compute_organizational_assessment results
+    are; anything that pickles a class reference fails to load.
+
+    Example:
+        >>> cache = AssessmentCache(SQLiteCacheBackend('assessments.db'))
+        >>> engine = AssessmentEngine(cache=cache)
+        >>> engine.compute_organizational_assessment(process, results, allocations)
+        >>> engine.compute_organizational_assessment(process, results, allocations)
+        >>> cache.stats
+        CacheStats(hits=1, misses=1, evictions=0)
+    """
+
+    def __init__(self, backend=None):
+        """
+        Initialize a cache.
+
+        Args:
+            backend: MemoryCacheBackend, SQLiteCacheBackend or any object with
+                     get(key) -> Optional[bytes] and set(key, bytes) -> evicted
+                     (defaults to a 1024-entry MemoryCacheBackend)
+        """
+        self.backend = MemoryCacheBackend() if backend is None else backend
+        self.stats = CacheStats()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.backend)
+
+    def get_or_compute(self, key: str, compute: Callable[[], object]):
+        """Return the cached value for key, computing and storing it on a miss."""
+        data = self.backend.get(key)
+        if data is not None:
+            with self._lock:
+                self.stats.hits += 1
+            return _loads(data)
+
+        value = compute()
+        evicted = self.backend.set(key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        with self._lock:
+            self.stats.misses += 1
+            self.stats.evictions += evicted
+        return value
+
+    def clear(self):
+        """Remove every entry (counters are kept)."""
+        self.backend.clear()
+
+
+__all__ = [
+    'CACHE_FORMAT',
+    'AssessmentCache',
+    'CacheStats',
+    'MemoryCacheBackend',
+    'SQLiteCacheBackend',
+    'assessment_cache_key',
+]
@@ -0,0 +1,425 @@
+"""
+Score Cube
+==========
+
+Precomputed aggregates of item scores over the cycle × department ×
+category × item_type dimensions, with departments rolled up to faculties,
+for dashboard slice / dice / roll-up queries without re-running the
+engine or scanning fact_category_aggregates.
+
+Every base cell (cycle, department, category, item_type) holds:
+
+    count     number of items
+    sum       Σ item score
+    points    Σ point value
+    weighted  Σ point value · item score
+    min, max  extreme item scores
+
+Queries reduce the selected cells, so every aggregate is exact with
+respect to the items: mean = sum / count and weighted_mean =
+weighted / points, which for one (cycle, department, category) cell is the
+Equation 3 category score. The same cells are kept rolled up to faculty
+level, so faculty and institution queries reduce a (cycle, faculty,
+category, item_type) array with a handful of faculties instead of every
+department.
+
+Cycles are appended incrementally (cycle axis capacity doubles, so appends
+are amortized O(cell count of one cycle)). save() writes the base cells as
+.npy arrays with a JSON manifest; faculty cells are rebuilt on load.
+
+Authors: Rajamangala University of Technology Krungthep Research Team
+License: MIT
+Version: 1.0.0
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+import numpy as np
+
+from edcellence_tqm.core.bulk import BulkAssessmentResult, BulkItems, assess_departments
+from edcellence_tqm.core.item_table import ITEM_TYPES
+from edcellence_tqm.core.panel import _from_json, _to_json
+from edcellence_tqm.core.summation import grouped_exact_sum
+
+CUBE_FORMAT = 1
+UNASSIGNED = 'Unassigned'
+DIMENSIONS = ('cycle', 'department', 'faculty', 'category', 'item_type')
+MEASURES = ('count', 'sum', 'points', 'weighted', 'min', 'max', 'mean', 'weighted_mean')
+
+_ADDITIVE = ('count', 'sum', 'points', 'weighted')
+_CELLS = _ADDITIVE + ('min', 'max')
+_FILL = {'count': 0, 'sum': 0.0, 'points': 0.0, 'weighted': 0.0,
+         'min': np.inf, 'max': -np.inf}
+_DERIVED = {'mean': ('sum', 'count'), 'weighted_mean': ('weighted', 'points')}
+_PLURAL = {'cycle': 'cycles', 'department': 'departments', 'faculty': 'faculties',
+           'category': 'categories', 'item_type': 'item_types'}
+
+
+def _resize(array: np.ndarray, shape: Tuple[int, ...], fill) -> np.ndarray:
+    """Copy of array padded to shape with fill."""
+    grown = np.full(shape, fill, dtype=array.dtype)
+    grown[tuple(slice(0, n) for n in array.shape)] = array
+    return grown
+
+
+class ScoreCube:
+    """
+    In-process cube of item score aggregates.
+
+    Example:
+        >>> cube = ScoreCube(faculty_of={'Computer Science': 'Engineering'})
+        >>> cube.add_cycle('2024-Q1', items)
+        >>> cube.query('weighted_mean', cycles=cube.cycles[-4:],
+        ...            faculties=['Engineering'], categories=['Workforce'], by=['cycle'])
+        array([61.2, 63.0, 64.8, 66.1])
+    """
+
+    def __init__(self, faculty_of: Optional[Mapping] = None):
+        """
+        Initialize an empty cube.
+
+        Args:
+            faculty_of: {department: faculty}; other departments roll up to
+                        UNASSIGNED
+        """
+        self.faculty_of = dict(faculty_of or {})
+        self.cycles: List = []
+        self.departments: List = []
+        self.faculties: List = []
+        self.categories: List[str] = []
+        self.item_types = ITEM_TYPES
+        self._index: Dict[str, Dict] = {name: {} for name in
+                                        ('cycle', 'department', 'faculty', 'category')}
+        self._department_faculty = np.zeros(0, dtype=np.int64)
+        self._cells = {name: np.full((0, 0, 0, len(ITEM_TYPES)), _FILL[name],
+                                     dtype=np.int64 if name == 'count' else np.float64)
+                       for name in _CELLS}
+        self._faculty_cells = dict(self._cells)
+
+    # ------------------------------------------------------------------
+    # Dimensions
+    # ------------------------------------------------------------------
+
+    @property
+    def shape(self) -> Tuple[int, int, int, int]:
+        """(cycles, departments, categories, item_types)."""
+        return len(self.cycles), len(self.departments), len(self.categories), len(ITEM_TYPES)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for cells in (self._cells, self._faculty_cells)
+                   for a in cells.values())
+
+    def _registered_labels(self, dimension: str) -> List:
+        """Label list of a dimension that grows as data is added."""
+        return {'cycle': self.cycles, 'department': self.departments,
+                'faculty': self.faculties, 'category': self.categories}[dimension]
+
+    def _labels(self, dimension: str) -> Sequence:
+        if dimension == 'item_type':
+            return ITEM_TYPES
+        return self._registered_labels(dimension)
+
+    def _codes(self, dimension: str, labels: Sequence) -> np.ndarray:
+        if dimension == 'item_type':
+            index = {name: code for code, name in enumerate(ITEM_TYPES)}
+        else:
+            index = self._index[dimension]
+        try:
+            return np.array([index[label] for label in labels], dtype=np.int64)
+        except KeyError as error:
+            raise KeyError(f"Unknown {dimension}: {error.args[0]!r}") from None
+
+    def _register(self, dimension: str, labels) -> np.ndarray:
+        """Codes of labels, adding new ones to the dimension."""
+        index = self._index[dimension]
+        names = self._registered_labels(dimension)
+        for label in labels:
+            if label not in index:
+                index[label] = len(names)
+                names.append(label)
+        return np.array([index[label] for label in labels], dtype=np.int64)
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def add_cycle(self, cycle, items, result: Optional[BulkAssessmentResult] = None):
+        """
+        Aggregate one cycle's item scores into the cube.
+
+        Args:
+            cycle: Cycle label; must sort after every cycle already added
+            items: BulkItems or long-format DataFrame for the cycle
+            result: assess_departments(items) if already computed
+
+        Raises:
+            ValueError: If the cycle is not after the last one
+        """
+        if not isinstance(items, BulkItems):
+            items = BulkItems.from_frame(items)
+        if result is None:
+            result = assess_departments(items)
+        self.add_scores(
+            cycle,
+            department=items.departments[items.department],
+            category=np.asarray(items.categories, dtype=object)[items.category],
+            item_type=items.item_type,
+            point_value=items.point_value,
+            item_score=result.item_score,
+        )
+
+    def add_scores(self, cycle, department, category, item_type, point_value, item_score):
+        """
+        Aggregate one cycle from item-level columns.
+
+        Args:
+            cycle: Cycle label; must sort after every cycle already added
+            department, category: (N,) labels
+            item_type: (N,) PROCESS_ITEM / RESULTS_ITEM codes
+            point_value, item_score: (N,) values
+        """
+        if self.cycles and not self.cycles[-1] < cycle:
+            raise ValueError(
+                f"Cycles must be added in increasing order: {cycle!r} after {self.cycles[-1]!r}"
+            )
+        department = np.asarray(department)
+        d_labels, d_inverse = np.unique(department, return_inverse=True)
+        k_labels, k_inverse = np.unique(np.asarray(category), return_inverse=True)
+        d_codes = self._register('department', d_labels.tolist())[d_inverse.ravel()]
+        k_codes = self._register('category', k_labels.tolist())[k_inverse.ravel()]
+        new = self.departments[len(self._department_faculty):]
+        self._department_faculty = np.concatenate([
+            self._department_faculty,
+            self._register('faculty', [self.faculty_of.get(d, UNASSIGNED) for d in new]),
+        ])
+        self._register('cycle', [cycle])
+
+        _, n_departments, n_categories, n_types = self.shape
+        t = len(self.cycles) - 1
+        self._reserve(t + 1)
+        cell = (d_codes * n_categories + k_codes) * n_types + np.asarray(item_type, np.int64)
+        size = n_departments * n_categories * n_types
+        score = np.asarray(item_score, dtype=np.float64)
+        points = np.asarray(point_value, dtype=np.float64)
+        values = {
+            'count': np.bincount(cell, minlength=size),
+            'sum': grouped_exact_sum(cell, score, size),
+            'points': grouped_exact_sum(cell, points, size),
+            'weighted': grouped_exact_sum(cell, points * score, size),
+            'min': np.full(size, np.inf),
+            'max': np.full(size, -np.inf),
+        }
+        np.minimum.at(values['min'], cell, score)
+        np.maximum.at(values['max'], cell, score)
+        for name, flat in values.items():
+            self._cells[name][t] = flat.reshape(n_departments, n_categories, n_types)
+        self._roll_up_faculties(t)
+
+    def _reserve(self, n_cycles: int):
+        """Grow cell arrays to hold n_cycles and the current dimensions."""
+        _, n_departments, n_categories, n_types = self.shape
+        capacity = self._cells['count'].shape[0]
+        current = self._cells['count'].shape[1:3]
+        if capacity >= n_cycles and current == (n_departments, n_categories):
+            return
+        capacity = max(capacity, 1)
+        while capacity < n_cycles:
+            capacity *= 2
+        for name in _CELLS:
+            self._cells[name] = _resize(self._cells[name],
+                                        (capacity, n_departments, n_categories, n_types),
+                                        _FILL[name])
+        self._faculty_cells = {
+            name: _resize(self._faculty_cells[name],
+                          (capacity, len(self.faculties), n_categories, n_types), _FILL[name])
+            for name in _CELLS
+        }
+
+    def _roll_up_faculties(self, t: int):
+        faculty = self._department_faculty
+        n_faculties = len(self.faculties)
+        for name in _CELLS:
+            base = self._cells[name][t]
+            rolled = np.full((n_faculties,) + base.shape[1:], _FILL[name], dtype=base.dtype)
+            reduce = {'min': np.minimum, 'max': np.maximum}.get(name, np.add)
+            reduce.at(rolled, faculty, base)
+            self._faculty_cells[name][t] = rolled
+
+    @classmethod
+    def from_panel(cls, panel, faculty_of: Optional[Mapping] = None) -> 'ScoreCube':
+        """Build a cube from every cycle of a PanelStore."""
+        cube = cls(faculty_of)
+        departments = panel.departments
+        categories = np.asarray(panel.categories, dtype=object)
+        for t, cycle in enumerate(panel.cycles):
+            scores = panel.select('item_score', cycle, cycle)[0]
+            d, i = np.nonzero(~np.isnan(scores))
+            cube.add_scores(cycle, departments[d], categories[panel.item_category[i]],
+                            panel.item_type[i], panel.point_value[i], scores[d, i])
+        return cube
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def query(
+        self,
+        measure: str = 'weighted_mean',
+        cycles: Optional[Sequence] = None,
+        departments: Optional[Sequence] = None,
+        faculties: Optional[Sequence] = None,
+        categories: Optional[Sequence] = None,
+        item_types: Optional[Sequence] = None,
+        by: Sequence[str] = ()
+    ) -> Union[float, np.ndarray]:
+        """
+        Aggregate the selected cells.
+
+        Filters select labels along a dimension (all labels if None);
+        dimensions listed in ``by`` are kept as output axes, in that order,
+        with labels in filter order (or cube order: self.cycles,
+        self.departments, self.faculties, self.categories, ITEM_TYPES).
+        Every other dimension is rolled up.
+
+        Args:
+            measure: One of MEASURES
+            cycles, departments, faculties, categories, item_types: Filters
+            by: Dimensions to group by (department and faculty are exclusive)
+
+        Returns:
+            float for an empty ``by``, else an ndarray; NaN (count 0) for
+            empty selections
+
+        Example:
+            >>> cube.query('count', by=['faculty', 'item_type'])
+        """
+        if measure not in MEASURES:
+            raise ValueError(f"measure must be one of {MEASURES}, got {measure!r}")
+        by = list(by)
+        unknown = [dimension for dimension in by if dimension not in DIMENSIONS]
+        if unknown or len(set(by)) != len(by):
+            raise ValueError(f"by must list distinct dimensions from {DIMENSIONS}, got {by}")
+        if 'department' in by and 'faculty' in by:
+            raise ValueError("Group by department or faculty, not both")
+
+        use_departments = departments is not None or 'department' in by
+        if use_departments:
+            if 'faculty' in by:
+                raise ValueError("Filter by faculties (not departments) when grouping by faculty")
+            cells, unit = self._cells, 'department'
+            rows = (np.arange(len(self.departments)) if departments is None
+                    else self._codes('department', departments))
+            if faculties is not None:
+                keep = np.isin(self._department_faculty[rows], self._codes('faculty', faculties))
+                rows = rows[keep]
+        else:
+            cells, unit = self._faculty_cells, 'faculty'
+            rows = (np.arange(len(self.faculties)) if faculties is None
+                    else self._codes('faculty', faculties))
+
+        selectors = [
+            self._codes('cycle', cycles) if cycles is not None else slice(0, len(self.cycles)),
+            rows,
+            self._codes('category', categories) if categories is not None else slice(None),
+            self._codes('item_type', item_types) if item_types is not None else slice(None),
+        ]
+        axes = ['cycle', unit, 'category', 'item_type']
+        kept = [axes.index(dimension) for dimension in by]
+        dropped = tuple(a for a in range(4) if a not in kept)
+
+        def reduce(name):
+            block = cells[name]
+            for axis, selector in enumerate(selectors):
+                block = block[(slice(None),) * axis + (selector,)]
+            reducer = {'min': np.min, 'max': np.max}.get(name, np.sum)
+            if 0 in block.shape:
+                return np.full([block.shape[a] for a in kept], _FILL[name], dtype=block.dtype)
+            return np.transpose(reducer(block, axis=dropped), np.argsort(np.argsort(kept)))
+
+        if measure in _DERIVED:
+            numerator, denominator = (reduce(name) for name in _DERIVED[measure])
+            with np.errstate(invalid='ignore', divide='ignore'):
+                value = np.where(denominator > 0, numerator / np.where(denominator > 0,
+                                                                       denominator, 1), np.nan)
+        else:
+            value = reduce(measure).astype(np.float64)
+            if measure in ('min', 'max'):
+                value[np.isinf(value)] = np.nan
+        return float(value) if value.ndim == 0 else value
+
+    def query_frame(self, measures: Sequence[str] = ('weighted_mean', 'count'),
+                    by: Sequence[str] = ('cycle', 'faculty', 'category'), **filters):
+        """Return grouped measures as a long pandas DataFrame (one row per group)."""
+        import pandas as pd
+
+        by = list(by)
+        labels = [list(self._labels(d) if filters.get(_PLURAL[d]) is None
+                       else filters[_PLURAL[d]]) for d in by]
+        grid = pd.MultiIndex.from_product(labels, names=by).to_frame(index=False)
+        for measure in measures:
+            grid[measure] = np.ravel(self.query(measure, by=by, **filters))
+        return grid
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: Union[str, Path]):
+        """
+        Write base cells as .npy arrays plus manifest.json.
+
+        Labels may be numbers, strings, dates, datetimes or tuples of these
+        (encoded as in PanelStore.save).
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        n = len(self.cycles)
+        for name in _CELLS:
+            np.save(path / f'{name}.npy', self._cells[name][:n])
+        manifest = {
+            'format': CUBE_FORMAT,
+            'cycles': _to_json(self.cycles),
+            'departments': _to_json(self.departments),
+            'categories': list(self.categories),
+            'faculties': _to_json(self.faculties),
+            'department_faculty': self._department_faculty.tolist(),
+            'faculty_of': [_to_json(pair) for pair in self.faculty_of.items()],
+        }
+        (path / 'manifest.json').write_text(json.dumps(manifest, indent=2))
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'ScoreCube':
+        """
+        Load a cube written by save().
+
+        Raises:
+            ValueError: If the directory was written by an incompatible version
+        """
+        path = Path(path)
+        manifest = json.loads((path / 'manifest.json').read_text())
+        if manifest.get('format') != CUBE_FORMAT:
+            raise ValueError(f"Unsupported cube format: {manifest.get('format')!r}")
+        cube = cls(dict(_from_json(pair) for pair in manifest['faculty_of']))
+        for dimension in ('cycle', 'department', 'category', 'faculty'):
+            cube._register(dimension, _from_json(manifest[_PLURAL[dimension]]))
+        cube._department_faculty = np.array(manifest['department_faculty'], dtype=np.int64)
+        cube._cells = {name: np.load(path / f'{name}.npy') for name in _CELLS}
+        shape = cube._cells['count'].shape
+        cube._faculty_cells = {
+            name: np.full((shape[0], len(cube.faculties)) + shape[2:], _FILL[name],
+                          dtype=cube._cells[name].dtype)
+            for name in _CELLS
+        }
+        for t in range(len(cube.cycles)):
+            cube._roll_up_faculties(t)
+        return cube
+
+
+__all__ = [
+    'DIMENSIONS',
+    'MEASURES',
+    'UNASSIGNED',
+    'ScoreCube',
+]
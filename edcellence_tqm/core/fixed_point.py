@@ -0,0 +1,416 @@
+"""
+Fixed-Point Scoring
+===================
+
+Integer counterparts of Equations 1-4 at the scales of the database schema
+(scripts/schema_simplified.sql):
+
+    indicators      DECIMAL(4,3)  → uint16 thousandths  (0..1000)
+    weights         DECIMAL(4,3)  → int64 basis points  (0..10000)
+    item, category
+    and organizational
+    scores          DECIMAL(5,2)  → uint16 hundredths   (0..10000)
+
+The float path computes in float64 and leaves rounding to the database, so
+a reconciliation run compares 73.245000000001 against a stored 73.24 or
+73.25. Here every step is exact integer arithmetic followed by one explicit
+rounding to the DB scale:
+
+    Eq 1/2  S_i = round(Σ w_d·x_d / 10³)          w in bp, x in thousandths
+    Eq 3    C_k = round(Σ v_i·S_i / Σ v_i)        S in hundredths
+    Eq 4    O   = round(Σ W_k·C_k / 10⁴)          W in bp, C in hundredths
+
+Categories aggregate the rounded item scores, as a query over the stored
+item_score column would. Rounding is half-even by default; 'half_up'
+(half away from zero, as ROUND() on NUMERIC in PostgreSQL and MySQL) is
+available for databases that round that way. Results are identical on every
+platform, and uint16 inputs and outputs take a quarter of the memory of
+float64.
+
+Authors: Rajamangala University of Technology Krungthep Research Team
+License: MIT
+Version: 1.0.0
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Optional, Tuple
+import numpy as np
+
+from edcellence_tqm.core.bulk import BulkItems
+from edcellence_tqm.core.item_table import PROCESS_ITEM
+from edcellence_tqm.core.weights import WeightsLike, as_weight_profile
+
+INDICATOR_SCALE = 1_000  # DECIMAL(4,3)
+SCORE_SCALE = 100  # DECIMAL(5,2)
+WEIGHT_SCALE = 10_000  # basis points
+
+ROUNDING_MODES = ('half_even', 'half_up')
+
+
+# ============================================================================
+# Conversions
+# ============================================================================
+
+def _check_rounding(rounding: str):
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f"rounding must be one of {ROUNDING_MODES}, got {rounding!r}")
+
+
+def divide_rounded(numerator, denominator, rounding: str = 'half_even') -> np.ndarray:
+    """
+    Integer division of non-negative integers rounded to the nearest integer.
+
+    Args:
+        numerator: Non-negative integer array
+        denominator: Positive integer array or scalar (broadcast)
+        rounding: 'half_even' (ties to even) or 'half_up' (ties away from zero)
+
+    Returns:
+        np.ndarray: int64 quotients
+
+    Example:
+        >>> divide_rounded([5, 15, 25, 26], 10)
+        array([0, 2, 2, 3])
+    """
+    _check_rounding(rounding)
+    numerator = np.asarray(numerator, dtype=np.int64)
+    denominator = np.asarray(denominator, dtype=np.int64)
+    quotient, remainder = np.divmod(numerator, denominator)
+    twice = 2 * remainder
+    up = twice > denominator
+    tie = twice == denominator
+    if rounding == 'half_even':
+        tie &= (quotient & 1) == 1
+    return quotient + (up | tie)
+
+
+def to_fixed(values, scale: int = INDICATOR_SCALE, dtype=np.uint16) -> np.ndarray:
+    """
+    Convert decimal values in [0, 1] (or [0, 100] for scores) to scaled integers.
+
+    Floats are rounded half-even after scaling, which is exact for values
+    that already have at most log10(scale) decimals (e.g. values read from
+    the DECIMAL columns).
+
+    Args:
+        values: Array-like of non-negative decimals
+        scale: INDICATOR_SCALE (thousandths) or SCORE_SCALE (hundredths)
+        dtype: Integer storage type
+
+    Returns:
+        np.ndarray of scaled integers
+
+    Raises:
+        ValueError: If a value is NaN, negative or does not fit the dtype
+    """
+    values = np.asarray(values, dtype=np.float64)
+    scaled = np.rint(values * scale)
+    # NaN fails both comparisons
+    invalid = ~((scaled >= 0) & (scaled <= np.iinfo(dtype).max))
+    if invalid.any():
+        bad = values.ravel()[np.flatnonzero(invalid.ravel())[0]]
+        raise ValueError(f"Value {bad} cannot be stored at scale {scale} as {np.dtype(dtype)}")
+    return scaled.astype(dtype)
+
+
+def from_fixed(values, scale: int = SCORE_SCALE) -> np.ndarray:
+    """Convert scaled integers back to float64 decimals (e.g. hundredths → score)."""
+    return np.asarray(values, dtype=np.float64) / scale
+
+
+def to_decimal(values, scale: int = SCORE_SCALE) -> np.ndarray:
+    """Convert scaled integers to an object array of exact decimal.Decimal values."""
+    exponent = -len(str(scale)) + 1
+    integers = np.asarray(values, dtype=np.int64)
+    return np.array([Decimal(v).scaleb(exponent) for v in integers.ravel().tolist()],
+                    dtype=object).reshape(integers.shape)
+
+
+def basis_points(weights: Optional[WeightsLike], kind: str) -> np.ndarray:
+    """
+    Return a weight profile as int64 basis points in canonical order.
+
+    Args:
+        weights: WeightProfile, dict, vector or None (defaults for kind)
+        kind: 'adli', 'letci' or 'category'
+
+    Returns:
+        np.ndarray: int64 basis points summing to 10000
+
+    Raises:
+        ValueError: If a weight is not a whole number of basis points
+    """
+    profile = as_weight_profile(weights, kind)
+    scaled = np.asarray(profile.weights, dtype=np.float64) * WEIGHT_SCALE
+    points = np.rint(scaled).astype(np.int64)
+    inexact = np.flatnonzero(np.abs(scaled - points) > 1e-6)
+    if len(inexact):
+        j = inexact[0]
+        raise ValueError(
+            f"Weight {profile.dimensions[j]}={profile.weights[j]} is not a whole number "
+            f"of basis points"
+        )
+    if points.sum() != WEIGHT_SCALE:
+        raise ValueError(f"Basis-point weights must sum to {WEIGHT_SCALE}, got {points.sum()}")
+    return points
+
+
+# ============================================================================
+# Equations 1-4
+# ============================================================================
+
+def _weighted_thousandths(indicators: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """Σ w_d·x_d per row in int64 (w in basis points, x in thousandths)."""
+    total = np.zeros(len(indicators), dtype=np.int64)
+    for j, weight in enumerate(points.tolist()):
+        total += indicators[:, j].astype(np.int64) * weight
+    return total
+
+
+def compute_item_scores_fixed(
+    indicators,
+    weights: Optional[WeightsLike] = None,
+    kind: str = 'adli',
+    rounding: str = 'half_even'
+) -> np.ndarray:
+    """
+    Fixed-point Equation 1 (kind='adli') or Equation 2 (kind='letci').
+
+    Args:
+        indicators: (N, 4) indicators as uint16 thousandths in canonical order
+        weights: Optional WeightProfile or dict (defaults for kind if None)
+        kind: 'adli' or 'letci'
+        rounding: 'half_even' or 'half_up'
+
+    Returns:
+        np.ndarray: (N,) uint16 scores in hundredths (0..10000)
+
+    Example:
+        >>> X = to_fixed([[0.805, 0.70, 0.65, 0.75]])
+        >>> compute_item_scores_fixed(X)  # 100·(.3·.805+.3·.7+.2·.65+.2·.75) = 73.15
+        array([7315], dtype=uint16)
+    """
+    indicators = np.asarray(indicators)
+    if indicators.ndim != 2 or indicators.shape[1] != 4:
+        raise ValueError(f"Indicators must have shape (N, 4), got {indicators.shape}")
+    if indicators.dtype.kind not in 'iu':
+        raise ValueError(f"Fixed-point indicators must be integers, got {indicators.dtype}")
+    if np.any(indicators < 0) or np.any(indicators > INDICATOR_SCALE):
+        raise ValueError(f"Fixed-point indicators must be in range [0,{INDICATOR_SCALE}]")
+    total = _weighted_thousandths(indicators, basis_points(weights, kind))
+    return divide_rounded(total, INDICATOR_SCALE, rounding).astype(np.uint16)
+
+
+def compute_category_score_fixed(
+    item_scores,
+    item_point_values,
+    rounding: str = 'half_even'
+) -> int:
+    """
+    Fixed-point Equation 3 for one category.
+
+    Args:
+        item_scores: Item scores in hundredths
+        item_point_values: Integer point allocations
+
+    Returns:
+        int: Category score in hundredths (0 for an empty category)
+
+    Raises:
+        ValueError: If the lengths differ or the point values sum to zero
+    """
+    scores = np.asarray(item_scores, dtype=np.int64)
+    points = np.asarray(item_point_values, dtype=np.int64)
+    if scores.shape != points.shape:
+        raise ValueError("item_scores and item_point_values must have same length")
+    if len(scores) == 0:
+        return 0
+    if points.sum() == 0:
+        raise ValueError("Total point values cannot be zero")
+    return int(divide_rounded(np.dot(scores, points), points.sum(), rounding))
+
+
+def compute_organizational_scores_fixed(
+    category_scores,
+    category_weights: Optional[WeightsLike] = None,
+    rounding: str = 'half_even'
+) -> np.ndarray:
+    """
+    Fixed-point Equation 4 over the last axis.
+
+    Args:
+        category_scores: (..., 7) category scores in hundredths, columns in
+                         the category profile's dimension order
+        category_weights: Optional category WeightProfile or dict (EdPEx
+                          defaults if None)
+
+    Returns:
+        np.ndarray: (...,) uint16 organizational scores in hundredths
+    """
+    points = basis_points(category_weights, 'category')
+    scores = np.asarray(category_scores, dtype=np.int64)
+    if scores.shape[-1] != len(points):
+        raise ValueError(f"Expected {len(points)} category columns, got {scores.shape[-1]}")
+    return divide_rounded(scores @ points, WEIGHT_SCALE, rounding).astype(np.uint16)
+
+
+# ============================================================================
+# Bulk Pipeline
+# ============================================================================
+
+@dataclass
+class FixedPointAssessment:
+    """
+    Equations 1-4 for many departments at DB scale.
+
+    Attributes:
+        departments: (D,) department labels
+        categories: Category names for the columns of category_scores
+        organizational_score: (D,) uint16 hundredths
+        category_scores: (D, K) uint16 hundredths (0 where a department has
+                         no items in a category; see category_item_counts)
+        category_item_counts: (D, K) number of items per department x category
+        item_score: (N,) uint16 hundredths aligned with the assessed rows
+        rounding: Rounding mode used
+    """
+    departments: np.ndarray
+    categories: Tuple[str, ...]
+    organizational_score: np.ndarray
+    category_scores: np.ndarray
+    category_item_counts: np.ndarray
+    item_score: np.ndarray
+    rounding: str = 'half_even'
+
+    def __len__(self) -> int:
+        return len(self.departments)
+
+    def to_frame(self, decimal: bool = False):
+        """
+        Return department-level scores as a pandas DataFrame.
+
+        Args:
+            decimal: Exact decimal.Decimal values instead of float64
+        """
+        import pandas as pd
+
+        convert = to_decimal if decimal else from_fixed
+        frame = pd.DataFrame({
+            'department': self.departments,
+            'organizational_score': convert(self.organizational_score),
+        })
+        scores = convert(self.category_scores).astype(object)
+        scores[self.category_item_counts == 0] = None
+        for k, name in enumerate(self.categories):
+            frame[name] = scores[:, k]
+        return frame
+
+
+def assess_departments_fixed(
+    items: BulkItems,
+    adli_weights: Optional[WeightsLike] = None,
+    letci_weights: Optional[WeightsLike] = None,
+    category_weights: Optional[WeightsLike] = None,
+    indicators: Optional[np.ndarray] = None,
+    rounding: str = 'half_even'
+) -> FixedPointAssessment:
+    """
+    Compute fixed-point Equations 1-4 for every department of a BulkItems table.
+
+    Args:
+        items: BulkItems table
+        adli_weights: Optional ADLI WeightProfile or dict (NIST defaults if None)
+        letci_weights: Optional LeTCI WeightProfile or dict (Baldrige defaults if None)
+        category_weights: Optional category WeightProfile or dict (EdPEx defaults if None)
+        indicators: Optional (N, 4) uint16 thousandths aligned with the rows
+                    of items; converted from items.indicators if None
+        rounding: 'half_even' or 'half_up'
+
+    Returns:
+        FixedPointAssessment
+
+    Raises:
+        ValueError: If a weight is not a whole number of basis points, or a
+                    department lacks a weighted category (as in
+                    assess_departments)
+
+    Example:
+        >>> items = BulkItems.from_csv('data/examples/sample_assessment_data.csv')
+        >>> assess_departments_fixed(items).to_frame(decimal=True)
+    """
+    _check_rounding(rounding)
+    if indicators is None:
+        indicators = to_fixed(items.indicators)
+    elif indicators.shape != (len(items), 4):
+        raise ValueError(f"Indicators must have shape ({len(items)}, 4), got {indicators.shape}")
+    category_points = basis_points(category_weights, 'category')
+    category_profile = as_weight_profile(category_weights, 'category')
+
+    # Equations 1-2
+    is_process = items.item_type == PROCESS_ITEM
+    item_score = np.empty(len(items), dtype=np.uint16)
+    item_score[is_process] = compute_item_scores_fixed(
+        indicators[is_process], adli_weights, 'adli', rounding)
+    item_score[~is_process] = compute_item_scores_fixed(
+        indicators[~is_process], letci_weights, 'letci', rounding)
+
+    # Equation 3: integer grouped sums per department x category
+    n_departments, n_categories = items.n_departments, len(items.categories)
+    cell = items.department * n_categories + items.category
+    size = n_departments * n_categories
+    points = items.point_value.astype(np.int64)
+    numerator = np.zeros(size, dtype=np.int64)
+    denominator = np.zeros(size, dtype=np.int64)
+    np.add.at(numerator, cell, item_score.astype(np.int64) * points)
+    np.add.at(denominator, cell, points)
+    counts = np.bincount(cell, minlength=size).reshape(n_departments, n_categories)
+    if np.any((denominator == 0) & (counts.ravel() > 0)):
+        raise ValueError("Total point values cannot be zero")
+    category_scores = np.zeros(size, dtype=np.int64)
+    present = denominator > 0
+    category_scores[present] = divide_rounded(numerator[present], denominator[present],
+                                              rounding)
+    category_scores = category_scores.reshape(n_departments, n_categories).astype(np.uint16)
+
+    # Equation 4
+    columns = []
+    for name in category_profile.dimensions:
+        if name not in items.categories:
+            raise ValueError(f"Missing score for category: {name}")
+        k = items.categories.index(name)
+        missing = np.flatnonzero(counts[:, k] == 0)
+        if len(missing):
+            raise ValueError(
+                f"Missing score for category: {name} "
+                f"(department {items.departments[missing[0]]!r})"
+            )
+        columns.append(k)
+    total = category_scores[:, columns].astype(np.int64) @ category_points
+    organizational_score = divide_rounded(total, WEIGHT_SCALE, rounding).astype(np.uint16)
+
+    return FixedPointAssessment(
+        departments=items.departments,
+        categories=items.categories,
+        organizational_score=organizational_score,
+        category_scores=category_scores,
+        category_item_counts=counts,
+        item_score=item_score,
+        rounding=rounding,
+    )
+
+
+__all__ = [
+    'INDICATOR_SCALE',
+    'SCORE_SCALE',
+    'WEIGHT_SCALE',
+    'FixedPointAssessment',
+    'assess_departments_fixed',
+    'basis_points',
+    'compute_category_score_fixed',
+    'compute_item_scores_fixed',
+    'compute_organizational_scores_fixed',
+    'divide_rounded',
+    'from_fixed',
+    'to_decimal',
+    'to_fixed',
+]
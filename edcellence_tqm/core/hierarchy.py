@@ -0,0 +1,409 @@
+"""
+Hierarchical Roll-up
+====================
+
+Aggregates department assessments up an organizational hierarchy such as
+department → faculty → institution (dim_department.faculty_name), with
+incremental maintenance.
+
+Every node reports the weighted means of its descendant departments:
+
+    score_n = Σ_d w_d·score_d / Σ_d w_d        (d under node n)
+
+for the organizational score, the IHI and each category score (a category
+averages only the departments that assessed it), plus the node's top-k gap
+priorities across its departments. Department weights w_d are equal, or the
+department's student_count or staff_count.
+
+Each node keeps its weighted sums in ExactAccumulator partials. Changing
+one department subtracts its previous contribution from, and adds the new
+one to, the nodes on its path to the root only; because the sums are exact,
+the result is bit-identical to rebuilding the tree. A node's top-k list is
+re-merged from its children's top-k lists (O(children·k) per ancestor).
+Each touched node's summary is rebuilt during the update, so reading any
+node afterwards is a dict lookup.
+
+Authors: Rajamangala University of Technology Krungthep Research Team
+License: MIT
+Version: 1.0.0
+"""
+
+import math
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+import numpy as np
+
+from edcellence_tqm.core.maturity import DEFAULT_MATURITY_BANDS, MaturityBands
+from edcellence_tqm.core.ranking import TopKAccumulator
+from edcellence_tqm.core.summation import ExactAccumulator
+
+WEIGHTINGS = ('equal', 'student_count', 'staff_count')
+DEFAULT_ROOT = 'Institution'
+
+NodePath = Tuple
+NodeLike = Union[NodePath, str]
+
+
+# ============================================================================
+# Hierarchy
+# ============================================================================
+
+class Hierarchy:
+    """
+    Tree of departments under named grouping levels.
+
+    Nodes are identified by their path from the root, e.g.
+    ('Institution', 'Engineering', 'Computer Science') for a department or
+    ('Institution', 'Engineering') for a faculty.
+
+    Example:
+        >>> hierarchy = Hierarchy.from_frame(dim_department, levels=['faculty_name'])
+        >>> hierarchy.parent(('Institution', 'Engineering', 'Computer Science'))
+        ('Institution', 'Engineering')
+    """
+
+    def __init__(
+        self,
+        paths: Mapping[object, Sequence],
+        root: str = DEFAULT_ROOT,
+        attributes: Optional[Mapping[str, Mapping[object, float]]] = None
+    ):
+        """
+        Initialize a hierarchy.
+
+        Args:
+            paths: {department: [level labels from the top]}, e.g.
+                   {'Computer Science': ['Engineering']}; an empty path
+                   attaches the department directly to the root
+            root: Root node label
+            attributes: Optional {attribute: {department: value}}, e.g.
+                        student_count and staff_count used as weights
+
+        Raises:
+            ValueError: If a department is also used as a grouping label on
+                        the same path
+        """
+        self.root: NodePath = (root,)
+        self._parent: Dict[NodePath, Optional[NodePath]] = {self.root: None}
+        self._children: Dict[NodePath, List[NodePath]] = {self.root: []}
+        self._leaf: Dict[object, NodePath] = {}
+        for department, groups in paths.items():
+            node: NodePath = self.root
+            for label in list(groups) + [department]:
+                child = node + (label,)
+                if child not in self._parent:
+                    self._parent[child] = node
+                    self._children[child] = []
+                    self._children[node].append(child)
+                node = child
+            self._leaf[department] = node
+        for path in self._leaf.values():
+            if self._children[path]:
+                raise ValueError(f"Department {path[-1]!r} is also a grouping node")
+        self._by_label: Dict[object, List[NodePath]] = {}
+        for path in self._parent:
+            self._by_label.setdefault(path[-1], []).append(path)
+        self.attributes = {name: dict(values) for name, values in (attributes or {}).items()}
+
+    @classmethod
+    def from_frame(
+        cls,
+        frame,
+        levels: Sequence[str] = ('faculty_name',),
+        department: str = 'department',
+        root: str = DEFAULT_ROOT
+    ) -> 'Hierarchy':
+        """
+        Build a hierarchy from a dim_department-style DataFrame.
+
+        Args:
+            frame: One row per department
+            levels: Grouping columns from the top, e.g. ['faculty_name'] or
+                    ['faculty_name', 'department_type']; a missing label
+                    attaches the department to the level above
+            department: Department label column
+            root: Root node label
+
+        Raises:
+            ValueError: If a department appears twice
+        """
+        labels = frame[department].tolist()
+        if len(set(labels)) != len(labels):
+            raise ValueError("Each department must appear once")
+        columns = [frame[level].tolist() for level in levels]
+        paths = {
+            label: [group[i] for group in columns if group[i] is not None and group[i] == group[i]]
+            for i, label in enumerate(labels)
+        }
+        attributes = {
+            name: dict(zip(labels, frame[name].to_numpy(dtype=np.float64).tolist()))
+            for name in WEIGHTINGS[1:] if name in frame
+        }
+        return cls(paths, root, attributes)
+
+    @property
+    def departments(self) -> List:
+        return list(self._leaf)
+
+    @property
+    def nodes(self) -> List[NodePath]:
+        return list(self._parent)
+
+    def leaf(self, department) -> NodePath:
+        """Path of a department's node."""
+        try:
+            return self._leaf[department]
+        except KeyError:
+            raise KeyError(f"Unknown department: {department!r}") from None
+
+    def parent(self, node: NodePath) -> Optional[NodePath]:
+        return self._parent[node]
+
+    def children(self, node: NodePath) -> List[NodePath]:
+        return list(self._children[node])
+
+    def ancestors(self, node: NodePath) -> List[NodePath]:
+        """Nodes from node's parent up to the root."""
+        path: List[NodePath] = []
+        parent = self._parent[node]
+        while parent is not None:
+            path.append(parent)
+            parent = self._parent[parent]
+        return path
+
+    def resolve(self, node: NodeLike) -> NodePath:
+        """
+        Return the path of a node given its path or a unique label.
+
+        Raises:
+            KeyError: If the label names no node or more than one
+        """
+        if isinstance(node, tuple):
+            if node not in self._parent:
+                raise KeyError(f"Unknown node: {node!r}")
+            return node
+        matches = self._by_label.get(node, [])
+        if len(matches) != 1:
+            problem = 'Unknown' if not matches else 'Ambiguous'
+            raise KeyError(f"{problem} node label {node!r}; pass the node path")
+        return matches[0]
+
+    def weight(self, department, weighting: str) -> float:
+        """
+        Roll-up weight of a department.
+
+        Raises:
+            ValueError: If the weighting is unknown or the attribute is
+                        missing or negative for the department
+        """
+        if weighting not in WEIGHTINGS:
+            raise ValueError(f"weighting must be one of {WEIGHTINGS}, got {weighting!r}")
+        if weighting == 'equal':
+            return 1.0
+        value = self.attributes.get(weighting, {}).get(department)
+        if value is None or not math.isfinite(value) or value < 0:
+            raise ValueError(f"Department {department!r} has no valid {weighting}: {value!r}")
+        return float(value)
+
+
+# ============================================================================
+# Roll-up Engine
+# ============================================================================
+
+class _Contribution:
+    """A department's weighted terms, kept so they can be subtracted exactly."""
+
+    __slots__ = ('weight', 'score', 'ihi', 'categories', 'gaps')
+
+    def __init__(self, weight: float, result: Dict):
+        self.weight = weight
+        self.score = weight * float(result['organizational_score'])
+        self.ihi = weight * float(result['ihi'])
+        self.categories = {name: weight * float(score)
+                           for name, score in result['category_scores'].items()}
+        self.gaps = [(item_id, float(score)) for item_id, score in result['gap_priorities']]
+
+
+class _NodeSums:
+    """Exact weighted sums of one node's departments."""
+
+    __slots__ = ('departments', 'weight', 'score', 'ihi', 'category_weight',
+                 'category_score', 'top')
+
+    def __init__(self):
+        self.departments = 0
+        self.weight = ExactAccumulator()
+        self.score = ExactAccumulator()
+        self.ihi = ExactAccumulator()
+        self.category_weight: Dict[str, ExactAccumulator] = {}
+        self.category_score: Dict[str, ExactAccumulator] = {}
+        self.top: List[Tuple[object, str, float]] = []
+
+    def apply(self, c: _Contribution, sign: float):
+        self.departments += int(sign)
+        self.weight.add(sign * c.weight)
+        self.score.add(sign * c.score)
+        self.ihi.add(sign * c.ihi)
+        for name, weighted in c.categories.items():
+            self.category_weight.setdefault(name, ExactAccumulator()).add(sign * c.weight)
+            self.category_score.setdefault(name, ExactAccumulator()).add(sign * weighted)
+
+
+def _mean(total: ExactAccumulator, weight: ExactAccumulator) -> float:
+    w = weight.value()
+    return total.value() / w if w > 0 else float('nan')
+
+
+class RollupEngine:
+    """
+    Incrementally maintained roll-up of department assessments.
+
+    Example:
+        >>> rollup = RollupEngine(hierarchy, weighting='student_count')
+        >>> for department, result in bulk_result.iter_department_results():
+        ...     rollup.set_department(department, result)
+        >>> rollup.get('Engineering')['organizational_score']
+        68.4
+        >>> rollup.set_department('Computer Science', new_result)  # path only
+    """
+
+    def __init__(
+        self,
+        hierarchy: Hierarchy,
+        weighting: str = 'equal',
+        top_k: int = 10,
+        maturity_bands: Optional[MaturityBands] = None
+    ):
+        """
+        Initialize an empty roll-up.
+
+        Args:
+            hierarchy: Department hierarchy
+            weighting: 'equal', 'student_count' or 'staff_count'
+            top_k: Gap priorities kept per node
+            maturity_bands: Band table for node maturity (MATURITY_BANDS if None)
+        """
+        if weighting not in WEIGHTINGS:
+            raise ValueError(f"weighting must be one of {WEIGHTINGS}, got {weighting!r}")
+        if top_k < 0:
+            raise ValueError(f"top_k must be non-negative, got {top_k}")
+        self.hierarchy = hierarchy
+        self.weighting = weighting
+        self.top_k = int(top_k)
+        self.maturity_bands = DEFAULT_MATURITY_BANDS if maturity_bands is None else maturity_bands
+        self._contributions: Dict[object, _Contribution] = {}
+        self._sums: Dict[NodePath, _NodeSums] = {node: _NodeSums() for node in hierarchy.nodes}
+        self._summaries: Dict[NodePath, Dict] = {}
+        for node in hierarchy.nodes:
+            self._summarize(node)
+
+    def __len__(self) -> int:
+        return len(self._contributions)
+
+    def __contains__(self, department) -> bool:
+        return department in self._contributions
+
+    def set_department(self, department, result: Dict):
+        """
+        Add or replace one department's assessment.
+
+        Args:
+            department: Department label in the hierarchy
+            result: compute_organizational_assessment-style dict with
+                    'organizational_score', 'ihi', 'category_scores' and
+                    'gap_priorities'
+        """
+        leaf = self.hierarchy.leaf(department)
+        contribution = _Contribution(self.hierarchy.weight(department, self.weighting), result)
+        self._update(department, leaf, contribution)
+
+    def remove_department(self, department):
+        """Remove a department's assessment from every ancestor."""
+        if department not in self._contributions:
+            raise KeyError(f"Department {department!r} has no assessment")
+        self._update(department, self.hierarchy.leaf(department), None)
+
+    def set_departments(self, results: Iterable[Tuple[object, Dict]]):
+        """set_department for each (department, result), e.g. iter_department_results()."""
+        for department, result in results:
+            self.set_department(department, result)
+
+    def _update(self, department, leaf: NodePath, contribution: Optional[_Contribution]):
+        path = [leaf] + self.hierarchy.ancestors(leaf)
+        previous = self._contributions.pop(department, None)
+        if contribution is not None:
+            self._contributions[department] = contribution
+        for node in path:
+            sums = self._sums[node]
+            if previous is not None:
+                sums.apply(previous, -1.0)
+            if contribution is not None:
+                sums.apply(contribution, 1.0)
+            sums.top = self._merge_top(node, department, contribution)
+            self._summarize(node)
+
+    def _merge_top(self, node: NodePath, department,
+                   contribution: Optional[_Contribution]) -> List[Tuple[object, str, float]]:
+        top = TopKAccumulator(self.top_k)
+        children = self.hierarchy.children(node)
+        if not children:
+            if contribution is not None:
+                top.push(contribution.gaps, department=department)
+            return top.result()
+        for child in children:
+            top.push_entries(self._sums[child].top)
+        return top.result()
+
+    def _summarize(self, node: NodePath):
+        sums = self._sums[node]
+        score = _mean(sums.score, sums.weight)
+        self._summaries[node] = {
+            'node': node,
+            'organizational_score': score,
+            'ihi': _mean(sums.ihi, sums.weight),
+            'category_scores': {
+                name: _mean(sums.category_score[name], weight)
+                for name, weight in sums.category_weight.items() if weight.value() > 0
+            },
+            'gap_priorities': list(sums.top),
+            'maturity_level': (self.maturity_bands.describe(self.maturity_bands.classify_one(score))
+                               if math.isfinite(score) else None),
+            'departments': sums.departments,
+            'weight': sums.weight.value(),
+        }
+
+    def get(self, node: NodeLike) -> Dict:
+        """
+        Return a node's roll-up (O(1) for a node path).
+
+        Returns:
+            Dict with 'organizational_score', 'ihi', 'category_scores',
+            'gap_priorities' [(department, item_id, gap)], 'maturity_level',
+            'departments' (count assessed) and 'weight' (total weight);
+            scores are NaN for a node without assessed departments
+        """
+        return self._summaries[self.hierarchy.resolve(node)]
+
+    def to_frame(self):
+        """Return every node's scores as a pandas DataFrame (one row per node)."""
+        import pandas as pd
+
+        rows = []
+        for node, summary in self._summaries.items():
+            rows.append({
+                'node': node[-1],
+                'depth': len(node) - 1,
+                'parent': node[-2] if len(node) > 1 else None,
+                'organizational_score': summary['organizational_score'],
+                'ihi': summary['ihi'],
+                'departments': summary['departments'],
+                'weight': summary['weight'],
+                **summary['category_scores'],
+            })
+        return pd.DataFrame(rows)
+
+
+__all__ = [
+    'WEIGHTINGS',
+    'Hierarchy',
+    'RollupEngine',
+]
@@ -0,0 +1,384 @@
+"""
+Compact Indicator Types
+=======================
+
+Memory-lean alternatives to ADLIIndicators / LeTCIIndicators for holding
+many indicator sets, e.g. several years of item-level assessments.
+
+ADLIIndicators and LeTCIIndicators are mutable dataclasses with a per-object
+``__dict__``, over 200 bytes per item once the four floats are counted.
+This module provides:
+
+    FrozenADLIIndicators / FrozenLeTCIIndicators
+        Frozen, hashable dataclasses with ``__slots__`` (no ``__dict__``);
+        usable as dict keys and set members
+    IndicatorArray
+        N indicator sets in one C-contiguous (N, 4) float64 or float32
+        buffer (32 or 16 bytes per item), validated once in bulk
+    ADLIView / LeTCIView
+        Read-only row views handed out by IndicatorArray; they hold a
+        zero-copy reference to one buffer row
+
+All of them expose the same field attributes as the dataclasses, so they
+can be passed wherever a single ADLIIndicators / LeTCIIndicators is read:
+compute_adli_score / compute_letci_score, AssessmentEngine.add_process_item
+/ add_results_item / update_item, and the item dicts of
+compute_organizational_assessment. Views compare equal to (and hash like)
+the frozen types with the same values.
+
+Authors: Rajamangala University of Technology Krungthep Research Team
+License: MIT
+Version: 1.0.0
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+import numpy as np
+
+from edcellence_tqm.core.batch import (
+    ADLI_COLUMNS,
+    LETCI_COLUMNS,
+    _indicator_matrix,
+    weighted_dimension_scores,
+)
+from edcellence_tqm.core.weights import WeightsLike, as_weight_profile
+
+if TYPE_CHECKING:
+    from edcellence_tqm.core.adli_letci import ADLIIndicators, LeTCIIndicators
+
+INDICATOR_KINDS = ('adli', 'letci')
+_FIELDS = {'adli': ADLI_COLUMNS, 'letci': LETCI_COLUMNS}
+_DTYPES = (np.float64, np.float32)
+
+
+def _check_range(kind: str, values) -> None:
+    for value in values:
+        if not 0 <= value <= 1:
+            label = 'ADLI' if kind == 'adli' else 'LeTCI'
+            raise ValueError(f"{label} indicators must be in range [0,1], got {value}")
+
+
+# ============================================================================
+# Frozen Indicator Types
+# ============================================================================
+
+@dataclass(frozen=True)
+class FrozenADLIIndicators:
+    """Immutable, hashable, slotted ADLI indicators for process items."""
+    __slots__ = ADLI_COLUMNS
+    approach: float  # P_A ∈ [0,1]
+    deployment: float  # P_D ∈ [0,1]
+    learning: float  # P_L ∈ [0,1]
+    integration: float  # P_I ∈ [0,1]
+
+    def __post_init__(self):
+        """Validate indicator ranges."""
+        _check_range('adli', (self.approach, self.deployment, self.learning, self.integration))
+
+    def __reduce__(self):
+        # Slotted frozen instances cannot be restored by setattr
+        return (type(self), (self.approach, self.deployment, self.learning, self.integration))
+
+
+@dataclass(frozen=True)
+class FrozenLeTCIIndicators:
+    """Immutable, hashable, slotted LeTCI indicators for results items."""
+    __slots__ = LETCI_COLUMNS
+    level: float  # R_Lv ∈ [0,1]
+    trend: float  # R_Tr ∈ [0,1]
+    comparison: float  # R_Cp ∈ [0,1]
+    integration: float  # R_I ∈ [0,1]
+
+    def __post_init__(self):
+        """Validate indicator ranges."""
+        _check_range('letci', (self.level, self.trend, self.comparison, self.integration))
+
+    def __reduce__(self):
+        return (type(self), (self.level, self.trend, self.comparison, self.integration))
+
+
+_FrozenType = Type[Union[FrozenADLIIndicators, FrozenLeTCIIndicators]]
+_FROZEN_TYPES: Dict[str, _FrozenType] = {
+    'adli': FrozenADLIIndicators,
+    'letci': FrozenLeTCIIndicators,
+}
+
+
+def indicator_kind(indicators) -> Optional[str]:
+    """
+    Return 'adli' or 'letci' for any indicator object, None otherwise.
+
+    Recognizes ADLIIndicators / LeTCIIndicators, the frozen types, views and
+    any object with the matching field attributes.
+    """
+    kind: Optional[str] = getattr(type(indicators), 'kind', None)
+    if kind in INDICATOR_KINDS:
+        return kind
+    for kind in INDICATOR_KINDS:
+        if all(hasattr(indicators, name) for name in _FIELDS[kind]):
+            return kind
+    return None
+
+
+def indicator_values(indicators) -> tuple:
+    """Return an indicator object's four values in canonical order."""
+    kind = indicator_kind(indicators)
+    if kind is None:
+        raise TypeError(f"Expected ADLI or LeTCI indicators, got {type(indicators)}")
+    return tuple(getattr(indicators, name) for name in _FIELDS[kind])
+
+
+def freeze(indicators):
+    """Return a FrozenADLIIndicators / FrozenLeTCIIndicators copy of any indicator object."""
+    kind = indicator_kind(indicators)
+    if kind is None:
+        raise TypeError(f"Expected ADLI or LeTCI indicators, got {type(indicators)}")
+    return _FROZEN_TYPES[kind](*(float(v) for v in indicator_values(indicators)))
+
+
+# ============================================================================
+# Row Views
+# ============================================================================
+
+class IndicatorView:
+    """
+    Read-only view of one IndicatorArray row.
+
+    Holds a zero-copy reference to the row, so it reflects later writes to
+    the array's buffer. Field reads return Python floats.
+    """
+
+    __slots__ = ('_row',)
+    _row: np.ndarray
+    kind: str = ''
+    fields: Tuple[str, ...] = ()
+
+    def __init__(self, row: np.ndarray):
+        object.__setattr__(self, '_row', row)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only; write to IndicatorArray.values")
+
+    def astuple(self) -> tuple:
+        """Return the four values as Python floats."""
+        return tuple(self._row.tolist())
+
+    def freeze(self):
+        """Return an independent frozen copy of the values."""
+        return _FROZEN_TYPES[self.kind](*self.astuple())
+
+    def __eq__(self, other):
+        if indicator_kind(other) != self.kind:
+            return NotImplemented
+        return self.astuple() == indicator_values(other)
+
+    def __hash__(self):
+        # Equal to the hash of the frozen dataclass with the same values
+        return hash(self.astuple())
+
+    def __repr__(self):
+        values = ', '.join(f"{name}={value!r}"
+                           for name, value in zip(self.fields, self.astuple()))
+        return f"{type(self).__name__}({values})"
+
+    def __reduce__(self):
+        return (_FROZEN_TYPES[self.kind], self.astuple())
+
+
+def _field(column: int):
+    return property(lambda self: float(self._row[column]))
+
+
+class ADLIView(IndicatorView):
+    """Read-only ADLI indicators backed by an IndicatorArray row."""
+    __slots__ = ()
+    kind = 'adli'
+    fields = ADLI_COLUMNS
+    approach = _field(0)
+    deployment = _field(1)
+    learning = _field(2)
+    integration = _field(3)
+
+
+class LeTCIView(IndicatorView):
+    """Read-only LeTCI indicators backed by an IndicatorArray row."""
+    __slots__ = ()
+    kind = 'letci'
+    fields = LETCI_COLUMNS
+    level = _field(0)
+    trend = _field(1)
+    comparison = _field(2)
+    integration = _field(3)
+
+
+_VIEW_TYPES = {'adli': ADLIView, 'letci': LeTCIView}
+
+
+# ============================================================================
+# Indicator Array
+# ============================================================================
+
+class IndicatorArray:
+    """
+    N ADLI or LeTCI indicator sets in one (N, 4) buffer.
+
+    Integer indexing returns a view object, slicing returns an IndicatorArray
+    sharing the buffer (fancy and boolean indexing copy, as in NumPy).
+
+    Example:
+        >>> array = IndicatorArray(np.random.rand(1_000_000, 4), 'adli', dtype=np.float32)
+        >>> array.nbytes
+        16000000
+        >>> compute_adli_score(array[0]) == array.scores()[0]
+        True
+    """
+
+    def __init__(self, values, kind: str = 'adli', dtype=np.float64, validate: bool = True):
+        """
+        Initialize an indicator array.
+
+        Args:
+            values: (N, 4) array-like in canonical order (ADLI: approach,
+                    deployment, learning, integration; LeTCI: level, trend,
+                    comparison, integration)
+            kind: 'adli' or 'letci'
+            dtype: np.float64 or np.float32 storage
+            validate: Check shape and [0,1] range once in bulk; pass False
+                      only for values that are already validated
+
+        Raises:
+            ValueError: If kind or dtype is unsupported, or validation fails
+        """
+        if kind not in INDICATOR_KINDS:
+            raise ValueError(f"kind must be one of {INDICATOR_KINDS}, got {kind!r}")
+        dtype = np.dtype(dtype)
+        if dtype not in _DTYPES:
+            raise ValueError(f"dtype must be float64 or float32, got {dtype}")
+        if validate:
+            _indicator_matrix(values)
+        values = np.ascontiguousarray(values, dtype=dtype)
+        if values.ndim != 2 or values.shape[1] != 4:
+            raise ValueError(f"Indicators must have shape (N, 4), got {values.shape}")
+        self.kind = kind
+        self.values: np.ndarray = values
+
+    @classmethod
+    def from_objects(
+        cls,
+        objects: Iterable,
+        kind: Optional[str] = None,
+        dtype=np.float64
+    ) -> 'IndicatorArray':
+        """
+        Pack indicator objects (dataclasses, frozen types or views) into an array.
+
+        Args:
+            objects: Indicator objects of one kind
+            kind: 'adli' or 'letci' (inferred from the first object if None)
+            dtype: np.float64 or np.float32 storage
+
+        Raises:
+            ValueError: If the objects are of mixed or unknown kind, or empty
+                        without an explicit kind
+        """
+        objects = list(objects)
+        if kind is None:
+            if not objects:
+                raise ValueError("Cannot infer kind of an empty sequence; pass kind")
+            kind = indicator_kind(objects[0])
+        if kind not in INDICATOR_KINDS:
+            raise ValueError(f"Objects are not ADLI or LeTCI indicators: {type(objects[0])}")
+        fields = _FIELDS[kind]
+        try:
+            rows = [[getattr(obj, name) for name in fields] for obj in objects]
+        except AttributeError:
+            raise ValueError(f"All objects must be {kind.upper()} indicators") from None
+        return cls(np.array(rows, dtype=np.float64).reshape(-1, 4), kind, dtype=dtype)
+
+    @property
+    def fields(self) -> tuple:
+        """Field names of the four columns."""
+        return _FIELDS[self.kind]
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.values.dtype
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the buffer."""
+        return self.values.nbytes
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return _VIEW_TYPES[self.kind](self.values[index])
+        return IndicatorArray(self.values[index].reshape(-1, 4), self.kind, self.dtype,
+                              validate=False)
+
+    def __iter__(self):
+        view = _VIEW_TYPES[self.kind]
+        for row in self.values:
+            yield view(row)
+
+    def __repr__(self):
+        return f"IndicatorArray(kind={self.kind!r}, n={len(self)}, dtype={self.dtype})"
+
+    def column(self, name: str) -> np.ndarray:
+        """Zero-copy (N,) view of one field, e.g. array.column('deployment')."""
+        if name not in self.fields:
+            raise ValueError(f"Unknown {self.kind} field: {name!r}; expected one of {self.fields}")
+        return self.values[:, self.fields.index(name)]
+
+    def astype(self, dtype) -> 'IndicatorArray':
+        """Return a copy stored with another dtype."""
+        return IndicatorArray(self.values, self.kind, dtype=dtype, validate=False)
+
+    def scores(self, weights: Optional[WeightsLike] = None) -> np.ndarray:
+        """
+        Score every row (vectorized Equation 1 or 2).
+
+        Each score equals compute_adli_score / compute_letci_score of the
+        corresponding view.
+        """
+        profile = as_weight_profile(weights, self.kind)
+        return weighted_dimension_scores(self.values.astype(np.float64, copy=False),
+                                         profile.vector)
+
+    def to_objects(self, frozen: bool = False) -> List:
+        """
+        Materialize the rows as objects.
+
+        Args:
+            frozen: Build FrozenADLIIndicators / FrozenLeTCIIndicators instead
+                    of ADLIIndicators / LeTCIIndicators
+
+        Returns:
+            List of N independent indicator objects
+        """
+        build: Callable[..., Union['ADLIIndicators', 'LeTCIIndicators',
+                                   FrozenADLIIndicators, FrozenLeTCIIndicators]]
+        if frozen:
+            build = _FROZEN_TYPES[self.kind]
+        else:
+            from edcellence_tqm.core import adli_letci
+
+            build = (adli_letci.ADLIIndicators if self.kind == 'adli'
+                     else adli_letci.LeTCIIndicators).trusted
+        return [build(*row) for row in self.values.tolist()]
+
+
+__all__ = [
+    'INDICATOR_KINDS',
+    'ADLIView',
+    'FrozenADLIIndicators',
+    'FrozenLeTCIIndicators',
+    'IndicatorArray',
+    'IndicatorView',
+    'LeTCIView',
+    'freeze',
+    'indicator_kind',
+    'indicator_values',
+]
@@ -0,0 +1,352 @@
+"""
+Columnar Item Store
+===================
+
+Struct-of-arrays backing store for assessment items.
+
+Each item occupies one row across a set of growable NumPy columns instead of
+one Python dict holding a float, an int and an indicator dataclass. The
+columns live in two preallocated blocks (one float64, one int32) that double
+in capacity when full. Rows are addressed through an interned item ID
+registry, and removal moves the last row into the vacated slot, so add,
+update and remove are all amortized O(1).
+
+Aggregations used by AssessmentEngine (point-weighted mean score, mean
+integration indicator) are single reductions over contiguous column views
+and allocate no intermediate arrays.
+
+Authors: Rajamangala University of Technology Krungthep Research Team
+License: MIT
+Version: 1.0.0
+"""
+
+from threading import Lock
+from typing import Dict, Iterator, List, Optional, Sequence
+import numpy as np
+
+from edcellence_tqm.core.summation import exact_sum
+
+# Item type codes stored in the item_type column
+PROCESS_ITEM = 0
+RESULTS_ITEM = 1
+ITEM_TYPES = ('Process', 'Results')
+
+# Category code for items added without a category
+NO_CATEGORY = -1
+
+# Column positions inside the float64 and int32 blocks
+_INDICATORS = slice(0, 4)
+_DEPLOYMENT_GAP = 4
+_SCORE = 5
+_WEIGHTED_SCORE = 6
+_N_FLOAT_COLUMNS = 7
+
+_ITEM_INDEX = 0
+_CATEGORY = 1
+_ITEM_TYPE = 2
+_POINT_VALUE = 3
+_N_INT_COLUMNS = 4
+
+
+class ItemRegistry:
+    """
+    Interned item ID registry mapping item IDs to dense integer codes.
+
+    Each table owns a registry by default, so its codes stay dense and its
+    code → row array stays as small as the table. Tables over the same item
+    catalogue may share one (e.g. DEFAULT_REGISTRY) to intern IDs once; a
+    table's code → row array is then sized to the largest code it holds.
+    """
+
+    def __init__(self):
+        self.names: List[str] = []
+        self._codes: Dict[str, int] = {}
+        self._lock = Lock()
+
+    def get(self, item_id: str) -> Optional[int]:
+        """Return the code of an item ID, or None if never registered."""
+        return self._codes.get(item_id)
+
+    def code(self, item_id: str) -> int:
+        """Return the code of an item ID, registering it if new."""
+        code = self._codes.get(item_id)
+        if code is None:
+            with self._lock:
+                code = self._codes.get(item_id)
+                if code is None:
+                    code = len(self.names)
+                    self.names.append(item_id)
+                    self._codes[item_id] = code
+        return code
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+DEFAULT_REGISTRY = ItemRegistry()
+
+
+class ItemTable:
+    """
+    Growable struct-of-arrays table of assessment items.
+
+    Columns (one row per item, first ``len(table)`` rows are live):
+        item_index: int32 code in the table's ItemRegistry
+        category: int32 category code (NO_CATEGORY if unassigned)
+        item_type: int32 PROCESS_ITEM or RESULTS_ITEM
+        indicators: (n, 4) float64 dimension indicators in canonical order
+        point_value: int32 Baldrige point allocation
+        deployment_gap: float64 deployment urgency δ ∈ [0,1]
+        score: float64 item score [0,100]
+        weighted_score: float64 score · point_value
+
+    Example:
+        >>> table = ItemTable()
+        >>> table.upsert('1.1', PROCESS_ITEM, (0.8, 0.7, 0.6, 0.75), 70, 72.0)
+        0
+        >>> table.weighted_mean_score()
+        72.0
+    """
+
+    __slots__ = ('_size', '_capacity', '_floats', '_ints', '_row_by_code',
+                 'registry', 'category_names', '_category_codes')
+
+    def __init__(self, capacity: int = 8, registry: Optional[ItemRegistry] = None):
+        """
+        Initialize an empty table.
+
+        Args:
+            capacity: Initial number of preallocated rows
+            registry: Item ID registry (defaults to a new one owned by the table)
+        """
+        self._size = 0
+        self.registry = ItemRegistry() if registry is None else registry
+        # Sized lazily to the largest code this table holds, not a shared registry
+        self._row_by_code = np.full(0, -1, dtype=np.int32)
+        self.category_names: List[str] = []
+        self._category_codes: Dict[str, int] = {}
+        self._allocate(max(int(capacity), 1))
+
+    def _allocate(self, capacity: int):
+        """Allocate (or grow) both column blocks to the given row capacity."""
+        floats = np.empty((capacity, _N_FLOAT_COLUMNS), dtype=np.float64)
+        ints = np.empty((capacity, _N_INT_COLUMNS), dtype=np.int32)
+        n = self._size
+        if n:
+            floats[:n] = self._floats[:n]
+            ints[:n] = self._ints[:n]
+        self._floats = floats
+        self._ints = ints
+        self._capacity = capacity
+
+    # ------------------------------------------------------------------
+    # Registries
+    # ------------------------------------------------------------------
+
+    def category_code(self, category: Optional[str]) -> int:
+        """Return the code for a category name, registering it if new."""
+        if category is None:
+            return NO_CATEGORY
+        code = self._category_codes.get(category)
+        if code is None:
+            code = len(self.category_names)
+            self._category_codes[category] = code
+            self.category_names.append(category)
+        return code
+
+    def category_name(self, row: int) -> Optional[str]:
+        """Return the category name stored at a row (None if unassigned)."""
+        code = int(self._ints[row, _CATEGORY])
+        return None if code == NO_CATEGORY else self.category_names[code]
+
+    def _item_code(self, item_id: str) -> int:
+        code = self.registry.code(item_id)
+        size = len(self._row_by_code)
+        if code >= size:
+            grown = np.full(max(code + 1, min(2 * size, len(self.registry))), -1,
+                            dtype=np.int32)
+            grown[:size] = self._row_by_code
+            self._row_by_code = grown
+        return code
+
+    def _row(self, item_id: str) -> int:
+        """Return the row of an item, or -1 if it is not live."""
+        code = self.registry.get(item_id)
+        if code is None or code >= len(self._row_by_code):
+            return -1
+        return int(self._row_by_code[code])
+
+    # ------------------------------------------------------------------
+    # Row operations
+    # ------------------------------------------------------------------
+
+    def upsert(
+        self,
+        item_id: str,
+        item_type: int,
+        indicators: Sequence[float],
+        point_value: int,
+        score: float,
+        category: Optional[str] = None,
+        deployment_gap: float = 0.0
+    ) -> int:
+        """
+        Insert a new item or overwrite an existing one in place.
+
+        Args:
+            item_id: Item identifier (e.g. '1.1')
+            item_type: PROCESS_ITEM or RESULTS_ITEM
+            indicators: Four dimension indicators in canonical order
+            point_value: Baldrige point allocation
+            score: Precomputed item score [0,100]
+            category: Optional category name
+            deployment_gap: Deployment urgency [0,1]
+
+        Returns:
+            int: Row index of the item
+        """
+        row = self._row(item_id)
+        if row < 0:
+            if self._size == self._capacity:
+                self._allocate(2 * self._capacity)
+            row = self._size
+            self._size += 1
+            code = self._item_code(item_id)
+            self._row_by_code[code] = row
+            self._ints[row, _ITEM_INDEX] = code
+
+        ints = self._ints[row]
+        ints[_CATEGORY] = self.category_code(category)
+        ints[_ITEM_TYPE] = item_type
+        ints[_POINT_VALUE] = point_value
+        floats = self._floats[row]
+        floats[_INDICATORS] = indicators
+        floats[_DEPLOYMENT_GAP] = deployment_gap
+        floats[_SCORE] = score
+        floats[_WEIGHTED_SCORE] = score * point_value
+        return row
+
+    def remove(self, item_id: str):
+        """
+        Remove an item by moving the last row into its slot.
+
+        Raises:
+            KeyError: If the item is not in the table
+        """
+        row = self.row(item_id)
+        self._row_by_code[self.registry.get(item_id)] = -1
+        last = self._size - 1
+        if row != last:
+            self._floats[row] = self._floats[last]
+            self._ints[row] = self._ints[last]
+            self._row_by_code[self._ints[row, _ITEM_INDEX]] = row
+        self._size = last
+
+    def row(self, item_id: str) -> int:
+        """Return the row index of an item (KeyError if absent)."""
+        row = self._row(item_id)
+        if row < 0:
+            raise KeyError(item_id)
+        return row
+
+    def item_id(self, row: int) -> str:
+        """Return the item ID stored at a row."""
+        if not 0 <= row < self._size:
+            raise IndexError(f"Row {row} out of range for table of size {self._size}")
+        return self.registry.names[self._ints[row, _ITEM_INDEX]]
+
+    def item_ids(self) -> List[str]:
+        """Return item IDs in row order."""
+        names = self.registry.names
+        return [names[code] for code in self.item_index.tolist()]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, item_id) -> bool:
+        return self._row(item_id) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.item_ids())
+
+    # ------------------------------------------------------------------
+    # Column views (no copies)
+    # ------------------------------------------------------------------
+
+    @property
+    def item_index(self) -> np.ndarray:
+        return self._ints[:self._size, _ITEM_INDEX]
+
+    @property
+    def category(self) -> np.ndarray:
+        return self._ints[:self._size, _CATEGORY]
+
+    @property
+    def item_type(self) -> np.ndarray:
+        return self._ints[:self._size, _ITEM_TYPE]
+
+    @property
+    def point_value(self) -> np.ndarray:
+        return self._ints[:self._size, _POINT_VALUE]
+
+    @property
+    def indicators(self) -> np.ndarray:
+        return self._floats[:self._size, _INDICATORS]
+
+    @property
+    def deployment_gap(self) -> np.ndarray:
+        return self._floats[:self._size, _DEPLOYMENT_GAP]
+
+    @property
+    def score(self) -> np.ndarray:
+        return self._floats[:self._size, _SCORE]
+
+    @property
+    def weighted_score(self) -> np.ndarray:
+        return self._floats[:self._size, _WEIGHTED_SCORE]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column blocks (including spare capacity)."""
+        return self._floats.nbytes + self._ints.nbytes + self._row_by_code.nbytes
+
+    # ------------------------------------------------------------------
+    # Aggregations
+    # ------------------------------------------------------------------
+
+    def total_points(self) -> int:
+        """Sum of point values over all live rows."""
+        return int(self.point_value.sum())
+
+    def weighted_score_sum(self) -> float:
+        """Σ(v_i·S_i) over all live rows (exact, independent of row order)."""
+        return exact_sum(self.weighted_score)
+
+    def weighted_mean_score(self) -> float:
+        """
+        Point-value weighted mean score Σ(v_i·S_i) / Σ(v_i) (0.0 for an empty table).
+
+        Raises:
+            ValueError: If the live rows' point values sum to zero
+        """
+        if self._size == 0:
+            return 0.0
+        total = self.total_points()
+        if total == 0:
+            raise ValueError("Total point values cannot be zero")
+        return self.weighted_score_sum() / total
+
+    def integration_sum(self) -> float:
+        """Sum of the integration indicator (column 3) over all live rows (exact)."""
+        return exact_sum(self.indicators[:, 3])
+
+
+__all__ = [
+    'PROCESS_ITEM',
+    'RESULTS_ITEM',
+    'ITEM_TYPES',
+    'NO_CATEGORY',
+    'ItemRegistry',
+    'DEFAULT_REGISTRY',
+    'ItemTable',
+]
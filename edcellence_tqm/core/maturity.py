@@ -0,0 +1,268 @@
+"""
+Maturity Band Classification
+============================
+
+Array-based Baldrige maturity classification over a sorted band-edge table.
+
+The published bands are integer-inclusive ranges with gaps between them
+(0-20, 21-40, 41-60, 61-85, 86-100), which leaves scores such as 20.5 or
+85.4 unclassified. MaturityBands gives the bands continuous semantics by
+their upper edges:
+
+    level 1:  lower ≤ score ≤ max_1
+    level k:  max_{k-1} < score ≤ max_k
+
+so every score in [lower, max_last] maps to exactly one level, and integer
+scores map exactly as in the published table. classify() runs one
+np.searchsorted over the edge table and returns compact int8 level codes;
+labels and descriptions are only looked up when asked for.
+
+Band tables can be built from MATURITY_BANDS or from the
+``lookup_maturity_levels`` rows in ``scripts/schema_simplified.sql``.
+
+Authors: Rajamangala University of Technology Krungthep Research Team
+License: MIT
+Version: 1.0.0
+"""
+
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple, Union
+import numpy as np
+
+# Baldrige maturity bands (integer-inclusive score ranges)
+MATURITY_BANDS = {
+    1: {'range': (0, 20), 'label': 'Reactive', 'description': 'Activity-based, undocumented'},
+    2: {'range': (21, 40), 'label': 'Early Systematic', 'description': 'Initial process definitions'},
+    3: {'range': (41, 60), 'label': 'Aligned', 'description': 'Systematic, deployed across units'},
+    4: {'range': (61, 85), 'label': 'Integrated', 'description': 'Well-deployed, strategic alignment'},
+    5: {'range': (86, 100), 'label': 'Role Model', 'description': 'Innovative, benchmarked, sustained'}
+}
+
+
+class MaturityBands:
+    """
+    Sorted maturity band-edge table.
+
+    Attributes:
+        levels: (B,) int8 level codes in ascending band order
+        upper_edges: (B,) float64 inclusive upper score edge of each band
+        lower_bound: Lowest valid score
+        labels: Band labels aligned with levels
+        descriptions: Band descriptions aligned with levels
+        ranges: Published (min, max) score range of each band
+
+    Example:
+        >>> bands = MaturityBands.from_dict(MATURITY_BANDS)
+        >>> bands.classify([12.0, 20.5, 72.5, 100.0])
+        array([1, 2, 4, 5], dtype=int8)
+        >>> bands.label(4)
+        'Integrated'
+    """
+
+    def __init__(
+        self,
+        levels: Sequence[int],
+        upper_edges: Sequence[float],
+        lower_bound: float = 0.0,
+        labels: Optional[Sequence[str]] = None,
+        descriptions: Optional[Sequence[str]] = None,
+        ranges: Optional[Sequence[Tuple[float, float]]] = None
+    ):
+        """
+        Initialize a band table.
+
+        Args:
+            levels: Level codes (1-127) in ascending band order
+            upper_edges: Strictly increasing inclusive upper edge per band
+            lower_bound: Lowest valid score (inclusive)
+            labels: Optional band labels
+            descriptions: Optional band descriptions
+            ranges: Optional published (min, max) range per band
+
+        Raises:
+            ValueError: If edges are not strictly increasing, lengths differ
+                        or levels do not fit in int8
+        """
+        levels = [int(level) for level in levels]
+        upper = np.asarray(upper_edges, dtype=np.float64)
+        n = len(levels)
+        if n == 0:
+            raise ValueError("At least one maturity band is required")
+        if upper.shape != (n,):
+            raise ValueError(f"Got {len(upper)} upper edges for {n} levels")
+        if not all(1 <= level <= 127 for level in levels) or len(set(levels)) != n:
+            raise ValueError(f"Levels must be distinct integers in 1..127, got {levels}")
+        if not np.all(np.isfinite(upper)) or np.any(np.diff(upper) <= 0):
+            raise ValueError(f"Upper edges must be finite and strictly increasing, got {upper}")
+        if not lower_bound <= upper[0]:
+            raise ValueError(f"Lower bound {lower_bound} exceeds first upper edge {upper[0]}")
+
+        for name, values in (('labels', labels), ('descriptions', descriptions),
+                             ('ranges', ranges)):
+            if values is not None and len(values) != n:
+                raise ValueError(f"Got {len(values)} {name} for {n} levels")
+
+        upper.flags.writeable = False
+        self.levels = np.array(levels, dtype=np.int8)
+        self.levels.flags.writeable = False
+        self.upper_edges = upper
+        self.lower_bound = float(lower_bound)
+        self.labels = tuple(labels) if labels is not None else tuple(str(lv) for lv in levels)
+        self.descriptions = tuple(descriptions) if descriptions is not None else ('',) * n
+        if ranges is None:
+            lows = [self.lower_bound] + upper[:-1].tolist()
+            ranges = list(zip(lows, upper.tolist()))
+        self.ranges = tuple(tuple(r) for r in ranges)
+        self._upper_list = upper.tolist()
+        self._position = {level: i for i, level in enumerate(levels)}
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def __repr__(self) -> str:
+        bands = ', '.join(f"{lv}:{label}≤{edge:g}" for lv, label, edge in
+                          zip(self.levels.tolist(), self.labels, self._upper_list))
+        return f"MaturityBands(lower={self.lower_bound:g}, {bands})"
+
+    # ------------------------------------------------------------------
+    # Constructors
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_dict(cls, bands: Dict[int, Dict[str, Any]]) -> 'MaturityBands':
+        """Build a table from a MATURITY_BANDS-style {level: {'range', 'label', ...}} dict."""
+        rows = [
+            {'level': level, 'label': info.get('label'), 'description': info.get('description'),
+             'min_score': info['range'][0], 'max_score': info['range'][1]}
+            for level, info in bands.items()
+        ]
+        return cls.from_rows(rows)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Any]]) -> 'MaturityBands':
+        """
+        Build a table from lookup_maturity_levels rows.
+
+        Args:
+            rows: Dicts with level, min_score, max_score and optional label
+                  and description (from read_lookup_table or a cursor)
+
+        Raises:
+            ValueError: If band ranges overlap or a range is inverted
+        """
+        rows = sorted(rows, key=lambda row: float(row['max_score']))
+        if not rows:
+            raise ValueError("At least one maturity band is required")
+        previous_max = None
+        for row in rows:
+            low, high = float(row['min_score']), float(row['max_score'])
+            if low > high:
+                raise ValueError(f"Band {row['level']} has min_score {low} > max_score {high}")
+            if previous_max is not None and low <= previous_max:
+                raise ValueError(f"Band {row['level']} overlaps the band below it")
+            previous_max = high
+
+        def _number(value):
+            value = float(value)
+            return int(value) if value.is_integer() else value
+
+        return cls(
+            levels=[row['level'] for row in rows],
+            upper_edges=[float(row['max_score']) for row in rows],
+            lower_bound=float(rows[0]['min_score']),
+            labels=[row.get('label') or str(row['level']) for row in rows],
+            descriptions=[row.get('description') or '' for row in rows],
+            ranges=[(_number(row['min_score']), _number(row['max_score'])) for row in rows]
+        )
+
+    @classmethod
+    def from_schema(cls, path: Optional[Union[str, Path]] = None) -> 'MaturityBands':
+        """Load the lookup_maturity_levels rows from the schema script."""
+        from edcellence_tqm.database.schema import read_lookup_table
+
+        return cls.from_rows(read_lookup_table('lookup_maturity_levels', path=path))
+
+    # ------------------------------------------------------------------
+    # Classification
+    # ------------------------------------------------------------------
+
+    def classify(self, scores) -> np.ndarray:
+        """
+        Map scores to int8 level codes.
+
+        Args:
+            scores: Array-like of scores (any shape)
+
+        Returns:
+            np.ndarray: int8 level codes with the shape of scores
+
+        Raises:
+            ValueError: If any score is NaN or outside [lower_bound, last edge]
+        """
+        scores = np.asarray(scores, dtype=np.float64)
+        outside = ~((scores >= self.lower_bound) & (scores <= self._upper_list[-1]))
+        if outside.any():
+            raise ValueError(
+                f"Score {scores[outside].flat[0]} outside valid range "
+                f"[{self.lower_bound:g},{self._upper_list[-1]:g}]"
+            )
+        return self.levels[np.searchsorted(self.upper_edges, scores, side='left')]
+
+    def classify_one(self, score: float) -> int:
+        """Map one score to its level (scalar counterpart of classify)."""
+        if not self.lower_bound <= score <= self._upper_list[-1]:
+            raise ValueError(
+                f"Score {score} outside valid range "
+                f"[{self.lower_bound:g},{self._upper_list[-1]:g}]"
+            )
+        return int(self.levels[bisect_left(self._upper_list, score)])
+
+    # ------------------------------------------------------------------
+    # Label lookup
+    # ------------------------------------------------------------------
+
+    def label(self, level: int) -> str:
+        """Return the label of a level code."""
+        return self.labels[self._position[int(level)]]
+
+    def labels_for(self, codes) -> np.ndarray:
+        """Return an object array of labels for an array of level codes."""
+        table = np.empty(128, dtype=object)
+        table[self.levels] = self.labels
+        return table[np.asarray(codes, dtype=np.int64)]
+
+    def categorical(self, codes):
+        """
+        Return level codes as a pandas Categorical of labels.
+
+        The labels are stored once in the categories; the codes are reused
+        as category codes without building a label per score.
+        """
+        import pandas as pd
+
+        positions = np.full(128, -1, dtype=np.int8)
+        positions[self.levels] = np.arange(len(self.levels), dtype=np.int8)
+        return pd.Categorical.from_codes(
+            positions[np.asarray(codes, dtype=np.int64)], categories=list(self.labels), ordered=True
+        )
+
+    def describe(self, level: int) -> Dict[str, Any]:
+        """Return {'level', 'label', 'description', 'range'} for a level code."""
+        i = self._position[int(level)]
+        return {
+            'level': int(level),
+            'label': self.labels[i],
+            'description': self.descriptions[i],
+            'range': self.ranges[i]
+        }
+
+
+DEFAULT_MATURITY_BANDS = MaturityBands.from_dict(MATURITY_BANDS)
+
+
+__all__ = [
+    'MATURITY_BANDS',
+    'MaturityBands',
+    'DEFAULT_MATURITY_BANDS',
+]
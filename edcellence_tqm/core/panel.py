@@ -0,0 +1,569 @@
+"""
+Longitudinal Panel Store
+========================
+
+In-memory store of assessments over many cycles, keyed like
+fact_organizational_scores by (department, assessment cycle).
+
+Item-level data is held in dense (cycle, department, item) arrays and
+department-level results in (cycle, department) arrays:
+
+    indicators            (C, D, I, 4)  ADLI or LeTCI indicators
+    item_score            (C, D, I)     Equation 1/2 scores
+    deployment_gap        (C, D, I)     deployment urgency
+    category_scores       (C, D, K)     Equation 3 scores
+    organizational_score  (C, D)        Equation 4 score
+    ihi                   (C, D)        Integration Health Index
+    maturity_level        (C, D)        maturity level code (0 if absent)
+
+Cells a department did not report in a cycle are NaN (item_score NaN marks
+an absent item). Departments, cycles and items have dict index maps, so
+finding any (department, cycle) cell is O(1).
+
+Storage grows in chunks of ``chunk_cycles`` cycles: appending a cycle
+writes into the current chunk and starts a new one when it is full, so
+history is never copied. A department first seen in a later cycle widens
+only the current and later chunks; older chunks read as NaN for it.
+Time-range queries locate the chunks by binary search over the cycle
+labels (appended in increasing order) and return views when the range
+lies in one chunk.
+
+save() writes one .npy file per array plus a JSON manifest; load() maps the
+files read-only (mmap), so a saved history is not read into memory until
+queried, and new cycles can still be appended. Every file is written to a
+temporary name and swapped in with os.replace, so a panel can be saved back
+to the directory it was loaded from while its maps stay readable.
+
+Authors: Rajamangala University of Technology Krungthep Research Team
+License: MIT
+Version: 1.0.0
+"""
+
+import bisect
+import json
+import os
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, Literal, Optional, Sequence, Tuple, Union
+import numpy as np
+
+from edcellence_tqm.core.bulk import BulkItems, assess_departments
+from edcellence_tqm.core.maturity import DEFAULT_MATURITY_BANDS, MaturityBands
+from edcellence_tqm.core.weights import WeightsLike, as_weight_profile
+
+PANEL_FORMAT = 1
+
+ITEM_FIELDS = ('indicators', 'item_score', 'deployment_gap')
+DEPARTMENT_FIELDS = ('organizational_score', 'ihi', 'maturity_level', 'category_scores')
+
+
+class _Chunk:
+    """Arrays for cycles [start, start + capacity) over the first `width` departments."""
+
+    __slots__ = ('start', 'capacity', 'width', 'arrays')
+
+    def __init__(self, start: int, arrays: Dict[str, np.ndarray]):
+        self.start = start
+        self.arrays = arrays
+        self.capacity, self.width = arrays['organizational_score'].shape
+
+    @classmethod
+    def allocate(cls, start: int, capacity: int, width: int, n_items: int,
+                 n_categories: int) -> '_Chunk':
+        cycles = (capacity, width)
+        return cls(start, {
+            'indicators': np.full(cycles + (n_items, 4), np.nan),
+            'item_score': np.full(cycles + (n_items,), np.nan),
+            'deployment_gap': np.full(cycles + (n_items,), np.nan),
+            'organizational_score': np.full(cycles, np.nan),
+            'ihi': np.full(cycles, np.nan),
+            'maturity_level': np.zeros(cycles, dtype=np.int8),
+            'category_scores': np.full(cycles + (n_categories,), np.nan),
+        })
+
+    def widen(self, width: int, filled: int) -> '_Chunk':
+        """Copy of this chunk with room for `width` departments (first `filled` cycles)."""
+        n_items = self.arrays['item_score'].shape[2]
+        n_categories = self.arrays['category_scores'].shape[2]
+        wider = _Chunk.allocate(self.start, self.capacity, width, n_items, n_categories)
+        for name, array in self.arrays.items():
+            wider.arrays[name][:filled, :self.width] = array[:filled]
+        return wider
+
+
+class PanelStore:
+    """
+    Dense (department, cycle, item) panel of assessments.
+
+    Example:
+        >>> panel = PanelStore()
+        >>> for month, frame in monthly_frames:
+        ...     panel.append_cycle(month, frame)
+        >>> panel.cell('Engineering', 6)['organizational_score']
+        71.3
+        >>> panel.select('organizational_score', start=3, stop=9).shape
+        (7, 3)
+    """
+
+    def __init__(
+        self,
+        chunk_cycles: int = 16,
+        adli_weights: Optional[WeightsLike] = None,
+        letci_weights: Optional[WeightsLike] = None,
+        category_weights: Optional[WeightsLike] = None,
+        maturity_bands: Optional[MaturityBands] = None
+    ):
+        """
+        Initialize an empty panel.
+
+        Args:
+            chunk_cycles: Cycles allocated per storage chunk
+            adli_weights: ADLI weights used to score appended cycles
+            letci_weights: LeTCI weights used to score appended cycles
+            category_weights: Category weights used to score appended cycles
+            maturity_bands: Maturity band table (MATURITY_BANDS if None)
+        """
+        if chunk_cycles < 1:
+            raise ValueError(f"chunk_cycles must be positive, got {chunk_cycles}")
+        self.chunk_cycles = chunk_cycles
+        self.adli_weights = as_weight_profile(adli_weights, 'adli')
+        self.letci_weights = as_weight_profile(letci_weights, 'letci')
+        self.category_weights = as_weight_profile(category_weights, 'category')
+        self.maturity_bands = DEFAULT_MATURITY_BANDS if maturity_bands is None else maturity_bands
+
+        self.cycles: List = []
+        self._cycle_index: Dict = {}
+        self._departments: List = []
+        self._department_index: Dict = {}
+        self.item_names = np.zeros(0, dtype=str)
+        self.item_category = np.zeros(0, dtype=np.int64)
+        self.item_type = np.zeros(0, dtype=np.int8)
+        self.point_value = np.zeros(0, dtype=np.int64)
+        self.categories: Tuple[str, ...] = ()
+        self._item_index: Dict[str, int] = {}
+        self._chunks: List[_Chunk] = []
+        self._chunk_starts: List[int] = []
+
+    # ------------------------------------------------------------------
+    # Dimensions
+    # ------------------------------------------------------------------
+
+    @property
+    def departments(self) -> np.ndarray:
+        """(D,) department labels in order of first appearance."""
+        return np.array(self._departments, dtype=object)
+
+    @property
+    def n_cycles(self) -> int:
+        return len(self.cycles)
+
+    @property
+    def n_departments(self) -> int:
+        return len(self._departments)
+
+    @property
+    def n_items(self) -> int:
+        return len(self.item_names)
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        """(cycles, departments, items)."""
+        return self.n_cycles, self.n_departments, self.n_items
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the chunk arrays (including spare capacity)."""
+        return sum(a.nbytes for chunk in self._chunks for a in chunk.arrays.values())
+
+    def cycle_index(self, cycle) -> int:
+        """Position of a cycle label (O(1))."""
+        try:
+            return self._cycle_index[cycle]
+        except KeyError:
+            raise KeyError(f"Unknown cycle: {cycle!r}") from None
+
+    def department_index(self, department) -> int:
+        """Position of a department label (O(1))."""
+        try:
+            return self._department_index[department]
+        except KeyError:
+            raise KeyError(f"Unknown department: {department!r}") from None
+
+    def cycle_slice(self, start=None, stop=None) -> slice:
+        """Cycle positions with start <= cycle <= stop (None leaves a side open)."""
+        first = 0 if start is None else bisect.bisect_left(self.cycles, start)
+        last = self.n_cycles if stop is None else bisect.bisect_right(self.cycles, stop)
+        return slice(first, max(first, last))
+
+    def _locate(self, t: int) -> Tuple[_Chunk, int]:
+        chunk = self._chunks[bisect.bisect_right(self._chunk_starts, t) - 1]
+        return chunk, t - chunk.start
+
+    # ------------------------------------------------------------------
+    # Appending
+    # ------------------------------------------------------------------
+
+    def _init_items(self, items: BulkItems):
+        first = np.unique(items.item_code, return_index=True)[1]
+        rows = first[np.argsort(items.item_code[first])]
+        self.item_names = items.item_names.astype(str)
+        self.item_category = items.category[rows]
+        self.item_type = items.item_type[rows]
+        self.point_value = items.point_value[rows]
+        self.categories = tuple(items.categories)
+        self._item_index = {name: i for i, name in enumerate(self.item_names.tolist())}
+
+    def _item_positions(self, items: BulkItems) -> np.ndarray:
+        """Panel item index of every row, checking item metadata."""
+        known = np.array([self._item_index.get(name, -1) for name in items.item_names.tolist()],
+                         dtype=np.int64)
+        if np.any(known < 0):
+            new = items.item_names[np.flatnonzero(known < 0)[0]]
+            raise ValueError(f"Item {new!r} is not in the panel's item set")
+        positions = known[items.item_code]
+
+        category_code = np.array([self.categories.index(name) if name in self.categories else -1
+                                  for name in items.categories], dtype=np.int64)
+        checks = (
+            ('category', category_code[items.category], self.item_category[positions]),
+            ('item_type', items.item_type, self.item_type[positions]),
+            ('point_value', items.point_value, self.point_value[positions]),
+        )
+        for name, given, expected in checks:
+            bad = np.flatnonzero(given != expected)
+            if len(bad):
+                row = int(bad[0])
+                raise ValueError(
+                    f"Item {self.item_names[positions[row]]!r} changed {name} "
+                    f"(department {items.departments[items.department[row]]!r})"
+                )
+        return positions
+
+    def _writable_chunk(self, t: int) -> Tuple[_Chunk, int]:
+        """Chunk and offset for a new cycle t, allocating or widening as needed."""
+        width = self.n_departments
+        if not self._chunks or t >= self._chunks[-1].start + self._chunks[-1].capacity:
+            chunk = _Chunk.allocate(t, self.chunk_cycles, width, self.n_items,
+                                    len(self.categories))
+            self._chunks.append(chunk)
+            self._chunk_starts.append(t)
+        chunk = self._chunks[-1]
+        if chunk.width < width:
+            # Only the current chunk is copied (at most chunk_cycles cycles)
+            chunk = self._chunks[-1] = chunk.widen(max(width, 2 * chunk.width),
+                                                   t - chunk.start)
+        return chunk, t - chunk.start
+
+    def append_cycle(self, cycle, items) -> int:
+        """
+        Assess one cycle and append it to the panel.
+
+        Args:
+            cycle: Cycle label (assessment_cycle_id, month number, date, ...);
+                   must sort after every cycle already in the panel
+            items: BulkItems or long-format DataFrame for this cycle
+
+        Returns:
+            Position of the new cycle
+
+        Raises:
+            ValueError: If the cycle is not after the last one, an item is
+                        unknown or changed category/type/points, or the
+                        cycle cannot be assessed (see assess_departments)
+        """
+        if not isinstance(items, BulkItems):
+            items = BulkItems.from_frame(items)
+        if self.cycles and not self.cycles[-1] < cycle:
+            raise ValueError(
+                f"Cycles must be appended in increasing order: {cycle!r} after "
+                f"{self.cycles[-1]!r}"
+            )
+        result = assess_departments(
+            items, adli_weights=self.adli_weights, letci_weights=self.letci_weights,
+            category_weights=self.category_weights, maturity_bands=self.maturity_bands
+        )
+        if not self.cycles and not self.n_items:
+            self._init_items(items)
+        positions = self._item_positions(items)
+
+        # Validation passed: register new departments and the cycle
+        codes = []
+        for label in items.departments.tolist():
+            if label not in self._department_index:
+                self._department_index[label] = len(self._departments)
+                self._departments.append(label)
+            codes.append(self._department_index[label])
+        departments = np.array(codes, dtype=np.int64)
+
+        t = self.n_cycles
+        chunk, offset = self._writable_chunk(t)
+        arrays = chunk.arrays
+        rows = departments[items.department]
+        arrays['indicators'][offset, rows, positions] = items.indicators
+        arrays['item_score'][offset, rows, positions] = result.item_score
+        arrays['deployment_gap'][offset, rows, positions] = items.deployment_gap
+        arrays['organizational_score'][offset, departments] = result.organizational_score
+        arrays['ihi'][offset, departments] = result.ihi
+        arrays['maturity_level'][offset, departments] = result.maturity_level
+        columns = [result.categories.index(name) if name in result.categories else -1
+                   for name in self.categories]
+        scores = np.full((len(departments), len(self.categories)), np.nan)
+        present = [k for k, c in enumerate(columns) if c >= 0]
+        scores[:, present] = result.category_scores[:, [columns[k] for k in present]]
+        arrays['category_scores'][offset, departments] = scores
+
+        self.cycles.append(cycle)
+        self._cycle_index[cycle] = t
+        return t
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def cell(self, department, cycle) -> Dict:
+        """
+        Return one department's data for one cycle (O(1) lookup).
+
+        Returns:
+            Dict with 'organizational_score', 'ihi', 'maturity_level',
+            'category_scores' {category: score} and item-level 'indicators'
+            (I, 4), 'item_score' (I,) and 'deployment_gap' (I,) views
+            (NaN for items the department did not report)
+        """
+        chunk, offset = self._locate(self.cycle_index(cycle))
+        d = self.department_index(department)
+        if d >= chunk.width:
+            raise KeyError(f"Department {department!r} has no data for cycle {cycle!r}")
+        arrays = chunk.arrays
+        return {
+            'organizational_score': float(arrays['organizational_score'][offset, d]),
+            'ihi': float(arrays['ihi'][offset, d]),
+            'maturity_level': int(arrays['maturity_level'][offset, d]),
+            'category_scores': dict(zip(self.categories,
+                                        arrays['category_scores'][offset, d].tolist())),
+            **{name: arrays[name][offset, d] for name in ITEM_FIELDS},
+        }
+
+    def select(
+        self,
+        field: str,
+        start=None,
+        stop=None,
+        departments: Optional[Sequence] = None
+    ) -> np.ndarray:
+        """
+        Return a field over a time range as a (T, D, ...) array.
+
+        Args:
+            field: One of ITEM_FIELDS or DEPARTMENT_FIELDS
+            start: First cycle label included (None for the first cycle)
+            stop: Last cycle label included (None for the last cycle)
+            departments: Optional department labels (all departments if None)
+
+        Returns:
+            np.ndarray: A view when the range lies in one chunk and spans
+            every department, otherwise a copy; departments added after a
+            cycle read as NaN (maturity_level 0) for it
+        """
+        if field not in ITEM_FIELDS + DEPARTMENT_FIELDS:
+            raise ValueError(f"Unknown field {field!r}; expected one of "
+                             f"{ITEM_FIELDS + DEPARTMENT_FIELDS}")
+        span = self.cycle_slice(start, stop)
+        columns = (None if departments is None
+                   else np.array([self.department_index(d) for d in departments], dtype=np.int64))
+        width = self.n_departments
+
+        pieces = []
+        t = span.start
+        while t < span.stop:
+            chunk, offset = self._locate(t)
+            end = min(span.stop, chunk.start + chunk.capacity)
+            block = chunk.arrays[field][offset:offset + end - t]
+            if chunk.width < width:
+                fill = 0 if field == 'maturity_level' else np.nan
+                padded = np.full((len(block), width) + block.shape[2:], fill, dtype=block.dtype)
+                padded[:, :chunk.width] = block
+                block = padded
+            else:
+                block = block[:, :width]
+            pieces.append(block if columns is None else block[:, columns])
+            t = end
+
+        if len(pieces) == 1:
+            return pieces[0]
+        if not pieces:
+            template = self._chunks[0].arrays[field] if self._chunks else np.zeros((0, 0))
+            n = width if columns is None else len(columns)
+            return np.zeros((0, n) + template.shape[2:], dtype=template.dtype)
+        return np.concatenate(pieces)
+
+    def series(self, department, field: str = 'organizational_score',
+               start=None, stop=None) -> Tuple[List, np.ndarray]:
+        """Return (cycle labels, values) of one department over a time range."""
+        span = self.cycle_slice(start, stop)
+        values = self.select(field, start, stop, departments=[department])[:, 0]
+        return self.cycles[span], values
+
+    def to_frame(self, start=None, stop=None):
+        """
+        Return department-level results as a long pandas DataFrame.
+
+        One row per reported (cycle, department) with cycle, department,
+        organizational_score, ihi, maturity_level and one column per category.
+        """
+        import pandas as pd
+
+        span = self.cycle_slice(start, stop)
+        scores = self.select('organizational_score', start, stop)
+        cycle_pos, dept_pos = np.nonzero(~np.isnan(scores))
+        frame = pd.DataFrame({
+            'cycle': np.array(self.cycles[span], dtype=object)[cycle_pos],
+            'department': self.departments[dept_pos],
+            'organizational_score': scores[cycle_pos, dept_pos],
+            'ihi': self.select('ihi', start, stop)[cycle_pos, dept_pos],
+            'maturity_level': self.select('maturity_level', start, stop)[cycle_pos, dept_pos],
+        })
+        categories = self.select('category_scores', start, stop)[cycle_pos, dept_pos]
+        for k, name in enumerate(self.categories):
+            frame[name] = categories[:, k]
+        return frame
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: Union[str, Path]):
+        """
+        Write the panel to a directory of .npy columns plus manifest.json.
+
+        Each field is written as one contiguous (C, D, ...) array, so a
+        loaded panel is a single chunk that can be memory-mapped. Files are
+        replaced, not overwritten, so path may be the directory this panel
+        was loaded (and is still mapped) from. Cycle and department labels
+        may be numbers, strings, dates, datetimes or tuples of these.
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        for field in ITEM_FIELDS + DEPARTMENT_FIELDS:
+            _save_array(path / f'{field}.npy', np.ascontiguousarray(self.select(field)))
+        _save_array(path / 'item_category.npy', self.item_category)
+        _save_array(path / 'item_type.npy', self.item_type)
+        _save_array(path / 'point_value.npy', self.point_value)
+        bands = self.maturity_bands
+        manifest = {
+            'format': PANEL_FORMAT,
+            'chunk_cycles': self.chunk_cycles,
+            'cycles': _to_json(self.cycles),
+            'departments': _to_json(self._departments),
+            'items': self.item_names.tolist(),
+            'categories': list(self.categories),
+            'weights': {profile.kind: profile.to_dict() for profile in
+                        (self.adli_weights, self.letci_weights, self.category_weights)},
+            'maturity_bands': {
+                'levels': bands.levels.tolist(),
+                'upper_edges': bands.upper_edges.tolist(),
+                'lower_bound': float(bands.lower_bound),
+                'labels': list(bands.labels),
+                'descriptions': list(bands.descriptions),
+                'ranges': [list(r) for r in np.asarray(bands.ranges).tolist()],
+            },
+        }
+        temporary = path / 'manifest.json.tmp'
+        temporary.write_text(json.dumps(manifest, indent=2))
+        os.replace(temporary, path / 'manifest.json')
+
+    @classmethod
+    def load(cls, path: Union[str, Path], mmap: bool = True) -> 'PanelStore':
+        """
+        Load a panel written by save().
+
+        Args:
+            path: Panel directory
+            mmap: Map the history read-only instead of reading it into memory;
+                  appended cycles go into new in-memory chunks
+
+        Raises:
+            ValueError: If the directory was written by an incompatible version
+        """
+        path = Path(path)
+        manifest = json.loads((path / 'manifest.json').read_text())
+        if manifest.get('format') != PANEL_FORMAT:
+            raise ValueError(f"Unsupported panel format: {manifest.get('format')!r}")
+        weights = manifest['weights']
+        bands = manifest['maturity_bands']
+        panel = cls(
+            chunk_cycles=manifest['chunk_cycles'],
+            adli_weights=weights['adli'],
+            letci_weights=weights['letci'],
+            category_weights=weights['category'],
+            maturity_bands=MaturityBands(
+                bands['levels'], bands['upper_edges'], bands['lower_bound'],
+                bands['labels'], bands['descriptions'], [tuple(r) for r in bands['ranges']]
+            ),
+        )
+        panel.cycles = _from_json(manifest['cycles'])
+        panel._cycle_index = {cycle: t for t, cycle in enumerate(panel.cycles)}
+        panel._departments = _from_json(manifest['departments'])
+        panel._department_index = {d: i for i, d in enumerate(panel._departments)}
+        panel.item_names = np.array(manifest['items'], dtype=str)
+        panel._item_index = {name: i for i, name in enumerate(manifest['items'])}
+        panel.categories = tuple(manifest['categories'])
+        panel.item_category = np.load(path / 'item_category.npy')
+        panel.item_type = np.load(path / 'item_type.npy')
+        panel.point_value = np.load(path / 'point_value.npy')
+        if panel.cycles:
+            mode: Optional[Literal['r', 'r+', 'c']] = 'r' if mmap else None
+            arrays = {field: np.load(path / f'{field}.npy', mmap_mode=mode)
+                      for field in ITEM_FIELDS + DEPARTMENT_FIELDS}
+            panel._chunks = [_Chunk(0, arrays)]
+            panel._chunk_starts = [0]
+        return panel
+
+
+def _save_array(path: Path, array: np.ndarray):
+    """np.save to a temporary file, then atomically replace path with it."""
+    temporary = path.with_name(path.name + '.tmp')
+    with open(temporary, 'wb') as handle:
+        np.save(handle, array)
+    os.replace(temporary, path)
+
+
+def _label_to_json(label):
+    """Encode one label: numpy scalars to Python values, tuples to lists and
+    dates/datetimes to {'date' or 'datetime': ISO string}."""
+    if isinstance(label, np.generic):
+        label = label.item()
+    if isinstance(label, tuple):
+        return [_label_to_json(part) for part in label]
+    if isinstance(label, datetime):
+        return {'datetime': label.isoformat()}
+    if isinstance(label, date):
+        return {'date': label.isoformat()}
+    return label
+
+
+def _label_from_json(value):
+    """Decode one label written by _label_to_json."""
+    if isinstance(value, list):
+        return tuple(_label_from_json(part) for part in value)
+    if isinstance(value, dict):
+        (kind, text), = value.items()
+        return datetime.fromisoformat(text) if kind == 'datetime' else date.fromisoformat(text)
+    return value
+
+
+def _to_json(labels: Sequence) -> List:
+    """Encode labels for the manifest (see _label_to_json)."""
+    return [_label_to_json(label) for label in labels]
+
+
+def _from_json(labels: List) -> List:
+    return [_label_from_json(label) for label in labels]
+
+
+__all__ = [
+    'DEPARTMENT_FIELDS',
+    'ITEM_FIELDS',
+    'PANEL_FORMAT',
+    'PanelStore',
+]
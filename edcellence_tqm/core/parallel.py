@@ -0,0 +1,336 @@
+"""
+Parallel Bulk Assessment
+========================
+
+Process-pool version of assess_departments for institution-wide runs.
+
+Departments occupy contiguous row ranges of a BulkItems table, so the table
+is split into shards of ``chunk_size`` whole departments and each shard is
+assessed by a worker process with the serial bulk pipeline. Inputs are not
+pickled per task: the numeric item columns are copied once into a
+``multiprocessing.shared_memory`` block that every worker maps, and workers
+write their columnar results straight into a second shared block. Tasks
+carry only (first department, last department) bounds.
+
+Every grouped reduction of the bulk pipeline is keyed by department, and a
+shard holds whole departments with their rows in the original order, so
+each shard reproduces its slice of the serial result bit-for-bit; gap
+orders are shifted by the shard's first row. Small inputs run serially.
+
+Authors: Rajamangala University of Technology Krungthep Research Team
+License: MIT
+Version: 1.0.0
+"""
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+from edcellence_tqm.core.bulk import BulkAssessmentResult, BulkItems, assess_departments
+from edcellence_tqm.core.maturity import DEFAULT_MATURITY_BANDS, MaturityBands
+from edcellence_tqm.core.weights import WeightProfile, WeightsLike, as_weight_profile
+
+# Inputs below this many item rows are assessed serially
+MIN_PARALLEL_ITEMS = 50_000
+
+_INPUT_COLUMNS = ('department', 'category', 'item_type', 'item_code',
+                  'indicators', 'point_value', 'deployment_gap')
+
+
+@dataclass(frozen=True)
+class _ShardSettings:
+    """Labels and scoring settings shared by every shard (pickled once per worker)."""
+    departments: np.ndarray
+    categories: Tuple[str, ...]
+    item_names: np.ndarray
+    adli_weights: WeightProfile
+    letci_weights: WeightProfile
+    category_weights: WeightProfile
+    target_score: float
+    maturity_bands: MaturityBands
+
+    def assess(self, items: BulkItems) -> BulkAssessmentResult:
+        """Run assess_departments with these settings."""
+        return assess_departments(
+            items,
+            adli_weights=self.adli_weights,
+            letci_weights=self.letci_weights,
+            category_weights=self.category_weights,
+            target_score=self.target_score,
+            maturity_bands=self.maturity_bands,
+        )
+
+
+@dataclass
+class _WorkerState:
+    """Shared blocks and settings attached by _init_worker."""
+    inputs: 'SharedColumns'
+    outputs: 'SharedColumns'
+    settings: _ShardSettings
+
+
+# Worker-process state set by _init_worker
+_WORKER: Optional[_WorkerState] = None
+
+
+# ============================================================================
+# Shared Memory Columns
+# ============================================================================
+
+class SharedColumns:
+    """
+    Named numpy arrays packed into one shared memory block.
+
+    The creating process owns the block and must unlink it; other processes
+    attach by (name, layout) and get zero-copy views.
+
+    Example:
+        >>> shared = SharedColumns.create({'x': np.arange(5.0)})
+        >>> other = SharedColumns.attach(shared.name, shared.layout)
+        >>> other.arrays['x'][0] = 7.0
+        >>> shared.arrays['x'][0]
+        7.0
+        >>> other.close(); shared.close(); shared.unlink()
+    """
+
+    _ALIGNMENT = 64
+
+    def __init__(self, block: shared_memory.SharedMemory, layout: Tuple, owner: bool):
+        self._block = block
+        self.layout = layout
+        self.owner = owner
+        self.arrays = {
+            name: np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf, offset=offset)
+            for name, dtype, shape, offset in layout
+        }
+
+    @property
+    def name(self) -> str:
+        return self._block.name
+
+    @classmethod
+    def allocate(cls, specs: List[Tuple[str, str, Tuple[int, ...]]]) -> 'SharedColumns':
+        """Create a zero-filled block from [(name, dtype, shape), ...]."""
+        layout = []
+        offset = 0
+        for name, dtype, shape in specs:
+            offset = -(-offset // cls._ALIGNMENT) * cls._ALIGNMENT
+            layout.append((name, np.dtype(dtype).str, tuple(int(s) for s in shape), offset))
+            offset += int(np.prod(shape, dtype=np.int64)) * np.dtype(dtype).itemsize
+        block = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        shared = cls(block, tuple(layout), owner=True)
+        for array in shared.arrays.values():
+            array[...] = 0
+        return shared
+
+    @classmethod
+    def create(cls, columns: Dict[str, np.ndarray]) -> 'SharedColumns':
+        """Create a block holding copies of the given arrays."""
+        columns = {name: np.asarray(array) for name, array in columns.items()}
+        shared = cls.allocate([(name, a.dtype.str, a.shape) for name, a in columns.items()])
+        for name, array in columns.items():
+            shared.arrays[name][...] = array
+        return shared
+
+    @classmethod
+    def attach(cls, name: str, layout: Tuple) -> 'SharedColumns':
+        """Map an existing block created by another process."""
+        if sys.version_info >= (3, 13):
+            block = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            block = shared_memory.SharedMemory(name=name)
+        return cls(block, layout, owner=False)
+
+    def close(self):
+        """Drop the array views and unmap the block."""
+        self.arrays = {}
+        self._block.close()
+
+    def unlink(self):
+        """Free the block (owner only, after every process has closed it)."""
+        if self.owner:
+            self._block.unlink()
+
+
+# ============================================================================
+# Workers
+# ============================================================================
+
+def _init_worker(input_name, input_layout, output_name, output_layout,
+                 settings: _ShardSettings):
+    """Attach a worker process to the shared input and output blocks."""
+    global _WORKER
+    _WORKER = _WorkerState(
+        inputs=SharedColumns.attach(input_name, input_layout),
+        outputs=SharedColumns.attach(output_name, output_layout),
+        settings=settings,
+    )
+
+
+def _assess_shard(first: int, last: int, row_start: int, row_stop: int) -> int:
+    """Assess departments [first, last) into the shared output block."""
+    if _WORKER is None:
+        raise RuntimeError("Worker process was not initialized with _init_worker")
+    columns = _WORKER.inputs.arrays
+    out = _WORKER.outputs.arrays
+    settings = _WORKER.settings
+    rows = slice(row_start, row_stop)
+
+    shard = BulkItems(
+        departments=settings.departments[first:last],
+        categories=settings.categories,
+        item_names=settings.item_names,
+        department=columns['department'][rows] - first,
+        category=columns['category'][rows],
+        item_type=columns['item_type'][rows],
+        item_code=columns['item_code'][rows],
+        indicators=columns['indicators'][rows],
+        point_value=columns['point_value'][rows],
+        deployment_gap=columns['deployment_gap'][rows],
+        source_row=np.arange(row_start, row_stop),
+    )
+    result = settings.assess(shard)
+
+    departments = slice(first, last)
+    out['organizational_score'][departments] = result.organizational_score
+    out['category_scores'][departments] = result.category_scores
+    out['category_item_counts'][departments] = result.category_item_counts
+    out['ihi'][departments] = result.ihi
+    out['maturity_level'][departments] = result.maturity_level
+    out['item_score'][rows] = result.item_score
+    out['gap_priority'][rows] = result.gap_priority
+    out['gap_rank'][rows] = result.gap_rank
+    out['gap_order'][rows] = result.gap_order + row_start
+    return last - first
+
+
+def _shards(offsets: np.ndarray, chunk_size: int) -> List[Tuple[int, int, int, int]]:
+    """Split departments into (first, last, row_start, row_stop) shards."""
+    n_departments = len(offsets) - 1
+    return [
+        (first, min(first + chunk_size, n_departments),
+         int(offsets[first]), int(offsets[min(first + chunk_size, n_departments)]))
+        for first in range(0, n_departments, chunk_size)
+    ]
+
+
+# ============================================================================
+# Parallel Pipeline
+# ============================================================================
+
+def assess_departments_parallel(
+    items: BulkItems,
+    adli_weights: Optional[WeightsLike] = None,
+    letci_weights: Optional[WeightsLike] = None,
+    category_weights: Optional[WeightsLike] = None,
+    target_score: float = 100.0,
+    maturity_bands: Optional[MaturityBands] = None,
+    n_workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    min_parallel_items: int = MIN_PARALLEL_ITEMS
+) -> BulkAssessmentResult:
+    """
+    Compute Equations 1-6 for every department across worker processes.
+
+    Returns exactly what assess_departments(items, ...) returns.
+
+    Args:
+        items: BulkItems table (see BulkItems.from_frame / from_csv)
+        adli_weights: Optional ADLI WeightProfile or dict (NIST defaults if None)
+        letci_weights: Optional LeTCI WeightProfile or dict (Baldrige defaults if None)
+        category_weights: Optional category WeightProfile or dict (EdPEx defaults if None)
+        target_score: Target item score T_i for gap prioritization
+        maturity_bands: Optional maturity band table (MATURITY_BANDS if None)
+        n_workers: Worker processes (os.cpu_count() if None)
+        chunk_size: Departments per shard (default: about four shards per worker)
+        min_parallel_items: Inputs with fewer rows run serially
+
+    Returns:
+        BulkAssessmentResult with per-department and per-item columns
+
+    Raises:
+        ValueError: If n_workers or chunk_size is not positive, or a
+                    department cannot be assessed (as in assess_departments;
+                    the error of the first failing shard is raised)
+
+    Example:
+        >>> items = BulkItems.from_arrays(**generate_assessment_columns(50_000))
+        >>> result = assess_departments_parallel(items, n_workers=8)
+    """
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    if n_workers < 1:
+        raise ValueError(f"n_workers must be positive, got {n_workers}")
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    if maturity_bands is None:
+        maturity_bands = DEFAULT_MATURITY_BANDS
+
+    settings = _ShardSettings(
+        departments=items.departments,
+        categories=items.categories,
+        item_names=items.item_names,
+        adli_weights=as_weight_profile(adli_weights, 'adli'),
+        letci_weights=as_weight_profile(letci_weights, 'letci'),
+        category_weights=as_weight_profile(category_weights, 'category'),
+        target_score=target_score,
+        maturity_bands=maturity_bands,
+    )
+    n_departments = items.n_departments
+    if chunk_size is None:
+        chunk_size = max(1, -(-n_departments // (4 * n_workers)))
+    shards = _shards(items.department_offsets, chunk_size)
+
+    if n_workers == 1 or len(shards) < 2 or len(items) < min_parallel_items:
+        return settings.assess(items)
+
+    n = len(items)
+    n_categories = len(items.categories)
+    inputs = SharedColumns.create({name: getattr(items, name) for name in _INPUT_COLUMNS})
+    try:
+        outputs = SharedColumns.allocate([
+            ('organizational_score', 'f8', (n_departments,)),
+            ('category_scores', 'f8', (n_departments, n_categories)),
+            ('category_item_counts', 'i8', (n_departments, n_categories)),
+            ('ihi', 'f8', (n_departments,)),
+            ('maturity_level', 'i1', (n_departments,)),
+            ('item_score', 'f8', (n,)),
+            ('gap_priority', 'f8', (n,)),
+            ('gap_rank', 'i8', (n,)),
+            ('gap_order', 'i8', (n,)),
+        ])
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(n_workers, len(shards)),
+                initializer=_init_worker,
+                initargs=(inputs.name, inputs.layout, outputs.name, outputs.layout, settings),
+            ) as pool:
+                futures = [pool.submit(_assess_shard, *shard) for shard in shards]
+                for future in futures:
+                    future.result()
+            columns = {name: array.copy() for name, array in outputs.arrays.items()}
+        finally:
+            outputs.close()
+            outputs.unlink()
+    finally:
+        inputs.close()
+        inputs.unlink()
+
+    return BulkAssessmentResult(
+        departments=items.departments,
+        categories=items.categories,
+        items=items,
+        maturity_bands=maturity_bands,
+        **columns,
+    )
+
+
+__all__ = [
+    'MIN_PARALLEL_ITEMS',
+    'SharedColumns',
+    'assess_departments_parallel',
+]
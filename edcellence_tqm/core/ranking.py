@@ -0,0 +1,232 @@
+"""
+Top-k Gap Prioritization
+========================
+
+Partial selection of the highest gap priority scores (Equation 6).
+
+Improvement plans and ``vw_top_priorities`` only ever show the first few
+priorities, so sorting every (item_id, gap) tuple is wasted work once gaps
+are ranked across every item of every department. top_k_indices finds the
+k-th largest score with np.partition (O(n)) and sorts only the entries at or
+above it; ties at the boundary are all kept as candidates, so the result is
+exactly the first k entries of the full sort.
+
+Ordering is always by descending gap score, with ties broken by ascending
+item_id (then department), matching rank_improvement_priorities and the
+bulk gap ranks.
+
+TopKAccumulator merges per-department ranked lists into an institution-wide
+top-k with a bounded heap, holding at most k entries at any time.
+
+Authors: Rajamangala University of Technology Krungthep Research Team
+License: MIT
+Version: 1.0.0
+"""
+
+import heapq
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+import numpy as np
+
+KeysLike = Union[np.ndarray, Sequence[np.ndarray]]
+
+
+def top_k_indices(scores, k: int, keys: Optional[KeysLike] = None) -> np.ndarray:
+    """
+    Return the indices of the k highest scores in priority order.
+
+    Args:
+        scores: (N,) array-like of gap priority scores
+        k: Number of entries to select (all entries if k >= N)
+        keys: Optional tie-break key array, or sequence of key arrays with the
+              primary key first (e.g. item IDs). Remaining ties keep input order
+
+    Returns:
+        np.ndarray: (min(k, N),) int64 indices, highest score first
+
+    Example:
+        >>> ids = np.array(['2.1', '3.1', '1.1', '1.2'])
+        >>> top_k_indices([1250.0, 3080.0, 2400.0, 3080.0], 2, keys=ids)
+        array([3, 1])
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    if scores.ndim != 1:
+        raise ValueError(f"Scores must be one-dimensional, got shape {scores.shape}")
+    if k < 0:
+        raise ValueError(f"k must be non-negative, got {k}")
+    if np.isnan(scores).any():
+        raise ValueError("Gap scores must not be NaN")
+
+    if keys is None:
+        keys = []
+    elif isinstance(keys, np.ndarray):
+        keys = [keys]
+    keys = [np.asarray(key) for key in keys]
+    for key in keys:
+        if key.shape != scores.shape:
+            raise ValueError(f"Key shape {key.shape} does not match scores shape {scores.shape}")
+
+    n = len(scores)
+    k = min(int(k), n)
+    if k == 0:
+        return np.empty(0, dtype=np.int64)
+
+    negated = -scores
+    if k < n:
+        # Everything at or above the k-th largest score, including boundary ties
+        threshold = np.partition(negated, k - 1)[k - 1]
+        candidates = np.flatnonzero(negated <= threshold)
+    else:
+        candidates = np.arange(n)
+
+    # np.lexsort treats the last key as primary
+    sort_keys = [candidates] + [key[candidates] for key in reversed(keys)]
+    order = np.lexsort(sort_keys + [negated[candidates]])
+    return candidates[order[:k]].astype(np.int64)
+
+
+def top_k_priorities(gap_scores: Dict[str, float], k: int) -> List[Tuple[str, float]]:
+    """
+    Return the k highest-priority items from a {item_id: gap_score} dict.
+
+    Equivalent to rank_improvement_priorities(gap_scores)[:k] without
+    sorting the whole dict.
+
+    Args:
+        gap_scores: Dict mapping item IDs to gap priority scores
+        k: Number of items to return
+
+    Returns:
+        List of (item_id, gap_score) tuples, highest priority first
+
+    Example:
+        >>> top_k_priorities({'1.1': 3080.0, '2.1': 1250.0, '3.2': 2400.0}, 2)
+        [('1.1', 3080.0), ('3.2', 2400.0)]
+    """
+    item_ids = list(gap_scores)
+    scores = np.fromiter(gap_scores.values(), dtype=np.float64, count=len(item_ids))
+    keys = np.array(item_ids, dtype=str) if item_ids else None
+    rows = top_k_indices(scores, k, keys=keys).tolist()
+    return [(item_ids[i], float(scores[i])) for i in rows]
+
+
+class _Entry:
+    """Heap entry ordered worst-first, so the heap root is the entry to evict."""
+
+    __slots__ = ('key', 'department', 'item_id', 'score')
+
+    def __init__(self, department, item_id: str, score: float):
+        self.department = department
+        self.item_id = item_id
+        self.score = score
+        self.key = (-score, item_id, '' if department is None else str(department))
+
+    def __lt__(self, other: '_Entry') -> bool:
+        return self.key > other.key
+
+
+class TopKAccumulator:
+    """
+    Streaming institution-wide top-k over per-department gap rankings.
+
+    Each department's ranked list is pushed once; at most k entries are kept,
+    and a pushed list is read only until its entries stop qualifying.
+
+    Example:
+        >>> top = TopKAccumulator(10)
+        >>> for department, result in department_results:
+        ...     top.push(result['gap_priorities'], department=department)
+        >>> top.result()[:2]
+        [('Engineering', '1.1', 3080.0), ('Business Admin', '6.1', 2950.0)]
+    """
+
+    def __init__(self, k: int):
+        """
+        Initialize an empty accumulator.
+
+        Args:
+            k: Number of institution-wide priorities to keep
+        """
+        if k < 0:
+            raise ValueError(f"k must be non-negative, got {k}")
+        self.k = int(k)
+        self._heap: List[_Entry] = []
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def _offer(self, entry: _Entry) -> bool:
+        """Keep an entry if it qualifies; return False if it does not."""
+        heap = self._heap
+        if len(heap) < self.k:
+            heapq.heappush(heap, entry)
+        elif self.k and heap[0] < entry:
+            heapq.heapreplace(heap, entry)
+        else:
+            return False
+        return True
+
+    def push(self, ranked: Iterable[Tuple[str, float]], department=None):
+        """
+        Merge one department's ranked [(item_id, gap_score), ...] list.
+
+        The list must be ordered highest priority first (as returned by
+        rank_improvement_priorities or top_k_priorities); reading stops at
+        the first entry that does not make the current top-k.
+        """
+        for item_id, score in ranked:
+            if not self._offer(_Entry(department, item_id, float(score))):
+                break
+
+    def push_entries(self, ranked: Iterable[Tuple[object, str, float]]):
+        """
+        Merge a ranked [(department, item_id, gap_score), ...] list, such as
+        another accumulator's result(); reading stops as in push().
+        """
+        for department, item_id, score in ranked:
+            if not self._offer(_Entry(department, item_id, float(score))):
+                break
+
+    def push_scores(self, item_ids, scores, department=None):
+        """Merge unranked gap score arrays for one department."""
+        item_ids = np.asarray(item_ids).astype(str)
+        rows = top_k_indices(scores, self.k, keys=item_ids)
+        self.push(zip(item_ids[rows].tolist(), np.asarray(scores)[rows].tolist()), department)
+
+    def merge(self, other: 'TopKAccumulator'):
+        """Merge another accumulator (e.g. from a parallel worker) into this one."""
+        for entry in other._heap:
+            self._offer(entry)
+
+    def result(self) -> List[Tuple[object, str, float]]:
+        """Return [(department, item_id, gap_score), ...], highest priority first."""
+        return [(e.department, e.item_id, e.score)
+                for e in sorted(self._heap, key=lambda e: e.key)]
+
+
+def merge_top_k(
+    ranked_by_department: Dict[object, List[Tuple[str, float]]],
+    k: int
+) -> List[Tuple[object, str, float]]:
+    """
+    Merge per-department ranked gap lists into an institution-wide top-k.
+
+    Args:
+        ranked_by_department: {department: [(item_id, gap_score), ...]} with
+                              each list ordered highest priority first
+        k: Number of priorities to return
+
+    Returns:
+        List of (department, item_id, gap_score), highest priority first
+    """
+    accumulator = TopKAccumulator(k)
+    for department, ranked in ranked_by_department.items():
+        accumulator.push(ranked, department=department)
+    return accumulator.result()
+
+
+__all__ = [
+    'top_k_indices',
+    'top_k_priorities',
+    'TopKAccumulator',
+    'merge_top_k',
+]
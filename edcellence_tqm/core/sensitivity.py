@@ -0,0 +1,490 @@
+"""
+Weight Sensitivity Sweeps
+=========================
+
+Evaluate every department under many candidate weight profiles at once.
+
+Each sweep takes (W, 4) ADLI and/or LeTCI weight matrices and/or a (W, 7)
+category weight matrix (one candidate profile per row; omitted matrices stay
+at the baseline weights) and processes the profiles in chunks of
+``chunk_size``:
+
+    1. Item scores:     Σ_d w_d·x_d for items × W_chunk, clipped to [0,100]
+    2. Category scores: point-weighted sums per department × category as a
+                        sparse (cells × items) @ (items × W_chunk) product
+                        (Equation 3)
+    3. Org scores:      Σ_k W_k·C_k per department and profile (Equation 4)
+    4. Maturity:        band-edge classification of every org score
+
+Memory is bounded by the chunk (items × chunk_size floats); only per-profile
+and per-department summaries are kept unless keep_scores is set.
+
+Against the baseline assessment (assess_departments with the baseline
+weights) the sweep reports the org score distribution per department,
+Kendall's tau between each profile's department ranking and the baseline
+ranking, rank shifts, and maturity-level flips.
+
+The weighted sums in steps 1 and 3 are accumulated dimension by dimension
+rather than by BLAS, so a profile's scores do not depend on the chunk it
+falls in. The baseline is scored by the same kernel, so sweeping the
+baseline weights reproduces the baseline exactly and reports no flips at
+band edges. Kernel and assess_departments (exact sums) scores agree to
+within a few ulps rather than bit-for-bit.
+
+Authors: Rajamangala University of Technology Krungthep Research Team
+License: MIT
+Version: 1.0.0
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence
+import numpy as np
+from scipy import sparse
+
+from edcellence_tqm.core.bulk import BulkItems, assess_departments
+from edcellence_tqm.core.item_table import PROCESS_ITEM
+from edcellence_tqm.core.maturity import DEFAULT_MATURITY_BANDS, MaturityBands
+from edcellence_tqm.core.weights import WeightProfile, WeightsLike, as_weight_profile
+
+
+def _profile_matrix(profiles, kind: str, dimensions: Sequence[str]) -> Optional[np.ndarray]:
+    """Convert candidate profiles to a validated (W, dims) float64 matrix."""
+    if profiles is None:
+        return None
+    if len(profiles) and isinstance(profiles[0], Mapping):
+        rows = []
+        for profile in profiles:
+            profile = as_weight_profile(profile, kind)
+            missing = [d for d in dimensions if d not in profile]
+            if missing:
+                raise ValueError(f"Missing weights for dimensions: {missing}")
+            rows.append([profile[d] for d in dimensions])
+        matrix = np.array(rows, dtype=np.float64).reshape(-1, len(dimensions))
+    else:
+        matrix = np.array(profiles, dtype=np.float64)
+
+    if matrix.ndim != 2 or matrix.shape[1] != len(dimensions):
+        raise ValueError(
+            f"{kind.upper()} profiles must have shape (W, {len(dimensions)}), got {matrix.shape}"
+        )
+    if not np.all(np.isfinite(matrix)):
+        raise ValueError(f"{kind.upper()} profiles must be finite")
+    sums = matrix.sum(axis=1)
+    bad = np.flatnonzero(~np.isclose(sums, 1.0, atol=1e-6))
+    if len(bad):
+        raise ValueError(
+            f"{kind.upper()} profile {bad[0]} must sum to 1.0, got {sums[bad[0]]}"
+        )
+    return matrix
+
+
+def random_weight_profiles(
+    base: WeightProfile,
+    n_profiles: int,
+    concentration: float = 200.0,
+    seed: int = 0
+) -> np.ndarray:
+    """
+    Draw candidate profiles scattered around a base profile.
+
+    Rows are Dirichlet samples with mean equal to the base weights; higher
+    concentration keeps them closer to the base.
+
+    Args:
+        base: Profile to perturb (e.g. DEFAULT_CATEGORY_PROFILE)
+        n_profiles: Number of rows W
+        concentration: Dirichlet concentration (sum of alphas)
+        seed: Random seed
+
+    Returns:
+        np.ndarray: (W, len(base)) matrix whose rows sum to 1
+    """
+    if np.any(base.vector <= 0):
+        raise ValueError("Base profile weights must be positive to perturb")
+    rng = np.random.default_rng(seed)
+    return rng.dirichlet(base.vector * concentration, size=n_profiles)
+
+
+# ============================================================================
+# Result
+# ============================================================================
+
+@dataclass
+class SensitivityResult:
+    """
+    Department and profile level summaries of a weight sweep.
+
+    Attributes:
+        departments: (D,) department labels
+        baseline_score: (D,) org scores under the baseline weights
+        baseline_level: (D,) baseline maturity level codes
+        score_mean: (D,) mean org score across profiles
+        score_std: (D,) population std of org scores across profiles
+        score_min: (D,) lowest org score across profiles
+        score_max: (D,) highest org score across profiles
+        profile_mean_score: (W,) mean org score over departments per profile
+        kendall_tau: (W,) Kendall's tau of each profile's department ranking
+                     versus the baseline ranking (ties in either ranking
+                     ordered by department; NaN for a single department)
+        maturity_flips: (W,) departments whose maturity level differs from
+                        the baseline under each profile
+        department_flips: (D,) profiles under which each department's level
+                          differs from its baseline level
+        max_rank_shift: (D,) largest |rank - baseline rank| across profiles
+        level_transitions: (B, B) counts of (baseline level, swept level)
+                           over every department × profile pair
+        maturity_bands: Band table used for the levels
+        org_scores: (W, D) every org score (only if keep_scores was set)
+    """
+    departments: np.ndarray
+    baseline_score: np.ndarray
+    baseline_level: np.ndarray
+    score_mean: np.ndarray
+    score_std: np.ndarray
+    score_min: np.ndarray
+    score_max: np.ndarray
+    profile_mean_score: np.ndarray
+    kendall_tau: np.ndarray
+    maturity_flips: np.ndarray
+    department_flips: np.ndarray
+    max_rank_shift: np.ndarray
+    level_transitions: np.ndarray
+    maturity_bands: MaturityBands
+    org_scores: Optional[np.ndarray] = None
+
+    @property
+    def n_profiles(self) -> int:
+        return len(self.kendall_tau)
+
+    def score_quantiles(self, q: Sequence[float]) -> np.ndarray:
+        """
+        Return (len(q), D) quantiles of each department's org score.
+
+        Requires a sweep run with keep_scores=True.
+        """
+        if self.org_scores is None:
+            raise ValueError("Quantiles need the full score matrix; rerun with keep_scores=True")
+        return np.quantile(self.org_scores, q, axis=0)
+
+    def to_frame(self):
+        """Return the department-level summary as a pandas DataFrame."""
+        import pandas as pd
+
+        return pd.DataFrame({
+            'department': self.departments,
+            'baseline_score': self.baseline_score,
+            'baseline_level': self.baseline_level,
+            'score_mean': self.score_mean,
+            'score_std': self.score_std,
+            'score_min': self.score_min,
+            'score_max': self.score_max,
+            'level_flips': self.department_flips,
+            'max_rank_shift': self.max_rank_shift,
+        })
+
+    def profile_frame(self):
+        """Return the per-profile summary as a pandas DataFrame."""
+        import pandas as pd
+
+        return pd.DataFrame({
+            'profile': np.arange(self.n_profiles),
+            'mean_score': self.profile_mean_score,
+            'kendall_tau': self.kendall_tau,
+            'maturity_flips': self.maturity_flips,
+        })
+
+
+# ============================================================================
+# Sweep
+# ============================================================================
+
+def _weighted_sum(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    (n, k) or (n, k, 1 or w) values × (w, k) weights → (n, w), summed over k in order.
+
+    Each output column depends only on its own weights and values, never on
+    how many columns are evaluated together (unlike a BLAS product).
+    """
+    if values.ndim == 2:
+        values = values[:, :, None]
+    total = values[:, 0] * weights[:, 0]
+    for k in range(1, values.shape[1]):
+        total += values[:, k] * weights[:, k]
+    return total
+
+
+def _descending_ranks(scores: np.ndarray) -> np.ndarray:
+    """0-based descending ranks along axis 0 (ties by department order)."""
+    order = np.argsort(-scores, axis=0, kind='stable')
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(len(scores))[:, None], axis=0)
+    return ranks
+
+
+def _kendall_tau(baseline_rank: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    """
+    Kendall's tau between a baseline ranking and each column of ranks.
+
+    Rankings are permutations (ties already broken), so tau = 1 - 4·I/(n(n-1))
+    where I is the number of inversions of the profile ranks listed in
+    baseline order. I is counted for all columns at once by a bottom-up
+    merge sort: at each level the blocks of size 2b are argsorted and every
+    right-half element counts the left-half elements that sort after it.
+    """
+    n, width = ranks.shape
+    if n < 2:
+        return np.full(width, np.nan)
+
+    size = 1 << (n - 1).bit_length()
+    blocks = np.empty((width, size), dtype=np.int64)
+    blocks[:, :n] = ranks[np.argsort(baseline_rank)].T
+    blocks[:, n:] = np.arange(n, size)  # padding above every rank adds no inversions
+
+    inversions = np.zeros(width, dtype=np.int64)
+    half = 1
+    while half < size:
+        view = blocks.reshape(width, size // (2 * half), 2 * half)
+        order = np.argsort(view, axis=-1, kind='stable')
+        is_left = order < half
+        left_before = np.cumsum(is_left, axis=-1)
+        inversions += np.where(is_left, 0, half - left_before).sum(axis=(1, 2))
+        view[...] = np.take_along_axis(view, order, axis=-1)
+        half *= 2
+    return 1.0 - 4.0 * inversions / (n * (n - 1))
+
+
+def sweep_weights(
+    items: BulkItems,
+    adli_profiles=None,
+    letci_profiles=None,
+    category_profiles=None,
+    category_names: Optional[Sequence[str]] = None,
+    baseline_weights: Optional[Dict[str, WeightsLike]] = None,
+    maturity_bands: Optional[MaturityBands] = None,
+    chunk_size: int = 256,
+    keep_scores: bool = False
+) -> SensitivityResult:
+    """
+    Score every department under W candidate weight profiles in one pass.
+
+    Args:
+        items: BulkItems table of all departments
+        adli_profiles: Optional (W, 4) ADLI weights (A, D, L, I) or a list of
+                       WeightProfile / dicts
+        letci_profiles: Optional (W, 4) LeTCI weights (Lv, Tr, Cp, I)
+        category_profiles: Optional (W, K) category weights whose columns
+                           follow category_names
+        category_names: Category column order (defaults to the baseline
+                        category profile, i.e. EdPEx order)
+        baseline_weights: Optional {'adli_weights', 'letci_weights',
+                          'category_weights'} for the baseline assessment;
+                          omitted profile matrices use these weights
+        maturity_bands: Optional maturity band table
+        chunk_size: Profiles evaluated per chunk (bounds memory)
+        keep_scores: Keep the full (W, D) org score matrix
+
+    Returns:
+        SensitivityResult
+
+    Raises:
+        ValueError: If no profiles are given, row counts differ, a profile
+                    does not sum to 1, or a department lacks a category
+
+    Example:
+        >>> profiles = random_weight_profiles(DEFAULT_CATEGORY_PROFILE, 1000)
+        >>> result = sweep_weights(items, category_profiles=profiles)
+        >>> result.kendall_tau.min(), result.maturity_flips.max()
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    baseline_weights = dict(baseline_weights or {})
+    unknown = set(baseline_weights) - {'adli_weights', 'letci_weights', 'category_weights'}
+    if unknown:
+        raise ValueError(f"Unknown baseline weight keys: {sorted(unknown)}")
+    if maturity_bands is None:
+        maturity_bands = DEFAULT_MATURITY_BANDS
+
+    adli_base = as_weight_profile(baseline_weights.get('adli_weights'), 'adli')
+    letci_base = as_weight_profile(baseline_weights.get('letci_weights'), 'letci')
+    category_base = as_weight_profile(baseline_weights.get('category_weights'), 'category')
+    if category_names is None:
+        category_names = category_base.dimensions
+    category_names = tuple(category_names)
+
+    adli = _profile_matrix(adli_profiles, 'adli', adli_base.dimensions)
+    letci = _profile_matrix(letci_profiles, 'letci', letci_base.dimensions)
+    category = _profile_matrix(category_profiles, 'category', category_names)
+    given = [m for m in (adli, letci, category) if m is not None]
+    if not given:
+        raise ValueError(
+            "At least one of adli_profiles, letci_profiles or category_profiles is required"
+        )
+    n_profiles = len(given[0])
+    if any(len(m) != n_profiles for m in given):
+        raise ValueError(f"Profile matrices must have the same number of rows, got "
+                         f"{[len(m) for m in given]}")
+
+    if category is None:
+        missing = [name for name in category_names if name not in category_base]
+        if missing:
+            raise ValueError(f"Missing weights for categories: {missing}")
+    category_base_row = np.array([category_base.get(name, 0.0) for name in category_names])
+
+    # Baseline assessment (also validates categories, IHI inputs and points)
+    baseline = assess_departments(items, maturity_bands=maturity_bands, **baseline_weights)
+    for name in category_names:
+        if name not in items.categories:
+            raise ValueError(f"Missing score for category: {name}")
+    category_columns = np.array([items.categories.index(name) for name in category_names])
+    lacking = np.flatnonzero(
+        (baseline.category_item_counts[:, category_columns] == 0).any(axis=1)
+    )
+    if len(lacking):
+        raise ValueError(
+            f"Missing category scores for department {items.departments[lacking[0]]!r}"
+        )
+
+    # Sparse (department × swept category, item) matrix of point values, so
+    # Equation 3 numerators for every profile are one sparse @ dense product
+    n_departments = items.n_departments
+    n_swept = len(category_names)
+    column_of = np.full(len(items.categories), -1, dtype=np.int64)
+    column_of[category_columns] = np.arange(n_swept)
+    item_column = column_of[items.category]
+    rows = np.flatnonzero(item_column >= 0)
+    points = items.point_value.astype(np.float64)
+    aggregate = sparse.csr_matrix(
+        (points[rows], (items.department[rows] * n_swept + item_column[rows], rows)),
+        shape=(n_departments * n_swept, len(items))
+    )
+    denominator = np.asarray(aggregate.sum(axis=1)).ravel()
+    is_process = items.item_type == PROCESS_ITEM
+    process_x = np.ascontiguousarray(items.indicators[is_process])
+    results_x = np.ascontiguousarray(items.indicators[~is_process])
+
+    def category_scores_for(item_scores: np.ndarray) -> np.ndarray:
+        """(N, w) item scores → (D, K, w) Equation 3 scores for the swept categories."""
+        numerator = aggregate @ item_scores
+        numerator /= denominator[:, None]
+        return numerator.reshape(n_departments, n_swept, -1)
+
+    def item_scores_for(adli_chunk: np.ndarray, letci_chunk: np.ndarray) -> np.ndarray:
+        """Equations 1-2 for (w, 4) ADLI and LeTCI weight chunks → (N, w)."""
+        item_scores = np.empty((len(items), len(adli_chunk)))
+        item_scores[is_process] = _weighted_sum(process_x, adli_chunk)
+        item_scores[~is_process] = _weighted_sum(results_x, letci_chunk)
+        item_scores *= 100
+        return np.clip(item_scores, 0, 100, out=item_scores)
+
+    def org_scores_for(category_scores: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """(D, K, 1 or w) category scores and (w, K) weights → (D, w) Equation 4 scores."""
+        scores = _weighted_sum(category_scores, weights)
+        return np.clip(scores, 0, 100, out=scores)
+
+    # Baseline item and category scores through the sweep kernel; they do not
+    # vary when only category weights are swept
+    base_categories = category_scores_for(
+        item_scores_for(adli_base.vector[None, :], letci_base.vector[None, :])
+    )
+
+    # Baseline references, scored by the kernel whenever the swept categories
+    # are exactly the baseline's, so an unchanged profile reproduces them
+    if set(category_names) == set(category_base.dimensions):
+        baseline_score = org_scores_for(base_categories, category_base_row[None, :])[:, 0]
+        baseline_level = maturity_bands.classify(baseline_score)
+    else:
+        baseline_score = baseline.organizational_score
+        baseline_level = baseline.maturity_level
+    baseline_rank = _descending_ranks(baseline_score[:, None])[:, 0]
+    n_bands = len(maturity_bands)
+    band_position = np.full(128, -1, dtype=np.int64)
+    band_position[maturity_bands.levels] = np.arange(n_bands)
+    baseline_band = band_position[baseline_level]
+
+    # Accumulators
+    score_sum = np.zeros(n_departments)
+    score_m2 = np.zeros(n_departments)
+    score_min = np.full(n_departments, np.inf)
+    score_max = np.full(n_departments, -np.inf)
+    profile_mean_score = np.empty(n_profiles)
+    kendall_tau = np.empty(n_profiles)
+    maturity_flips = np.empty(n_profiles, dtype=np.int64)
+    department_flips = np.zeros(n_departments, dtype=np.int64)
+    max_rank_shift = np.zeros(n_departments, dtype=np.int64)
+    level_transitions = np.zeros(n_bands * n_bands, dtype=np.int64)
+    org_scores = np.empty((n_profiles, n_departments)) if keep_scores else None
+
+    for start in range(0, n_profiles, chunk_size):
+        stop = min(start + chunk_size, n_profiles)
+        width = stop - start
+        if category is not None:
+            weights = category[start:stop]
+        else:
+            weights = np.broadcast_to(category_base_row, (width, len(category_names)))
+
+        # Equations 1-4
+        if adli is None and letci is None:
+            category_scores = base_categories
+        else:
+            adli_chunk = (adli[start:stop] if adli is not None
+                          else np.broadcast_to(adli_base.vector, (width, 4)))
+            letci_chunk = (letci[start:stop] if letci is not None
+                           else np.broadcast_to(letci_base.vector, (width, 4)))
+            category_scores = category_scores_for(item_scores_for(adli_chunk, letci_chunk))
+        scores = org_scores_for(category_scores, weights)
+        levels = maturity_bands.classify(scores)
+
+        # Distribution (chunk moments merged with Chan's update)
+        seen = start
+        chunk_mean = scores.mean(axis=1)
+        chunk_m2 = ((scores - chunk_mean[:, None]) ** 2).sum(axis=1)
+        if seen:
+            delta = chunk_mean - score_sum / seen
+            score_m2 += chunk_m2 + delta ** 2 * seen * width / (seen + width)
+        else:
+            score_m2 += chunk_m2
+        score_sum += scores.sum(axis=1)
+        np.minimum(score_min, scores.min(axis=1), out=score_min)
+        np.maximum(score_max, scores.max(axis=1), out=score_max)
+        profile_mean_score[start:stop] = scores.mean(axis=0)
+        if keep_scores:
+            org_scores[start:stop] = scores.T
+
+        # Rank stability
+        ranks = _descending_ranks(scores)
+        kendall_tau[start:stop] = _kendall_tau(baseline_rank, ranks)
+        shift = np.abs(ranks - baseline_rank[:, None])
+        np.maximum(max_rank_shift, shift.max(axis=1), out=max_rank_shift)
+
+        # Maturity flips
+        flipped = levels != baseline_level[:, None]
+        maturity_flips[start:stop] = flipped.sum(axis=0)
+        department_flips += flipped.sum(axis=1)
+        pairs = baseline_band[:, None] * n_bands + band_position[levels]
+        level_transitions += np.bincount(pairs.ravel(), minlength=n_bands * n_bands)
+
+    return SensitivityResult(
+        departments=items.departments,
+        baseline_score=baseline_score,
+        baseline_level=baseline_level,
+        score_mean=score_sum / n_profiles,
+        score_std=np.sqrt(score_m2 / n_profiles),
+        score_min=score_min,
+        score_max=score_max,
+        profile_mean_score=profile_mean_score,
+        kendall_tau=kendall_tau,
+        maturity_flips=maturity_flips,
+        department_flips=department_flips,
+        max_rank_shift=max_rank_shift,
+        level_transitions=level_transitions.reshape(n_bands, n_bands),
+        maturity_bands=maturity_bands,
+        org_scores=org_scores,
+    )
+
+
+__all__ = [
+    'SensitivityResult',
+    'random_weight_profiles',
+    'sweep_weights',
+]
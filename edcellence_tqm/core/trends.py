@@ -0,0 +1,415 @@
+"""
+LeTCI Level and Trend Derivation
+================================
+
+Derives the LeTCI ``level`` and ``trend`` indicators of results items from
+raw metric values (fact_results_metrics.metric_value) instead of entering
+them by hand.
+
+Every department × metric pair is one series over the assessment cycles.
+Series are held as one (S, T) array with NaN for missing cycles, so every
+computation below runs over all series at once:
+
+    level_t = clip((v_t - baseline) / (target - baseline), 0, 1)
+    trend_t = clip(0.5 + r_t / (2·full_credit_rate), 0, 1)
+    r_t     = slope_t / (target - baseline)
+
+slope_t is the least-squares (or Theil–Sen) slope of the trailing
+``window`` cycles ending at t, in metric units per cycle, so r_t is the
+share of the baseline-to-target distance gained per cycle. A flat series
+scores 0.5, improving by ``full_credit_rate`` of the distance per cycle
+scores 1 and declining at that rate scores 0. Metrics where lower is better
+simply have target < baseline.
+
+TrendTracker computes the same slopes incrementally: it keeps running
+regression sums per series and updates them in O(S) per new cycle, without
+refitting the history.
+
+Authors: Rajamangala University of Technology Krungthep Research Team
+License: MIT
+Version: 1.0.0
+"""
+
+import warnings
+from dataclasses import dataclass
+from typing import Mapping, Tuple
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from edcellence_tqm.core.bulk import _factorize
+
+TREND_METHODS = ('ols', 'theil_sen')
+
+
+def _check_window(window: int, min_periods: int, method: str):
+    if method not in TREND_METHODS:
+        raise ValueError(f"method must be one of {TREND_METHODS}, got {method!r}")
+    if window < 2:
+        raise ValueError(f"window must be at least 2, got {window}")
+    if not 2 <= min_periods <= window:
+        raise ValueError(f"min_periods must be in 2..window, got {min_periods}")
+
+
+# ============================================================================
+# Metric Series
+# ============================================================================
+
+@dataclass
+class MetricSeries:
+    """
+    Department × metric series on a common cycle axis.
+
+    Attributes:
+        departments: (S,) department of each series
+        metrics: (S,) metric (item_id) of each series
+        cycles: (T,) sorted cycle labels
+        values: (S, T) metric values, NaN where a cycle was not measured
+        series: (N,) series index of each source row
+        cycle: (N,) cycle index of each source row
+    """
+    departments: np.ndarray
+    metrics: np.ndarray
+    cycles: np.ndarray
+    values: np.ndarray
+    series: np.ndarray
+    cycle: np.ndarray
+
+    @classmethod
+    def from_arrays(cls, department, metric, cycle, value) -> 'MetricSeries':
+        """
+        Pivot long-format measurements into (S, T) series.
+
+        Raises:
+            ValueError: If a (department, metric, cycle) is measured twice
+        """
+        value = np.asarray(value, dtype=np.float64)
+        department_code, departments = _factorize(department)
+        metric_code, metrics = _factorize(metric)
+        cycles, cycle_code = np.unique(np.asarray(cycle), return_inverse=True)
+        cycle_code = cycle_code.ravel().astype(np.int64)
+
+        pair = department_code * max(len(metrics), 1) + metric_code
+        pairs, series = np.unique(pair, return_inverse=True)
+        series = series.ravel().astype(np.int64)
+        cell = series * len(cycles) + cycle_code
+        if len(np.unique(cell)) != len(cell):
+            raise ValueError("Each (department, metric, cycle) must be measured once")
+
+        values = np.full((len(pairs), len(cycles)), np.nan)
+        values[series, cycle_code] = value
+        return cls(
+            departments=departments[pairs // max(len(metrics), 1)],
+            metrics=metrics[pairs % max(len(metrics), 1)],
+            cycles=cycles,
+            values=values,
+            series=series,
+            cycle=cycle_code,
+        )
+
+    @classmethod
+    def from_frame(
+        cls,
+        frame,
+        department: str = 'department',
+        metric: str = 'item_id',
+        cycle: str = 'assessment_date',
+        value: str = 'metric_value'
+    ) -> 'MetricSeries':
+        """Pivot the rows of a long-format DataFrame with a non-null metric value."""
+        rows = frame[frame[value].notna()]
+        return cls.from_arrays(rows[department].to_numpy(), rows[metric].to_numpy(),
+                               rows[cycle].to_numpy(), rows[value].to_numpy())
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.values.shape
+
+    def target_arrays(self, targets: Mapping) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Per-series (baseline, target) arrays from a {metric: (baseline, target)} mapping.
+
+        Raises:
+            ValueError: If a metric has no target or baseline equals target
+        """
+        missing = sorted({str(m) for m in self.metrics.tolist() if m not in targets})
+        if missing:
+            raise ValueError(f"No (baseline, target) configured for metrics: {missing}")
+        pairs = np.array([targets[m] for m in self.metrics.tolist()],
+                         dtype=np.float64).reshape(-1, 2)
+        baseline, target = pairs[:, 0], pairs[:, 1]
+        if np.any(baseline == target):
+            raise ValueError("Baseline and target must differ for every metric")
+        return baseline, target
+
+
+# ============================================================================
+# Vectorized Slopes and Indicators
+# ============================================================================
+
+def _window_sums(
+    windows: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """n, Σx, Σx², Σy, Σxy over the last axis, x = -(w-1)..0, NaN excluded."""
+    w = windows.shape[-1]
+    x = np.arange(-(w - 1), 1, dtype=np.float64)
+    mask = ~np.isnan(windows)
+    y = np.where(mask, windows, 0.0)
+    xm = np.where(mask, x, 0.0)
+    return (
+        mask.sum(axis=-1),
+        xm.sum(axis=-1),
+        (xm * x).sum(axis=-1),
+        y.sum(axis=-1),
+        (xm * y).sum(axis=-1),
+    )
+
+
+def _ols_slope(n, sx, sxx, sy, sxy, min_periods: int) -> np.ndarray:
+    denominator = n * sxx - sx * sx
+    ok = (n >= min_periods) & (denominator > 0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(ok, (n * sxy - sx * sy) / denominator, np.nan)
+
+
+def _theil_sen_slope(windows: np.ndarray, min_periods: int) -> np.ndarray:
+    """Median of pairwise slopes over the last axis (NaN pairs skipped)."""
+    first, second = np.triu_indices(windows.shape[-1], k=1)
+    pairwise = (windows[..., second] - windows[..., first]) / (second - first)
+    enough = np.count_nonzero(~np.isnan(windows), axis=-1) >= min_periods
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN windows
+        slope = np.nanmedian(pairwise, axis=-1)
+    return np.where(enough, slope, np.nan)
+
+
+def rolling_slopes(
+    values,
+    window: int = 4,
+    method: str = 'ols',
+    min_periods: int = 3
+) -> np.ndarray:
+    """
+    Trailing-window slope of every series at every cycle.
+
+    Args:
+        values: (S, T) series, NaN for missing cycles
+        window: Number of cycles in each trailing window (including t)
+        method: 'ols' (least squares) or 'theil_sen' (median pairwise slope)
+        min_periods: Minimum measured cycles in a window for a slope
+
+    Returns:
+        np.ndarray: (S, T) slopes in value units per cycle (NaN where the
+        window has fewer than min_periods measurements)
+
+    Example:
+        >>> rolling_slopes([[1.0, 2.0, 4.0, np.nan, 5.0]], window=3, min_periods=2)
+        array([[nan, 1. , 1.5, 2. , 0.5]])
+    """
+    _check_window(window, min_periods, method)
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim != 2:
+        raise ValueError(f"values must have shape (S, T), got {values.shape}")
+    padded = np.concatenate([np.full((len(values), window - 1), np.nan), values], axis=1)
+    windows = sliding_window_view(padded, window, axis=1)
+    if method == 'theil_sen':
+        return _theil_sen_slope(windows, min_periods)
+    return _ols_slope(*_window_sums(windows), min_periods)
+
+
+def level_indicators(values, baseline, target) -> np.ndarray:
+    """
+    LeTCI level: position of each value between baseline (0) and target (1).
+
+    baseline and target broadcast against values, e.g. (S, 1) columns for
+    (S, T) series. NaN values stay NaN.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    span = np.asarray(target, dtype=np.float64) - baseline
+    return np.clip((values - baseline) / span, 0.0, 1.0)
+
+
+def trend_indicators(slopes, baseline, target, full_credit_rate: float = 0.1) -> np.ndarray:
+    """
+    LeTCI trend: 0.5 for a flat series, 1 (0) when improving (declining) by
+    full_credit_rate of the baseline-to-target distance per cycle.
+    """
+    if full_credit_rate <= 0:
+        raise ValueError(f"full_credit_rate must be positive, got {full_credit_rate}")
+    span = np.asarray(target, dtype=np.float64) - baseline
+    rate = np.asarray(slopes, dtype=np.float64) / span
+    return np.clip(0.5 + rate / (2.0 * full_credit_rate), 0.0, 1.0)
+
+
+def derive_letci(
+    frame,
+    targets: Mapping,
+    window: int = 4,
+    method: str = 'ols',
+    full_credit_rate: float = 0.1,
+    min_periods: int = 3,
+    department: str = 'department',
+    metric: str = 'item_id',
+    cycle: str = 'assessment_date',
+    value: str = 'metric_value'
+):
+    """
+    Fill the level and trend indicators of results rows from their metric values.
+
+    Args:
+        frame: Long-format DataFrame with a metric value column
+        targets: {metric: (baseline, target)} for every measured metric
+        window: Cycles per trend window
+        method: 'ols' or 'theil_sen'
+        full_credit_rate: Share of the baseline-to-target distance per cycle
+                          that earns a trend of 1
+        min_periods: Minimum measured cycles per trend window
+        department, metric, cycle, value: Column names
+
+    Returns:
+        Copy of frame with 'metric_slope' added and 'level' / 'trend' filled
+        for measured rows; rows whose window is too short keep their trend
+
+    Raises:
+        ValueError: If a metric has no target or a cell is measured twice
+    """
+    series = MetricSeries.from_frame(frame, department, metric, cycle, value)
+    baseline, target = series.target_arrays(targets)
+    slopes = rolling_slopes(series.values, window, method, min_periods)
+    levels = level_indicators(series.values, baseline[:, None], target[:, None])
+    trends = trend_indicators(slopes, baseline[:, None], target[:, None], full_credit_rate)
+
+    result = frame.copy()
+    rows = np.flatnonzero(frame[value].notna().to_numpy())
+    at = (series.series, series.cycle)
+    slope_column = np.full(len(frame), np.nan)
+    slope_column[rows] = slopes[at]
+    result['metric_slope'] = slope_column
+
+    for name, derived in (('level', levels[at]), ('trend', trends[at])):
+        column = (result[name].to_numpy(dtype=np.float64, copy=True) if name in result
+                  else np.full(len(frame), np.nan))
+        known = ~np.isnan(derived)
+        column[rows[known]] = derived[known]
+        result[name] = column
+    return result
+
+
+# ============================================================================
+# Incremental Trends
+# ============================================================================
+
+class TrendTracker:
+    """
+    Trailing-window slopes of S series, updated one cycle at a time.
+
+    For least squares, keeps n, Σx, Σx², Σy and Σxy of each window with x
+    measured relative to the newest cycle (x = 0 newest, -1 previous, ...),
+    so a new cycle drops the oldest point, shifts x by one and adds the new
+    point in O(S). Theil–Sen recomputes the median from the window buffer.
+    Slopes agree with rolling_slopes to rounding.
+
+    Example:
+        >>> tracker = TrendTracker.from_values(series.values, window=4)
+        >>> slopes = tracker.update(next_cycle_values)
+    """
+
+    def __init__(self, n_series: int, window: int = 4, method: str = 'ols',
+                 min_periods: int = 3):
+        """
+        Initialize a tracker with empty windows.
+
+        Args:
+            n_series: Number of series S
+            window: Cycles per trailing window
+            method: 'ols' or 'theil_sen'
+            min_periods: Minimum measured cycles in a window for a slope
+        """
+        _check_window(window, min_periods, method)
+        self.window = window
+        self.method = method
+        self.min_periods = min_periods
+        self.n_cycles = 0
+        # Ring buffer of the last `window` values; _head is the oldest slot
+        self._buffer = np.full((n_series, window), np.nan)
+        self._head = 0
+        self._n = np.zeros(n_series)
+        self._sx = np.zeros(n_series)
+        self._sxx = np.zeros(n_series)
+        self._sy = np.zeros(n_series)
+        self._sxy = np.zeros(n_series)
+
+    @classmethod
+    def from_values(cls, values, window: int = 4, method: str = 'ols',
+                    min_periods: int = 3) -> 'TrendTracker':
+        """Build a tracker positioned after the last cycle of (S, T) history."""
+        values = np.asarray(values, dtype=np.float64)
+        tracker = cls(len(values), window, method, min_periods)
+        for t in range(values.shape[1]):
+            tracker.update(values[:, t])
+        return tracker
+
+    @property
+    def n_series(self) -> int:
+        return len(self._buffer)
+
+    def update(self, values) -> np.ndarray:
+        """
+        Add one cycle (NaN for series not measured) and return the new slopes.
+
+        Returns:
+            np.ndarray: (S,) slopes of the windows ending at the new cycle
+        """
+        y = np.asarray(values, dtype=np.float64)
+        if y.shape != (self.n_series,):
+            raise ValueError(f"Expected {self.n_series} values, got shape {y.shape}")
+        offset = float(self.window - 1)
+
+        # Drop the oldest point (x = -(w-1)), then shift every x down by one
+        oldest = self._buffer[:, self._head]
+        leaving = ~np.isnan(oldest)
+        old_y = np.where(leaving, oldest, 0.0)
+        self._n -= leaving
+        self._sx += offset * leaving
+        self._sxx -= offset * offset * leaving
+        self._sy -= old_y
+        self._sxy += offset * old_y
+        self._sxx += self._n - 2.0 * self._sx
+        self._sx -= self._n
+        self._sxy -= self._sy
+
+        # Add the new point at x = 0
+        arriving = ~np.isnan(y)
+        self._n += arriving
+        self._sy += np.where(arriving, y, 0.0)
+        self._buffer[:, self._head] = y
+        self._head = (self._head + 1) % self.window
+        self.n_cycles += 1
+        return self.slopes()
+
+    def slopes(self) -> np.ndarray:
+        """(S,) slopes of the current windows."""
+        if self.method == 'theil_sen':
+            return _theil_sen_slope(self.windows(), self.min_periods)
+        return _ols_slope(self._n, self._sx, self._sxx, self._sy, self._sxy, self.min_periods)
+
+    def windows(self) -> np.ndarray:
+        """(S, window) current window values, oldest first."""
+        return np.roll(self._buffer, -self._head, axis=1)
+
+    def indicators(self, baseline, target, full_credit_rate: float = 0.1) -> Tuple[
+            np.ndarray, np.ndarray]:
+        """(level, trend) indicators of the newest cycle of every series."""
+        latest = self._buffer[:, (self._head - 1) % self.window]
+        return (level_indicators(latest, baseline, target),
+                trend_indicators(self.slopes(), baseline, target, full_credit_rate))
+
+
+__all__ = [
+    'TREND_METHODS',
+    'MetricSeries',
+    'TrendTracker',
+    'derive_letci',
+    'level_indicators',
+    'rolling_slopes',
+    'trend_indicators',
+]
@@ -0,0 +1,556 @@
+"""
+Monte Carlo Uncertainty Propagation
+===================================
+
+Confidence intervals on organizational scores, category scores and IHI
+under assessor noise in the indicator values.
+
+Each Monte Carlo sample perturbs every indicator of every item with
+Gaussian noise, clips it to [0,1] and pushes the perturbed table through
+Equations 1-5:
+
+    x̃_ij = clip(x_ij + σ_ij·z_ij + τ_a(i)·u_a(i), 0, 1)
+
+where σ_ij is the noise level of dimension j of item i (a scalar, one level
+per dimension, or one level per assessor) and the optional τ_a·u_a is a
+shift shared by every item scored by assessor a in that sample (assessor
+leniency or severity).
+
+Samples are processed in chunks of ``chunk_size``; per-department results
+are folded into fixed-bin histograms, so memory is bounded by the chunk and
+the histograms, not by the number of samples. Percentile intervals are read
+from the histograms with linear interpolation inside a bin (accurate to
+one bin width, 0.1 score points by default).
+
+Sample s always draws its normals from the Philox counter range reserved
+for s, every kernel is elementwise or sums in a fixed order, and chunks are
+merged in sample order, so results for a seed are identical for any
+chunk_size or n_workers.
+
+Authors: Rajamangala University of Technology Krungthep Research Team
+License: MIT
+Version: 1.0.0
+"""
+
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
+from scipy import sparse
+
+from edcellence_tqm.core.bulk import BulkItems, _factorize, assess_departments
+from edcellence_tqm.core.item_table import PROCESS_ITEM
+from edcellence_tqm.core.maturity import DEFAULT_MATURITY_BANDS, MaturityBands
+from edcellence_tqm.core.weights import (
+    ADLI_DIMENSIONS,
+    LETCI_DIMENSIONS,
+    WeightsLike,
+    as_weight_profile,
+)
+
+SigmaLike = Union[float, Sequence[float], Mapping]
+
+# Each sample owns 2^64 Philox counter blocks
+_STREAM_BITS = 64
+
+
+# ============================================================================
+# Noise model
+# ============================================================================
+
+def _sigma_row(sigma: SigmaLike, item_type: int) -> np.ndarray:
+    """Resolve a noise level spec to a (4,) row for one item type."""
+    if isinstance(sigma, Mapping):
+        unknown = set(sigma) - set(ADLI_DIMENSIONS) - set(LETCI_DIMENSIONS)
+        if unknown:
+            raise ValueError(f"Unknown indicator dimensions: {sorted(unknown)}")
+        dimensions = ADLI_DIMENSIONS if item_type == PROCESS_ITEM else LETCI_DIMENSIONS
+        row = np.array([float(sigma.get(d, 0.0)) for d in dimensions])
+    else:
+        row = np.broadcast_to(np.asarray(sigma, dtype=np.float64), (4,)).copy()
+    if not np.all(np.isfinite(row)) or np.any(row < 0):
+        raise ValueError(f"Noise levels must be finite and non-negative, got {row}")
+    return row
+
+
+def indicator_noise(
+    items: BulkItems,
+    sigma: SigmaLike = 0.05,
+    assessor=None,
+    assessor_sigma: Optional[Dict[object, SigmaLike]] = None,
+    assessor_shift: Optional[Union[float, Dict[object, float]]] = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Resolve a noise model to per-item noise levels.
+
+    Args:
+        items: BulkItems table
+        sigma: Noise std applied to every item: a scalar, four per-column
+               levels, or a {dimension: std} dict keyed by ADLI/LeTCI
+               dimension names ('A', 'D', 'L', 'I', 'Lv', 'Tr', 'Cp';
+               unlisted dimensions are noise-free)
+        assessor: Optional (N,) assessor labels in input row order
+        assessor_sigma: Optional {assessor: sigma spec} overriding sigma for
+                        that assessor's items
+        assessor_shift: Optional std of a per-sample shift shared by all of
+                        an assessor's items; a scalar or {assessor: std}
+
+    Returns:
+        Tuple of (N, 4) noise levels in BulkItems row order, (N,) assessor
+        codes (-1 for none) and (A,) shift std per assessor code
+
+    Raises:
+        ValueError: If assessor options are given without assessor labels,
+                    labels are misaligned, or a level is negative
+    """
+    n = len(items)
+    rows = {code: _sigma_row(sigma, code) for code in np.unique(items.item_type).tolist()}
+    levels = np.empty((n, 4), dtype=np.float64)
+    for code, row in rows.items():
+        levels[items.item_type == code] = row
+
+    if assessor is None:
+        if assessor_sigma or assessor_shift is not None:
+            raise ValueError("assessor_sigma and assessor_shift require assessor labels")
+        return levels, np.full(n, -1, dtype=np.int64), np.empty(0)
+
+    assessor = np.asarray(assessor, dtype=object)
+    if assessor.shape != (n,):
+        raise ValueError(f"Expected {n} assessor labels, got shape {assessor.shape}")
+    codes, names = _factorize(assessor[items.source_row])
+    position = {name: i for i, name in enumerate(names.tolist())}
+
+    for name, spec in (assessor_sigma or {}).items():
+        if name not in position:
+            raise ValueError(f"Unknown assessor: {name!r}")
+        mine = codes == position[name]
+        for code in np.unique(items.item_type[mine]).tolist():
+            levels[mine & (items.item_type == code)] = _sigma_row(spec, code)
+
+    shift = np.zeros(len(names))
+    if isinstance(assessor_shift, Mapping):
+        for name, std in assessor_shift.items():
+            if name not in position:
+                raise ValueError(f"Unknown assessor: {name!r}")
+            shift[position[name]] = float(std)
+    elif assessor_shift is not None:
+        shift[:] = float(assessor_shift)
+    if not np.all(np.isfinite(shift)) or np.any(shift < 0):
+        raise ValueError("Assessor shift levels must be finite and non-negative")
+    return levels, codes, shift
+
+
+def _standard_normals(seed: int, start: int, stop: int, width: int) -> np.ndarray:
+    """
+    Standard normals for samples [start, stop), `width` per sample.
+
+    Sample s draws from its own Philox stream (key = seed, counter starting
+    at s·2^64), so its normals do not depend on which chunk produced them.
+    """
+    normals = np.empty((stop - start, width))
+    for row, sample in enumerate(range(start, stop)):
+        bit_generator = np.random.Philox(key=seed, counter=sample << _STREAM_BITS)
+        np.random.Generator(bit_generator).standard_normal(out=normals[row])
+    return normals
+
+
+# ============================================================================
+# Result
+# ============================================================================
+
+def _histogram_quantiles(
+    counts: np.ndarray,
+    low: float,
+    high: float,
+    q: np.ndarray,
+    minimum: np.ndarray,
+    maximum: np.ndarray
+) -> np.ndarray:
+    """Interpolated quantiles (q in [0,1]) of fixed-bin histograms along the last axis."""
+    q = np.asarray(q, dtype=np.float64)
+    n_bins = counts.shape[-1]
+    width = (high - low) / n_bins
+    flat = counts.reshape(-1, n_bins)
+    out = np.empty((len(flat), len(q)))
+    for start in range(0, len(flat), 4096):
+        block = flat[start:start + 4096].astype(np.int64)
+        cumulative = np.cumsum(block, axis=1)
+        target = q[None, :] * cumulative[:, -1:]
+        # First bin whose cumulative count reaches each target
+        bins = np.minimum((cumulative[:, None, :] < target[:, :, None]).sum(axis=2), n_bins - 1)
+        before = np.take_along_axis(cumulative, bins, axis=1) - np.take_along_axis(block, bins, 1)
+        inside = np.take_along_axis(block, bins, axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            fraction = np.where(inside > 0, (target - before) / inside, 0.0)
+        out[start:start + 4096] = low + (bins + fraction) * width
+    quantiles = out.reshape(counts.shape[:-1] + (len(q),))
+    return np.clip(quantiles, minimum[..., None], maximum[..., None])
+
+
+@dataclass
+class UncertaintyResult:
+    """
+    Monte Carlo distributions of department scores.
+
+    Means and standard deviations are exact; percentiles are interpolated
+    from fixed-bin histograms over [0,100] (scores) and [0,1] (IHI).
+
+    Attributes:
+        departments: (D,) department labels
+        categories: Weighted category names (columns of the category arrays)
+        n_samples: Number of Monte Carlo samples
+        seed: Random seed
+        baseline_score: (D,) org scores of the unperturbed indicators
+        baseline_ihi: (D,) IHI of the unperturbed indicators
+        baseline_category: (D, K) category scores of the unperturbed indicators
+        score_mean, score_std: (D,) org score moments
+        ihi_mean, ihi_std: (D,) IHI moments
+        category_mean, category_std: (D, K) category score moments
+        score_range, ihi_range: (D, 2) lowest and highest sampled values
+        category_range: (D, K, 2) lowest and highest sampled category scores
+        score_histogram: (D, n_bins) int32 org score counts over [0,100]
+        ihi_histogram: (D, n_bins) int32 IHI counts over [0,1]
+        category_histogram: (D, K, n_bins) int32 category score counts
+        level_counts: (D, B) samples per maturity band
+        percentiles: Default percentiles for the interval accessors
+        maturity_bands: Band table used for level_counts
+    """
+    departments: np.ndarray
+    categories: Tuple[str, ...]
+    n_samples: int
+    seed: int
+    baseline_score: np.ndarray
+    baseline_ihi: np.ndarray
+    baseline_category: np.ndarray
+    score_mean: np.ndarray
+    score_std: np.ndarray
+    ihi_mean: np.ndarray
+    ihi_std: np.ndarray
+    category_mean: np.ndarray
+    category_std: np.ndarray
+    score_range: np.ndarray
+    ihi_range: np.ndarray
+    category_range: np.ndarray
+    score_histogram: np.ndarray
+    ihi_histogram: np.ndarray
+    category_histogram: np.ndarray
+    level_counts: np.ndarray
+    percentiles: Tuple[float, ...] = (2.5, 97.5)
+    maturity_bands: MaturityBands = DEFAULT_MATURITY_BANDS
+
+    def __len__(self) -> int:
+        return len(self.departments)
+
+    def _quantiles(self, metric: str, percentiles: Optional[Sequence[float]]) -> np.ndarray:
+        if percentiles is None:
+            percentiles = self.percentiles
+        q = np.asarray(percentiles, dtype=np.float64) / 100.0
+        if np.any((q < 0) | (q > 1)):
+            raise ValueError(f"Percentiles must be in [0,100], got {percentiles}")
+        if metric == 'score':
+            return _histogram_quantiles(self.score_histogram, 0.0, 100.0, q,
+                                        self.score_range[:, 0], self.score_range[:, 1])
+        if metric == 'ihi':
+            return _histogram_quantiles(self.ihi_histogram, 0.0, 1.0, q,
+                                        self.ihi_range[:, 0], self.ihi_range[:, 1])
+        if metric == 'category':
+            return _histogram_quantiles(self.category_histogram, 0.0, 100.0, q,
+                                        self.category_range[..., 0], self.category_range[..., 1])
+        raise ValueError(f"Unknown metric {metric!r}; expected 'score', 'ihi' or 'category'")
+
+    def score_interval(self, percentiles: Optional[Sequence[float]] = None) -> np.ndarray:
+        """Return (D, P) org score percentiles."""
+        return self._quantiles('score', percentiles)
+
+    def ihi_interval(self, percentiles: Optional[Sequence[float]] = None) -> np.ndarray:
+        """Return (D, P) IHI percentiles."""
+        return self._quantiles('ihi', percentiles)
+
+    def category_interval(self, percentiles: Optional[Sequence[float]] = None) -> np.ndarray:
+        """Return (D, K, P) category score percentiles."""
+        return self._quantiles('category', percentiles)
+
+    def ihi_confidence_intervals(self) -> List[Tuple[float, float]]:
+        """
+        Return one (lower, upper) IHI interval per department, in departments order.
+
+        plot_ihi_trajectory takes one interval per quarter: run one
+        propagation per quarter and take department d's entry from each.
+        """
+        interval = self.ihi_interval(self.percentiles[:1] + self.percentiles[-1:])
+        return [(float(low), float(high)) for low, high in interval]
+
+    def level_probability(self) -> np.ndarray:
+        """Return (D, B) share of samples in each maturity band."""
+        return self.level_counts / self.n_samples
+
+    def to_frame(self):
+        """Return per-department means, stds and interval bounds as a pandas DataFrame."""
+        import pandas as pd
+
+        bounds = self.percentiles[:1] + self.percentiles[-1:]
+        score = self.score_interval(bounds)
+        ihi = self.ihi_interval(bounds)
+        return pd.DataFrame({
+            'department': self.departments,
+            'baseline_score': self.baseline_score,
+            'score_mean': self.score_mean,
+            'score_std': self.score_std,
+            'score_lower': score[:, 0],
+            'score_upper': score[:, 1],
+            'baseline_ihi': self.baseline_ihi,
+            'ihi_mean': self.ihi_mean,
+            'ihi_std': self.ihi_std,
+            'ihi_lower': ihi[:, 0],
+            'ihi_upper': ihi[:, 1],
+        })
+
+
+# ============================================================================
+# Simulation
+# ============================================================================
+
+def propagate_uncertainty(
+    items: BulkItems,
+    n_samples: int = 10_000,
+    sigma: SigmaLike = 0.05,
+    assessor=None,
+    assessor_sigma: Optional[Dict[object, SigmaLike]] = None,
+    assessor_shift: Optional[Union[float, Dict[object, float]]] = None,
+    seed: int = 0,
+    adli_weights: Optional[WeightsLike] = None,
+    letci_weights: Optional[WeightsLike] = None,
+    category_weights: Optional[WeightsLike] = None,
+    maturity_bands: Optional[MaturityBands] = None,
+    percentiles: Sequence[float] = (2.5, 97.5),
+    n_bins: int = 1000,
+    chunk_size: int = 32,
+    n_workers: int = 1
+) -> UncertaintyResult:
+    """
+    Propagate indicator noise through Equations 1-5 by Monte Carlo.
+
+    Peak memory is about 4 × chunk_size × N × 8 bytes for a chunk plus
+    (K + 2) × D × n_bins × 4 bytes of histograms, independent of n_samples.
+
+    Args:
+        items: BulkItems table of all departments
+        n_samples: Number of Monte Carlo samples
+        sigma: Indicator noise std (scalar, per column, or per dimension
+               name; see indicator_noise)
+        assessor: Optional (N,) assessor labels in input row order
+        assessor_sigma: Optional {assessor: sigma spec} per-assessor noise
+        assessor_shift: Optional std of a per-sample shift shared by each
+                        assessor's items (scalar or {assessor: std})
+        seed: Random seed (Philox key)
+        adli_weights: Optional ADLI weights (NIST defaults if None)
+        letci_weights: Optional LeTCI weights (Baldrige defaults if None)
+        category_weights: Optional category weights (EdPEx defaults if None)
+        maturity_bands: Optional maturity band table
+        percentiles: Default interval percentiles of the result
+        n_bins: Histogram bins per department and metric
+        chunk_size: Samples evaluated per chunk (bounds memory)
+        n_workers: Threads evaluating chunks concurrently
+
+    Returns:
+        UncertaintyResult
+
+    Raises:
+        ValueError: If n_samples, n_bins, chunk_size or n_workers is not
+                    positive, or the items cannot be assessed
+
+    Example:
+        >>> result = propagate_uncertainty(items, n_samples=20_000, sigma=0.05, seed=7)
+        >>> result.to_frame()[['department', 'score_lower', 'score_upper']]
+        >>> # One department's IHI trajectory, one propagation per quarter
+        >>> results = [propagate_uncertainty(q, seed=7) for q in quarterly_items]
+        >>> plot_ihi_trajectory(quarters, [r.baseline_ihi[d] for r in results],
+        ...                     [r.ihi_confidence_intervals()[d] for r in results])
+    """
+    for name, value in (('n_samples', n_samples), ('n_bins', n_bins),
+                        ('chunk_size', chunk_size), ('n_workers', n_workers)):
+        if value < 1:
+            raise ValueError(f"{name} must be positive, got {value}")
+    if maturity_bands is None:
+        maturity_bands = DEFAULT_MATURITY_BANDS
+    percentiles = tuple(float(p) for p in percentiles)
+
+    adli_profile = as_weight_profile(adli_weights, 'adli')
+    letci_profile = as_weight_profile(letci_weights, 'letci')
+    category_profile = as_weight_profile(category_weights, 'category')
+
+    # Baseline assessment (also validates categories, IHI inputs and points)
+    baseline = assess_departments(
+        items, adli_weights=adli_profile, letci_weights=letci_profile,
+        category_weights=category_profile, maturity_bands=maturity_bands
+    )
+    levels, assessor_code, shift_level = indicator_noise(
+        items, sigma, assessor, assessor_sigma, assessor_shift
+    )
+
+    n = len(items)
+    n_departments = items.n_departments
+    category_names = category_profile.dimensions
+    n_swept = len(category_names)
+    category_columns = np.array([items.categories.index(name) for name in category_names])
+    category_weight = category_profile.vector
+    is_process = items.item_type == PROCESS_ITEM
+
+    # Per-row dimension weights (Equations 1-2)
+    row_weights = np.where(is_process[:, None], adli_profile.vector, letci_profile.vector)
+
+    # Equation 3 as a sparse (department × category, item) product
+    column_of = np.full(len(items.categories), -1, dtype=np.int64)
+    column_of[category_columns] = np.arange(n_swept)
+    item_column = column_of[items.category]
+    rows = np.flatnonzero(item_column >= 0)
+    points = items.point_value.astype(np.float64)
+    aggregate = sparse.csr_matrix(
+        (points[rows], (items.department[rows] * n_swept + item_column[rows], rows)),
+        shape=(n_departments * n_swept, n)
+    )
+    denominator = np.asarray(aggregate.sum(axis=1)).ravel()
+
+    # Equation 5 as a sparse (department, item) product of integration means
+    n_process = np.bincount(items.department[is_process], minlength=n_departments)
+    n_results = np.bincount(items.department[~is_process], minlength=n_departments)
+    share = 0.5 / np.where(is_process, n_process[items.department], n_results[items.department])
+    integration = sparse.csr_matrix(
+        (share, (items.department, np.arange(n))), shape=(n_departments, n)
+    )
+
+    baseline_category = baseline.category_scores[:, category_columns].ravel()
+
+    n_assessors = len(shift_level)
+    shifted = assessor_code >= 0
+    width = 4 * n + n_assessors
+
+    def evaluate(start: int, stop: int):
+        """Equations 1-5 for samples [start, stop) → sample-major arrays."""
+        normals = _standard_normals(seed, start, stop, width)
+        x = normals[:, :4 * n].reshape(-1, n, 4)
+        x *= levels
+        if n_assessors:
+            shift = normals[:, 4 * n:4 * n + n_assessors] * shift_level
+            x[:, shifted] += shift[:, assessor_code[shifted], None]
+        x += items.indicators
+        np.clip(x, 0, 1, out=x)
+
+        item_score = x[..., 0] * row_weights[:, 0]
+        for j in range(1, 4):
+            item_score += x[..., j] * row_weights[:, j]
+        item_score *= 100
+        np.clip(item_score, 0, 100, out=item_score)
+
+        # Sums of deviations from the exact baseline sums: a noise-free sample
+        # reproduces the baseline bit-for-bit
+        item_score -= baseline.item_score
+        category = (aggregate @ item_score.T) / denominator[:, None]
+        category += baseline_category[:, None]
+        category = category.reshape(n_departments, n_swept, -1)
+        score = category_weight[0] * category[:, 0]
+        for k in range(1, n_swept):
+            score += category_weight[k] * category[:, k]
+        np.clip(score, 0, 100, out=score)
+        x[..., 3] -= items.indicators[:, 3]
+        ihi = integration @ x[..., 3].T
+        ihi += baseline.ihi[:, None]
+        np.clip(ihi, 0, 1, out=ihi)
+        return score.T.copy(), ihi.T.copy(), np.moveaxis(category, 2, 0).copy()
+
+    # Accumulators (moments about the baseline, summed in sample order)
+    metrics = {
+        'score': (baseline.organizational_score, 100.0, (n_departments,)),
+        'ihi': (baseline.ihi, 1.0, (n_departments,)),
+        'category': (baseline.category_scores[:, category_columns], 100.0,
+                     (n_departments, n_swept)),
+    }
+    total = {m: np.zeros(shape) for m, (_, _, shape) in metrics.items()}
+    squares = {m: np.zeros(shape) for m, (_, _, shape) in metrics.items()}
+    lowest = {m: np.full(shape, np.inf) for m, (_, _, shape) in metrics.items()}
+    highest = {m: np.full(shape, -np.inf) for m, (_, _, shape) in metrics.items()}
+    histogram = {m: np.zeros(shape + (n_bins,), dtype=np.int32)
+                 for m, (_, _, shape) in metrics.items()}
+    n_bands = len(maturity_bands)
+    band_position = np.full(128, -1, dtype=np.int64)
+    band_position[maturity_bands.levels] = np.arange(n_bands)
+    level_counts = np.zeros(n_departments * n_bands, dtype=np.int64)
+    department_band = np.arange(n_departments) * n_bands
+
+    def merge(samples: Dict[str, np.ndarray]):
+        for metric, values in samples.items():
+            centre, scale, _ = metrics[metric]
+            counts = histogram[metric].reshape(-1)
+            bins = np.minimum((values * (n_bins / scale)).astype(np.int64), n_bins - 1)
+            bins += np.arange(values[0].size).reshape(values.shape[1:]) * n_bins
+            for row, cells in zip(values, bins):
+                deviation = row - centre
+                total[metric] += deviation
+                squares[metric] += deviation * deviation
+                counts[cells.ravel()] += 1  # one cell per department (and category)
+            np.minimum(lowest[metric], values.min(axis=0), out=lowest[metric])
+            np.maximum(highest[metric], values.max(axis=0), out=highest[metric])
+        codes = band_position[maturity_bands.classify(samples['score'])]
+        level_counts[:] += np.bincount((department_band + codes).ravel(),
+                                       minlength=len(level_counts))
+
+    chunks = [(start, min(start + chunk_size, n_samples))
+              for start in range(0, n_samples, chunk_size)]
+    if n_workers == 1:
+        for start, stop in chunks:
+            merge(dict(zip(metrics, evaluate(start, stop))))
+    else:
+        # Bounded window of in-flight chunks, merged strictly in sample order
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            pending: Deque[Future] = deque()
+            for start, stop in chunks:
+                pending.append(pool.submit(evaluate, start, stop))
+                if len(pending) >= 2 * n_workers:
+                    merge(dict(zip(metrics, pending.popleft().result())))
+            while pending:
+                merge(dict(zip(metrics, pending.popleft().result())))
+
+    def moments(metric: str):
+        mean_deviation = total[metric] / n_samples
+        variance = np.maximum(squares[metric] / n_samples - mean_deviation ** 2, 0.0)
+        return metrics[metric][0] + mean_deviation, np.sqrt(variance)
+
+    def value_range(metric: str):
+        return np.stack([lowest[metric], highest[metric]], axis=-1)
+
+    score_mean, score_std = moments('score')
+    ihi_mean, ihi_std = moments('ihi')
+    category_mean, category_std = moments('category')
+    return UncertaintyResult(
+        departments=items.departments,
+        categories=tuple(category_names),
+        n_samples=int(n_samples),
+        seed=int(seed),
+        baseline_score=baseline.organizational_score,
+        baseline_ihi=baseline.ihi,
+        baseline_category=metrics['category'][0],
+        score_mean=score_mean,
+        score_std=score_std,
+        ihi_mean=ihi_mean,
+        ihi_std=ihi_std,
+        category_mean=category_mean,
+        category_std=category_std,
+        score_range=value_range('score'),
+        ihi_range=value_range('ihi'),
+        category_range=value_range('category'),
+        score_histogram=histogram['score'],
+        ihi_histogram=histogram['ihi'],
+        category_histogram=histogram['category'],
+        level_counts=level_counts.reshape(n_departments, n_bands),
+        percentiles=percentiles,
+        maturity_bands=maturity_bands,
+    )
+
+
+__all__ = [
+    'UncertaintyResult',
+    'indicator_noise',
+    'propagate_uncertainty',
+]
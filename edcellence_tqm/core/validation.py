@@ -0,0 +1,373 @@
+"""
+Bulk Input Validation
+=====================
+
+Column-wise validation of assessment item inputs.
+
+ADLIIndicators and LeTCIIndicators check their fields one object at a time
+and raise on the first bad value, so a bulk import pays for an object per
+row and stops at the first error. validate_arrays / validate_frame check
+whole columns with NumPy instead and return a ValidationReport listing
+every violation:
+
+    unknown item type            item_type not 'Process'/'Results'
+    missing indicator            NaN/None/non-numeric value in one of the
+                                 four dimensions of the row's item type
+    indicator out of range       value outside [0,1]
+    missing point value          NaN/None point value
+    invalid point value          negative, infinite or non-integer
+    deployment gap out of range  deployment gap outside [0,1]
+
+The report is four compact arrays (row, reason code, column code, value)
+sorted by row. Batches that pass can be turned into indicator objects or
+compute_organizational_assessment item dicts in trusted mode, which skips
+the per-object __post_init__ checks.
+
+Authors: Rajamangala University of Technology Krungthep Research Team
+License: MIT
+Version: 1.0.0
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+from edcellence_tqm.core.batch import ADLI_COLUMNS, LETCI_COLUMNS
+from edcellence_tqm.core.bulk import _item_type_codes
+from edcellence_tqm.core.item_table import ITEM_TYPES, PROCESS_ITEM, RESULTS_ITEM
+
+# Reason codes (index into REASONS)
+UNKNOWN_ITEM_TYPE = 0
+MISSING_INDICATOR = 1
+INDICATOR_OUT_OF_RANGE = 2
+MISSING_POINT_VALUE = 3
+INVALID_POINT_VALUE = 4
+GAP_OUT_OF_RANGE = 5
+
+REASONS = (
+    'unknown item type',
+    'missing indicator',
+    'indicator out of range [0,1]',
+    'missing point value',
+    'point value must be a non-negative integer',
+    'deployment gap out of range [0,1]',
+)
+
+# Column codes (index into COLUMNS); indicator columns follow the item type
+COLUMNS = ('item_type',) + tuple(dict.fromkeys(ADLI_COLUMNS + LETCI_COLUMNS)) + (
+    'point_value', 'deployment_gap')
+_ITEM_TYPE_COLUMN = COLUMNS.index('item_type')
+_POINT_COLUMN = COLUMNS.index('point_value')
+_GAP_COLUMN = COLUMNS.index('deployment_gap')
+_INDICATOR_COLUMNS = np.array([
+    [COLUMNS.index(name) for name in ADLI_COLUMNS],
+    [COLUMNS.index(name) for name in LETCI_COLUMNS],
+])
+
+
+class ValidationError(ValueError):
+    """Raised when a batch that must be valid is not; carries the report."""
+
+    def __init__(self, report: 'ValidationReport', limit: int = 5):
+        self.report = report
+        lines = report.messages(limit)
+        more = len(report) - len(lines)
+        super().__init__(
+            f"{len(report)} invalid value(s) in {report.n_rows} rows: " + '; '.join(lines)
+            + (f"; ... and {more} more" if more > 0 else '')
+        )
+
+
+# ============================================================================
+# Report
+# ============================================================================
+
+@dataclass
+class ValidationReport:
+    """
+    Every violation found in a batch, sorted by row then column.
+
+    Attributes:
+        n_rows: Number of rows checked
+        rows: (V,) int64 row positions of the violations
+        reasons: (V,) int8 reason codes (index into REASONS)
+        columns: (V,) int8 column codes (index into COLUMNS)
+        values: (V,) float64 offending values (NaN when missing or non-numeric)
+    """
+    n_rows: int
+    rows: np.ndarray
+    reasons: np.ndarray
+    columns: np.ndarray
+    values: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @property
+    def ok(self) -> bool:
+        """True if no violation was found."""
+        return len(self.rows) == 0
+
+    @property
+    def invalid_rows(self) -> np.ndarray:
+        """Sorted unique row positions with at least one violation."""
+        return np.unique(self.rows)
+
+    @property
+    def valid_mask(self) -> np.ndarray:
+        """(n_rows,) bool mask of rows without violations."""
+        mask = np.ones(self.n_rows, dtype=bool)
+        mask[self.rows] = False
+        return mask
+
+    def counts(self) -> Dict[str, int]:
+        """Return {reason: violation count} for the reasons that occur."""
+        counts = np.bincount(self.reasons, minlength=len(REASONS))
+        return {REASONS[code]: int(n) for code, n in enumerate(counts.tolist()) if n}
+
+    def messages(self, limit: Optional[int] = None, first_row: int = 0) -> List[str]:
+        """Return readable messages for the first `limit` violations."""
+        stop = len(self) if limit is None else min(limit, len(self))
+        lines = []
+        for row, reason, column, value in zip(self.rows[:stop].tolist(),
+                                              self.reasons[:stop].tolist(),
+                                              self.columns[:stop].tolist(),
+                                              self.values[:stop].tolist()):
+            got = '' if np.isnan(value) else f", got {value:g}"
+            lines.append(f"Data row {first_row + row}: {COLUMNS[column]}: {REASONS[reason]}{got}")
+        return lines
+
+    def raise_if_invalid(self, limit: int = 5):
+        """Raise ValidationError if any violation was found."""
+        if not self.ok:
+            raise ValidationError(self, limit)
+
+    def to_frame(self):
+        """Return the violations as a pandas DataFrame (row, column, reason, value)."""
+        import pandas as pd
+
+        return pd.DataFrame({
+            'row': self.rows,
+            'column': np.array(COLUMNS, dtype=object)[self.columns],
+            'reason': np.array(REASONS, dtype=object)[self.reasons],
+            'value': self.values,
+        })
+
+
+# ============================================================================
+# Validation
+# ============================================================================
+
+def _numeric(values) -> np.ndarray:
+    """Convert a column to float64, mapping None and non-numeric entries to NaN."""
+    array = np.asarray(values)
+    if array.dtype.kind in 'fiub':
+        return array.astype(np.float64, copy=False)
+    import pandas as pd
+
+    return pd.to_numeric(pd.Series(array.ravel()), errors='coerce') \
+        .to_numpy(dtype=np.float64).reshape(array.shape)
+
+
+def validate_arrays(
+    item_type,
+    indicators,
+    point_value,
+    deployment_gap=None
+) -> ValidationReport:
+    """
+    Validate item columns and report every violation.
+
+    Args:
+        item_type: (N,) 'Process'/'Results' labels or 0/1 codes
+        indicators: (N, 4) indicators in canonical order (ADLI for process
+                    rows, LeTCI for results rows); NaN/None marks a missing
+                    dimension
+        point_value: (N,) point allocations
+        deployment_gap: Optional (N,) deployment urgency (NaN means 0.0)
+
+    Returns:
+        ValidationReport (never raises for bad values)
+
+    Raises:
+        ValueError: If the column shapes do not match
+
+    Example:
+        >>> report = validate_arrays(['Process', 'Results'],
+        ...                          [[0.8, 0.7, None, 0.6], [0.5, 1.2, 0.4, 0.3]], [70, 80])
+        >>> report.messages()
+        ['Data row 0: learning: missing indicator',
+         'Data row 1: trend: indicator out of range [0,1], got 1.2']
+    """
+    codes = _item_type_codes(item_type, strict=False)
+    n = len(codes)
+    values = _numeric(indicators).reshape(n, -1) if n else np.empty((0, 4))
+    points = _numeric(point_value)
+    if values.shape != (n, 4):
+        raise ValueError(f"Indicators must have shape ({n}, 4), got {values.shape}")
+    if points.shape != (n,):
+        raise ValueError(f"Expected {n} point values, got shape {points.shape}")
+
+    found: List[Tuple[np.ndarray, int, np.ndarray, np.ndarray]] = []
+
+    def record(mask: np.ndarray, reason: int, column, value):
+        rows = np.flatnonzero(mask)
+        if len(rows):
+            column = np.broadcast_to(np.asarray(column, dtype=np.int8), mask.shape)[rows]
+            found.append((rows, reason, column, np.asarray(value, dtype=np.float64)[rows]))
+
+    known = codes >= 0
+    record(~known, UNKNOWN_ITEM_TYPE, _ITEM_TYPE_COLUMN, np.full(n, np.nan))
+
+    # Indicator checks, one dimension at a time, against the item type's columns
+    column_of = _INDICATOR_COLUMNS[np.where(known, codes, 0)]
+    for j in range(4):
+        column = values[:, j]
+        missing = known & np.isnan(column)
+        record(missing, MISSING_INDICATOR, column_of[:, j], column)
+        record(known & ~missing & ((column < 0) | (column > 1)),
+               INDICATOR_OUT_OF_RANGE, column_of[:, j], column)
+
+    missing = np.isnan(points)
+    record(missing, MISSING_POINT_VALUE, _POINT_COLUMN, points)
+    with np.errstate(invalid='ignore'):
+        record(~missing & ~((points >= 0) & (points == np.floor(points)) & np.isfinite(points)),
+               INVALID_POINT_VALUE, _POINT_COLUMN, points)
+
+    if deployment_gap is not None:
+        gap = _numeric(deployment_gap)
+        if gap.shape != (n,):
+            raise ValueError(f"Expected {n} deployment gaps, got shape {gap.shape}")
+        record(~np.isnan(gap) & ~((gap >= 0) & (gap <= 1)), GAP_OUT_OF_RANGE, _GAP_COLUMN, gap)
+
+    if not found:
+        empty = np.empty(0)
+        return ValidationReport(n, empty.astype(np.int64), empty.astype(np.int8),
+                                empty.astype(np.int8), empty)
+    rows = np.concatenate([f[0] for f in found])
+    reasons = np.concatenate([np.full(len(f[0]), f[1], dtype=np.int8) for f in found])
+    columns = np.concatenate([f[2] for f in found])
+    values = np.concatenate([f[3] for f in found])
+    order = np.lexsort((columns, rows))
+    return ValidationReport(n, rows[order].astype(np.int64), reasons[order],
+                            columns[order], values[order])
+
+
+def frame_indicators(frame, codes: np.ndarray) -> np.ndarray:
+    """(N, 4) canonical indicators of a long-format frame; absent columns read as NaN."""
+    n = len(frame)
+    indicators = np.full((n, 4), np.nan)
+    for code, names in ((PROCESS_ITEM, ADLI_COLUMNS), (RESULTS_ITEM, LETCI_COLUMNS)):
+        rows = codes == code
+        for j, name in enumerate(names):
+            if name in frame:
+                indicators[rows, j] = _numeric(frame[name].to_numpy())[rows]
+    return indicators
+
+
+def validate_frame(frame) -> ValidationReport:
+    """
+    Validate a long-format item DataFrame (sample_assessment_data.csv layout).
+
+    Process rows are checked on the ADLI columns and results rows on the
+    LeTCI columns; a column absent from the frame counts as missing for
+    every row of that item type. Rows are reported by position.
+    """
+    if 'item_type' not in frame or 'point_value' not in frame:
+        raise ValueError("Frame must have item_type and point_value columns")
+    codes = _item_type_codes(frame['item_type'].to_numpy(), strict=False)
+    gap = frame['deployment_gap'].to_numpy() if 'deployment_gap' in frame else None
+    return validate_arrays(codes, frame_indicators(frame, codes),
+                           frame['point_value'].to_numpy(), gap)
+
+
+# ============================================================================
+# Trusted Construction
+# ============================================================================
+
+def indicator_objects(item_type, indicators, report: Optional[ValidationReport] = None,
+                      trusted: bool = True) -> list:
+    """
+    Build ADLIIndicators / LeTCIIndicators for a batch of rows.
+
+    In trusted mode the batch is validated in bulk once (or the given
+    passing report is reused) and the objects are built without their
+    per-field __post_init__ checks; otherwise each object validates itself.
+
+    Args:
+        item_type: (N,) 'Process'/'Results' labels or 0/1 codes
+        indicators: (N, 4) indicators in canonical order
+        report: Optional report of a previous validate_arrays on this batch
+        trusted: Skip per-object validation after bulk validation
+
+    Returns:
+        List of N indicator objects
+
+    Raises:
+        ValidationError: In trusted mode, if the batch has any violation
+    """
+    from edcellence_tqm.core.adli_letci import ADLIIndicators, LeTCIIndicators
+
+    codes = _item_type_codes(item_type, strict=False)
+    values = _numeric(indicators).reshape(len(codes), -1).tolist()
+    if not trusted:
+        if np.any(codes < 0):
+            raise ValueError(f"item_type must be one of {ITEM_TYPES}")
+        types = (ADLIIndicators, LeTCIIndicators)
+        return [types[code](*row) for code, row in zip(codes.tolist(), values)]
+
+    if report is None or report.n_rows != len(codes):
+        report = validate_arrays(codes, values, np.zeros(len(codes)))
+    report.raise_if_invalid()
+    builders = (ADLIIndicators.trusted, LeTCIIndicators.trusted)
+    return [builders[code](*row) for code, row in zip(codes.tolist(), values)]
+
+
+def assessment_items(frame, trusted: bool = True) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Convert a long-format frame to compute_organizational_assessment inputs.
+
+    Args:
+        frame: One department's rows (item_id, category, item_type,
+               point_value, indicator columns, optional deployment_gap)
+        trusted: Validate the frame in bulk and skip per-object checks
+
+    Returns:
+        (process_items, results_items) lists of item dicts
+
+    Raises:
+        ValidationError: In trusted mode, if the frame has any violation
+    """
+    codes = _item_type_codes(frame['item_type'].to_numpy(), strict=False)
+    indicators = frame_indicators(frame, codes)
+    gap = (_numeric(frame['deployment_gap'].to_numpy()) if 'deployment_gap' in frame
+           else np.zeros(len(frame)))
+    report = validate_frame(frame) if trusted else None
+    objects = indicator_objects(codes, indicators, report=report, trusted=trusted)
+
+    process_items, results_items = [], []
+    for item_id, category, points, delta, code, values in zip(
+        frame['item_id'].astype(str).tolist(), frame['category'].tolist(),
+        frame['point_value'].tolist(), np.nan_to_num(gap).tolist(), codes.tolist(), objects
+    ):
+        item = {'item_id': item_id, 'category': category, 'point_value': int(points),
+                'deployment_gap': delta}
+        if code == PROCESS_ITEM:
+            item['adli'] = values
+            process_items.append(item)
+        else:
+            item['letci'] = values
+            results_items.append(item)
+    return process_items, results_items
+
+
+__all__ = [
+    'REASONS',
+    'COLUMNS',
+    'ValidationError',
+    'ValidationReport',
+    'assessment_items',
+    'indicator_objects',
+    'validate_arrays',
+    'validate_frame',
+]
@@ -0,0 +1,344 @@
+"""
+Weight Profiles
+===============
+
+Immutable, validated weight sets for Equations 1, 2 and 4.
+
+A WeightProfile is validated once when it is built (dimension names, shape,
+finiteness, Σw = 1) and then holds its weights both as a tuple and as a
+read-only contiguous float64 vector in canonical dimension order:
+
+    adli:     A, D, L, I
+    letci:    Lv, Tr, Cp, I
+    category: the order given (EdPEx order for the defaults)
+
+Scoring functions accept a profile wherever they accept a weight dict and
+skip validation for it, so the per-item hot loop only does the multiply-adds.
+Profiles are hashable and also behave as read-only {dimension: weight}
+mappings, so code written against the old weight dicts keeps working.
+
+Profiles can be loaded from the lookup tables in
+``scripts/schema_simplified.sql`` (lookup_adli_weights,
+lookup_letci_weights, lookup_category_weights).
+
+Authors: Rajamangala University of Technology Krungthep Research Team
+License: MIT
+Version: 1.0.0
+"""
+
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Mapping, Optional, Sequence, Tuple, Union
+import numpy as np
+
+# ============================================================================
+# Default Weights
+# ============================================================================
+
+# NIST default ADLI weights (Baldrige 2023)
+DEFAULT_ADLI_WEIGHTS = {
+    'A': 0.30,  # Approach
+    'D': 0.30,  # Deployment
+    'L': 0.20,  # Learning
+    'I': 0.20   # Integration
+}
+
+# Baldrige default LeTCI weights
+DEFAULT_LETCI_WEIGHTS = {
+    'Lv': 0.40,  # Level (current performance)
+    'Tr': 0.25,  # Trend (improvement trajectory)
+    'Cp': 0.25,  # Comparison (external benchmarks)
+    'I': 0.10    # Integration (cross-category alignment)
+}
+
+# EdPEx default category weights (aligned with Baldrige)
+DEFAULT_CATEGORY_WEIGHTS = {
+    'Leadership': 0.12,
+    'Strategy': 0.085,
+    'Customers': 0.085,
+    'Measurement': 0.10,
+    'Workforce': 0.10,
+    'Operations': 0.15,
+    'Results': 0.36
+}
+
+ADLI_DIMENSIONS = ('A', 'D', 'L', 'I')
+LETCI_DIMENSIONS = ('Lv', 'Tr', 'Cp', 'I')
+
+# Canonical dimension order per profile kind (None: order as given)
+PROFILE_KINDS = {
+    'adli': ADLI_DIMENSIONS,
+    'letci': LETCI_DIMENSIONS,
+    'category': None,
+}
+
+# Lookup table name → dimension code
+_LOOKUP_DIMENSIONS = {
+    'adli': {'Approach': 'A', 'Deployment': 'D', 'Learning': 'L', 'Integration': 'I'},
+    'letci': {'Level': 'Lv', 'Trend': 'Tr', 'Comparison': 'Cp', 'Integration': 'I'},
+}
+
+# Weight column read from each lookup table by default
+_LOOKUP_COLUMNS = {
+    'adli': 'default_weight',
+    'letci': 'default_weight',
+    'category': 'edpex_weight',
+}
+
+
+# ============================================================================
+# WeightProfile
+# ============================================================================
+
+@dataclass(frozen=True)
+class WeightProfile(Mapping):
+    """
+    Validated, immutable weight set for one scoring equation.
+
+    Attributes:
+        kind: 'adli', 'letci' or 'category'
+        dimensions: Dimension (or category) names in canonical order
+        weights: Weights aligned with dimensions
+
+    Example:
+        >>> profile = WeightProfile.from_dict('adli', {'A': 0.3, 'D': 0.3, 'L': 0.2, 'I': 0.2})
+        >>> profile['D'], profile.vector
+        (0.3, array([0.3, 0.3, 0.2, 0.2]))
+    """
+    kind: str
+    dimensions: Tuple[str, ...]
+    weights: Tuple[float, ...]
+    _vector: np.ndarray = field(init=False, repr=False, compare=False, hash=False)
+    _index: Dict[str, int] = field(init=False, repr=False, compare=False, hash=False)
+
+    def __post_init__(self):
+        """Validate the weights and precompute the vector and name index."""
+        if self.kind not in PROFILE_KINDS:
+            raise ValueError(
+                f"Unknown weight profile kind {self.kind!r}, expected one of {list(PROFILE_KINDS)}"
+            )
+        dimensions = tuple(str(d) for d in self.dimensions)
+        weights = tuple(float(w) for w in self.weights)
+        if len(weights) != len(dimensions):
+            raise ValueError(
+                f"Got {len(weights)} weights for {len(dimensions)} dimensions"
+            )
+        if len(set(dimensions)) != len(dimensions):
+            raise ValueError(f"Duplicate dimensions in {list(dimensions)}")
+
+        canonical = PROFILE_KINDS[self.kind]
+        if canonical is not None and dimensions != canonical:
+            raise ValueError(
+                f"{self.kind.upper()} weights must use dimensions {list(canonical)} "
+                f"in that order, got {list(dimensions)}"
+            )
+        if not dimensions:
+            raise ValueError("Weight profile must have at least one dimension")
+        if not all(math.isfinite(w) for w in weights):
+            raise ValueError(f"Weights must be finite, got {list(weights)}")
+
+        weight_sum = sum(weights)
+        if not np.isclose(weight_sum, 1.0, atol=1e-6):
+            prefix = 'Category weights' if self.kind == 'category' else 'Weights'
+            raise ValueError(f"{prefix} must sum to 1.0, got {weight_sum}")
+
+        vector = np.array(weights, dtype=np.float64)
+        vector.flags.writeable = False
+        object.__setattr__(self, 'dimensions', dimensions)
+        object.__setattr__(self, 'weights', weights)
+        object.__setattr__(self, '_vector', vector)
+        object.__setattr__(self, '_index', {d: i for i, d in enumerate(dimensions)})
+
+    def __reduce__(self):
+        """Pickle by fields so the vector is rebuilt read-only on load."""
+        return (self.__class__, (self.kind, self.dimensions, self.weights))
+
+    # ------------------------------------------------------------------
+    # Mapping interface
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, dimension: str) -> float:
+        return self.weights[self._index[dimension]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.dimensions)
+
+    def __len__(self) -> int:
+        return len(self.dimensions)
+
+    @property
+    def vector(self) -> np.ndarray:
+        """Read-only contiguous float64 weight vector in dimension order."""
+        return self._vector
+
+    def index(self, dimension: str) -> int:
+        """Position of a dimension in the weight vector."""
+        return self._index[dimension]
+
+    def to_dict(self) -> Dict[str, float]:
+        """Return the weights as a plain {dimension: weight} dict."""
+        return dict(zip(self.dimensions, self.weights))
+
+    # ------------------------------------------------------------------
+    # Constructors
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_dict(cls, kind: str, weights: Mapping[str, float]) -> 'WeightProfile':
+        """
+        Build a profile from a {dimension: weight} dict.
+
+        ADLI and LeTCI weights are reordered into canonical order; category
+        weights keep the dict's order (Equation 4 sums in that order).
+
+        Raises:
+            ValueError: If a canonical dimension is missing or unexpected
+                        dimensions are present, or the weights are invalid
+        """
+        canonical = PROFILE_KINDS.get(kind)
+        if canonical is None:
+            return cls(kind, tuple(weights), tuple(weights.values()))
+
+        missing = [d for d in canonical if d not in weights]
+        if missing:
+            raise ValueError(f"Missing weights for dimensions: {missing}")
+        extra = [d for d in weights if d not in canonical]
+        if extra:
+            raise ValueError(f"Unexpected {kind.upper()} dimensions: {extra}")
+        return cls(kind, canonical, tuple(weights[d] for d in canonical))
+
+    @classmethod
+    def from_vector(
+        cls,
+        kind: str,
+        vector: Union[Sequence[float], np.ndarray],
+        dimensions: Optional[Sequence[str]] = None
+    ) -> 'WeightProfile':
+        """
+        Build a profile from weights in canonical dimension order.
+
+        Args:
+            kind: 'adli', 'letci' or 'category'
+            vector: Weights in dimension order
+            dimensions: Dimension names; defaults to the canonical order
+                        (the EdPEx category order for category profiles)
+        """
+        if dimensions is None:
+            dimensions = PROFILE_KINDS.get(kind) or tuple(DEFAULT_CATEGORY_WEIGHTS)
+        array = np.asarray(vector, dtype=np.float64)
+        if array.shape != (len(dimensions),):
+            raise ValueError(
+                f"Weight vector must have shape ({len(dimensions)},), got {array.shape}"
+            )
+        return cls(kind, tuple(dimensions), tuple(array.tolist()))
+
+    @classmethod
+    def from_lookup_rows(
+        cls,
+        kind: str,
+        rows: Iterable[Dict],
+        column: Optional[str] = None
+    ) -> 'WeightProfile':
+        """
+        Build a profile from lookup_<kind>_weights rows.
+
+        Args:
+            kind: 'adli', 'letci' or 'category'
+            rows: Row dicts (from read_lookup_table or a database cursor)
+            column: Weight column; defaults to default_weight for ADLI/LeTCI
+                    and edpex_weight for categories
+
+        Example:
+            >>> rows = [{'dimension_name': 'Approach', 'default_weight': 0.3}, ...]
+            >>> WeightProfile.from_lookup_rows('adli', rows)
+        """
+        if kind not in PROFILE_KINDS:
+            raise ValueError(f"Unknown weight profile kind {kind!r}")
+        column = column or _LOOKUP_COLUMNS[kind]
+
+        weights = {}
+        for row in rows:
+            if kind == 'category':
+                name = row['category_name']
+            else:
+                dimension = row['dimension_name']
+                name = _LOOKUP_DIMENSIONS[kind].get(dimension)
+                if name is None:
+                    raise ValueError(f"Unknown {kind.upper()} dimension {dimension!r}")
+            weights[name] = float(row[column])
+        return cls.from_dict(kind, weights)
+
+    @classmethod
+    def from_schema(
+        cls,
+        kind: str,
+        column: Optional[str] = None,
+        path: Optional[Union[str, Path]] = None
+    ) -> 'WeightProfile':
+        """
+        Load a profile from the lookup table rows in the schema script.
+
+        Args:
+            kind: 'adli', 'letci' or 'category'
+            column: Weight column (see from_lookup_rows)
+            path: Schema script path (defaults to the schema script)
+
+        Example:
+            >>> WeightProfile.from_schema('category', column='baldrige_weight')
+        """
+        from edcellence_tqm.database.schema import read_lookup_table
+
+        if kind not in PROFILE_KINDS:
+            raise ValueError(f"Unknown weight profile kind {kind!r}")
+        rows = read_lookup_table(f'lookup_{kind}_weights', path=path)
+        return cls.from_lookup_rows(kind, rows, column=column)
+
+
+WeightsLike = Union[WeightProfile, Dict[str, float], Sequence[float], np.ndarray]
+
+DEFAULT_ADLI_PROFILE = WeightProfile.from_dict('adli', DEFAULT_ADLI_WEIGHTS)
+DEFAULT_LETCI_PROFILE = WeightProfile.from_dict('letci', DEFAULT_LETCI_WEIGHTS)
+DEFAULT_CATEGORY_PROFILE = WeightProfile.from_dict('category', DEFAULT_CATEGORY_WEIGHTS)
+
+_DEFAULT_PROFILES = {
+    'adli': DEFAULT_ADLI_PROFILE,
+    'letci': DEFAULT_LETCI_PROFILE,
+    'category': DEFAULT_CATEGORY_PROFILE,
+}
+
+
+def as_weight_profile(weights: Optional[WeightsLike], kind: str) -> WeightProfile:
+    """
+    Return weights as a WeightProfile of the given kind.
+
+    Profiles are returned as-is, None selects the default profile, dicts go
+    through WeightProfile.from_dict and sequences through from_vector.
+
+    Raises:
+        ValueError: If the weights are invalid or a profile of another kind
+                    is passed
+    """
+    if weights is None:
+        return _DEFAULT_PROFILES[kind]
+    if isinstance(weights, WeightProfile):
+        if weights.kind != kind:
+            raise ValueError(f"Expected a {kind!r} weight profile, got {weights.kind!r}")
+        return weights
+    if isinstance(weights, Mapping):
+        return WeightProfile.from_dict(kind, weights)
+    return WeightProfile.from_vector(kind, weights)
+
+
+__all__ = [
+    'DEFAULT_ADLI_WEIGHTS',
+    'DEFAULT_LETCI_WEIGHTS',
+    'DEFAULT_CATEGORY_WEIGHTS',
+    'ADLI_DIMENSIONS',
+    'LETCI_DIMENSIONS',
+    'WeightProfile',
+    'DEFAULT_ADLI_PROFILE',
+    'DEFAULT_LETCI_PROFILE',
+    'DEFAULT_CATEGORY_PROFILE',
+    'as_weight_profile',
+]
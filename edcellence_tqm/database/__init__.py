@@ -0,0 +1,25 @@
+"""
+Database layer for EdcellenceTQM.
+
+Classes:
+    ConnectionPool: Thread-safe pool of DB-API connections (SQLite stand-in built in)
+    AssessmentRepository: Batched upserts of bulk assessment results into the fact tables
+
+Functions:
+    pushdown_statements: SQL that scores a cycle inside the database (Equations 1-5)
+    read_lookup_table: Rows of a lookup table from the schema script
+    sqlite_schema_sql: The schema script translated for SQLite
+"""
+
+from edcellence_tqm.database.schema import read_lookup_table, sqlite_schema_sql
+from edcellence_tqm.database.pool import ConnectionPool
+from edcellence_tqm.database.repository import AssessmentRepository
+from edcellence_tqm.database.pushdown import pushdown_statements
+
+__all__ = [
+    "ConnectionPool",
+    "AssessmentRepository",
+    "pushdown_statements",
+    "read_lookup_table",
+    "sqlite_schema_sql",
+]
@@ -0,0 +1,154 @@
+"""
+Connection Pool
+===============
+
+Small thread-safe pool of DB-API connections.
+
+Connections are created lazily up to ``size`` and reused LIFO, so a busy
+worker keeps hitting a warm connection. transaction() commits on success
+and rolls back on error, which is all the repository layer needs from a
+driver; any DB-API 2.0 connect function can be pooled (sqlite3,
+psycopg2, ...).
+
+ConnectionPool.sqlite() builds the SQLite stand-in: file databases use WAL
+journaling so readers do not block the writer, and ':memory:' becomes a
+named shared-cache database so every pooled connection sees the same data.
+
+Authors: Rajamangala University of Technology Krungthep Research Team
+License: MIT
+Version: 1.0.0
+"""
+
+import itertools
+import queue
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Iterator, List, Optional, Union
+
+_memory_ids = itertools.count()
+
+
+class ConnectionPool:
+    """
+    Pool of up to ``size`` reusable connections.
+
+    Example:
+        >>> pool = ConnectionPool.sqlite('tqm.db', size=4)
+        >>> with pool.transaction() as connection:
+        ...     connection.execute("DELETE FROM fact_gap_analysis")
+    """
+
+    def __init__(self, connect: Callable[[], Any], size: int = 4, timeout: float = 30.0):
+        """
+        Initialize an empty pool.
+
+        Args:
+            connect: Zero-argument function returning a new DB-API connection
+            size: Most connections open at once
+            timeout: Seconds to wait for a free connection
+        """
+        if size < 1:
+            raise ValueError(f"size must be positive, got {size}")
+        self.size = size
+        self.timeout = timeout
+        self._connect = connect
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._all: List[Any] = []
+        self._lock = Lock()
+        self._closed = False
+        # Connection kept open for the pool's lifetime (shared in-memory SQLite)
+        self._anchor: Optional[Any] = None
+
+    @classmethod
+    def sqlite(cls, path: Union[str, Path] = ':memory:', size: int = 4,
+               timeout: float = 30.0) -> 'ConnectionPool':
+        """Pool of sqlite3 connections to one database file (or shared in-memory DB)."""
+        if str(path) == ':memory:':
+            uri = f'file:edcellence_tqm_{next(_memory_ids)}?mode=memory&cache=shared'
+
+            def connect_memory():
+                return sqlite3.connect(uri, uri=True, check_same_thread=False, timeout=timeout)
+
+            pool = cls(connect_memory, size + 1, timeout)
+            # Pin one connection so the shared in-memory database outlives idle periods
+            pool._anchor = pool._open()
+            return pool
+
+        def connect_file():
+            connection = sqlite3.connect(str(path), check_same_thread=False, timeout=timeout)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            return connection
+
+        return cls(connect_file, size, timeout)
+
+    def _open(self):
+        connection = self._connect()
+        self._all.append(connection)
+        return connection
+
+    def acquire(self):
+        """Take a connection, opening one if the pool is not full."""
+        if self._closed:
+            raise ValueError("Connection pool is closed")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._all) < self.size:
+                return self._open()
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No free connection after {self.timeout}s") from None
+
+    def release(self, connection):
+        """Return a connection to the pool (a no-op once the pool is closed)."""
+        with self._lock:
+            if not self._closed:
+                self._idle.put(connection)
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Borrow a connection for the duration of a with block."""
+        connection = self.acquire()
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    @contextmanager
+    def transaction(self) -> Iterator[Any]:
+        """Borrow a connection and commit on success, roll back on error."""
+        with self.connection() as connection:
+            try:
+                yield connection
+            except BaseException:
+                connection.rollback()
+                raise
+            connection.commit()
+
+    def close(self):
+        """Close every connection."""
+        with self._lock:
+            self._closed = True
+            for connection in self._all:
+                connection.close()
+            self._all.clear()
+            self._anchor = None
+            while not self._idle.empty():
+                self._idle.get_nowait()
+
+    def __enter__(self) -> 'ConnectionPool':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+__all__ = [
+    'ConnectionPool',
+]
@@ -0,0 +1,250 @@
+"""
+SQL Pushdown of Equations 1-6
+=============================
+
+Generates set-based statements that score an assessment cycle inside the
+database, so large cycles never leave it:
+
+    fact_assessment_scores.item_score      Equation 1 (lookup_adli_weights)
+    fact_results_metrics.results_score     Equation 2 (lookup_letci_weights)
+    fact_category_aggregates               Equation 3 (dim_assessment_item.point_value)
+    fact_organizational_scores             Equation 4 (lookup_category_weights),
+                                           maturity level and IHI (Equation 5)
+    fact_gap_analysis                      Equation 6 priorities and per-department
+                                           ranks of staged gap rows
+
+Each statement reads the dimension columns written by
+AssessmentRepository.save_items and joins the lookup tables once; the
+aggregate statements recompute the unrounded item scores in a shared CTE
+so category and organizational scores are not built from values already
+rounded to DECIMAL(5,2), matching assess_departments. Departments that
+lack a weighted category, or lack process or results items, get no
+organizational row (assess_departments raises for them instead).
+
+The SQL uses UPDATE ... FROM, CTEs, window functions and
+INSERT ... SELECT ... ON CONFLICT, accepted by PostgreSQL 9.5+ and
+SQLite 3.33+.
+
+Authors: Rajamangala University of Technology Krungthep Research Team
+License: MIT
+Version: 1.0.0
+"""
+
+from typing import Dict, Sequence, Tuple
+
+from edcellence_tqm.database.repository import FACT_TABLES, on_conflict_sql
+
+# (lookup dimension_name, fact column) in Equation 1/2 order
+ADLI_DIMENSIONS = (
+    ('Approach', 'approach_score'),
+    ('Deployment', 'deployment_score'),
+    ('Learning', 'learning_score'),
+    ('Integration', 'integration_score'),
+)
+LETCI_DIMENSIONS = (
+    ('Level', 'level_score'),
+    ('Trend', 'trend_score'),
+    ('Comparison', 'comparison_score'),
+    ('Integration', 'integration_score'),
+)
+
+# Selectable weight columns of each lookup table
+WEIGHT_COLUMNS = {
+    'adli': ('default_weight', 'nist_weight'),
+    'letci': ('default_weight', 'baldrige_weight'),
+    'category': ('edpex_weight', 'baldrige_weight'),
+}
+
+
+def _check_column(kind: str, column: str) -> str:
+    if column not in WEIGHT_COLUMNS[kind]:
+        raise ValueError(
+            f"Unknown {kind} weight column {column!r}; expected one of {WEIGHT_COLUMNS[kind]}"
+        )
+    return column
+
+
+def _clip(expression: str, low: int, high: int) -> str:
+    return (f"CASE WHEN {expression} < {low} THEN {low} "
+            f"WHEN {expression} > {high} THEN {high} ELSE {expression} END")
+
+
+def _weights_sql(table: str, dimensions: Sequence[Tuple[str, str]], column: str) -> str:
+    """One-row pivot of a lookup weight table: columns w0..w3 in dimension order."""
+    pivots = ', '.join(
+        f"SUM(CASE WHEN dimension_name = '{name}' THEN {column} END) AS w{j}"
+        for j, (name, _) in enumerate(dimensions)
+    )
+    return f"SELECT {pivots} FROM {table}"
+
+
+def _score_sql(dimensions: Sequence[Tuple[str, str]], alias: str = '') -> str:
+    """Unclipped Equation 1/2 score 100·Σ w_d·x_d against a pivoted weight row w."""
+    terms = ' + '.join(f"{alias}{column} * w.w{j}" for j, (_, column) in enumerate(dimensions))
+    return f"100 * ({terms})"
+
+
+def _items_cte(placeholder: str, adli_column: str, letci_column: str) -> Tuple[str, int]:
+    """
+    CTEs 'items' (clipped item scores of one cycle) and 'categories' (Equation 3).
+
+    Returns:
+        (SQL, number of cycle_id parameters it takes)
+    """
+    branches = []
+    for table, date, flag, lookup, dimensions, column in (
+        ('fact_assessment_scores', 'assessment_date', 1, 'lookup_adli_weights',
+         ADLI_DIMENSIONS, adli_column),
+        ('fact_results_metrics', 'measurement_date', 0, 'lookup_letci_weights',
+         LETCI_DIMENSIONS, letci_column),
+    ):
+        branches.append(
+            f"SELECT f.department_id, f.assessment_cycle_id, i.category_name, i.point_value, "
+            f"f.integration_score, {flag} AS is_process, f.{date} AS assessed_on, "
+            f"{_score_sql(dimensions, 'f.')} AS raw_score "
+            f"FROM {table} f "
+            f"JOIN dim_assessment_item i ON i.item_id = f.item_id "
+            f"CROSS JOIN ({_weights_sql(lookup, dimensions, column)}) w "
+            f"WHERE f.assessment_cycle_id = {placeholder}"
+        )
+    sql = (
+        f"WITH raw_items AS ({' UNION ALL '.join(branches)}), "
+        f"items AS (SELECT raw_items.*, {_clip('raw_score', 0, 100)} AS item_score "
+        f"FROM raw_items), "
+        f"categories AS (SELECT department_id, assessment_cycle_id, category_name, "
+        f"SUM(item_score * point_value) / SUM(point_value) AS category_score, "
+        f"COUNT(*) AS item_count, SUM(point_value) AS total_point_value "
+        f"FROM items GROUP BY department_id, assessment_cycle_id, category_name)"
+    )
+    return sql, len(branches)
+
+
+def pushdown_statements(
+    placeholder: str = '?',
+    adli_column: str = 'default_weight',
+    letci_column: str = 'default_weight',
+    category_column: str = 'edpex_weight'
+) -> Dict[str, Tuple[str, int]]:
+    """
+    Statements that score one assessment cycle in the database, in execution order.
+
+    Each statement comes with its parameter count; every parameter is bound
+    to the same cycle_id, so run it with ``(cycle_id,) * n_params``.
+
+    Args:
+        placeholder: Driver parameter marker ('?' for sqlite3, '%s' for psycopg2)
+        adli_column: lookup_adli_weights column for Equation 1
+        letci_column: lookup_letci_weights column for Equation 2
+        category_column: lookup_category_weights column for Equation 4
+
+    Returns:
+        {target table: (SQL, n_params)}
+
+    Example:
+        >>> statements = pushdown_statements()
+        >>> list(statements)
+        ['fact_assessment_scores', 'fact_results_metrics', 'fact_category_aggregates',
+         'fact_organizational_scores']
+        >>> for sql, n_params in statements.values():
+        ...     cursor.execute(sql, (cycle_id,) * n_params)
+    """
+    adli_column = _check_column('adli', adli_column)
+    letci_column = _check_column('letci', letci_column)
+    category_column = _check_column('category', category_column)
+
+    statements = {}
+    for table, score, lookup, dimensions, column in (
+        ('fact_assessment_scores', 'item_score', 'lookup_adli_weights',
+         ADLI_DIMENSIONS, adli_column),
+        ('fact_results_metrics', 'results_score', 'lookup_letci_weights',
+         LETCI_DIMENSIONS, letci_column),
+    ):
+        statements[table] = (
+            f"UPDATE {table} SET {score} = ROUND({_clip(_score_sql(dimensions), 0, 100)}, 2) "
+            f"FROM ({_weights_sql(lookup, dimensions, column)}) w "
+            f"WHERE assessment_cycle_id = {placeholder}",
+            1,
+        )
+
+    cte, cte_params = _items_cte(placeholder, adli_column, letci_column)
+    keys, columns = FACT_TABLES['fact_category_aggregates']
+    statements['fact_category_aggregates'] = (
+        f"INSERT INTO fact_category_aggregates ({', '.join(keys + columns)}) {cte} "
+        f"SELECT category_name, department_id, assessment_cycle_id, "
+        f"ROUND(category_score, 2), item_count, total_point_value "
+        f"FROM categories WHERE TRUE {on_conflict_sql(keys, columns)}",
+        cte_params,
+    )
+
+    keys, columns = FACT_TABLES['fact_organizational_scores']
+    statements['fact_organizational_scores'] = (
+        f"INSERT INTO fact_organizational_scores ({', '.join(keys + columns)}) {cte}, "
+        f"weighted AS (SELECT c.department_id, c.assessment_cycle_id, "
+        f"SUM(l.{category_column} * c.category_score) AS raw_score, COUNT(*) AS n_categories "
+        f"FROM categories c JOIN lookup_category_weights l ON l.category_name = c.category_name "
+        f"GROUP BY c.department_id, c.assessment_cycle_id), "
+        f"integration AS (SELECT department_id, assessment_cycle_id, "
+        f"0.5 * (AVG(CASE WHEN is_process = 1 THEN integration_score END) "
+        f"+ AVG(CASE WHEN is_process = 0 THEN integration_score END)) AS raw_ihi, "
+        f"MAX(assessed_on) AS assessment_date "
+        f"FROM items GROUP BY department_id, assessment_cycle_id), "
+        f"scored AS (SELECT s.department_id, s.assessment_cycle_id, "
+        f"{_clip('s.raw_score', 0, 100)} AS score, {_clip('g.raw_ihi', 0, 1)} AS ihi, "
+        f"g.assessment_date FROM weighted s "
+        f"JOIN integration g ON g.department_id = s.department_id "
+        f"AND g.assessment_cycle_id = s.assessment_cycle_id "
+        f"WHERE s.n_categories = (SELECT COUNT(*) FROM lookup_category_weights) "
+        f"AND g.raw_ihi IS NOT NULL) "
+        f"SELECT department_id, assessment_cycle_id, ROUND(score, 2), "
+        f"(SELECT MIN(level) FROM lookup_maturity_levels WHERE scored.score <= max_score), "
+        f"ROUND(ihi, 3), assessment_date "
+        f"FROM scored WHERE TRUE {on_conflict_sql(keys, columns)}",
+        cte_params,
+    )
+    return statements
+
+
+def gap_ranking_sql(placeholder: str = '?') -> Tuple[str, str]:
+    """
+    Statements that score and rank one cycle's staged fact_gap_analysis rows.
+
+    Staged rows are those with a NULL priority_rank. The first statement
+    fills their gap_score, priority_score (Equation 6) and priority_rank
+    from current_score, target_score, point_value and deployment_urgency,
+    with one RANK() window per department (ties ordered by item_id, so
+    ranks are unique); it takes the cycle_id. The second deletes one
+    department's rows of the cycle ranked below a cut-off, so departments
+    saved by other calls are untouched; it takes the cycle_id, the
+    department_id and top N.
+
+    Returns:
+        (rank_sql, prune_sql)
+    """
+    gap = "target_score - current_score"
+    raw = f"({gap}) * point_value * deployment_urgency"
+    priority = f"CASE WHEN {raw} > 0 THEN {raw} ELSE 0 END"
+    rank_sql = (
+        f"UPDATE fact_gap_analysis SET gap_score = ROUND(r.gap, 2), "
+        f"priority_score = ROUND(r.priority, 2), priority_rank = r.priority_rank "
+        f"FROM (SELECT gap_id, gap, priority, RANK() OVER (PARTITION BY department_id "
+        f"ORDER BY priority DESC, item_id) AS priority_rank "
+        f"FROM (SELECT gap_id, department_id, item_id, {gap} AS gap, {priority} AS priority "
+        f"FROM fact_gap_analysis WHERE assessment_cycle_id = {placeholder} "
+        f"AND priority_rank IS NULL) g) r "
+        f"WHERE fact_gap_analysis.gap_id = r.gap_id"
+    )
+    prune_sql = (
+        f"DELETE FROM fact_gap_analysis "
+        f"WHERE assessment_cycle_id = {placeholder} AND department_id = {placeholder} "
+        f"AND priority_rank > {placeholder}"
+    )
+    return rank_sql, prune_sql
+
+
+__all__ = [
+    'ADLI_DIMENSIONS',
+    'LETCI_DIMENSIONS',
+    'WEIGHT_COLUMNS',
+    'pushdown_statements',
+    'gap_ranking_sql',
+]
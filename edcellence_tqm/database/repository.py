@@ -0,0 +1,583 @@
+"""
+Assessment Repository
+=====================
+
+Persists bulk assessment results into the fact tables of
+``scripts/schema_simplified.sql``:
+
+    fact_assessment_scores       process items (ADLI indicators, item score)
+    fact_results_metrics         results items (LeTCI indicators, item score)
+    fact_category_aggregates     Equation 3 scores per department × category
+    fact_organizational_scores   Equation 4 score, maturity level and IHI
+    fact_gap_analysis            Equation 6 priorities ranked per department
+
+Every write is set-based: rows are built column-wise from a
+BulkAssessmentResult and sent with executemany in batches of
+``batch_size`` as upserts on the tables' UNIQUE keys
+(INSERT ... ON CONFLICT (...) DO UPDATE), inside one transaction per
+assessment. Re-saving a cycle therefore replaces its rows instead of
+failing or duplicating them; fact_gap_analysis has no UNIQUE key, so its
+rows are deleted and re-inserted per (cycle, department). The statements
+are accepted by PostgreSQL 9.5+ and SQLite 3.24+; SQLite is the local
+stand-in used by the tests and benchmarks.
+
+Values are rounded to their DECIMAL column scales (item and category
+scores to 2 places, indicators and IHI to 3) before writing.
+
+Every write of organizational scores also folds them into
+fact_latest_department_scores, a one-row-per-department snapshot read by
+vw_latest_department_scores_snapshot, in the same transaction.
+vw_latest_department_scores still computes the latest rows from the facts,
+so it stays correct for writes made outside this layer. Run
+rebuild_latest_scores() once on databases created before the snapshot
+table existed, and after writing organizational scores with other clients.
+
+Authors: Rajamangala University of Technology Krungthep Research Team
+License: MIT
+Version: 1.0.0
+"""
+
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+import numpy as np
+
+from edcellence_tqm.core.bulk import BulkAssessmentResult, BulkItems, gap_priorities
+from edcellence_tqm.core.item_table import ITEM_TYPES, PROCESS_ITEM, RESULTS_ITEM
+from edcellence_tqm.database.pool import ConnectionPool
+from edcellence_tqm.database.schema import sqlite_schema_sql
+
+# Columns written per fact table and their UNIQUE conflict keys
+FACT_TABLES = {
+    'fact_assessment_scores': (
+        ('item_id', 'department_id', 'assessment_cycle_id'),
+        ('assessment_date', 'approach_score', 'deployment_score', 'learning_score',
+         'integration_score', 'item_score'),
+    ),
+    'fact_results_metrics': (
+        ('item_id', 'department_id', 'assessment_cycle_id'),
+        ('measurement_date', 'level_score', 'trend_score', 'comparison_score',
+         'integration_score', 'results_score'),
+    ),
+    'fact_category_aggregates': (
+        ('category_name', 'department_id', 'assessment_cycle_id'),
+        ('category_score', 'item_count', 'total_point_value'),
+    ),
+    'fact_organizational_scores': (
+        ('department_id', 'assessment_cycle_id'),
+        ('organizational_score', 'maturity_level', 'ihi_score', 'assessment_date'),
+    ),
+}
+
+# fact_gap_analysis has no UNIQUE key: a cycle's rows are replaced per department
+GAP_COLUMNS = ('item_id', 'department_id', 'assessment_cycle_id', 'current_score',
+               'target_score', 'gap_score', 'point_value', 'deployment_urgency',
+               'priority_score', 'priority_rank')
+
+# Latest-score snapshot maintained alongside fact_organizational_scores
+LATEST_SCORES_TABLE = 'fact_latest_department_scores'
+LATEST_SCORES_COLUMNS = ('assessment_cycle_id', 'organizational_score', 'maturity_level',
+                         'ihi_score', 'assessment_date')
+# A row replaces the snapshot when it re-saves the snapshot's cycle or is
+# newer by (assessment_date, assessment_cycle_id)
+_NEWER = (f"excluded.assessment_cycle_id = {LATEST_SCORES_TABLE}.assessment_cycle_id "
+          f"OR excluded.assessment_date > {LATEST_SCORES_TABLE}.assessment_date "
+          f"OR (excluded.assessment_date = {LATEST_SCORES_TABLE}.assessment_date "
+          f"AND excluded.assessment_cycle_id >= {LATEST_SCORES_TABLE}.assessment_cycle_id)")
+
+
+def _latest_rows_sql(names: str, where: str = '') -> str:
+    """SELECT of each department's newest organizational score (ROW_NUMBER per department)."""
+    return (f"SELECT {names} FROM (SELECT {names}, ROW_NUMBER() OVER ("
+            f"PARTITION BY department_id "
+            f"ORDER BY assessment_date DESC, assessment_cycle_id DESC) AS recency "
+            f"FROM fact_organizational_scores {where}) ranked WHERE recency = 1")
+
+
+def on_conflict_sql(keys: Sequence[str], columns: Sequence[str], update: bool = True) -> str:
+    """
+    ON CONFLICT clause updating every non-key column (DO NOTHING if update=False).
+
+    Example:
+        >>> on_conflict_sql(['k'], ['v'])
+        'ON CONFLICT (k) DO UPDATE SET v = excluded.v'
+    """
+    updates = ', '.join(f'{column} = excluded.{column}' for column in columns)
+    action = f'DO UPDATE SET {updates}' if columns and update else 'DO NOTHING'
+    return f"ON CONFLICT ({', '.join(keys)}) {action}"
+
+
+def upsert_sql(table: str, keys: Sequence[str], columns: Sequence[str],
+               placeholder: str = '?', update: bool = True) -> str:
+    """
+    INSERT ... ON CONFLICT (keys) DO UPDATE statement for one table.
+
+    With update=False existing rows are kept (ON CONFLICT DO NOTHING);
+    without keys a plain INSERT is returned.
+
+    Example:
+        >>> upsert_sql('t', ['k'], ['v'])
+        'INSERT INTO t (k, v) VALUES (?, ?) ON CONFLICT (k) DO UPDATE SET v = excluded.v'
+    """
+    names = list(keys) + list(columns)
+    sql = (f"INSERT INTO {table} ({', '.join(names)}) "
+           f"VALUES ({', '.join([placeholder] * len(names))})")
+    return f"{sql} {on_conflict_sql(keys, columns, update)}" if keys else sql
+
+
+def _batches(rows: Iterable[Tuple], size: int) -> Iterable[List[Tuple]]:
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _column_rows(columns: Sequence) -> Iterable[Tuple]:
+    """Row tuples of Python scalars from parallel columns (arrays or scalars)."""
+    n = max(len(c) for c in columns if isinstance(c, (np.ndarray, list)))
+    lists = [c.tolist() if isinstance(c, np.ndarray) else
+             c if isinstance(c, list) else [c] * n for c in columns]
+    return zip(*lists)
+
+
+class AssessmentRepository:
+    """
+    Bulk writer and reader for assessment fact tables.
+
+    Example:
+        >>> repository = AssessmentRepository(ConnectionPool.sqlite('tqm.db'))
+        >>> repository.create_schema()
+        >>> cycle = repository.cycle_id('2024-Q1', '2024-01-01', '2024-03-31')
+        >>> repository.save_assessment(result, cycle, '2024-03-31')
+        {'fact_assessment_scores': 12000, 'fact_results_metrics': 4000, ...}
+    """
+
+    def __init__(self, pool: ConnectionPool, placeholder: str = '?', batch_size: int = 5000):
+        """
+        Initialize a repository.
+
+        Args:
+            pool: Connection pool
+            placeholder: Driver parameter marker ('?' for sqlite3, '%s' for psycopg2)
+            batch_size: Rows per executemany call
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        self.pool = pool
+        self.placeholder = placeholder
+        self.batch_size = batch_size
+
+    def create_schema(self):
+        """Create the simplified schema (SQLite stand-in databases only)."""
+        with self.pool.transaction() as connection:
+            connection.executescript(sqlite_schema_sql())
+
+    def write_rows(self, connection, table: str, keys: Sequence[str], columns: Sequence[str],
+                   rows: Iterable[Tuple], update: bool = True) -> int:
+        """Upsert row tuples (keys then columns) in executemany batches; returns row count."""
+        sql = upsert_sql(table, keys, columns, self.placeholder, update)
+        cursor = connection.cursor()
+        count = 0
+        for batch in _batches(rows, self.batch_size):
+            cursor.executemany(sql, batch)
+            count += len(batch)
+        return count
+
+    # ------------------------------------------------------------------
+    # Dimensions
+    # ------------------------------------------------------------------
+
+    def department_ids(
+        self,
+        departments: Sequence,
+        faculty_of: Optional[Mapping] = None
+    ) -> Dict[Any, int]:
+        """
+        Return {label: department_id}, registering unknown departments.
+
+        Labels are stored as both department_code and department_name;
+        existing departments are left unchanged.
+        """
+        labels = [str(label) for label in departments]
+        faculty_of = faculty_of or {}
+        rows = [(label, label, faculty_of.get(original))
+                for label, original in zip(labels, departments)]
+        with self.pool.transaction() as connection:
+            self.write_rows(connection, 'dim_department', ['department_code'],
+                            ['department_name', 'faculty_name'], rows, update=False)
+            cursor = connection.cursor()
+            cursor.execute("SELECT department_code, department_id FROM dim_department")
+            ids = dict(cursor.fetchall())
+        return {original: ids[label] for label, original in zip(labels, departments)}
+
+    def cycle_id(self, cycle_code: str, start_date: str, end_date: Optional[str] = None,
+                 cycle_type: Optional[str] = None) -> int:
+        """Return the cycle_id of a cycle code, registering it if needed."""
+        with self.pool.transaction() as connection:
+            self.write_rows(connection, 'dim_assessment_cycle', ['cycle_code'],
+                            ['cycle_start_date', 'cycle_end_date', 'cycle_type'],
+                            [(cycle_code, start_date, end_date or start_date, cycle_type)],
+                            update=False)
+            cursor = connection.cursor()
+            cursor.execute(
+                f"SELECT cycle_id FROM dim_assessment_cycle WHERE cycle_code = {self.placeholder}",
+                (cycle_code,)
+            )
+            return cursor.fetchone()[0]
+
+    def register_items(self, items: BulkItems) -> int:
+        """
+        Upsert dim_assessment_item rows (category, item type, point value) for items.
+
+        Attributes are taken from each item's first row; returns the item count.
+        """
+        codes, first = np.unique(items.item_code, return_index=True)
+        categories = np.asarray(items.categories, dtype=object)
+        rows = _column_rows([
+            items.item_names[codes].astype(str), categories[items.category[first]],
+            np.asarray(ITEM_TYPES, dtype=object)[items.item_type[first]],
+            items.point_value[first],
+        ])
+        with self.pool.transaction() as connection:
+            return self.write_rows(connection, 'dim_assessment_item', ['item_id'],
+                                   ['category_name', 'item_type', 'point_value'], rows)
+
+    # ------------------------------------------------------------------
+    # Facts
+    # ------------------------------------------------------------------
+
+    def item_rows(
+        self,
+        items: BulkItems,
+        cycle_id: int,
+        assessment_date: str,
+        department_ids: Mapping,
+        item_score: Optional[np.ndarray] = None
+    ) -> Dict[str, Iterable[Tuple]]:
+        """Row iterators for the two item fact tables; item scores are NULL if not given."""
+        codes = np.array([department_ids[d] for d in items.departments.tolist()],
+                         dtype=np.int64)
+        department = codes[items.department]
+        item_ids = items.item_ids.astype(str)
+        indicators = np.round(items.indicators, 3)
+        score = None if item_score is None else np.round(item_score, 2)
+        rows = {}
+        for table, kind in (('fact_assessment_scores', PROCESS_ITEM),
+                            ('fact_results_metrics', RESULTS_ITEM)):
+            r = np.flatnonzero(items.item_type == kind)
+            rows[table] = _column_rows([
+                item_ids[r], department[r], cycle_id, assessment_date,
+                *(indicators[r, j] for j in range(4)), None if score is None else score[r],
+            ])
+        return rows
+
+    def assessment_rows(
+        self,
+        result: BulkAssessmentResult,
+        cycle_id: int,
+        assessment_date: str,
+        department_ids: Mapping
+    ) -> Dict[str, Iterable[Tuple]]:
+        """Row iterators per fact table for one assessed cycle (keys first, then columns)."""
+        items = result.items
+        codes = np.array([department_ids[d] for d in result.departments.tolist()],
+                         dtype=np.int64)
+        rows = self.item_rows(items, cycle_id, assessment_date, department_ids,
+                              result.item_score)
+
+        d, k = np.nonzero(result.category_item_counts > 0)
+        points = np.zeros(result.category_scores.shape, dtype=np.int64)
+        np.add.at(points, (items.department, items.category), items.point_value)
+        categories = np.asarray(result.categories, dtype=object)
+        rows['fact_category_aggregates'] = _column_rows([
+            categories[k], codes[d], cycle_id, np.round(result.category_scores[d, k], 2),
+            result.category_item_counts[d, k], points[d, k],
+        ])
+        rows['fact_organizational_scores'] = _column_rows([
+            codes, cycle_id, np.round(result.organizational_score, 2),
+            result.maturity_level.astype(np.int64), np.round(result.ihi, 3), assessment_date,
+        ])
+        return rows
+
+    def save_assessment(
+        self,
+        result: BulkAssessmentResult,
+        cycle_id: int,
+        assessment_date: str,
+        department_ids: Optional[Mapping] = None
+    ) -> Dict[str, int]:
+        """
+        Upsert a bulk assessment into the fact tables in one transaction.
+
+        Args:
+            result: assess_departments result for one cycle
+            cycle_id: dim_assessment_cycle.cycle_id
+            assessment_date: ISO date stored as assessment/measurement date
+            department_ids: {label: department_id}; registered via
+                            department_ids() if None
+
+        Returns:
+            {table: rows written}
+        """
+        if department_ids is None:
+            department_ids = self.department_ids(result.departments.tolist())
+        rows = self.assessment_rows(result, cycle_id, assessment_date, department_ids)
+        written = {}
+        with self.pool.transaction() as connection:
+            for table, (keys, columns) in FACT_TABLES.items():
+                written[table] = self.write_rows(connection, table, keys, columns, rows[table])
+            self.refresh_latest_scores(connection, cycle_id)
+        return written
+
+    def gap_rows(
+        self,
+        result: BulkAssessmentResult,
+        cycle_id: int,
+        department_ids: Mapping,
+        target_score: float = 100.0,
+        top_n: Optional[int] = None,
+        ranked: bool = True
+    ) -> Iterable[Tuple]:
+        """
+        fact_gap_analysis rows (GAP_COLUMNS order) for one assessed cycle.
+
+        Gap, Equation 6 priority and per-department rank are computed for all
+        items in one vectorized pass and rows come out in (department, rank)
+        order, keeping the top_n per department if given. With ranked=False
+        every item is returned as a staged row for gap_ranking_sql, with
+        NULL gap, priority and rank.
+        """
+        items = result.items
+        codes = np.array([department_ids[d] for d in result.departments.tolist()],
+                         dtype=np.int64)
+        priority, rank, order = gap_priorities(items, result.item_score, target_score)
+        rows = order if top_n is None or not ranked else order[rank[order] <= top_n]
+        score = result.item_score[rows]
+        return _column_rows([
+            items.item_ids[rows].astype(str), codes[items.department[rows]], cycle_id,
+            np.round(score, 2), float(target_score),
+            np.round(target_score - score, 2) if ranked else None,
+            items.point_value[rows], np.round(items.deployment_gap[rows], 3),
+            np.round(priority[rows], 2) if ranked else None,
+            rank[rows] if ranked else None,
+        ])
+
+    def save_gap_analysis(
+        self,
+        result: BulkAssessmentResult,
+        cycle_id: int,
+        department_ids: Optional[Mapping] = None,
+        target_score: float = 100.0,
+        top_n: Optional[int] = None,
+        rank_in_database: bool = False
+    ) -> int:
+        """
+        Replace the cycle's gap analysis rows of the result's departments.
+
+        Args:
+            result: assess_departments result for one cycle
+            cycle_id: dim_assessment_cycle.cycle_id
+            department_ids: {label: department_id}; registered via
+                            department_ids() if None
+            target_score: Target item score T_i
+            top_n: Keep only the N highest priorities per department
+            rank_in_database: Stage raw gap inputs and let the database
+                              compute gap, priority and rank (gap_ranking_sql)
+                              instead of ranking in numpy
+
+        Returns:
+            Rows stored
+        """
+        if top_n is not None and top_n < 1:
+            raise ValueError(f"top_n must be positive, got {top_n}")
+        if department_ids is None:
+            department_ids = self.department_ids(result.departments.tolist())
+        rows = self.gap_rows(result, cycle_id, department_ids, target_score, top_n,
+                             ranked=not rank_in_database)
+        stale = [(cycle_id, department_ids[d]) for d in result.departments.tolist()]
+        with self.pool.transaction() as connection:
+            cursor = connection.cursor()
+            cursor.executemany(
+                f"DELETE FROM fact_gap_analysis WHERE assessment_cycle_id = {self.placeholder} "
+                f"AND department_id = {self.placeholder}", stale
+            )
+            written = self.write_rows(connection, 'fact_gap_analysis', (), GAP_COLUMNS, rows)
+            if rank_in_database:
+                from edcellence_tqm.database.pushdown import gap_ranking_sql
+
+                rank_sql, prune_sql = gap_ranking_sql(self.placeholder)
+                cursor.execute(rank_sql, (cycle_id,))
+                if top_n is not None:
+                    cursor.executemany(prune_sql, [(cycle, department, top_n)
+                                                   for cycle, department in stale])
+                    # Ranks are unique per department, so each keeps min(items, top_n)
+                    sizes = np.diff(result.items.department_offsets)
+                    written = int(np.minimum(sizes, top_n).sum())
+        return written
+
+    # ------------------------------------------------------------------
+    # Pushdown
+    # ------------------------------------------------------------------
+
+    def save_items(
+        self,
+        items: BulkItems,
+        cycle_id: int,
+        assessment_date: str,
+        department_ids: Optional[Mapping] = None
+    ) -> Dict[str, int]:
+        """
+        Upsert the raw indicator rows of a cycle, leaving item scores NULL.
+
+        Items are registered in dim_assessment_item; score the cycle with
+        compute_in_database().
+
+        Returns:
+            {table: rows written}
+        """
+        if department_ids is None:
+            department_ids = self.department_ids(items.departments.tolist())
+        self.register_items(items)
+        rows = self.item_rows(items, cycle_id, assessment_date, department_ids)
+        with self.pool.transaction() as connection:
+            return {table: self.write_rows(connection, table, *FACT_TABLES[table], rows[table])
+                    for table in rows}
+
+    def compute_in_database(self, cycle_id: int, **weight_columns) -> Dict[str, int]:
+        """
+        Score a cycle with Equations 1-5 inside the database, in one transaction.
+
+        Args:
+            cycle_id: dim_assessment_cycle.cycle_id
+            **weight_columns: adli_column, letci_column and category_column
+                              lookup columns (see pushdown_statements)
+
+        Returns:
+            {table: rows updated or upserted}
+        """
+        from edcellence_tqm.database.pushdown import pushdown_statements
+
+        statements = pushdown_statements(self.placeholder, **weight_columns)
+        written = {}
+        with self.pool.transaction() as connection:
+            cursor = connection.cursor()
+            for table, (sql, n_params) in statements.items():
+                cursor.execute(sql, (cycle_id,) * n_params)
+                written[table] = cursor.rowcount
+            self.refresh_latest_scores(connection, cycle_id)
+        return written
+
+    # ------------------------------------------------------------------
+    # Latest-score snapshot
+    # ------------------------------------------------------------------
+
+    def refresh_latest_scores(self, connection, cycle_id: int) -> int:
+        """
+        Fold one cycle's organizational scores into the latest-score snapshot.
+
+        Called inside the transaction that wrote fact_organizational_scores,
+        so the snapshot never lags the facts. A cycle's rows replace a
+        department's snapshot row when they are newer (by assessment date,
+        then cycle id) or re-save the snapshot's own cycle. Departments whose
+        snapshot cycle was re-saved with an earlier date are first recomputed
+        from their full history, since an older cycle may now be the latest.
+        After deleting facts use rebuild_latest_scores().
+
+        Returns:
+            Rows examined (the cycle's organizational scores)
+        """
+        names = ', '.join(('department_id',) + LATEST_SCORES_COLUMNS)
+        updates = ', '.join(f'{column} = excluded.{column}' for column in LATEST_SCORES_COLUMNS)
+        cursor = connection.cursor()
+        backdated = (
+            f"SELECT s.department_id FROM {LATEST_SCORES_TABLE} s "
+            f"JOIN fact_organizational_scores o ON o.department_id = s.department_id "
+            f"AND o.assessment_cycle_id = s.assessment_cycle_id "
+            f"WHERE s.assessment_cycle_id = {self.placeholder} "
+            f"AND o.assessment_date < s.assessment_date"
+        )
+        cursor.execute(
+            f"INSERT INTO {LATEST_SCORES_TABLE} ({names}) "
+            f"{_latest_rows_sql(names, f'WHERE department_id IN ({backdated})')} "
+            f"ON CONFLICT (department_id) DO UPDATE SET {updates}",
+            (cycle_id,)
+        )
+        cursor.execute(
+            f"INSERT INTO {LATEST_SCORES_TABLE} ({names}) "
+            f"SELECT {names} FROM fact_organizational_scores "
+            f"WHERE assessment_cycle_id = {self.placeholder} "
+            f"ON CONFLICT (department_id) DO UPDATE SET {updates} WHERE {_NEWER}",
+            (cycle_id,)
+        )
+        return cursor.rowcount
+
+    def rebuild_latest_scores(self) -> int:
+        """
+        Recompute the whole snapshot from fact_organizational_scores.
+
+        This is the one-time migration for databases that predate the
+        snapshot table, and the repair after organizational scores are
+        written, backdated or deleted without this repository.
+
+        Returns:
+            Snapshot rows (one per department with scores)
+        """
+        names = ', '.join(('department_id',) + LATEST_SCORES_COLUMNS)
+        with self.pool.transaction() as connection:
+            cursor = connection.cursor()
+            cursor.execute(f"DELETE FROM {LATEST_SCORES_TABLE}")
+            cursor.execute(f"INSERT INTO {LATEST_SCORES_TABLE} ({names}) "
+                           f"{_latest_rows_sql(names)}")
+            return cursor.rowcount
+
+    def latest_scores(self, departments: Optional[Sequence] = None):
+        """
+        Latest score of every department (or of the given department codes).
+
+        Reads vw_latest_department_scores_snapshot, which scans the
+        one-row-per-department snapshot and joins each dimension by primary
+        key, so latency does not grow with the number of stored cycles.
+        Scores written without this repository appear after
+        rebuild_latest_scores().
+        """
+        sql = "SELECT * FROM vw_latest_department_scores_snapshot"
+        params: Sequence = ()
+        if departments is not None:
+            params = [str(code) for code in departments]
+            sql += f" WHERE department_code IN ({', '.join([self.placeholder] * len(params))})"
+        return self.fetch_frame(sql + " ORDER BY department_code", params)
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def fetch_frame(self, sql: str, params: Sequence = ()):
+        """Run a query and return the rows as a pandas DataFrame."""
+        import pandas as pd
+
+        with self.pool.connection() as connection:
+            cursor = connection.cursor()
+            cursor.execute(sql, tuple(params))
+            columns = [column[0] for column in cursor.description]
+            return pd.DataFrame(cursor.fetchall(), columns=columns)
+
+    def organizational_scores(self, cycle_id: int):
+        """Department scores of one cycle, with department codes."""
+        return self.fetch_frame(
+            "SELECT d.department_code, o.organizational_score, o.maturity_level, o.ihi_score "
+            "FROM fact_organizational_scores o "
+            "JOIN dim_department d ON d.department_id = o.department_id "
+            f"WHERE o.assessment_cycle_id = {self.placeholder} ORDER BY d.department_code",
+            (cycle_id,)
+        )
+
+
+__all__ = [
+    'FACT_TABLES',
+    'GAP_COLUMNS',
+    'LATEST_SCORES_TABLE',
+    'AssessmentRepository',
+    'on_conflict_sql',
+    'upsert_sql',
+]
@@ -0,0 +1,188 @@
+"""
+Schema Utilities
+================
+
+Helpers for reading the reference data in the simplified PostgreSQL
+schema without a running database. The canonical script is
+``scripts/schema_simplified.sql`` (the file docker-compose and psql use);
+setup.py copies it into this package at build time, so installed wheels
+read the packaged copy and a source checkout reads SCHEMA_PATH.
+
+The lookup tables (category, ADLI and LeTCI weights, maturity levels) are
+populated by ``INSERT INTO ... VALUES`` statements in the schema script.
+read_lookup_table parses those statements together with the matching
+``CREATE TABLE`` column list and returns the rows as dicts.
+
+sqlite_schema_sql translates the script for SQLite, the local stand-in
+used by the repository layer and its tests.
+
+Authors: Rajamangala University of Technology Krungthep Research Team
+License: MIT
+Version: 1.0.0
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+# Repository copy of the simplified PostgreSQL schema
+SCHEMA_PATH = Path(__file__).resolve().parents[2] / 'scripts' / 'schema_simplified.sql'
+
+# Package-data copy written next to this module by setup.py's build_py step
+SCHEMA_RESOURCE = SCHEMA_PATH.name
+
+_CONSTRAINT_KEYWORDS = ('PRIMARY', 'UNIQUE', 'CHECK', 'FOREIGN', 'CONSTRAINT')
+
+
+def read_schema_sql(path: Optional[Union[str, Path]] = None) -> str:
+    """Return the text of the schema script (defaults to default_schema_path())."""
+    return Path(path or default_schema_path()).read_text(encoding='utf-8')
+
+
+def default_schema_path() -> Path:
+    """Packaged SCHEMA_RESOURCE in an installed wheel, SCHEMA_PATH in a source checkout."""
+    packaged = Path(__file__).with_name(SCHEMA_RESOURCE)
+    return packaged if packaged.is_file() else SCHEMA_PATH
+
+
+def sqlite_schema_sql(path: Optional[Union[str, Path]] = None, sql: Optional[str] = None) -> str:
+    """
+    Return the schema script translated for SQLite.
+
+    SERIAL keys become INTEGER PRIMARY KEY (rowid aliases) and COMMENT ON
+    statements are dropped; everything else is accepted by SQLite 3.24+.
+
+    Example:
+        >>> sqlite3.connect(':memory:').executescript(sqlite_schema_sql())
+    """
+    if sql is None:
+        sql = read_schema_sql(path)
+    sql = _strip_comments(sql)
+    sql = re.sub(r'\bSERIAL\s+PRIMARY\s+KEY\b', 'INTEGER PRIMARY KEY', sql, flags=re.IGNORECASE)
+    return re.sub(r'^\s*COMMENT\s+ON\b[^;]*;', '', sql, flags=re.IGNORECASE | re.MULTILINE)
+
+
+def _strip_comments(sql: str) -> str:
+    """Remove '--' line comments that are not inside string literals."""
+    lines = []
+    for line in sql.splitlines():
+        in_string = False
+        for i, char in enumerate(line):
+            if char == "'":
+                in_string = not in_string
+            elif char == '-' and not in_string and line[i:i + 2] == '--':
+                line = line[:i]
+                break
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+def _split_top_level(text: str, separator: str = ',') -> List[str]:
+    """Split on a separator that is outside quotes and parentheses."""
+    parts, depth, in_string, start = [], 0, False, 0
+    for i, char in enumerate(text):
+        if char == "'":
+            in_string = not in_string
+        elif in_string:
+            continue
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return [part.strip() for part in parts if part.strip()]
+
+
+def _parse_literal(token: str) -> Any:
+    """Convert a SQL literal to a Python value."""
+    if token.startswith("'") and token.endswith("'"):
+        return token[1:-1].replace("''", "'")
+    upper = token.upper()
+    if upper == 'NULL':
+        return None
+    if upper in ('TRUE', 'FALSE'):
+        return upper == 'TRUE'
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+
+def table_columns(sql: str, table: str) -> List[str]:
+    """Return the column names declared by CREATE TABLE for a table."""
+    sql = _strip_comments(sql)
+    match = re.search(
+        rf'CREATE\s+TABLE\s+{re.escape(table)}\s*\((.*?)\)\s*;', sql, re.IGNORECASE | re.DOTALL
+    )
+    if match is None:
+        raise ValueError(f"Table {table} is not defined in the schema")
+    columns = []
+    for definition in _split_top_level(match.group(1)):
+        name_match = re.match(r'\w+', definition)
+        if name_match is None:
+            raise ValueError(f"Cannot read a column name from {definition!r} in table {table}")
+        name = name_match.group(0)
+        if name.upper() not in _CONSTRAINT_KEYWORDS:
+            columns.append(name)
+    return columns
+
+
+def read_lookup_table(
+    table: str,
+    path: Optional[Union[str, Path]] = None,
+    sql: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Read the rows inserted into a lookup table by the schema script.
+
+    Args:
+        table: Table name (e.g. 'lookup_adli_weights')
+        path: Schema script path (defaults to default_schema_path())
+        sql: Schema text; overrides path when given
+
+    Returns:
+        List of {column_name: value} dicts in insertion order
+
+    Example:
+        >>> rows = read_lookup_table('lookup_adli_weights')
+        >>> rows[0]['dimension_name'], rows[0]['default_weight']
+        ('Approach', 0.3)
+    """
+    if sql is None:
+        sql = read_schema_sql(path)
+    columns = table_columns(sql, table)
+    sql = _strip_comments(sql)
+
+    rows = []
+    pattern = rf'INSERT\s+INTO\s+{re.escape(table)}\s+VALUES\s*'
+    for match in re.finditer(pattern, sql, re.IGNORECASE):
+        # Scan to the terminating semicolon outside string literals
+        body, in_string = [], False
+        for char in sql[match.end():]:
+            if char == "'":
+                in_string = not in_string
+            elif char == ';' and not in_string:
+                break
+            body.append(char)
+        for row in _split_top_level(''.join(body)):
+            values = [_parse_literal(token) for token in _split_top_level(row.strip()[1:-1])]
+            if len(values) != len(columns):
+                raise ValueError(
+                    f"Row in {table} has {len(values)} values, expected {len(columns)}"
+                )
+            rows.append(dict(zip(columns, values)))
+    return rows
+
+
+__all__ = [
+    'SCHEMA_PATH',
+    'SCHEMA_RESOURCE',
+    'default_schema_path',
+    'read_schema_sql',
+    'sqlite_schema_sql',
+    'table_columns',
+    'read_lookup_table',
+]
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+"""
+Batch Scoring Benchmark - EdcellenceTQM
+
+Compares the per-item scalar scoring loop (compute_adli_score on one
+ADLIIndicators at a time) with the vectorized compute_adli_scores_batch
+for 10^3 to 10^7 items.
+
+The scalar loop is timed on at most --scalar-limit items and extrapolated
+linearly above that, since its cost is a constant per item.
+
+Usage:
+    python examples/scripts/benchmark_batch_scoring.py --max-exponent 7
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from edcellence_tqm.core import (
+    ADLIIndicators,
+    compute_adli_score,
+    compute_adli_scores_batch,
+)
+
+
+def time_scalar(matrix: np.ndarray) -> float:
+    """Time the per-item scalar scoring loop."""
+    rows = matrix.tolist()
+    start = time.perf_counter()
+    for row in rows:
+        compute_adli_score(ADLIIndicators(*row))
+    return time.perf_counter() - start
+
+
+def time_batch(matrix: np.ndarray, repeats: int = 3) -> float:
+    """Time the vectorized scoring call (best of several runs)."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        compute_adli_scores_batch(matrix)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Run the batch scoring benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--min-exponent', type=int, default=3)
+    parser.add_argument('--max-exponent', type=int, default=7)
+    parser.add_argument('--scalar-limit', type=int, default=100_000)
+    args = parser.parse_args()
+
+    print("=" * 72)
+    print("EdcellenceTQM - Batch vs Scalar ADLI Scoring")
+    print("=" * 72)
+    print(f"{'items':>12} {'scalar (s)':>14} {'batch (s)':>12} {'speedup':>10} {'items/s':>14}")
+    print("-" * 72)
+
+    rng = np.random.default_rng(0)
+    for exponent in range(args.min_exponent, args.max_exponent + 1):
+        n = 10 ** exponent
+        matrix = rng.random((n, 4))
+
+        sample = min(n, args.scalar_limit)
+        scalar_seconds = time_scalar(matrix[:sample]) * (n / sample)
+        batch_seconds = time_batch(matrix)
+
+        marker = '*' if sample < n else ' '
+        print(
+            f"{n:>12,} {scalar_seconds:>13.4f}{marker} {batch_seconds:>12.5f} "
+            f"{scalar_seconds / batch_seconds:>9.0f}x {n / batch_seconds:>14,.0f}"
+        )
+
+    print("-" * 72)
+    print("* extrapolated from a timed sample of --scalar-limit items")
+
+
+if __name__ == "__main__":
+    main()
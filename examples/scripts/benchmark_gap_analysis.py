@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+"""
+Gap-Analysis Writer Benchmark - EdcellenceTQM
+
+Populates fact_gap_analysis for one cycle on a file-backed SQLite database
+three ways: ranking each department with rank_improvement_priorities and
+inserting its rows (the per-department loop), the bulk writer ranking all
+departments in one numpy pass, and the bulk writer staging raw inputs and
+ranking with RANK() OVER (PARTITION BY department_id ...) in the database.
+
+Usage:
+    python examples/scripts/benchmark_gap_analysis.py --top-n 10 --max-exponent 4
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from edcellence_tqm.core import BulkItems, assess_departments, rank_improvement_priorities
+from edcellence_tqm.database import AssessmentRepository, ConnectionPool
+from edcellence_tqm.database.repository import GAP_COLUMNS
+from edcellence_tqm.utils.synthetic import generate_assessment_columns
+
+
+def best_of(func, repeats: int = 3) -> float:
+    """Return the best wall time of several calls."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def per_department(repository, result, cycle_id, department_ids, top_n):
+    """Baseline: rank and write one department at a time."""
+    sql = (f"INSERT INTO fact_gap_analysis ({', '.join(GAP_COLUMNS)}) "
+           f"VALUES ({', '.join('?' * len(GAP_COLUMNS))})")
+    items = result.items
+    item_ids = items.item_ids.tolist()
+    offsets = items.department_offsets
+    with repository.pool.transaction() as connection:
+        connection.execute("DELETE FROM fact_gap_analysis WHERE assessment_cycle_id = ?",
+                           (cycle_id,))
+        for d, department in enumerate(result.departments.tolist()):
+            rows = range(offsets[d], offsets[d + 1])
+            gaps = {item_ids[row]: float(result.gap_priority[row]) for row in rows}
+            by_item = {item_ids[row]: row for row in rows}
+            ranked = rank_improvement_priorities(gaps)[:top_n]
+            connection.executemany(sql, [
+                (item, department_ids[department], cycle_id,
+                 round(float(result.item_score[by_item[item]]), 2), 100.0,
+                 round(100.0 - float(result.item_score[by_item[item]]), 2),
+                 int(items.point_value[by_item[item]]),
+                 round(float(items.deployment_gap[by_item[item]]), 3), round(gap, 2), rank)
+                for rank, (item, gap) in enumerate(ranked, start=1)
+            ])
+
+
+def main():
+    """Run the gap-analysis benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--top-n', type=int, default=10)
+    parser.add_argument('--min-exponent', type=int, default=2)
+    parser.add_argument('--max-exponent', type=int, default=4)
+    args = parser.parse_args()
+
+    print("=" * 72)
+    print(f"EdcellenceTQM - Gap Analysis Writes, Top {args.top_n} per Department (SQLite)")
+    print("=" * 72)
+    print(f"{'departments':>12} {'per-dept loop (s)':>19} {'numpy rank (s)':>16} "
+          f"{'RANK() OVER (s)':>17}")
+    print("-" * 72)
+
+    for exponent in range(args.min_exponent, args.max_exponent + 1):
+        n = 10 ** exponent
+        result = assess_departments(BulkItems.from_arrays(**generate_assessment_columns(n)))
+        with tempfile.TemporaryDirectory() as directory:
+            pool = ConnectionPool.sqlite(Path(directory) / 'tqm.db', size=1)
+            repository = AssessmentRepository(pool)
+            repository.create_schema()
+            ids = repository.department_ids(result.departments.tolist())
+            cycle = repository.cycle_id('2024-Q1', '2024-01-01')
+
+            loop = best_of(lambda: per_department(repository, result, cycle, ids, args.top_n))
+            numpy_rank = best_of(lambda: repository.save_gap_analysis(
+                result, cycle, ids, top_n=args.top_n))
+            sql_rank = best_of(lambda: repository.save_gap_analysis(
+                result, cycle, ids, top_n=args.top_n, rank_in_database=True))
+            pool.close()
+
+        print(f"{n:>12,} {loop:>19.4f} {numpy_rank:>16.4f} {sql_rank:>17.4f}")
+
+    print("-" * 72)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""
+Latest-Score Lookup Benchmark - EdcellenceTQM
+
+Grows a synthetic quarterly history of organizational scores on a
+file-backed SQLite database and times "latest score per department" two
+ways as cycles accumulate: vw_latest_department_scores, the correlated
+MAX(assessment_date) subquery over fact_organizational_scores, and the
+snapshot view read by AssessmentRepository.latest_scores
+(fact_latest_department_scores, kept current on every write).
+
+Usage:
+    python examples/scripts/benchmark_latest_scores.py --departments 1000 --max-cycles 256
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+
+from edcellence_tqm.database import AssessmentRepository, ConnectionPool
+from edcellence_tqm.database.repository import FACT_TABLES
+
+CORRELATED_SQL = "SELECT * FROM vw_latest_department_scores ORDER BY department_code"
+
+
+def best_of(func, repeats: int = 3) -> float:
+    """Return the best wall time of several calls."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def add_cycle(repository, quarter, department_ids, rng):
+    """Write one quarter of organizational scores and refresh the snapshot."""
+    end = date(2000 + quarter // 4, 3 * (quarter % 4) + 1, 28).isoformat()
+    cycle = repository.cycle_id(f'C{quarter:04d}', end)
+    scores = np.round(rng.uniform(20, 95, len(department_ids)), 2)
+    levels = np.searchsorted([20, 40, 60, 85, 100], scores) + 1
+    rows = zip(department_ids, [cycle] * len(scores), scores.tolist(), levels.tolist(),
+               np.round(rng.uniform(0.3, 0.9, len(scores)), 3).tolist(), [end] * len(scores))
+    keys, columns = FACT_TABLES['fact_organizational_scores']
+    with repository.pool.transaction() as connection:
+        repository.write_rows(connection, 'fact_organizational_scores', keys, columns, rows)
+        repository.refresh_latest_scores(connection, cycle)
+
+
+def main():
+    """Run the latest-score benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--departments', type=int, default=1000)
+    parser.add_argument('--max-cycles', type=int, default=256)
+    args = parser.parse_args()
+
+    print("=" * 72)
+    print(f"EdcellenceTQM - Latest Score per Department, {args.departments:,} Departments")
+    print("=" * 72)
+    print(f"{'cycles':>8} {'history rows':>14} {'correlated (ms)':>17} {'snapshot (ms)':>15}")
+    print("-" * 72)
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as directory:
+        pool = ConnectionPool.sqlite(Path(directory) / 'tqm.db', size=1)
+        repository = AssessmentRepository(pool)
+        repository.create_schema()
+        ids = list(repository.department_ids(
+            [f'D{d:05d}' for d in range(args.departments)]).values())
+
+        quarter, checkpoint = 0, 4
+        while checkpoint <= args.max_cycles:
+            while quarter < checkpoint:
+                add_cycle(repository, quarter, ids, rng)
+                quarter += 1
+            correlated = best_of(lambda: repository.fetch_frame(CORRELATED_SQL))
+            snapshot = best_of(lambda: repository.latest_scores())
+            assert repository.latest_scores()['cycle_code'].eq(f'C{quarter - 1:04d}').all()
+            print(f"{quarter:>8} {quarter * len(ids):>14,} {correlated * 1e3:>17.2f} "
+                  f"{snapshot * 1e3:>15.2f}")
+            checkpoint *= 4
+        pool.close()
+
+    print("-" * 72)
+
+
+if __name__ == "__main__":
+    main()
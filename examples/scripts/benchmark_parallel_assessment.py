@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""
+Parallel Assessment Scaling Benchmark - EdcellenceTQM
+
+Times assess_departments against assess_departments_parallel with 1 to N
+worker processes on a synthetic institution, and checks that every
+parallel run reproduces the serial result exactly.
+
+Usage:
+    python examples/scripts/benchmark_parallel_assessment.py --departments 100000 --max-workers 8
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from edcellence_tqm.core import BulkItems, assess_departments, assess_departments_parallel
+from edcellence_tqm.utils.synthetic import generate_assessment_columns
+
+RESULT_COLUMNS = ('organizational_score', 'category_scores', 'category_item_counts', 'ihi',
+                  'maturity_level', 'item_score', 'gap_priority', 'gap_rank', 'gap_order')
+
+
+def best_of(func, repeats: int = 3):
+    """Return the best wall time of several calls and the last result."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    """Run the scaling benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--departments', type=int, default=100_000)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--chunk-size', type=int, default=None)
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    items = BulkItems.from_arrays(**generate_assessment_columns(args.departments, seed=0))
+
+    print("=" * 72)
+    print(f"EdcellenceTQM - Parallel Assessment ({args.departments:,} departments, "
+          f"{len(items):,} items, {os.cpu_count()} CPUs)")
+    print("=" * 72)
+    print(f"{'workers':>8} {'time (s)':>12} {'speedup':>10} {'identical':>10}")
+    print("-" * 72)
+
+    serial_seconds, serial = best_of(lambda: assess_departments(items), args.repeats)
+    print(f"{'serial':>8} {serial_seconds:>12.3f} {1.0:>10.2f} {'-':>10}")
+
+    for workers in range(1, args.max_workers + 1):
+        seconds, result = best_of(
+            lambda: assess_departments_parallel(
+                items, n_workers=workers, chunk_size=args.chunk_size, min_parallel_items=0
+            ),
+            args.repeats
+        )
+        identical = all(
+            np.array_equal(getattr(serial, name), getattr(result, name), equal_nan=True)
+            for name in RESULT_COLUMNS
+        )
+        print(f"{workers:>8} {seconds:>12.3f} {serial_seconds / seconds:>10.2f} "
+              f"{str(identical):>10}")
+
+    print("-" * 72)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+"""
+SQL Pushdown Benchmark - EdcellenceTQM
+
+Scores one stored assessment cycle (item, category and organizational
+scores) two ways on a file-backed SQLite database: pull the indicator rows
+into Python, run assess_departments and upsert the results back
+(pull-compute-push), or run the pushdown statements inside the database
+(AssessmentRepository.compute_in_database).
+
+Usage:
+    python examples/scripts/benchmark_pushdown.py --max-exponent 4
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from edcellence_tqm.core import BulkItems, assess_departments
+from edcellence_tqm.database import AssessmentRepository, ConnectionPool
+from edcellence_tqm.utils.synthetic import generate_assessment_columns
+
+PULL_SQL = """
+SELECT d.department_code AS department, f.item_id, i.category_name AS category,
+       i.item_type, i.point_value, f.approach_score AS x0, f.deployment_score AS x1,
+       f.learning_score AS x2, f.integration_score AS x3
+FROM fact_assessment_scores f
+JOIN dim_assessment_item i ON i.item_id = f.item_id
+JOIN dim_department d ON d.department_id = f.department_id
+WHERE f.assessment_cycle_id = ?
+UNION ALL
+SELECT d.department_code, f.item_id, i.category_name, i.item_type, i.point_value,
+       f.level_score, f.trend_score, f.comparison_score, f.integration_score
+FROM fact_results_metrics f
+JOIN dim_assessment_item i ON i.item_id = f.item_id
+JOIN dim_department d ON d.department_id = f.department_id
+WHERE f.assessment_cycle_id = ?
+"""
+
+
+def best_of(func, repeats: int = 3) -> float:
+    """Return the best wall time of several calls."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def pull_compute_push(repository, cycle_id, department_ids):
+    """Fetch the cycle's indicators, score them in Python and upsert the results."""
+    frame = repository.fetch_frame(PULL_SQL, (cycle_id, cycle_id))
+    items = BulkItems.from_arrays(
+        frame['department'], frame['item_id'], frame['category'], frame['item_type'],
+        frame[['x0', 'x1', 'x2', 'x3']].to_numpy(dtype=np.float64), frame['point_value'],
+    )
+    result = assess_departments(items)
+    repository.save_assessment(result, cycle_id, '2024-03-31', department_ids)
+    return result
+
+
+def main():
+    """Run the pushdown benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--min-exponent', type=int, default=2)
+    parser.add_argument('--max-exponent', type=int, default=4)
+    args = parser.parse_args()
+
+    print("=" * 72)
+    print("EdcellenceTQM - Pull-Compute-Push vs In-Database Scoring (SQLite)")
+    print("=" * 72)
+    print(f"{'departments':>12} {'items':>10} {'pull-compute-push (s)':>23} "
+          f"{'pushdown (s)':>14} {'speedup':>9}")
+    print("-" * 72)
+
+    for exponent in range(args.min_exponent, args.max_exponent + 1):
+        n = 10 ** exponent
+        items = BulkItems.from_arrays(**generate_assessment_columns(n))
+        with tempfile.TemporaryDirectory() as directory:
+            pool = ConnectionPool.sqlite(Path(directory) / 'tqm.db', size=1)
+            repository = AssessmentRepository(pool)
+            repository.create_schema()
+            ids = repository.department_ids(items.departments.tolist())
+            cycle = repository.cycle_id('2024-Q1', '2024-01-01', '2024-03-31')
+            repository.save_items(items, cycle, '2024-03-31', ids)
+
+            pulled = best_of(lambda: pull_compute_push(repository, cycle, ids))
+            pushed = best_of(lambda: repository.compute_in_database(cycle))
+            pool.close()
+
+        print(f"{n:>12,} {len(items):>10,} {pulled:>23.4f} {pushed:>14.4f} "
+              f"{pulled / pushed:>8.1f}x")
+
+    print("-" * 72)
+
+
+if __name__ == "__main__":
+    main()
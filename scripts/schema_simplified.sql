@@ -115,6 +115,22 @@ CREATE TABLE fact_gap_analysis (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Fact: Latest organizational score per department (snapshot)
+-- One row per department, maintained by the repository layer on every write to
+-- fact_organizational_scores. Rows written by other clients (plain SQL, psql) and
+-- databases created before this table existed need a one-time rebuild:
+-- AssessmentRepository.rebuild_latest_scores()
+CREATE TABLE fact_latest_department_scores (
+    department_id INT PRIMARY KEY,
+    assessment_cycle_id INT NOT NULL,
+
+    organizational_score DECIMAL(5,2),
+    maturity_level INT,
+    ihi_score DECIMAL(4,3),
+
+    assessment_date DATE NOT NULL
+);
+
 -- ============================================================================
 -- DIMENSION TABLES (Reference data)
 -- ============================================================================
@@ -278,6 +294,14 @@ CREATE INDEX idx_assessment_dept_cycle ON fact_assessment_scores(department_id,
 CREATE INDEX idx_assessment_item ON fact_assessment_scores(item_id);
 CREATE INDEX idx_results_dept_cycle ON fact_results_metrics(department_id, assessment_cycle_id);
 CREATE INDEX idx_category_dept_cycle ON fact_category_aggregates(department_id, assessment_cycle_id);
+CREATE INDEX idx_assessment_cycle ON fact_assessment_scores(assessment_cycle_id);
+CREATE INDEX idx_results_cycle ON fact_results_metrics(assessment_cycle_id);
+-- Covers vw_latest_department_scores (MAX(assessment_date) probe and score columns)
+CREATE INDEX idx_org_dept_date ON fact_organizational_scores(department_id, assessment_date, assessment_cycle_id, organizational_score, maturity_level, ihi_score);
+-- Covers every snapshot column read by vw_latest_department_scores_snapshot
+CREATE INDEX idx_latest_covering ON fact_latest_department_scores(department_id, assessment_cycle_id, maturity_level, organizational_score, ihi_score, assessment_date);
+CREATE INDEX idx_latest_maturity ON fact_latest_department_scores(maturity_level, organizational_score);
+CREATE INDEX idx_gap_cycle_dept ON fact_gap_analysis(assessment_cycle_id, department_id, priority_rank);
 
 -- Dimension tables
 CREATE INDEX idx_dept_code ON dim_department(department_code);
@@ -310,6 +334,23 @@ WHERE o.assessment_date = (
     WHERE department_id = o.department_id
 );
 
+-- View: Latest assessment scores by department, from the snapshot table
+-- One primary-key lookup per joined dimension; flat as cycles accumulate
+CREATE VIEW vw_latest_department_scores_snapshot AS
+SELECT
+    d.department_code,
+    d.department_name,
+    l.organizational_score,
+    l.maturity_level,
+    m.label as maturity_label,
+    l.ihi_score,
+    c.cycle_code,
+    l.assessment_date
+FROM fact_latest_department_scores l
+JOIN dim_department d ON l.department_id = d.department_id
+JOIN dim_assessment_cycle c ON l.assessment_cycle_id = c.cycle_id
+JOIN lookup_maturity_levels m ON l.maturity_level = m.level;
+
 -- View: Top improvement priorities
 CREATE VIEW vw_top_priorities AS
 SELECT
@@ -336,6 +377,7 @@ COMMENT ON TABLE fact_results_metrics IS 'LeTCI results metrics with dimensional
 COMMENT ON TABLE fact_category_aggregates IS 'Category-level scores as point-value weighted means (Equation 3)';
 COMMENT ON TABLE fact_organizational_scores IS 'Organizational scores and IHI metrics (Equations 4-5)';
 COMMENT ON TABLE fact_gap_analysis IS 'Gap-based improvement prioritization (Equation 6)';
+COMMENT ON TABLE fact_latest_department_scores IS 'Latest organizational score per department, kept current by the repository layer (rebuild_latest_scores after external writes)';
 
 -- ============================================================================
 -- END OF SIMPLIFIED SCHEMA
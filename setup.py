@@ -3,9 +3,30 @@ Setup script for EdcellenceTQM package.
 
 This setup.py exists for backward compatibility with older tools.
 Modern installations should use pyproject.toml.
+
+It also copies the canonical schema script, scripts/schema_simplified.sql,
+into edcellence_tqm/database/ at build time so installed packages can read
+the lookup tables (see edcellence_tqm.database.schema).
 """
 
+from pathlib import Path
+
 from setuptools import setup
+from setuptools.command.build_py import build_py
+
+SCHEMA_SCRIPT = Path("scripts") / "schema_simplified.sql"
+
+
+class BuildPyWithSchema(build_py):
+    """build_py that also ships scripts/schema_simplified.sql as package data."""
+
+    def run(self):
+        super().run()
+        # Editable installs read the script from the checkout instead
+        if not getattr(self, "editable_mode", False):
+            target = Path(self.build_lib) / "edcellence_tqm" / "database" / SCHEMA_SCRIPT.name
+            self.copy_file(str(SCHEMA_SCRIPT), str(target))
+
 
 if __name__ == "__main__":
-    setup()
+    setup(cmdclass={"build_py": BuildPyWithSchema})
@@ -0,0 +1,81 @@
+"""
+Unit tests for vectorized batch scoring (Equations 1-2 over arrays).
+
+Tests verify:
+- Bit-identical results versus the scalar scoring functions
+- Weight dict and weight vector inputs
+- Shape, range and weight validation
+"""
+
+import pytest
+import numpy as np
+from edcellence_tqm.core import (
+    ADLIIndicators,
+    LeTCIIndicators,
+    compute_adli_score,
+    compute_letci_score,
+    compute_adli_scores_batch,
+    compute_letci_scores_batch,
+)
+
+
+@pytest.fixture
+def random_indicators():
+    """Random (N, 4) indicator matrix in [0,1]."""
+    rng = np.random.default_rng(42)
+    return rng.random((500, 4))
+
+
+class TestBatchADLI:
+    """Test vectorized ADLI scoring."""
+
+    def test_matches_scalar_exactly(self, random_indicators):
+        """Every batch score should equal the scalar score bit-for-bit."""
+        batch = compute_adli_scores_batch(random_indicators)
+        scalar = [compute_adli_score(ADLIIndicators(*row)) for row in random_indicators.tolist()]
+        assert batch.tolist() == scalar
+
+    def test_custom_weights_dict_and_vector(self, random_indicators):
+        """Weight dicts and vectors in canonical order give the same scores."""
+        weights = {'A': 0.25, 'D': 0.35, 'L': 0.15, 'I': 0.25}
+        by_dict = compute_adli_scores_batch(random_indicators, weights)
+        by_vector = compute_adli_scores_batch(random_indicators, [0.25, 0.35, 0.15, 0.25])
+        scalar = [
+            compute_adli_score(ADLIIndicators(*row), weights)
+            for row in random_indicators.tolist()
+        ]
+        assert by_dict.tolist() == scalar
+        assert by_vector.tolist() == scalar
+
+    def test_weight_validation(self, random_indicators):
+        """Weights not summing to 1.0 should raise ValueError."""
+        with pytest.raises(ValueError, match="sum to 1.0"):
+            compute_adli_scores_batch(random_indicators, [0.3, 0.3, 0.3, 0.3])
+
+    def test_invalid_range_raises_error(self):
+        """Out-of-range or NaN indicators should raise ValueError."""
+        with pytest.raises(ValueError, match="must be in range"):
+            compute_adli_scores_batch([[0.5, 1.5, 0.5, 0.5]])
+        with pytest.raises(ValueError, match="must be in range"):
+            compute_adli_scores_batch([[0.5, np.nan, 0.5, 0.5]])
+
+    def test_shape_validation(self):
+        """Inputs that are not (N, 4) should raise ValueError."""
+        with pytest.raises(ValueError, match="shape"):
+            compute_adli_scores_batch(np.zeros((3, 3)))
+
+
+class TestBatchLeTCI:
+    """Test vectorized LeTCI scoring."""
+
+    def test_matches_scalar_exactly(self, random_indicators):
+        """Every batch score should equal the scalar score bit-for-bit."""
+        batch = compute_letci_scores_batch(random_indicators)
+        scalar = [
+            compute_letci_score(LeTCIIndicators(*row)) for row in random_indicators.tolist()
+        ]
+        assert batch.tolist() == scalar
+
+    def test_empty_input(self):
+        """An empty (0, 4) input should return an empty array."""
+        assert compute_letci_scores_batch(np.empty((0, 4))).shape == (0,)
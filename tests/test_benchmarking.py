@@ -0,0 +1,123 @@
+"""
+Unit tests for peer benchmark comparison.
+
+Tests verify:
+- Exact mid-rank percentiles within peer groups, ties and NaN handling
+- Quantile sketch accuracy and merging across shards
+- derive_comparison peer groups, lower-is-better metrics and sketch mode
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from edcellence_tqm.core import PeerSketches, QuantileSketch, derive_comparison
+from edcellence_tqm.core.benchmarking import build_peer_sketches, peer_percentiles
+from edcellence_tqm.core.cube import UNASSIGNED
+
+
+def reference_percentiles(population, values):
+    ordered = np.sort(population)
+    below = np.searchsorted(ordered, values, 'left')
+    equal = np.searchsorted(ordered, values, 'right') - below
+    return (below + 0.5 * equal) / len(ordered)
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({
+        'department': ['A', 'B', 'C', 'D', 'A', 'B', 'C', 'D', 'A'],
+        'department_type': ['Academic', 'Academic', 'Academic', 'Support'] * 2 + ['Academic'],
+        'item_id': ['7.1'] * 4 + ['7.2'] * 4 + ['1.1'],
+        'assessment_date': ['2024-02-01'] * 9,
+        'metric_value': [80.0, 60.0, 70.0, 90.0, 5.0, 3.0, 4.0, 4.0, np.nan],
+        'comparison': [np.nan] * 8 + [0.4],
+    })
+
+
+class TestPeerPercentiles:
+    """Test exact vectorized ranking."""
+
+    def test_matches_reference(self):
+        """Every group ranks like a per-group sort."""
+        rng = np.random.default_rng(3)
+        values = rng.integers(0, 50, size=2000).astype(float)
+        values[::17] = np.nan
+        groups = rng.integers(0, 7, size=2000)
+        result = peer_percentiles(values, groups)
+        for g in range(7):
+            rows = np.flatnonzero((groups == g) & ~np.isnan(values))
+            np.testing.assert_allclose(result[rows],
+                                       reference_percentiles(values[rows], values[rows]))
+        assert np.isnan(result[::17]).all()
+
+    def test_ties_and_singletons(self):
+        """Ties share a mid-rank; a department without peers scores 0.5."""
+        result = peer_percentiles([10.0, 30.0, 20.0, 30.0, 5.0], [0, 0, 0, 0, 1])
+        assert result.tolist() == [0.125, 0.75, 0.375, 0.75, 0.5]
+
+
+class TestQuantileSketch:
+    """Test mergeable sketches."""
+
+    def test_accuracy_and_size(self):
+        """Rank error stays near 1/k while memory stays O(k)."""
+        values = np.random.default_rng(0).normal(size=200_000)
+        sketch = QuantileSketch(k=200).update(values)
+        probes = values[::997]
+        error = np.abs(sketch.percentile(probes) - reference_percentiles(values, probes))
+        assert len(sketch) == 200_000 and sketch.size < 1000
+        assert error.max() < 0.02
+        assert sketch.quantile(0.5) == pytest.approx(0.0, abs=0.05)
+
+    def test_merge_shards(self):
+        """Merged shard sketches match a single sketch's accuracy."""
+        rng = np.random.default_rng(1)
+        shards = [rng.uniform(0, 100, size=30_000) for _ in range(5)]
+        merged = QuantileSketch(k=200)
+        for shard in shards:
+            merged.merge(QuantileSketch(k=200).update(shard))
+        population = np.concatenate(shards)
+        probes = np.linspace(1, 99, 50)
+        assert merged.n == 150_000
+        np.testing.assert_allclose(merged.percentile(probes),
+                                   reference_percentiles(population, probes), atol=0.02)
+        with pytest.raises(ValueError, match="different k|k=200 and k=100"):
+            merged.merge(QuantileSketch(k=100))
+
+
+class TestDeriveComparison:
+    """Test frame derivation."""
+
+    def test_institution_and_peer_groups(self, frame):
+        """Percentiles are taken per metric within the chosen peer group."""
+        result = derive_comparison(frame)
+        assert result['comparison'].tolist()[:4] == [0.625, 0.125, 0.375, 0.875]
+        by_type = derive_comparison(frame, peer_by='department_type')
+        assert by_type['comparison'].tolist()[:4] == [5 / 6, 1 / 6, 0.5, 0.5]
+        assert by_type['comparison'].tolist()[8] == 0.4
+
+    def test_missing_peer_labels(self, frame):
+        """Rows without a peer label are ranked together in the UNASSIGNED group."""
+        frame['department_type'] = frame['department'].map({'A': 'Academic', 'C': 'Academic',
+                                                            'B': None, 'D': np.nan})
+        expected = [0.75, 0.25, 0.25, 0.75] * 2
+        for method in ('exact', 'sketch'):
+            result = derive_comparison(frame, peer_by='department_type', method=method)
+            assert result['comparison'].tolist()[:8] == expected
+        population = build_peer_sketches(frame, peer_by='department_type')
+        assert ('2024-02-01', '7.1', UNASSIGNED) in population
+
+    def test_lower_is_better(self, frame):
+        """Lower-is-better metrics rank the smallest value highest."""
+        result = derive_comparison(frame, lower_is_better={'7.2'})
+        assert result['comparison'].tolist()[4:8] == [0.125, 0.875, 0.5, 0.5]
+
+    def test_sketch_population(self, frame):
+        """Sketch mode ranks against merged population sketches."""
+        other = frame.assign(metric_value=frame['metric_value'] + 100)
+        population = build_peer_sketches(frame).merge(build_peer_sketches(other))
+        assert isinstance(population, PeerSketches) and len(population) == 2
+        result = derive_comparison(frame, method='sketch', population=population)
+        assert result['comparison'].tolist()[:4] == [0.3125, 0.0625, 0.1875, 0.4375]
+        with pytest.raises(ValueError, match="method"):
+            derive_comparison(frame, method='tdigest')
@@ -0,0 +1,150 @@
+"""
+Unit tests for multi-department bulk assessment (Equations 1-6).
+
+Tests verify:
+- Parity with AssessmentEngine.compute_organizational_assessment
+- Loading the long-format sample CSV
+- Per-department gap ranking and validation errors
+"""
+
+from pathlib import Path
+
+import pytest
+import numpy as np
+from edcellence_tqm.core import ADLIIndicators, LeTCIIndicators, AssessmentEngine
+from edcellence_tqm.core.bulk import BulkItems, assess_departments, gap_priorities
+from edcellence_tqm.core.validation import validate_arrays
+from edcellence_tqm.utils.synthetic import generate_assessment_columns
+
+SAMPLE_CSV = Path(__file__).parent.parent / 'data' / 'examples' / 'sample_assessment_data.csv'
+
+
+def engine_assessment(items: BulkItems, department: str):
+    """Run the per-organization engine on one department of a BulkItems table."""
+    offsets = items.department_offsets
+    d = list(items.departments).index(department)
+    process_items, results_items = [], []
+    for row in range(offsets[d], offsets[d + 1]):
+        item = {
+            'item_id': str(items.item_names[items.item_code[row]]),
+            'category': items.categories[items.category[row]],
+            'point_value': int(items.point_value[row]),
+            'deployment_gap': float(items.deployment_gap[row]),
+        }
+        values = items.indicators[row].tolist()
+        if items.item_type[row] == 0:
+            process_items.append(dict(item, adli=ADLIIndicators(*values)))
+        else:
+            results_items.append(dict(item, letci=LeTCIIndicators(*values)))
+    return AssessmentEngine().compute_organizational_assessment(process_items, results_items, {})
+
+
+class TestBulkItems:
+    """Test construction of the columnar input table."""
+
+    def test_load_sample_csv(self):
+        """The sample CSV should load as 3 departments x 16 items."""
+        items = BulkItems.from_csv(SAMPLE_CSV)
+        assert len(items) == 48
+        assert items.departments.tolist() == ['Computer Science', 'Business Admin', 'Engineering']
+        assert items.department_offsets.tolist() == [0, 16, 32, 48]
+        assert np.count_nonzero(items.item_type == 1) == 12
+
+    def test_rows_grouped_by_department(self):
+        """Interleaved input rows should be regrouped by department."""
+        items = BulkItems.from_arrays(
+            department=['B', 'A', 'B', 'A'],
+            item_id=['1.1', '1.1', '7.1', '7.1'],
+            category=['Leadership', 'Leadership', 'Results', 'Results'],
+            item_type=['Process', 'Process', 'Results', 'Results'],
+            indicators=np.full((4, 4), 0.5),
+            point_value=[70, 70, 120, 120],
+        )
+        assert items.departments.tolist() == ['B', 'A']
+        assert items.department.tolist() == [0, 0, 1, 1]
+        assert items.source_row.tolist() == [0, 2, 1, 3]
+
+    def test_invalid_item_type(self):
+        """Unknown item types should raise ValueError."""
+        with pytest.raises(ValueError, match="item_type"):
+            BulkItems.from_arrays(['A'], ['1.1'], ['Leadership'], ['Enabler'],
+                                  [[0.5] * 4], [70])
+
+    def test_item_type_labels_normalized(self):
+        """Labels match case- and whitespace-insensitively, as in validation."""
+        labels = ['process', ' RESULTS ', 'Process', 'results']
+        items = BulkItems.from_arrays(['A'] * 4, ['1.1', '7.1', '1.2', '7.2'],
+                                      ['Leadership', 'Results', 'Leadership', 'Results'],
+                                      labels, np.full((4, 4), 0.5), [70, 120, 50, 50])
+        assert items.item_type.tolist() == [0, 1, 0, 1]
+        assert validate_arrays(labels, np.full((4, 4), 0.5), [70, 120, 50, 50]).ok
+
+
+class TestAssessDepartments:
+    """Test the bulk Equations 1-6 pipeline."""
+
+    @pytest.fixture
+    def items(self):
+        return BulkItems.from_arrays(**generate_assessment_columns(25, seed=4))
+
+    def test_matches_engine(self, items):
+        """Every department should match the per-organization engine."""
+        result = assess_departments(items)
+        for department in items.departments[:10]:
+            expected = engine_assessment(items, department)
+            actual = result.department_result(department)
+            assert actual['organizational_score'] == expected['organizational_score']
+            assert actual['category_scores'] == expected['category_scores']
+            assert np.isclose(actual['ihi'], expected['ihi'], rtol=0, atol=1e-12)
+            assert actual['gap_priorities'] == expected['gap_priorities']
+            assert actual['maturity_level']['level'] == expected['maturity_level']['level']
+
+    def test_gap_ranks_within_department(self, items):
+        """Gap ranks should run 1..n within each department, highest gap first."""
+        result = assess_departments(items)
+        offsets = items.department_offsets
+        for d in range(items.n_departments):
+            rows = slice(offsets[d], offsets[d + 1])
+            ranks = result.gap_rank[rows]
+            assert sorted(ranks.tolist()) == list(range(1, 17))
+            ordered = result.gap_priority[rows][np.argsort(ranks)]
+            assert np.all(np.diff(ordered) <= 0)
+
+    def test_gap_priorities_target(self, items):
+        """gap_priorities reproduces the pipeline and honours other targets."""
+        result = assess_departments(items, target_score=90.0)
+        priority, rank, order = gap_priorities(items, result.item_score, 90.0)
+        np.testing.assert_array_equal(priority, result.gap_priority)
+        np.testing.assert_array_equal(rank, result.gap_rank)
+        np.testing.assert_array_equal(order, result.gap_order)
+        expected = (90.0 - result.item_score) * items.point_value * items.deployment_gap
+        np.testing.assert_array_equal(priority, np.maximum(expected, 0))
+
+    def test_sample_csv_departments(self):
+        """The sample CSV should yield one result row per department."""
+        result = AssessmentEngine().assess_departments(BulkItems.from_csv(SAMPLE_CSV))
+        frame = result.to_frame()
+        assert len(frame) == 3
+        assert frame['organizational_score'].between(0, 100).all()
+        assert frame['ihi'].between(0, 1).all()
+
+    def test_missing_category_raises(self, items):
+        """A department without a weighted category should raise ValueError."""
+        keep = ~((items.department == 0) & (items.category == 0))
+        partial = BulkItems.from_arrays(
+            department=items.departments[items.department[keep]],
+            item_id=items.item_ids[keep],
+            category=np.array(items.categories)[items.category[keep]],
+            item_type=items.item_type[keep],
+            indicators=items.indicators[keep],
+            point_value=items.point_value[keep],
+        )
+        with pytest.raises(ValueError, match="Missing score for category: Leadership"):
+            assess_departments(partial)
+
+    def test_ten_thousand_departments(self):
+        """10,000 departments should be assessed in a single call."""
+        items = BulkItems.from_arrays(**generate_assessment_columns(10_000))
+        result = assess_departments(items)
+        assert result.organizational_score.shape == (10_000,)
+        assert np.all((result.maturity_level >= 1) & (result.maturity_level <= 5))
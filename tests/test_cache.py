@@ -0,0 +1,172 @@
+"""
+Unit tests for the assessment result cache.
+
+Tests verify:
+- Cached results equal uncached results and hits return copies
+- Any change to items, weights or bands produces a new key
+- LRU eviction by entry count and by bytes, with counters
+- The SQLite backend survives a restart
+"""
+
+import pickle
+
+import pytest
+import numpy as np
+from edcellence_tqm.core import (
+    ADLIIndicators,
+    AssessmentCache,
+    AssessmentEngine,
+    LeTCIIndicators,
+    MaturityBands,
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+)
+
+
+class _Payload:
+    """Pickles to a call that creates a file when loaded."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def __reduce__(self):
+        return (open, (self.path, 'w'))
+
+
+CATEGORIES = ['Leadership', 'Strategy', 'Customers', 'Measurement', 'Workforce', 'Operations']
+
+
+def department_inputs(seed: int = 0):
+    rng = np.random.default_rng(seed)
+    process = [
+        {'item_id': f'{k + 1}.1', 'category': name,
+         'adli': ADLIIndicators(*rng.uniform(0.4, 0.9, 4).tolist()),
+         'point_value': 50, 'deployment_gap': float(rng.uniform(0, 0.5))}
+        for k, name in enumerate(CATEGORIES)
+    ]
+    results = [
+        {'item_id': '7.1', 'category': 'Results',
+         'letci': LeTCIIndicators(*rng.uniform(0.4, 0.9, 4).tolist()), 'point_value': 120}
+    ]
+    allocations = {name: [50] for name in CATEGORIES}
+    allocations['Results'] = [120]
+    return process, results, allocations
+
+
+class TestAssessmentCache:
+    """Test caching through AssessmentEngine."""
+
+    def test_hit_returns_equal_copy(self):
+        """Repeated calls hit the cache and match the uncached result."""
+        inputs = department_inputs()
+        cache = AssessmentCache()
+        engine = AssessmentEngine(cache=cache)
+
+        first = engine.compute_organizational_assessment(*inputs)
+        first['category_scores']['Leadership'] = -1.0
+        second = engine.compute_organizational_assessment(*inputs)
+
+        assert second == AssessmentEngine().compute_organizational_assessment(*inputs)
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+        assert cache.stats.hit_rate == 0.5
+
+    def test_changes_invalidate(self):
+        """Changed indicators, gaps, weights or bands miss; equal numbers hit."""
+        process, results, allocations = department_inputs()
+        cache = AssessmentCache()
+        engine = AssessmentEngine(cache=cache)
+        engine.compute_organizational_assessment(process, results, allocations)
+
+        as_numpy = [dict(item, point_value=np.int64(50)) for item in process]
+        engine.compute_organizational_assessment(as_numpy, results, allocations)
+        assert cache.stats.hits == 1
+
+        changed = [dict(item) for item in process]
+        changed[2]['adli'] = ADLIIndicators(0.5, 0.5, 0.5, 0.5)
+        engine.compute_organizational_assessment(changed, results, allocations)
+        changed[2]['deployment_gap'] = 0.9
+        engine.compute_organizational_assessment(changed, results, allocations)
+
+        engine.adli_weights = engine.adli_weights.from_dict(
+            'adli', {'A': 0.4, 'D': 0.3, 'L': 0.2, 'I': 0.1})
+        engine.compute_organizational_assessment(process, results, allocations)
+        engine.maturity_bands = MaturityBands([1, 2], [50.0, 100.0])
+        result = engine.compute_organizational_assessment(process, results, allocations)
+
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 5
+        assert result == AssessmentEngine(
+            adli_weights={'A': 0.4, 'D': 0.3, 'L': 0.2, 'I': 0.1},
+            maturity_bands=MaturityBands([1, 2], [50.0, 100.0])
+        ).compute_organizational_assessment(process, results, allocations)
+
+    def test_lru_eviction_by_entries(self):
+        """The least recently used entry is evicted first."""
+        cache = AssessmentCache(MemoryCacheBackend(max_entries=2))
+        engine = AssessmentEngine(cache=cache)
+        a, b, c = (department_inputs(seed) for seed in range(3))
+
+        engine.compute_organizational_assessment(*a)
+        engine.compute_organizational_assessment(*b)
+        engine.compute_organizational_assessment(*a)   # a is now most recent
+        engine.compute_organizational_assessment(*c)   # evicts b
+        engine.compute_organizational_assessment(*a)
+        assert (cache.stats.hits, cache.stats.misses, cache.stats.evictions) == (2, 3, 1)
+        engine.compute_organizational_assessment(*b)
+        assert cache.stats.misses == 4
+        assert len(cache) == 2
+
+    def test_eviction_by_bytes(self):
+        """max_bytes bounds the total stored size."""
+        backend = MemoryCacheBackend(max_entries=None, max_bytes=3000)
+        cache = AssessmentCache(backend)
+        engine = AssessmentEngine(cache=cache)
+        for seed in range(6):
+            engine.compute_organizational_assessment(*department_inputs(seed))
+        assert backend.nbytes <= 3000
+        assert cache.stats.evictions == 6 - len(backend)
+
+    def test_sqlite_survives_restart(self, tmp_path):
+        """Entries written by one backend instance are hits for the next."""
+        path = tmp_path / 'cache.db'
+        inputs = department_inputs()
+        backend = SQLiteCacheBackend(path)
+        expected = AssessmentEngine(cache=AssessmentCache(backend)) \
+            .compute_organizational_assessment(*inputs)
+        backend.close()
+
+        cache = AssessmentCache(SQLiteCacheBackend(path))
+        assert AssessmentEngine(cache=cache).compute_organizational_assessment(*inputs) == expected
+        assert (cache.stats.hits, cache.stats.misses) == (1, 0)
+
+    def test_tampered_entry_is_not_executed(self, tmp_path):
+        """Entries that reference classes or functions are refused on load."""
+        marker = tmp_path / 'pwned'
+        backend = SQLiteCacheBackend(tmp_path / 'cache.db')
+        backend.set('key', pickle.dumps(_Payload(str(marker))))
+        cache = AssessmentCache(backend)
+        with pytest.raises(pickle.UnpicklingError, match="plain data"):
+            cache.get_or_compute('key', dict)
+        assert not marker.exists()
+
+        backend.set('key', pickle.dumps({'scores': [(1.5, 'a')], 'n': 3, 'ok': None}))
+        assert cache.get_or_compute('key', dict) == {'scores': [(1.5, 'a')], 'n': 3, 'ok': None}
+
+    def test_sqlite_lru_eviction(self, tmp_path):
+        """The SQLite backend evicts least recently used rows."""
+        backend = SQLiteCacheBackend(tmp_path / 'cache.db', max_entries=2)
+        assert backend.set('a', b'1') == 0
+        assert backend.set('b', b'22') == 0
+        assert backend.get('a') == b'1'
+        assert backend.set('c', b'333') == 1
+        assert 'b' not in backend and 'a' in backend and 'c' in backend
+        assert backend.nbytes == 4
+        backend.clear()
+        assert len(backend) == 0
+
+    def test_invalid_limits(self, tmp_path):
+        """Non-positive limits raise ValueError."""
+        with pytest.raises(ValueError, match="max_entries must be positive"):
+            MemoryCacheBackend(max_entries=0)
+        with pytest.raises(ValueError, match="max_bytes must be positive"):
+            SQLiteCacheBackend(tmp_path / 'cache.db', max_bytes=0)
@@ -0,0 +1,150 @@
+"""
+Unit tests for the score cube.
+
+Tests verify:
+- Base cells reproduce assess_departments category scores
+- Slice, dice and roll-up queries match direct item aggregation
+- Faculty roll-ups and grouped output axes
+- Incremental cycles, building from a PanelStore and .npy persistence
+"""
+
+from datetime import date
+
+import pytest
+import numpy as np
+import pandas as pd
+from edcellence_tqm.core import BulkItems, PanelStore, ScoreCube, assess_departments
+from edcellence_tqm.utils.synthetic import generate_assessment_columns
+
+FACULTY_OF = {f'D{d:05d}': ('Engineering' if d < 3 else 'Science') for d in range(5)}
+
+
+def make_cycle(seed):
+    return BulkItems.from_arrays(**generate_assessment_columns(6, seed=seed))
+
+
+def item_frame(cycles):
+    """Direct item-level frame for reference aggregation."""
+    frames = []
+    for cycle, items in cycles.items():
+        result = assess_departments(items)
+        frames.append(pd.DataFrame({
+            'cycle': cycle,
+            'department': items.departments[items.department],
+            'faculty': [FACULTY_OF.get(d, 'Unassigned')
+                        for d in items.departments[items.department]],
+            'category': np.asarray(items.categories, dtype=object)[items.category],
+            'item_type': np.where(items.item_type == 0, 'Process', 'Results'),
+            'points': items.point_value,
+            'score': result.item_score,
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+@pytest.fixture(scope='module')
+def cycles():
+    return {quarter: make_cycle(quarter) for quarter in range(1, 7)}
+
+
+@pytest.fixture(scope='module')
+def cube(cycles):
+    cube = ScoreCube(FACULTY_OF)
+    for cycle, items in cycles.items():
+        cube.add_cycle(cycle, items)
+    return cube
+
+
+class TestCells:
+    """Test cell contents."""
+
+    def test_category_scores(self, cube, cycles):
+        """A (cycle, department, category) weighted mean is the category score."""
+        result = assess_departments(cycles[4])
+        by = cube.query('weighted_mean', cycles=[4], by=['department', 'category'],
+                        categories=list(result.categories))
+        order = [cube.departments.index(d) for d in result.departments.tolist()]
+        np.testing.assert_array_equal(by[order], result.category_scores)
+
+    def test_shape_and_faculties(self, cube):
+        """Unmapped departments roll up to Unassigned."""
+        assert cube.shape == (6, 6, 7, 2)
+        assert cube.faculties == ['Engineering', 'Science', 'Unassigned']
+
+
+class TestQueries:
+    """Test slice, dice and roll-up queries."""
+
+    def test_slice_matches_items(self, cube, cycles):
+        """Workforce, Engineering, last four quarters."""
+        frame = item_frame(cycles)
+        rows = frame[(frame['faculty'] == 'Engineering') & (frame['category'] == 'Workforce')
+                     & frame['cycle'].isin([3, 4, 5, 6])]
+        expected = rows.groupby('cycle').apply(
+            lambda g: np.dot(g['points'], g['score']) / g['points'].sum())
+        got = cube.query('weighted_mean', cycles=cube.cycles[-4:], faculties=['Engineering'],
+                         categories=['Workforce'], by=['cycle'])
+        np.testing.assert_allclose(got, expected.to_numpy(), rtol=1e-12)
+
+    @pytest.mark.parametrize('measure,column,how', [
+        ('count', 'score', 'count'), ('sum', 'score', 'sum'), ('min', 'score', 'min'),
+        ('max', 'score', 'max'), ('mean', 'score', 'mean'), ('points', 'points', 'sum'),
+    ])
+    def test_rollup_measures(self, cube, cycles, measure, column, how):
+        """Grouped measures equal a groupby over the items."""
+        frame = item_frame(cycles)
+        expected = frame.groupby(['item_type', 'faculty'])[column].agg(how).unstack()
+        got = cube.query(measure, by=['item_type', 'faculty'])
+        np.testing.assert_allclose(got, expected[cube.faculties].to_numpy(), rtol=1e-12)
+
+    def test_dice_departments(self, cube, cycles):
+        """Department filters combine with faculty filters."""
+        frame = item_frame(cycles)
+        rows = frame[frame['department'].isin(['D00000', 'D00004']) & (frame['cycle'] == 2)]
+        got = cube.query('mean', cycles=[2], departments=['D00000', 'D00004'],
+                         faculties=['Engineering'])
+        assert got == pytest.approx(rows[rows['department'] == 'D00000']['score'].mean())
+        assert np.isnan(cube.query('min', departments=['D00005'], faculties=['Science']))
+        with pytest.raises(ValueError, match="not both"):
+            cube.query('sum', by=['department', 'faculty'])
+        with pytest.raises(KeyError, match="Unknown category"):
+            cube.query('sum', categories=['Finance'])
+
+
+class TestBuilding:
+    """Test incremental building and persistence."""
+
+    def test_from_panel(self, cube, cycles):
+        """A cube built from a PanelStore equals one built cycle by cycle."""
+        panel = PanelStore()
+        for cycle, items in cycles.items():
+            panel.append_cycle(cycle, items)
+        rebuilt = ScoreCube.from_panel(panel, FACULTY_OF)
+        for measure in ('count', 'weighted', 'max'):
+            np.testing.assert_array_equal(rebuilt.query(measure, by=['cycle', 'faculty']),
+                                          cube.query(measure, by=['cycle', 'faculty']))
+        with pytest.raises(ValueError, match="increasing order"):
+            rebuilt.add_cycle(3, cycles[3])
+
+    def test_save_load(self, cube, tmp_path):
+        """Saved cubes reload with identical cells and faculty roll-ups."""
+        cube.save(tmp_path / 'cube')
+        loaded = ScoreCube.load(tmp_path / 'cube')
+        assert loaded.cycles == cube.cycles and loaded.faculties == cube.faculties
+        np.testing.assert_array_equal(loaded.query('weighted_mean', by=['faculty', 'category']),
+                                      cube.query('weighted_mean', by=['faculty', 'category']))
+        loaded.add_cycle(7, make_cycle(7))
+        assert loaded.shape == (7, 6, 7, 2)
+        frame = loaded.query_frame(('count',), by=['cycle'], cycles=[7])
+        assert frame['count'].tolist() == [96.0]
+
+    def test_save_load_date_labels(self, tmp_path):
+        """Date cycle labels survive a save/load round trip."""
+        cube = ScoreCube(FACULTY_OF)
+        cube.add_cycle(date(2024, 3, 31), make_cycle(1))
+        cube.add_cycle(date(2024, 6, 30), make_cycle(2))
+        cube.save(tmp_path / 'cube')
+        loaded = ScoreCube.load(tmp_path / 'cube')
+        assert loaded.cycles == [date(2024, 3, 31), date(2024, 6, 30)]
+        np.testing.assert_array_equal(
+            loaded.query('count', cycles=[date(2024, 6, 30)], by=['faculty']),
+            cube.query('count', cycles=[date(2024, 6, 30)], by=['faculty']))
@@ -0,0 +1,121 @@
+"""
+Unit tests for fixed-point scoring.
+
+Tests verify:
+- Half-even and half-up integer rounding
+- Item, category and organizational scores match a decimal.Decimal reference
+- Results stay within rounding distance of the float pipeline
+- Basis-point weight and input validation
+"""
+
+from decimal import ROUND_HALF_EVEN, Decimal
+
+import pytest
+import numpy as np
+from edcellence_tqm.core import BulkItems, assess_departments, assess_departments_fixed
+from edcellence_tqm.core.fixed_point import (
+    basis_points,
+    compute_category_score_fixed,
+    compute_item_scores_fixed,
+    compute_organizational_scores_fixed,
+    divide_rounded,
+    to_decimal,
+    to_fixed,
+)
+from edcellence_tqm.core.weights import DEFAULT_ADLI_WEIGHTS, DEFAULT_CATEGORY_WEIGHTS
+from edcellence_tqm.utils.synthetic import generate_assessment_columns
+
+CENT = Decimal('0.01')
+
+
+@pytest.fixture(scope='module')
+def items():
+    columns = generate_assessment_columns(40, seed=8)
+    columns['indicators'] = np.round(columns['indicators'], 3)
+    return BulkItems.from_arrays(**columns)
+
+
+class TestRounding:
+    """Test integer rounding and conversions."""
+
+    def test_divide_rounded(self):
+        """Ties go to even or away from zero; other remainders to nearest."""
+        assert divide_rounded([5, 15, 25, 14, 16], 10).tolist() == [0, 2, 2, 1, 2]
+        assert divide_rounded([5, 15, 25, 14, 16], 10, 'half_up').tolist() == [1, 2, 3, 1, 2]
+        with pytest.raises(ValueError, match="rounding"):
+            divide_rounded([1], 2, 'half_down')
+
+    def test_conversions(self):
+        """Floats map to scaled integers and back to exact decimals."""
+        fixed = to_fixed([0.0, 0.125, 0.7, 1.0])
+        assert fixed.dtype == np.uint16 and fixed.tolist() == [0, 125, 700, 1000]
+        assert to_decimal([7315, 5]).tolist() == [Decimal('73.15'), Decimal('0.05')]
+        with pytest.raises(ValueError, match="cannot be stored"):
+            to_fixed([0.5, np.nan])
+        with pytest.raises(ValueError, match="cannot be stored"):
+            to_fixed([-0.1])
+
+    def test_basis_points(self):
+        """Weights become exact basis points; finer weights are rejected."""
+        assert basis_points(None, 'adli').tolist() == [3000, 3000, 2000, 2000]
+        assert basis_points(None, 'category').sum() == 10_000
+        with pytest.raises(ValueError, match="whole number of basis points"):
+            basis_points({'A': 0.30005, 'D': 0.29995, 'L': 0.2, 'I': 0.2}, 'adli')
+
+
+class TestFixedPointScores:
+    """Test Equations 1-4 against a Decimal reference."""
+
+    def test_item_scores_match_decimal(self):
+        """Equation 1 equals Decimal arithmetic with ROUND_HALF_EVEN."""
+        rng = np.random.default_rng(0)
+        fixed = rng.integers(0, 1001, size=(2000, 4)).astype(np.uint16)
+        scores = compute_item_scores_fixed(fixed)
+        weights = [Decimal(str(DEFAULT_ADLI_WEIGHTS[d])) for d in ('A', 'D', 'L', 'I')]
+        for row, score in zip(fixed.tolist(), scores.tolist()):
+            exact = 100 * sum(w * Decimal(x).scaleb(-3) for w, x in zip(weights, row))
+            assert Decimal(score).scaleb(-2) == exact.quantize(CENT, ROUND_HALF_EVEN)
+
+    def test_category_and_organizational(self):
+        """Equations 3-4 round the exact weighted means once."""
+        assert compute_category_score_fixed([7315, 6000], [70, 30]) == 6920  # 69.205 → 69.20
+        assert compute_category_score_fixed([7315, 6000], [70, 30], 'half_up') == 6921
+        assert compute_category_score_fixed([], []) == 0
+        scores = np.array([[5000] * 7, [10000] * 7])
+        assert compute_organizational_scores_fixed(scores).tolist() == [5000, 10000]
+
+    def test_bulk_matches_decimal_reference(self, items):
+        """Per-department results equal a Decimal recomputation and track the float path."""
+        fixed = assess_departments_fixed(items)
+        floats = assess_departments(items)
+        assert fixed.item_score.dtype == np.uint16
+        np.testing.assert_allclose(fixed.organizational_score / 100,
+                                   floats.organizational_score, atol=0.02)
+
+        weights = {k: Decimal(str(v)) for k, v in DEFAULT_CATEGORY_WEIGHTS.items()}
+        for d in range(len(items.departments)):
+            rows = items.department == d
+            categories = {}
+            for k, name in enumerate(items.categories):
+                in_category = rows & (items.category == k)
+                points = items.point_value[in_category].tolist()
+                total = sum(Decimal(int(s)) * v for s, v in
+                            zip(fixed.item_score[in_category].tolist(), points))
+                categories[name] = (total / sum(points)).quantize(1, ROUND_HALF_EVEN)
+                assert fixed.category_scores[d, k] == categories[name]
+            organizational = sum(weights[n] * categories[n] for n in weights)
+            assert fixed.organizational_score[d] == organizational.quantize(1, ROUND_HALF_EVEN)
+
+        frame = fixed.to_frame(decimal=True)
+        assert frame['organizational_score'][0] == Decimal(int(fixed.organizational_score[0])) \
+            .scaleb(-2)
+
+    def test_precomputed_indicators(self, items):
+        """Passing uint16 thousandths gives the same result as converting."""
+        indicators = to_fixed(items.indicators)
+        a = assess_departments_fixed(items)
+        b = assess_departments_fixed(items, indicators=indicators)
+        assert np.array_equal(a.organizational_score, b.organizational_score)
+        assert indicators.nbytes * 4 == items.indicators.nbytes
+        with pytest.raises(ValueError, match="must be integers"):
+            compute_item_scores_fixed(items.indicators)
@@ -0,0 +1,118 @@
+"""
+Unit tests for hierarchical roll-up.
+
+Tests verify:
+- Hierarchy construction from dim_department-style frames
+- Equal, student_count and staff_count weighted means per node
+- Incremental updates touch only the changed department's path and match
+  a full rebuild bit-for-bit
+- Node top-k gap priorities
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from edcellence_tqm.core import BulkItems, Hierarchy, RollupEngine, assess_departments
+from edcellence_tqm.core.ranking import merge_top_k
+from edcellence_tqm.utils.synthetic import generate_assessment_columns
+
+
+@pytest.fixture(scope='module')
+def departments():
+    rng = np.random.default_rng(2)
+    return pd.DataFrame({
+        'department': [f'D{d:05d}' for d in range(12)],
+        'faculty_name': ['Engineering'] * 5 + ['Science'] * 4 + ['Business'] * 2 + [None],
+        'student_count': rng.integers(50, 900, size=12),
+        'staff_count': rng.integers(5, 60, size=12),
+    })
+
+
+@pytest.fixture(scope='module')
+def results():
+    bulk = assess_departments(BulkItems.from_arrays(**generate_assessment_columns(12, seed=6)))
+    return dict(bulk.iter_department_results())
+
+
+def build(departments, results, weighting='equal'):
+    rollup = RollupEngine(Hierarchy.from_frame(departments), weighting=weighting, top_k=5)
+    rollup.set_departments(results.items())
+    return rollup
+
+
+class TestHierarchy:
+    """Test tree construction."""
+
+    def test_from_frame(self, departments):
+        """Faculties group departments; a missing faculty attaches to the root."""
+        hierarchy = Hierarchy.from_frame(departments)
+        assert hierarchy.leaf('D00000') == ('Institution', 'Engineering', 'D00000')
+        assert hierarchy.leaf('D00011') == ('Institution', 'D00011')
+        assert len(hierarchy.children(('Institution',))) == 4
+        assert hierarchy.resolve('Science') == ('Institution', 'Science')
+        with pytest.raises(KeyError, match="Unknown node label"):
+            hierarchy.resolve('Medicine')
+
+    def test_department_cannot_be_group(self):
+        """A department label reused as a grouping node is rejected."""
+        with pytest.raises(ValueError, match="grouping node"):
+            Hierarchy({'Engineering': [], 'Civil': ['Engineering']})
+
+
+class TestRollup:
+    """Test weighted roll-up and incremental maintenance."""
+
+    @pytest.mark.parametrize('weighting', ['equal', 'student_count', 'staff_count'])
+    def test_weighted_means(self, departments, results, weighting):
+        """Each node is the weighted mean of its departments."""
+        rollup = build(departments, results, weighting)
+        members = departments[departments['faculty_name'] == 'Science']['department']
+        w = (np.ones(len(members)) if weighting == 'equal'
+             else departments.set_index('department').loc[members, weighting].to_numpy(float))
+        scores = np.array([results[d]['organizational_score'] for d in members])
+        science = rollup.get('Science')
+        assert science['organizational_score'] == pytest.approx(np.dot(w, scores) / w.sum())
+        assert science['departments'] == 4
+        institution = rollup.get(('Institution',))
+        assert institution['departments'] == 12
+        assert set(institution['category_scores']) == set(results['D00000']['category_scores'])
+
+    def test_incremental_matches_rebuild(self, departments, results):
+        """Updating one department equals rebuilding the whole tree."""
+        rollup = build(departments, results, 'student_count')
+        changed = dict(results)
+        changed['D00002'] = dict(results['D00002'], organizational_score=12.5, ihi=0.05,
+                                 gap_priorities=[('6.1', 99999.0)])
+        touched = []
+        original = rollup._summarize
+        rollup._summarize = lambda node: (touched.append(node), original(node))
+        rollup.set_department('D00002', changed['D00002'])
+        assert touched == [('Institution', 'Engineering', 'D00002'),
+                           ('Institution', 'Engineering'), ('Institution',)]
+        rebuilt = build(departments, changed, 'student_count')
+        for node in rebuilt.hierarchy.nodes:
+            assert rollup.get(node) == rebuilt.get(node)
+        assert rollup.get('Engineering')['gap_priorities'][0] == ('D00002', '6.1', 99999.0)
+
+    def test_remove_department(self, departments, results):
+        """Removing a department restores the sums without it."""
+        rollup = build(departments, results)
+        rollup.remove_department('D00009')
+        assert rollup.get('Business')['departments'] == 1
+        assert rollup.get('Business')['organizational_score'] == \
+            results['D00010']['organizational_score']
+        assert np.isnan(rollup.get('D00009')['organizational_score'])
+        with pytest.raises(KeyError):
+            rollup.remove_department('D00009')
+
+    def test_top_gaps(self, departments, results):
+        """Node priorities are the top-k over the node's departments."""
+        rollup = build(departments, results)
+        expected = merge_top_k({d: results[d]['gap_priorities'] for d in results}, 5)
+        assert rollup.get(('Institution',))['gap_priorities'] == expected
+
+    def test_missing_weight(self, results):
+        """Weighting by an attribute the department lacks is rejected."""
+        rollup = RollupEngine(Hierarchy({'A': ['F']}), weighting='staff_count')
+        with pytest.raises(ValueError, match="no valid staff_count"):
+            rollup.set_department('A', results['D00000'])
@@ -0,0 +1,135 @@
+"""
+Unit tests for incremental AssessmentEngine maintenance.
+
+Tests verify:
+- update_item / remove_item adjust the running totals
+- Scores after any sequence of edits equal a fresh engine bit-for-bit
+- Scores equal a full exact recompute over the item tables
+- Error handling for unknown and ambiguous items
+"""
+
+import math
+
+import pytest
+import numpy as np
+from edcellence_tqm.core import ADLIIndicators, LeTCIIndicators, AssessmentEngine
+
+CATEGORIES = ['Leadership', 'Strategy', 'Customers', 'Measurement', 'Workforce', 'Operations']
+
+
+def full_recompute(engine: AssessmentEngine):
+    """Exact org score, IHI and category scores straight from the item tables."""
+    tables = (engine.process_table, engine.results_table)
+    weighted = np.concatenate([t.weighted_score for t in tables]).tolist()
+    points = np.concatenate([t.point_value for t in tables]).tolist()
+    org = math.fsum(weighted) / sum(points)
+    ihi = 0.5 * (math.fsum(tables[0].indicators[:, 3].tolist()) / len(tables[0]) +
+                 math.fsum(tables[1].indicators[:, 3].tolist()) / len(tables[1]))
+
+    by_category = {}
+    for table in tables:
+        for row in range(len(table)):
+            entry = by_category.setdefault(table.category_name(row), ([], []))
+            entry[0].append(float(table.weighted_score[row]))
+            entry[1].append(int(table.point_value[row]))
+    categories = {name: math.fsum(w) / sum(p) for name, (w, p) in by_category.items()}
+    return org, ihi, categories
+
+
+def random_edits(seed: int, n_edits: int = 400):
+    """Apply random add/update/remove operations; return the engine and final state."""
+    rng = np.random.default_rng(seed)
+    engine = AssessmentEngine()
+    state = {}
+    for _ in range(n_edits):
+        item_id = f"{rng.integers(1, 7)}.{rng.integers(1, 6)}"
+        is_process = item_id[0] != '6'
+        action = rng.random()
+        if item_id in state and action < 0.2:
+            engine.remove_item(item_id)
+            del state[item_id]
+            continue
+        values = rng.random(4).tolist()
+        indicators = ADLIIndicators(*values) if is_process else LeTCIIndicators(*values)
+        points = int(rng.integers(10, 90))
+        category = CATEGORIES[int(item_id[0]) - 1]
+        if item_id in state and action < 0.6:
+            engine.update_item(item_id, indicators=indicators)
+            state[item_id] = (indicators, state[item_id][1], category)
+        elif is_process:
+            engine.add_process_item(item_id, indicators, points, category)
+            state[item_id] = (indicators, points, category)
+        else:
+            engine.add_results_item(item_id, indicators, points, category)
+            state[item_id] = (indicators, points, category)
+    return engine, state
+
+
+class TestIncrementalEngine:
+    """Test running-total maintenance in AssessmentEngine."""
+
+    @pytest.mark.parametrize('seed', [0, 1, 2])
+    def test_matches_fresh_engine_and_recompute(self, seed):
+        """Edited engine equals a freshly built engine and a full recompute."""
+        engine, state = random_edits(seed)
+        fresh = AssessmentEngine()
+        for item_id, (indicators, points, category) in sorted(state.items(), reverse=True):
+            if isinstance(indicators, ADLIIndicators):
+                fresh.add_process_item(item_id, indicators, points, category)
+            else:
+                fresh.add_results_item(item_id, indicators, points, category)
+
+        org, ihi, categories = full_recompute(engine)
+        assert engine.compute_organizational_score() == fresh.compute_organizational_score() == org
+        assert engine.compute_ihi() == fresh.compute_ihi() == ihi
+        assert engine.compute_category_scores() == fresh.compute_category_scores() == categories
+
+    def test_update_keeps_unspecified_fields(self):
+        """update_item changes only the fields passed."""
+        engine = AssessmentEngine()
+        engine.add_process_item('1.1', ADLIIndicators(0.8, 0.7, 0.6, 0.75), 70, 'Leadership', 0.3)
+        engine.update_item('1.1', point_value=50)
+        item = engine.process_items['1.1']
+        assert item['points'] == 50
+        assert item['indicators'] == ADLIIndicators(0.8, 0.7, 0.6, 0.75)
+        assert engine.process_table.deployment_gap.tolist() == [0.3]
+
+        engine.update_item('1.1', category='Strategy')
+        assert list(engine.compute_category_scores()) == ['Strategy']
+
+    def test_remove_restores_previous_scores(self):
+        """Adding then removing an item restores the exact previous scores."""
+        engine, _ = random_edits(5, n_edits=100)
+        before = (engine.compute_organizational_score(), engine.compute_ihi(),
+                  engine.compute_category_scores())
+        engine.add_process_item('9.9', ADLIIndicators(0.1, 0.9, 0.3, 0.7), 33, 'Workforce')
+        engine.remove_item('9.9')
+        after = (engine.compute_organizational_score(), engine.compute_ihi(),
+                 engine.compute_category_scores())
+        assert after == before
+
+    def test_rebuild_totals_after_direct_table_edit(self):
+        """rebuild_totals resynchronizes after writing to a table directly."""
+        engine, _ = random_edits(3, n_edits=100)
+        engine.process_table.remove(engine.process_table.item_id(0))
+        engine.rebuild_totals()
+        org, ihi, categories = full_recompute(engine)
+        assert engine.compute_organizational_score() == org
+        assert engine.compute_ihi() == ihi
+        assert engine.compute_category_scores() == categories
+
+    def test_errors(self):
+        """Unknown IDs raise KeyError; IDs in both tables need item_type."""
+        engine = AssessmentEngine()
+        with pytest.raises(KeyError):
+            engine.remove_item('1.1')
+        with pytest.raises(KeyError):
+            engine.update_item('1.1', point_value=10)
+
+        engine.add_process_item('7.1', ADLIIndicators(0.5, 0.5, 0.5, 0.5), 10)
+        engine.add_results_item('7.1', LeTCIIndicators(0.5, 0.5, 0.5, 0.5), 10)
+        with pytest.raises(ValueError, match="pass item_type"):
+            engine.remove_item('7.1')
+        engine.remove_item('7.1', item_type='Results')
+        with pytest.raises(ValueError, match="Both process and results"):
+            engine.compute_ihi()
@@ -0,0 +1,116 @@
+"""
+Unit tests for compact indicator types.
+
+Tests verify:
+- Frozen types are slotted, immutable, hashable and validated
+- IndicatorArray views read the buffer without copying
+- Views and frozen types interoperate with the scalar scoring API
+- Packing, slicing, dtype and pickling behaviour
+"""
+
+import dataclasses
+import pickle
+
+import pytest
+import numpy as np
+from edcellence_tqm.core import (
+    ADLIIndicators,
+    AssessmentEngine,
+    FrozenADLIIndicators,
+    FrozenLeTCIIndicators,
+    IndicatorArray,
+    LeTCIIndicators,
+    compute_adli_score,
+    compute_letci_score,
+)
+from edcellence_tqm.core.indicators import ADLIView, freeze, indicator_kind
+
+
+class TestFrozenIndicators:
+    """Test the slotted, frozen dataclasses."""
+
+    def test_slotted_frozen_hashable(self):
+        """No __dict__, no assignment, usable as dict keys."""
+        indicators = FrozenADLIIndicators(0.8, 0.7, 0.6, 0.5)
+        assert not hasattr(indicators, '__dict__')
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            indicators.approach = 0.1
+        seen = {indicators: 'a', FrozenADLIIndicators(0.8, 0.7, 0.6, 0.5): 'b'}
+        assert len(seen) == 1
+        assert pickle.loads(pickle.dumps(indicators)) == indicators
+
+    def test_validation_and_scoring(self):
+        """Ranges are checked and scores match the mutable dataclasses."""
+        with pytest.raises(ValueError, match="LeTCI indicators must be in range"):
+            FrozenLeTCIIndicators(0.5, 1.5, 0.5, 0.5)
+        frozen = FrozenLeTCIIndicators(0.9, 0.6, 0.7, 0.4)
+        mutable = LeTCIIndicators(0.9, 0.6, 0.7, 0.4)
+        assert compute_letci_score(frozen) == compute_letci_score(mutable)
+        assert freeze(LeTCIIndicators(0.9, 0.6, 0.7, 0.4)) == frozen
+        assert indicator_kind(frozen) == 'letci'
+        assert indicator_kind(ADLIIndicators(0.1, 0.2, 0.3, 0.4)) == 'adli'
+        assert indicator_kind(object()) is None
+
+
+class TestIndicatorArray:
+    """Test the (N, 4) buffer container and its row views."""
+
+    def test_views_share_buffer(self):
+        """Views read the buffer in place and are read-only."""
+        array = IndicatorArray(np.full((3, 4), 0.5), 'adli')
+        view = array[1]
+        assert isinstance(view, ADLIView) and view.deployment == 0.5
+        array.values[1, 1] = 0.25
+        assert view.deployment == 0.25
+        with pytest.raises(AttributeError):
+            view.deployment = 0.1
+        part = array[1:]
+        assert np.shares_memory(part.values, array.values)
+        assert array.column('deployment').tolist() == [0.5, 0.25, 0.5]
+
+    def test_views_behave_like_dataclasses(self):
+        """Views score, compare and hash like the equivalent objects."""
+        rng = np.random.default_rng(3)
+        for dtype in (np.float64, np.float32):
+            array = IndicatorArray(rng.random((50, 4)), 'adli', dtype=dtype)
+            scores = array.scores({'A': 0.4, 'D': 0.3, 'L': 0.2, 'I': 0.1})
+            for view, score in zip(array, scores):
+                assert compute_adli_score(view, {'A': 0.4, 'D': 0.3, 'L': 0.2, 'I': 0.1}) == score
+            objects = array.to_objects()
+            assert objects[7] == array[7] and array[7] == objects[7]
+            assert array.to_objects(frozen=True)[7] == array[7]
+            assert hash(array[7]) == hash(array[7].freeze())
+            assert array[7] != IndicatorArray(array.values[7:8], 'letci')[0]
+
+    def test_from_objects_and_dtype(self):
+        """Packing round-trips; float32 halves the buffer."""
+        objects = [LeTCIIndicators(0.1 * i, 0.5, 0.25, 1.0) for i in range(10)]
+        array = IndicatorArray.from_objects(objects)
+        assert array.kind == 'letci' and array.nbytes == 10 * 4 * 8
+        assert array.to_objects() == objects
+        small = array.astype(np.float32)
+        assert small.nbytes == array.nbytes // 2
+        restored = pickle.loads(pickle.dumps(small))
+        assert np.array_equal(restored.values, small.values) and restored.dtype == np.float32
+
+        with pytest.raises(ValueError, match="must be LETCI indicators"):
+            IndicatorArray.from_objects(objects + [ADLIIndicators(0.1, 0.2, 0.3, 0.4)])
+        with pytest.raises(ValueError, match="range"):
+            IndicatorArray([[0.1, 0.2, 0.3, 1.4]])
+        with pytest.raises(ValueError, match="dtype"):
+            IndicatorArray([[0.1, 0.2, 0.3, 0.4]], dtype=np.float16)
+
+    def test_engine_accepts_views(self):
+        """Engine methods take views and frozen types in place of dataclasses."""
+        array = IndicatorArray(np.array([[0.8, 0.7, 0.6, 0.5], [0.6, 0.6, 0.6, 0.6]]), 'adli')
+        engine = AssessmentEngine()
+        engine.add_process_item('1.1', array[0], 70, category='Leadership')
+        engine.update_item('1.1', FrozenADLIIndicators(0.6, 0.6, 0.6, 0.6))
+
+        reference = AssessmentEngine()
+        reference.add_process_item('1.1', ADLIIndicators(0.6, 0.6, 0.6, 0.6), 70,
+                                   category='Leadership')
+        assert engine.compute_category_scores() == reference.compute_category_scores()
+        assert engine.process_items['1.1']['indicators'] == array[1]
+        with pytest.raises(TypeError):
+            engine.update_item('1.1', (0.1, 0.2, 0.3, 0.4))
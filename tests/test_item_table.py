@@ -0,0 +1,166 @@
+"""
+Unit tests for the columnar ItemTable and its use in AssessmentEngine.
+
+Tests verify:
+- Insert, in-place update and swap-remove semantics
+- Amortized growth past the initial capacity
+- Aggregations against the legacy dict-based computation
+"""
+
+import pytest
+import numpy as np
+from edcellence_tqm.core import (
+    ADLIIndicators,
+    LeTCIIndicators,
+    AssessmentEngine,
+    compute_adli_score,
+    compute_letci_score,
+    compute_integration_health_index,
+)
+from edcellence_tqm.core.item_table import (
+    ItemRegistry, ItemTable, PROCESS_ITEM, RESULTS_ITEM, NO_CATEGORY
+)
+
+
+class TestItemTable:
+    """Test row operations on the struct-of-arrays table."""
+
+    def test_upsert_and_update_in_place(self):
+        """Re-adding an item ID should overwrite its row, not append."""
+        table = ItemTable()
+        assert table.upsert('1.1', PROCESS_ITEM, (0.8, 0.7, 0.6, 0.5), 70, 70.0) == 0
+        assert table.upsert('1.2', PROCESS_ITEM, (0.5, 0.5, 0.5, 0.5), 50, 50.0) == 1
+        assert table.upsert('1.1', PROCESS_ITEM, (0.9, 0.9, 0.9, 0.9), 70, 90.0) == 0
+        assert len(table) == 2
+        assert table.score.tolist() == [90.0, 50.0]
+        assert table.weighted_score.tolist() == [90.0 * 70, 50.0 * 50]
+
+    def test_remove_moves_last_row(self):
+        """Removing a middle row should move the last row into its slot."""
+        table = ItemTable()
+        for i, item_id in enumerate(['1.1', '1.2', '2.1']):
+            table.upsert(item_id, PROCESS_ITEM, (0.5,) * 4, 10 * (i + 1), float(i), 'Leadership')
+        table.remove('1.1')
+        assert table.item_ids() == ['2.1', '1.2']
+        assert table.row('2.1') == 0
+        assert table.point_value.tolist() == [30, 20]
+        assert '1.1' not in table
+        with pytest.raises(KeyError):
+            table.remove('1.1')
+
+    def test_growth_preserves_rows(self):
+        """Rows should survive reallocation beyond the initial capacity."""
+        table = ItemTable(capacity=2)
+        for i in range(100):
+            table.upsert(f'item{i}', RESULTS_ITEM, (i / 100,) * 4, i + 1, float(i))
+        assert len(table) == 100
+        assert table.score.tolist() == [float(i) for i in range(100)]
+        assert table.indicators[37].tolist() == [0.37] * 4
+
+    def test_index_sized_to_own_codes(self):
+        """A table's code index tracks the codes it holds, not other tables' items."""
+        for i in range(10000):
+            ItemTable().upsert(f'item{i}', RESULTS_ITEM, (0.5,) * 4, 10, 50.0)
+        table = ItemTable()
+        table.upsert('1.1', PROCESS_ITEM, (0.5,) * 4, 10, 50.0)
+        assert table._row_by_code.size == 1 and table._row('item5') == -1
+
+        registry = ItemRegistry()
+        for i in range(10000):
+            registry.code(f'item{i}')
+        shared = ItemTable(registry=registry)
+        assert shared.nbytes == ItemTable().nbytes
+        shared.upsert('1.1', PROCESS_ITEM, (0.5,) * 4, 10, 50.0)
+        assert shared.row('1.1') == 0 and shared._row('item5') == -1
+
+    def test_weighted_mean_of_empty_table(self):
+        """An empty table has mean 0.0; zero total points raise ValueError."""
+        table = ItemTable()
+        assert table.weighted_mean_score() == 0.0
+        table.upsert('1.1', PROCESS_ITEM, (0.5,) * 4, 0, 50.0)
+        with pytest.raises(ValueError, match="point values"):
+            table.weighted_mean_score()
+
+    def test_category_codes(self):
+        """Categories should be interned; missing categories use NO_CATEGORY."""
+        table = ItemTable()
+        table.upsert('1.1', PROCESS_ITEM, (0.5,) * 4, 10, 50.0, 'Leadership')
+        table.upsert('2.1', PROCESS_ITEM, (0.5,) * 4, 10, 50.0, 'Strategy')
+        table.upsert('1.2', PROCESS_ITEM, (0.5,) * 4, 10, 50.0, 'Leadership')
+        table.upsert('9.9', PROCESS_ITEM, (0.5,) * 4, 10, 50.0)
+        assert table.category.tolist() == [0, 1, 0, NO_CATEGORY]
+        assert table.category_names == ['Leadership', 'Strategy']
+
+
+class TestEngineOnItemTable:
+    """Test AssessmentEngine aggregations backed by ItemTable."""
+
+    @pytest.fixture
+    def items(self):
+        rng = np.random.default_rng(7)
+        process = [(f'{c}.{i}', ADLIIndicators(*rng.random(4)), int(rng.integers(20, 90)))
+                   for c in range(1, 7) for i in range(1, 3)]
+        results = [(f'7.{i}', LeTCIIndicators(*rng.random(4)), int(rng.integers(60, 120)))
+                   for i in range(1, 5)]
+        return process, results
+
+    def test_matches_legacy_aggregation(self, items):
+        """Org score and IHI should match the list-based computation."""
+        process, results = items
+        engine = AssessmentEngine()
+        for item_id, ind, points in process:
+            engine.add_process_item(item_id, ind, points)
+        for item_id, ind, points in results:
+            engine.add_results_item(item_id, ind, points)
+
+        scores = ([compute_adli_score(ind) for _, ind, _ in process] +
+                  [compute_letci_score(ind) for _, ind, _ in results])
+        points = [p for _, _, p in process] + [p for _, _, p in results]
+        expected = sum(s * p for s, p in zip(scores, points)) / sum(points)
+        expected_ihi = compute_integration_health_index(
+            [ind.integration for _, ind, _ in process],
+            [ind.integration for _, ind, _ in results]
+        )
+
+        assert np.isclose(engine.compute_organizational_score(), expected, rtol=0, atol=1e-9)
+        assert np.isclose(engine.compute_ihi(), expected_ihi, rtol=0, atol=1e-12)
+
+    def test_legacy_item_views(self, items):
+        """process_items/results_items should expose the dict-of-dicts format."""
+        process, results = items
+        engine = AssessmentEngine()
+        item_id, ind, points = process[0]
+        engine.add_process_item(item_id, ind, points)
+        view = engine.process_items[item_id]
+        assert view['points'] == points
+        assert view['score'] == compute_adli_score(ind)
+        assert view['indicators'] == ind
+        assert engine.results_items == {}
+
+    def test_legacy_item_views_are_read_only(self, items):
+        """Writes to the legacy views raise instead of being silently dropped."""
+        process, _ = items
+        engine = AssessmentEngine()
+        item_id, ind, points = process[0]
+        engine.add_process_item(item_id, ind, points)
+        view = engine.process_items
+        with pytest.raises(TypeError):
+            view['9.9'] = {'score': 50.0, 'points': 10, 'indicators': ind}
+        with pytest.raises(TypeError):
+            del view[item_id]
+        with pytest.raises(TypeError):
+            view[item_id]['points'] = 1
+        assert engine.process_table.point_value.tolist() == [points]
+
+        # Reused until the items change, so indicator identity is kept
+        assert engine.process_items is view
+        assert engine.process_items[item_id]['indicators'] is view[item_id]['indicators']
+        engine.update_item(item_id, point_value=points + 1)
+        assert engine.process_items is not view
+        assert engine.process_items[item_id]['points'] == points + 1
+
+    def test_empty_engine(self):
+        """An engine with no items should report zero scores."""
+        engine = AssessmentEngine()
+        assert engine.compute_organizational_score() == 0.0
+        assert engine.compute_ihi() == 0.0
@@ -0,0 +1,85 @@
+"""
+Unit tests for maturity band classification.
+
+Tests verify:
+- Continuous band semantics (scores between published integer ranges)
+- Vectorized int8 codes equal the scalar classifier
+- Band tables built from lookup_maturity_levels and custom rows
+- Label lookup and validation
+"""
+
+import pytest
+import numpy as np
+from edcellence_tqm.core import (
+    DEFAULT_MATURITY_BANDS,
+    MATURITY_BANDS,
+    MaturityBands,
+    classify_maturity_level,
+)
+
+
+class TestMaturityBands:
+    """Test band-edge classification."""
+
+    @pytest.mark.parametrize('score, level', [
+        (0, 1), (20, 1), (20.5, 2), (21, 2), (40.7, 3), (60, 3), (60.01, 4),
+        (85, 4), (85.4, 5), (100, 5),
+    ])
+    def test_continuous_semantics(self, score, level):
+        """Every score in [0,100] maps to one level by upper edge."""
+        assert classify_maturity_level(score)['level'] == level
+        assert DEFAULT_MATURITY_BANDS.classify([score]).tolist() == [level]
+
+    def test_integer_scores_match_published_ranges(self):
+        """Integer scores land in the published inclusive range."""
+        for score in range(101):
+            result = classify_maturity_level(score)
+            low, high = result['range']
+            assert low <= score <= high
+            assert result['label'] == MATURITY_BANDS[result['level']]['label']
+
+    def test_vectorized_matches_scalar(self):
+        """int8 codes equal the scalar classifier element-wise."""
+        scores = np.random.default_rng(0).random(10_000) * 100
+        codes = DEFAULT_MATURITY_BANDS.classify(scores)
+        assert codes.dtype == np.int8
+        assert codes.tolist() == [classify_maturity_level(s)['level'] for s in scores.tolist()]
+
+    def test_out_of_range_rejected(self):
+        """Scores outside [0,100] and NaN raise ValueError."""
+        for bad in (-0.1, 100.5):
+            with pytest.raises(ValueError, match="outside valid range"):
+                classify_maturity_level(bad)
+        with pytest.raises(ValueError, match="outside valid range"):
+            DEFAULT_MATURITY_BANDS.classify([50.0, np.nan])
+
+
+class TestBandTables:
+    """Test building band tables and looking up labels."""
+
+    def test_schema_table_matches_defaults(self):
+        """lookup_maturity_levels gives the same edges and labels."""
+        bands = MaturityBands.from_schema()
+        assert bands.levels.tolist() == DEFAULT_MATURITY_BANDS.levels.tolist()
+        assert bands.upper_edges.tolist() == DEFAULT_MATURITY_BANDS.upper_edges.tolist()
+        assert bands.labels == DEFAULT_MATURITY_BANDS.labels
+        assert bands.describe(4)['range'] == (61, 85)
+
+    def test_custom_rows(self):
+        """Custom three-band tables classify with their own edges."""
+        bands = MaturityBands.from_rows([
+            {'level': 3, 'label': 'High', 'min_score': 70.5, 'max_score': 100},
+            {'level': 1, 'label': 'Low', 'min_score': 0, 'max_score': 40},
+            {'level': 2, 'label': 'Mid', 'min_score': 40.5, 'max_score': 70},
+        ])
+        codes = bands.classify([10.0, 40.2, 70.0, 70.1])
+        assert codes.tolist() == [1, 2, 2, 3]
+        assert bands.labels_for(codes).tolist() == ['Low', 'Mid', 'Mid', 'High']
+        assert list(bands.categorical(codes)) == ['Low', 'Mid', 'Mid', 'High']
+        assert classify_maturity_level(55.0, bands)['label'] == 'Mid'
+
+        with pytest.raises(ValueError, match="overlaps"):
+            MaturityBands.from_rows([
+                {'level': 1, 'min_score': 0, 'max_score': 50},
+                {'level': 2, 'min_score': 50, 'max_score': 100},
+            ])
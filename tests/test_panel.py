@@ -0,0 +1,144 @@
+"""
+Unit tests for the longitudinal panel store.
+
+Tests verify:
+- Appended cycles match a direct assess_departments run
+- O(1) cell lookup and inclusive time-range selection across chunks
+- Departments joining later read as missing for earlier cycles
+- Cycle order and item set validation
+- .npy/JSON persistence round trip with memory-mapped reload
+"""
+
+from datetime import date, datetime
+
+import pytest
+import numpy as np
+from edcellence_tqm.core import BulkItems, PanelStore, assess_departments
+from edcellence_tqm.core.panel import _from_json, _to_json
+from edcellence_tqm.utils.synthetic import generate_assessment_columns
+
+
+def make_cycle(n_departments, seed):
+    return BulkItems.from_arrays(**generate_assessment_columns(n_departments, seed=seed))
+
+
+@pytest.fixture
+def panel():
+    store = PanelStore(chunk_cycles=3)
+    for month in range(1, 8):
+        store.append_cycle(month, make_cycle(4, seed=month))
+    return store
+
+
+class TestAppend:
+    """Test appending cycles."""
+
+    def test_scores_match_bulk(self, panel):
+        """Each cycle holds the assess_departments results."""
+        items = make_cycle(4, seed=5)
+        result = assess_departments(items)
+        assert panel.shape == (7, 4, 16)
+        np.testing.assert_array_equal(panel.select('organizational_score', 5, 5)[0],
+                                      result.organizational_score)
+        np.testing.assert_array_equal(panel.select('maturity_level', 5, 5)[0],
+                                      result.maturity_level)
+        cell = panel.cell('D00002', 5)
+        assert cell['ihi'] == result.ihi[2]
+        offsets = items.department_offsets
+        np.testing.assert_array_equal(np.sort(cell['item_score']),
+                                      np.sort(result.item_score[offsets[2]:offsets[3]]))
+
+    def test_cycle_order_enforced(self, panel):
+        """Cycles must be appended in increasing order."""
+        with pytest.raises(ValueError, match="increasing order"):
+            panel.append_cycle(7, make_cycle(4, seed=0))
+        assert panel.n_cycles == 7
+
+    def test_unknown_item_rejected(self, panel):
+        """The item set is fixed by the first cycle."""
+        columns = generate_assessment_columns(2, seed=0)
+        columns['item_id'] = columns['item_id'].astype(object)
+        columns['item_id'][0] = 'new-item'
+        with pytest.raises(ValueError, match="not in the panel's item set"):
+            panel.append_cycle(8, BulkItems.from_arrays(**columns))
+        assert panel.n_cycles == 7
+
+    def test_new_department(self, panel):
+        """A department added later is missing for earlier cycles."""
+        panel.append_cycle(8, make_cycle(6, seed=8))
+        scores = panel.select('organizational_score')
+        assert scores.shape == (8, 6)
+        assert np.isnan(scores[:7, 4:]).all() and not np.isnan(scores[7]).any()
+        assert panel.select('maturity_level', 1, 2)[:, 5].tolist() == [0, 0]
+        with pytest.raises(KeyError, match="no data"):
+            panel.cell('D00005', 1)
+
+
+class TestQueries:
+    """Test time-range queries."""
+
+    def test_select_range(self, panel):
+        """Ranges are inclusive and may span chunks."""
+        full = panel.select('organizational_score')
+        np.testing.assert_array_equal(panel.select('organizational_score', 3, 5), full[2:5])
+        assert panel.select('ihi', stop=2).shape == (2, 4)
+        assert panel.select('ihi', 20, 30).shape == (0, 4)
+        assert panel.select('indicators', 2, 4, departments=['D00001']).shape == (3, 1, 16, 4)
+
+    def test_select_within_chunk_is_view(self, panel):
+        """A range inside one chunk does not copy."""
+        block = panel.select('item_score', 4, 6)
+        assert np.shares_memory(block, panel._chunks[1].arrays['item_score'])
+
+    def test_series_and_frame(self, panel):
+        """Department series and long frames agree with select."""
+        cycles, values = panel.series('D00003', start=2, stop=4)
+        assert cycles == [2, 3, 4]
+        np.testing.assert_array_equal(values, panel.select('organizational_score', 2, 4)[:, 3])
+        frame = panel.to_frame()
+        assert len(frame) == 28
+        row = frame[(frame['cycle'] == 6) & (frame['department'] == 'D00000')].iloc[0]
+        assert row['organizational_score'] == panel.cell('D00000', 6)['organizational_score']
+
+
+class TestPersistence:
+    """Test save/load."""
+
+    def test_round_trip(self, panel, tmp_path):
+        """A loaded panel is memory-mapped, identical and still appendable."""
+        panel.save(tmp_path / 'panel')
+        loaded = PanelStore.load(tmp_path / 'panel')
+        assert isinstance(loaded.select('item_score', 1, 2), np.memmap)
+        assert loaded.cycles == panel.cycles
+        for field in ('indicators', 'category_scores', 'maturity_level'):
+            np.testing.assert_array_equal(loaded.select(field), panel.select(field))
+        loaded.append_cycle(8, make_cycle(5, seed=8))
+        assert loaded.shape == (8, 5, 16)
+        np.testing.assert_array_equal(loaded.select('ihi', 1, 7)[:, :4], panel.select('ihi'))
+
+    def test_save_in_place(self, panel, tmp_path):
+        """A memory-mapped panel can be appended to and saved back over its own files."""
+        panel.save(tmp_path / 'panel')
+        loaded = PanelStore.load(tmp_path / 'panel')
+        loaded.save(tmp_path / 'panel')
+        loaded.append_cycle(8, make_cycle(5, seed=8))
+        loaded.save(tmp_path / 'panel')
+        np.testing.assert_array_equal(loaded.select('ihi', 1, 7)[:, :4], panel.select('ihi'))
+
+        reloaded = PanelStore.load(tmp_path / 'panel')
+        assert reloaded.cycles == loaded.cycles and reloaded.shape == (8, 5, 16)
+        for field in ('indicators', 'item_score', 'organizational_score', 'maturity_level'):
+            np.testing.assert_array_equal(reloaded.select(field), loaded.select(field))
+        assert not list((tmp_path / 'panel').glob('*.tmp'))
+
+    def test_date_labels(self, tmp_path):
+        """Date, datetime and tuple cycle or department labels survive a round trip."""
+        store = PanelStore()
+        store.append_cycle(date(2024, 3, 31), make_cycle(2, seed=1))
+        store.append_cycle(date(2024, 6, 30), make_cycle(2, seed=2))
+        store.save(tmp_path / 'panel')
+        loaded = PanelStore.load(tmp_path / 'panel')
+        assert loaded.cycles == [date(2024, 3, 31), date(2024, 6, 30)]
+        assert loaded.cycle_index(date(2024, 6, 30)) == 1
+        assert _from_json(_to_json([datetime(2024, 1, 2, 3, 4), ('D1', date(2024, 1, 1))])) \
+            == [datetime(2024, 1, 2, 3, 4), ('D1', date(2024, 1, 1))]
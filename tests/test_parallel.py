@@ -0,0 +1,111 @@
+"""
+Unit tests for the process-pool bulk assessment.
+
+Tests verify:
+- Sharded results are identical to assess_departments
+- Weights, target score and maturity bands reach the workers
+- Serial fallback for small inputs
+- Worker errors propagate
+- Shared memory column round trips
+"""
+
+import pytest
+import numpy as np
+from edcellence_tqm.core import (
+    BulkItems,
+    MaturityBands,
+    SharedColumns,
+    assess_departments,
+    assess_departments_parallel,
+)
+from edcellence_tqm.utils.synthetic import generate_assessment_columns
+
+RESULT_COLUMNS = ('organizational_score', 'category_scores', 'category_item_counts', 'ihi',
+                  'maturity_level', 'item_score', 'gap_priority', 'gap_rank', 'gap_order')
+
+
+@pytest.fixture(scope='module')
+def columns():
+    return generate_assessment_columns(45, seed=8)
+
+
+@pytest.fixture(scope='module')
+def items(columns):
+    return BulkItems.from_arrays(**columns)
+
+
+def assert_identical(expected, actual):
+    for name in RESULT_COLUMNS:
+        a, b = getattr(expected, name), getattr(actual, name)
+        assert a.dtype == b.dtype, name
+        assert np.array_equal(a, b, equal_nan=True), name
+    assert actual.items is expected.items
+    assert actual.department_result('D00007') == expected.department_result('D00007')
+
+
+class TestAssessDepartmentsParallel:
+    """Test sharded assessment across worker processes."""
+
+    @pytest.mark.parametrize('chunk_size', [1, 7, 44])
+    def test_identical_to_serial(self, items, chunk_size):
+        """Every shard layout reproduces the serial result bit-for-bit."""
+        result = assess_departments_parallel(
+            items, n_workers=2, chunk_size=chunk_size, min_parallel_items=0
+        )
+        assert_identical(assess_departments(items), result)
+
+    def test_options_reach_workers(self, items):
+        """Custom weights, target score and bands give the serial result."""
+        options = {
+            'adli_weights': {'A': 0.4, 'D': 0.3, 'L': 0.2, 'I': 0.1},
+            'target_score': 90.0,
+            'maturity_bands': MaturityBands([1, 2], [50.0, 100.0]),
+        }
+        result = assess_departments_parallel(
+            items, n_workers=3, chunk_size=10, min_parallel_items=0, **options
+        )
+        assert_identical(assess_departments(items, **options), result)
+        assert result.maturity_bands is options['maturity_bands']
+
+    def test_serial_fallback(self, items):
+        """Small inputs and single workers run serially with the same result."""
+        expected = assess_departments(items)
+        assert_identical(expected, assess_departments_parallel(items, n_workers=4))
+        assert_identical(expected, assess_departments_parallel(
+            items, n_workers=1, min_parallel_items=0))
+
+    def test_worker_errors_propagate(self, columns):
+        """A department the serial path rejects raises from its shard."""
+        keep = ~((columns['department'] == 'D00030') & (columns['item_type'] == 'Results'))
+        broken = BulkItems.from_arrays(**{
+            name: value[keep] for name, value in columns.items()
+        })
+        with pytest.raises(ValueError, match="D00030"):
+            assess_departments_parallel(broken, n_workers=2, chunk_size=5,
+                                        min_parallel_items=0)
+
+    def test_validation(self, items):
+        """Non-positive workers or chunk sizes raise ValueError."""
+        with pytest.raises(ValueError, match="n_workers must be positive"):
+            assess_departments_parallel(items, n_workers=0)
+        with pytest.raises(ValueError, match="chunk_size must be positive"):
+            assess_departments_parallel(items, chunk_size=0)
+
+
+class TestSharedColumns:
+    """Test the shared memory column block."""
+
+    def test_round_trip(self):
+        """Attached views see the owner's data and writes."""
+        source = {'x': np.arange(6.0).reshape(3, 2), 'code': np.array([1, 2, 3], dtype=np.int8)}
+        shared = SharedColumns.create(source)
+        try:
+            other = SharedColumns.attach(shared.name, shared.layout)
+            np.testing.assert_array_equal(other.arrays['x'], source['x'])
+            assert other.arrays['code'].dtype == np.int8
+            other.arrays['x'][0, 0] = -1.0
+            assert shared.arrays['x'][0, 0] == -1.0
+            other.close()
+        finally:
+            shared.close()
+            shared.unlink()
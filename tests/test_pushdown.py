@@ -0,0 +1,134 @@
+"""
+Unit tests for SQL pushdown scoring (SQLite stand-in).
+
+Tests verify:
+- Item, category and organizational scores match assess_departments
+- Lookup-table weights drive the computation
+- Recomputing a cycle upserts and leaves other cycles alone
+- Incomplete departments get no organizational row
+"""
+
+import pytest
+import numpy as np
+from edcellence_tqm.core import BulkItems, assess_departments
+from edcellence_tqm.database import AssessmentRepository, ConnectionPool, pushdown_statements
+from edcellence_tqm.utils.synthetic import generate_assessment_columns
+
+CUSTOM_WEIGHTS = {'Leadership': 0.3, 'Strategy': 0.1, 'Customers': 0.1, 'Measurement': 0.1,
+                  'Workforce': 0.1, 'Operations': 0.1, 'Results': 0.2}
+
+
+def make_items(n_departments=40, seed=5):
+    columns = generate_assessment_columns(n_departments, seed=seed)
+    # Stored indicators are DECIMAL(4,3)
+    columns['indicators'] = np.round(columns['indicators'], 3)
+    return BulkItems.from_arrays(**columns)
+
+
+def assert_rounded(stored, exact, places):
+    """Stored DECIMAL values are the exact values rounded (ties may go either way)."""
+    np.testing.assert_array_less(np.abs(np.asarray(stored, dtype=float) - exact),
+                                 0.5 * 10.0 ** -places + 1e-9)
+
+
+@pytest.fixture
+def repository():
+    pool = ConnectionPool.sqlite(size=1)
+    repository = AssessmentRepository(pool)
+    repository.create_schema()
+    yield repository
+    pool.close()
+
+
+def load_cycle(repository, items, code='2024-Q1'):
+    cycle = repository.cycle_id(code, '2024-01-01')
+    repository.save_items(items, cycle, '2024-03-31')
+    return cycle
+
+
+def category_frame(repository, cycle):
+    return repository.fetch_frame(
+        "SELECT d.department_code, c.category_name, c.category_score, c.item_count "
+        "FROM fact_category_aggregates c JOIN dim_department d USING (department_id) "
+        "WHERE c.assessment_cycle_id = ?", (cycle,)
+    ).pivot(index='department_code', columns='category_name')
+
+
+class TestPushdown:
+    """Test in-database scoring against the Python engine."""
+
+    def test_matches_python_engine(self, repository):
+        """Every written column agrees with assess_departments to its DECIMAL scale."""
+        items = make_items()
+        result = assess_departments(items)
+        cycle = load_cycle(repository, items)
+        written = repository.compute_in_database(cycle)
+        assert written == {'fact_assessment_scores': 480, 'fact_results_metrics': 160,
+                           'fact_category_aggregates': 280, 'fact_organizational_scores': 40}
+
+        scores = repository.organizational_scores(cycle)
+        assert_rounded(scores['organizational_score'], result.organizational_score, 2)
+        np.testing.assert_array_equal(scores['maturity_level'], result.maturity_level)
+        assert_rounded(scores['ihi_score'], result.ihi, 3)
+
+        categories = category_frame(repository, cycle)
+        assert_rounded(categories['category_score'][list(result.categories)],
+                       result.category_scores, 2)
+        np.testing.assert_array_equal(categories['item_count'][list(result.categories)],
+                                      result.category_item_counts)
+
+        stored = repository.fetch_frame(
+            "SELECT d.department_code, f.item_id, f.results_score FROM fact_results_metrics f "
+            "JOIN dim_department d USING (department_id) ORDER BY 1, 2")
+        rows = np.flatnonzero(items.item_type == 1)
+        expected = sorted(zip(items.departments[items.department[rows]].tolist(),
+                              items.item_ids[rows].tolist(), result.item_score[rows].tolist()))
+        assert_rounded(stored['results_score'], [score for *_, score in expected], 2)
+
+    def test_lookup_weights(self, repository):
+        """Category weights are read from lookup_category_weights."""
+        items = make_items(10)
+        cycle = load_cycle(repository, items)
+        with repository.pool.transaction() as connection:
+            connection.executemany(
+                "UPDATE lookup_category_weights SET baldrige_weight = ? WHERE category_name = ?",
+                [(weight, name) for name, weight in CUSTOM_WEIGHTS.items()])
+        repository.compute_in_database(cycle, category_column='baldrige_weight')
+        expected = assess_departments(items, category_weights=CUSTOM_WEIGHTS)
+        assert_rounded(repository.organizational_scores(cycle)['organizational_score'],
+                       expected.organizational_score, 2)
+        with pytest.raises(ValueError, match="Unknown category weight column"):
+            pushdown_statements(category_column='tqf_weight')
+
+    def test_parameter_counts(self):
+        """Each statement reports how many cycle_id parameters it binds."""
+        for placeholder in ('?', '%s'):
+            statements = pushdown_statements(placeholder)
+            assert {table: n for table, (_, n) in statements.items()} == {
+                'fact_assessment_scores': 1, 'fact_results_metrics': 1,
+                'fact_category_aggregates': 2, 'fact_organizational_scores': 2}
+            for sql, n_params in statements.values():
+                assert sql.count(placeholder) == n_params
+
+    def test_recompute_single_cycle(self, repository):
+        """Recomputing upserts in place and only touches the given cycle."""
+        first = load_cycle(repository, make_items(8, seed=1), '2024-Q1')
+        second = load_cycle(repository, make_items(8, seed=2), '2024-Q2')
+        repository.compute_in_database(first)
+        before = repository.organizational_scores(first)
+        repository.compute_in_database(first)
+        assert repository.organizational_scores(second).empty
+        assert repository.organizational_scores(first).equals(before)
+        count = repository.fetch_frame("SELECT COUNT(*) AS n FROM fact_category_aggregates")
+        assert count['n'][0] == 8 * 7
+
+    def test_incomplete_department_skipped(self, repository):
+        """Departments without results items get category rows but no score."""
+        items = make_items(3)
+        cycle = load_cycle(repository, items)
+        with repository.pool.transaction() as connection:
+            connection.execute("DELETE FROM fact_results_metrics WHERE department_id = 1")
+        written = repository.compute_in_database(cycle)
+        assert written['fact_organizational_scores'] == 2
+        assert repository.organizational_scores(cycle)['department_code'].tolist() == \
+            items.departments[1:].tolist()
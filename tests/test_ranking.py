@@ -0,0 +1,102 @@
+"""
+Unit tests for top-k gap prioritization.
+
+Tests verify:
+- top_k results equal the head of the full sort, including boundary ties
+- Tie-breaking by item ID (then department)
+- Streaming merge of per-department rankings
+- Institution-wide top-k from bulk results
+"""
+
+import pytest
+import numpy as np
+from edcellence_tqm.core import (
+    BulkItems,
+    TopKAccumulator,
+    assess_departments,
+    merge_top_k,
+    rank_improvement_priorities,
+    top_k_indices,
+    top_k_priorities,
+)
+from edcellence_tqm.utils.synthetic import generate_assessment_columns
+
+
+@pytest.fixture
+def tied_gaps():
+    """Gap scores with many ties (rounded values)."""
+    rng = np.random.default_rng(11)
+    return {f"{i // 10}.{i % 10}": float(rng.integers(0, 20) * 100.0) for i in range(500)}
+
+
+class TestTopK:
+    """Test partial-selection top-k."""
+
+    @pytest.mark.parametrize('k', [0, 1, 7, 50, 499, 500, 1000])
+    def test_matches_full_sort(self, tied_gaps, k):
+        """top_k equals the first k entries of the full ranking."""
+        expected = rank_improvement_priorities(tied_gaps)[:k]
+        assert top_k_priorities(tied_gaps, k) == expected
+        assert rank_improvement_priorities(tied_gaps, k=k) == expected
+
+    def test_ties_broken_by_item_id(self):
+        """Equal gaps are ordered by item ID regardless of input order."""
+        gaps = {'3.1': 100.0, '1.2': 100.0, '2.1': 250.0, '1.1': 100.0}
+        assert rank_improvement_priorities(gaps) == [
+            ('2.1', 250.0), ('1.1', 100.0), ('1.2', 100.0), ('3.1', 100.0)
+        ]
+        assert top_k_priorities(gaps, 2) == [('2.1', 250.0), ('1.1', 100.0)]
+
+    def test_indices_validation(self):
+        """Negative k, NaN scores and mismatched keys are rejected."""
+        with pytest.raises(ValueError):
+            top_k_indices([1.0, 2.0], -1)
+        with pytest.raises(ValueError, match="NaN"):
+            top_k_indices([1.0, np.nan], 1)
+        with pytest.raises(ValueError, match="Key shape"):
+            top_k_indices([1.0, 2.0], 1, keys=np.array(['a']))
+
+
+class TestStreamingTopK:
+    """Test merging per-department rankings."""
+
+    def test_merge_matches_global_sort(self, tied_gaps):
+        """Merged per-department top-k equals a sort over all entries."""
+        departments = {f"Dept {d}": {item: gap + d for item, gap in tied_gaps.items()}
+                       for d in range(0, 300, 100)}
+        everything = sorted(
+            ((dept, item, gap) for dept, gaps in departments.items() for item, gap in gaps.items()),
+            key=lambda e: (-e[2], e[1], e[0])
+        )
+        ranked = {dept: top_k_priorities(gaps, 25) for dept, gaps in departments.items()}
+        assert merge_top_k(ranked, 25) == everything[:25]
+
+        top = TopKAccumulator(25)
+        for dept, gaps in departments.items():
+            top.push_scores(list(gaps), list(gaps.values()), department=dept)
+        assert top.result() == everything[:25]
+        assert len(top) == 25
+
+    def test_merge_accumulators(self, tied_gaps):
+        """Accumulators built separately merge to the same result."""
+        left, right, both = TopKAccumulator(10), TopKAccumulator(10), TopKAccumulator(10)
+        ranked = rank_improvement_priorities(tied_gaps)
+        left.push(ranked, department='A')
+        right.push(ranked, department='B')
+        both.push(ranked, department='A')
+        both.push(ranked, department='B')
+        left.merge(right)
+        assert left.result() == both.result()
+
+
+class TestBulkTopPriorities:
+    """Test top-k over bulk assessment results."""
+
+    def test_institution_wide(self):
+        """Bulk top_priorities equals merging every department's ranking."""
+        items = BulkItems.from_arrays(**generate_assessment_columns(40, seed=2))
+        result = assess_departments(items)
+        ranked = {dept: result.ranked_gaps(dept) for dept in result.departments.tolist()}
+        assert result.top_priorities(15) == merge_top_k(ranked, 15)
+        dept = result.departments[0]
+        assert result.ranked_gaps(dept, k=3) == result.ranked_gaps(dept)[:3]
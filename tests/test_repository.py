@@ -0,0 +1,298 @@
+"""
+Unit tests for the database repository layer (SQLite stand-in).
+
+Tests verify:
+- The schema script loads, translates to SQLite and is mounted by docker-compose
+- Connection pool reuse, limits and transaction rollback
+- Bulk assessment writes land in every fact table with DECIMAL rounding
+- Re-saving a cycle upserts instead of duplicating rows
+- The latest-score snapshot tracks the newest cycle per department
+- Gap analysis rows are ranked per department, bounded by top_n and replaced
+"""
+
+import sqlite3
+import threading
+
+import pytest
+import numpy as np
+from edcellence_tqm.core import BulkItems, assess_departments, gap_priorities
+from edcellence_tqm.database import AssessmentRepository, ConnectionPool
+from edcellence_tqm.database.repository import upsert_sql
+from edcellence_tqm.database.schema import (
+    SCHEMA_PATH,
+    default_schema_path,
+    read_schema_sql,
+    sqlite_schema_sql,
+    table_columns,
+)
+from edcellence_tqm.utils.synthetic import generate_assessment_columns
+
+
+@pytest.fixture
+def repository():
+    pool = ConnectionPool.sqlite(size=2)
+    repository = AssessmentRepository(pool, batch_size=7)
+    repository.create_schema()
+    yield repository
+    pool.close()
+
+
+@pytest.fixture(scope='module')
+def result():
+    return assess_departments(BulkItems.from_arrays(**generate_assessment_columns(5, seed=3)))
+
+
+LEGACY_LATEST_SQL = "SELECT * FROM vw_latest_department_scores ORDER BY department_code"
+
+
+def count(repository, table):
+    return int(repository.fetch_frame(f"SELECT COUNT(*) AS n FROM {table}")['n'][0])
+
+
+class TestSchemaResource:
+    """Test the schema script in scripts/."""
+
+    def test_checkout_schema(self):
+        """A source checkout reads the canonical script in scripts/."""
+        assert SCHEMA_PATH.is_file()
+        assert default_schema_path() == SCHEMA_PATH
+        assert read_schema_sql() == SCHEMA_PATH.read_text(encoding='utf-8')
+        assert 'CREATE TABLE lookup_adli_weights' in read_schema_sql()
+
+    def test_sqlite_translation(self):
+        """The translated script runs on SQLite."""
+        sql = sqlite_schema_sql()
+        assert 'SERIAL' not in sql and 'COMMENT ON' not in sql
+        sqlite3.connect(':memory:').executescript(sql)
+
+    def test_unreadable_column_names_table(self):
+        """A definition without a leading identifier raises ValueError naming the table."""
+        assert table_columns("CREATE TABLE t (a INT, b TEXT, PRIMARY KEY (a));", 't') == ['a', 'b']
+        with pytest.raises(ValueError, match="table t"):
+            table_columns('CREATE TABLE t (a INT, "b c" TEXT);', 't')
+
+    def test_docker_compose_mounts_schema(self):
+        """docker-compose initializes PostgreSQL from the canonical script."""
+        root = SCHEMA_PATH.parents[1]
+        compose = (root / 'docker-compose.yml').read_text(encoding='utf-8')
+        assert f'./{SCHEMA_PATH.relative_to(root).as_posix()}:' in compose
+
+
+class TestConnectionPool:
+    """Test pooled connections."""
+
+    def test_reuse_and_limit(self, tmp_path):
+        """Connections are reused and the pool never exceeds its size."""
+        pool = ConnectionPool.sqlite(tmp_path / 'tqm.db', size=2, timeout=0.05)
+        with pool.connection() as first:
+            pass
+        with pool.connection() as again, pool.connection() as second:
+            assert again is first and second is not first
+            with pytest.raises(TimeoutError):
+                pool.acquire()
+        pool.close()
+        with pytest.raises(ValueError, match="closed"):
+            pool.acquire()
+
+    def test_release_after_close(self, tmp_path):
+        """Connections returned after close() are not pooled again."""
+        pool = ConnectionPool.sqlite(tmp_path / 'tqm.db', size=1)
+        connection = pool.acquire()
+        pool.close()
+        pool.release(connection)
+        assert pool._idle.empty()
+
+    def test_shared_memory_and_rollback(self, repository):
+        """In-memory pools share one database; failed transactions roll back."""
+        with pytest.raises(RuntimeError):
+            with repository.pool.transaction() as connection:
+                connection.execute("INSERT INTO dim_department (department_code, "
+                                   "department_name) VALUES ('X', 'X')")
+                raise RuntimeError
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append(count(repository, 'dim_department')))
+        thread.start()
+        thread.join()
+        assert seen == [0]
+
+
+class TestRepository:
+    """Test bulk assessment writes."""
+
+    def test_upsert_sql(self):
+        """Upserts update every non-key column."""
+        assert upsert_sql('t', ['k'], ['v', 'w'], '%s') == (
+            "INSERT INTO t (k, v, w) VALUES (%s, %s, %s) "
+            "ON CONFLICT (k) DO UPDATE SET v = excluded.v, w = excluded.w"
+        )
+
+    def test_save_assessment(self, repository, result):
+        """Every fact table receives its rows, rounded to column scale."""
+        cycle = repository.cycle_id('2024-Q1', '2024-01-01', '2024-03-31')
+        written = repository.save_assessment(result, cycle, '2024-03-31')
+        process = int(np.count_nonzero(result.items.item_type == 0))
+        assert written == {
+            'fact_assessment_scores': process,
+            'fact_results_metrics': len(result.items) - process,
+            'fact_category_aggregates': int(np.count_nonzero(result.category_item_counts)),
+            'fact_organizational_scores': 5,
+        }
+        scores = repository.organizational_scores(cycle)
+        assert scores['department_code'].tolist() == result.departments.tolist()
+        np.testing.assert_array_equal(scores['organizational_score'],
+                                      np.round(result.organizational_score, 2))
+        np.testing.assert_array_equal(scores['maturity_level'], result.maturity_level)
+        totals = repository.fetch_frame(
+            "SELECT SUM(total_point_value) AS points, SUM(item_count) AS items "
+            "FROM fact_category_aggregates")
+        assert totals['points'][0] == result.items.point_value.sum()
+        assert totals['items'][0] == len(result.items)
+
+    def test_resave_upserts(self, repository, result):
+        """Saving a cycle twice replaces rows; a new cycle adds rows."""
+        ids = repository.department_ids(result.departments.tolist())
+        first = repository.cycle_id('2024-Q1', '2024-01-01')
+        assert repository.cycle_id('2024-Q1', '2024-01-01') == first
+        repository.save_assessment(result, first, '2024-03-31', ids)
+        changed = assess_departments(result.items, category_weights={
+            'Leadership': 0.5, 'Strategy': 0.1, 'Customers': 0.1, 'Measurement': 0.05,
+            'Workforce': 0.05, 'Operations': 0.1, 'Results': 0.1})
+        repository.save_assessment(changed, first, '2024-03-31', ids)
+        assert count(repository, 'fact_organizational_scores') == 5
+        assert count(repository, 'fact_assessment_scores') + \
+            count(repository, 'fact_results_metrics') == len(result.items)
+        np.testing.assert_array_equal(repository.organizational_scores(first)
+                                      ['organizational_score'],
+                                      np.round(changed.organizational_score, 2))
+        second = repository.cycle_id('2024-Q2', '2024-04-01')
+        repository.save_assessment(result, second, '2024-06-30', ids)
+        assert count(repository, 'fact_organizational_scores') == 10
+        assert count(repository, 'dim_department') == 5
+
+
+class TestLatestScores:
+    """Test the latest-score snapshot."""
+
+    def test_out_of_order_cycles(self, repository):
+        """Older cycles saved late do not replace newer snapshot rows."""
+        for seed, code, date in ((1, 'Q1', '2024-03-31'), (3, 'Q3', '2024-09-30'),
+                                 (2, 'Q2', '2024-06-30')):
+            result = assess_departments(
+                BulkItems.from_arrays(**generate_assessment_columns(4 + seed, seed=seed)))
+            repository.save_assessment(result, repository.cycle_id(code, date), date)
+        latest = repository.latest_scores()
+        legacy = repository.fetch_frame(LEGACY_LATEST_SQL)
+        assert len(latest) == 7
+        assert latest['cycle_code'].tolist() == ['Q3'] * 7
+        for column in ('department_code', 'organizational_score', 'assessment_date'):
+            assert latest[column].tolist() == legacy[column].tolist()
+        assert repository.latest_scores(['D00005'])['department_code'].tolist() == ['D00005']
+
+    def test_backdated_resave(self, repository, result):
+        """Re-saving the snapshot's cycle with an earlier date still refreshes it."""
+        first = repository.cycle_id('Q1', '2024-01-01')
+        repository.save_assessment(result, first, '2024-03-31')
+        changed = assess_departments(result.items, category_weights={
+            'Leadership': 0.5, 'Strategy': 0.1, 'Customers': 0.1, 'Measurement': 0.05,
+            'Workforce': 0.05, 'Operations': 0.1, 'Results': 0.1})
+        repository.save_assessment(changed, first, '2024-03-15')
+        latest = repository.latest_scores()
+        assert latest['assessment_date'].tolist() == ['2024-03-15'] * 5
+        np.testing.assert_array_equal(latest['organizational_score'],
+                                      np.round(changed.organizational_score, 2))
+
+        # Moving Q1 behind another cycle hands the snapshot to that cycle
+        second = repository.cycle_id('Q0', '2024-01-01')
+        repository.save_assessment(result, second, '2024-03-20')
+        assert repository.latest_scores()['cycle_code'].tolist() == ['Q0'] * 5
+        repository.save_assessment(changed, first, '2024-03-25')
+        assert repository.latest_scores()['cycle_code'].tolist() == ['Q1'] * 5
+        repository.save_assessment(changed, first, '2024-03-10')
+        latest = repository.latest_scores()
+        assert latest['cycle_code'].tolist() == ['Q0'] * 5
+        assert latest['assessment_date'].tolist() == ['2024-03-20'] * 5
+
+    def test_pushdown_and_rebuild(self, repository, result):
+        """Pushdown writes refresh the snapshot; rebuild recovers from backdating."""
+        first = repository.cycle_id('Q1', '2024-01-01')
+        repository.save_assessment(result, first, '2024-03-31')
+        second = repository.cycle_id('Q2', '2024-04-01')
+        repository.save_items(result.items, second, '2024-06-30')
+        repository.compute_in_database(second)
+        assert repository.latest_scores()['cycle_code'].tolist() == ['Q2'] * 5
+        with repository.pool.transaction() as connection:
+            connection.execute("UPDATE fact_organizational_scores SET assessment_date = "
+                               "'2024-01-15' WHERE assessment_cycle_id = ?", (second,))
+        assert repository.rebuild_latest_scores() == 5
+        assert repository.latest_scores()['cycle_code'].tolist() == ['Q1'] * 5
+
+    def test_migrate_existing_database(self, repository, result):
+        """Facts written before the snapshot existed appear after one rebuild."""
+        repository.save_assessment(result, repository.cycle_id('Q1', '2024-01-01'), '2024-03-31')
+        with repository.pool.transaction() as connection:
+            connection.execute("DELETE FROM fact_latest_department_scores")
+        legacy = repository.fetch_frame(LEGACY_LATEST_SQL)
+        assert len(legacy) == 5 and repository.latest_scores().empty
+
+        assert repository.rebuild_latest_scores() == 5
+        latest = repository.latest_scores()
+        assert latest.columns.tolist() == legacy.columns.tolist()
+        assert latest.values.tolist() == legacy.values.tolist()
+
+
+class TestGapAnalysis:
+    """Test the bulk gap-analysis writer."""
+
+    GAP_SQL = ("SELECT d.department_code, g.item_id, g.gap_score, g.priority_score, "
+               "g.priority_rank FROM fact_gap_analysis g JOIN dim_department d "
+               "USING (department_id) ORDER BY d.department_code, g.priority_rank")
+
+    def test_ranked_in_numpy(self, repository, result):
+        """Stored ranks and priorities match BulkAssessmentResult.ranked_gaps."""
+        cycle = repository.cycle_id('Q1', '2024-01-01')
+        assert repository.save_gap_analysis(result, cycle) == len(result.items)
+        assert repository.save_gap_analysis(result, cycle, top_n=3) == 15
+        stored = repository.fetch_frame(self.GAP_SQL)
+        assert len(stored) == 15
+        for department, rows in stored.groupby('department_code'):
+            expected = result.ranked_gaps(department, k=3)
+            assert rows['item_id'].tolist() == [item for item, _ in expected]
+            np.testing.assert_allclose(rows['priority_score'],
+                                       np.round([gap for _, gap in expected], 2))
+            assert rows['priority_rank'].tolist() == [1, 2, 3]
+        with pytest.raises(ValueError, match="top_n must be positive"):
+            repository.save_gap_analysis(result, cycle, top_n=0)
+
+    def test_ranked_in_database(self, repository):
+        """RANK() OVER in the database agrees with numpy on the stored inputs."""
+        columns = generate_assessment_columns(6, seed=8)
+        columns['deployment_gap'] = np.round(columns['deployment_gap'], 3)
+        result = assess_departments(BulkItems.from_arrays(**columns))
+        cycle = repository.cycle_id('Q1', '2024-01-01')
+        assert repository.save_gap_analysis(result, cycle, top_n=4, rank_in_database=True) == 24
+        stored = repository.fetch_frame(self.GAP_SQL)
+
+        # The database ranks from current scores stored at DECIMAL(5,2)
+        priority, rank, order = gap_priorities(result.items, np.round(result.item_score, 2))
+        keep = order[rank[order] <= 4]
+        assert stored['item_id'].tolist() == result.items.item_ids[keep].tolist()
+        assert stored['priority_rank'].tolist() == rank[keep].tolist()
+        np.testing.assert_allclose(stored['priority_score'], np.round(priority[keep], 2))
+        np.testing.assert_allclose(stored['gap_score'],
+                                   np.round(100 - np.round(result.item_score[keep], 2), 2))
+
+    @pytest.mark.parametrize('rank_in_database', [False, True])
+    def test_department_subsets(self, repository, rank_in_database):
+        """Saving one set of departments leaves another set's rows of the cycle intact."""
+        columns = generate_assessment_columns(5, seed=4)
+        columns['deployment_gap'] = np.round(columns['deployment_gap'], 3)
+        first, second = (assess_departments(BulkItems.from_arrays(
+            **{name: values[mask] for name, values in columns.items()}))
+            for mask in (columns['department'] < 'D00002', columns['department'] >= 'D00002'))
+        cycle = repository.cycle_id('Q1', '2024-01-01')
+        assert repository.save_gap_analysis(first, cycle) == len(first.items)
+        assert repository.save_gap_analysis(second, cycle, top_n=3,
+                                            rank_in_database=rank_in_database) == 9
+        stored = repository.fetch_frame(self.GAP_SQL)
+        assert stored.groupby('department_code').size().to_dict() == {
+            'D00000': 16, 'D00001': 16, 'D00002': 3, 'D00003': 3, 'D00004': 3}
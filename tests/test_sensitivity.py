@@ -0,0 +1,108 @@
+"""
+Unit tests for weight sensitivity sweeps.
+
+Tests verify:
+- Swept org scores match assess_departments under each profile
+- Chunking does not change any result
+- Baseline profiles give tau = 1 and no maturity flips
+- Profile matrix validation
+"""
+
+import pytest
+import numpy as np
+from edcellence_tqm.core import (
+    DEFAULT_ADLI_PROFILE,
+    DEFAULT_CATEGORY_PROFILE,
+    DEFAULT_LETCI_PROFILE,
+    BulkItems,
+    WeightProfile,
+    assess_departments,
+    random_weight_profiles,
+    sweep_weights,
+)
+from edcellence_tqm.utils.synthetic import generate_assessment_columns
+
+
+@pytest.fixture(scope='module')
+def items():
+    return BulkItems.from_arrays(**generate_assessment_columns(60, seed=3))
+
+
+@pytest.fixture(scope='module')
+def profiles():
+    return {
+        'adli_profiles': random_weight_profiles(DEFAULT_ADLI_PROFILE, 40, 30, seed=1),
+        'letci_profiles': random_weight_profiles(DEFAULT_LETCI_PROFILE, 40, 30, seed=2),
+        'category_profiles': random_weight_profiles(DEFAULT_CATEGORY_PROFILE, 40, 30, seed=3),
+    }
+
+
+class TestSweepWeights:
+    """Test the vectorized weight sweep."""
+
+    def test_matches_bulk_assessment(self, items, profiles):
+        """Each profile's scores equal assess_departments to within ulps."""
+        result = sweep_weights(items, keep_scores=True, chunk_size=16, **profiles)
+        for w in (0, 17, 39):
+            expected = assess_departments(
+                items,
+                adli_weights=profiles['adli_profiles'][w],
+                letci_weights=profiles['letci_profiles'][w],
+                category_weights=WeightProfile.from_vector(
+                    'category', profiles['category_profiles'][w])
+            )
+            np.testing.assert_allclose(
+                result.org_scores[w], expected.organizational_score, rtol=0, atol=1e-10
+            )
+        assert result.maturity_flips.sum() == result.department_flips.sum()
+        assert result.level_transitions.sum() == 40 * items.n_departments
+
+    def test_chunk_size_independent(self, items, profiles):
+        """Results do not depend on how profiles are chunked."""
+        a = sweep_weights(items, chunk_size=7, keep_scores=True, **profiles)
+        b = sweep_weights(items, chunk_size=1000, keep_scores=True, **profiles)
+        np.testing.assert_allclose(a.org_scores, b.org_scores, rtol=0, atol=1e-12)
+        np.testing.assert_array_equal(a.maturity_flips, b.maturity_flips)
+        np.testing.assert_allclose(a.score_std, b.score_std, rtol=1e-9)
+        np.testing.assert_allclose(a.score_std, a.org_scores.std(axis=0), rtol=1e-9)
+
+    def test_baseline_profiles_are_stable(self, items):
+        """Sweeping the baseline weights changes nothing."""
+        category = np.tile(DEFAULT_CATEGORY_PROFILE.vector, (5, 1))
+        result = sweep_weights(items, category_profiles=category)
+        np.testing.assert_allclose(result.kendall_tau, 1.0)
+        assert result.maturity_flips.tolist() == [0] * 5
+        assert result.max_rank_shift.max() == 0
+        np.testing.assert_allclose(result.score_min, result.baseline_score, rtol=0, atol=1e-10)
+
+    def test_baseline_profile_at_band_edge(self):
+        """Sweeping the baseline profile reports no flips at a maturity band edge."""
+        columns = generate_assessment_columns(20, seed=1)
+        columns['indicators'] = np.full_like(columns['indicators'], 0.85)
+        items = BulkItems.from_arrays(**columns)
+        adli = np.vstack([random_weight_profiles(DEFAULT_ADLI_PROFILE, 9, seed=4),
+                          DEFAULT_ADLI_PROFILE.vector])
+        for profiles in ({'adli_profiles': [DEFAULT_ADLI_PROFILE.vector]},
+                         {'adli_profiles': adli[::-1], 'chunk_size': 4},
+                         {'category_profiles': [DEFAULT_CATEGORY_PROFILE.vector]}):
+            result = sweep_weights(items, keep_scores=True, **profiles)
+            np.testing.assert_allclose(result.baseline_score, 85.0, rtol=0, atol=1e-10)
+            assert result.maturity_flips[0] == 0
+            np.testing.assert_array_equal(result.org_scores[0], result.baseline_score)
+
+    def test_profile_dicts_and_validation(self, items):
+        """Profile lists are accepted; bad matrices raise ValueError."""
+        result = sweep_weights(items, adli_profiles=[DEFAULT_ADLI_PROFILE, {'A': 0.25, 'D': 0.25,
+                                                                            'L': 0.25, 'I': 0.25}])
+        assert result.n_profiles == 2
+        assert len(result.to_frame()) == items.n_departments
+
+        with pytest.raises(ValueError, match="must sum to 1.0"):
+            sweep_weights(items, adli_profiles=[[0.5, 0.5, 0.5, 0.5]])
+        with pytest.raises(ValueError, match="shape"):
+            sweep_weights(items, category_profiles=np.ones((3, 4)) / 4)
+        with pytest.raises(ValueError, match="same number of rows"):
+            sweep_weights(items, adli_profiles=np.full((2, 4), 0.25),
+                          letci_profiles=np.full((3, 4), 0.25))
+        with pytest.raises(ValueError, match="At least one"):
+            sweep_weights(items)
@@ -0,0 +1,126 @@
+"""
+Unit tests for streaming CSV ingestion.
+
+Tests verify:
+- Streamed results equal AssessmentEngine for any chunk size
+- Grouping by department and assessment cycle
+- Non-contiguous groups (sorted and buffered modes)
+- Column-wise validation errors with data row numbers
+"""
+
+import io
+from pathlib import Path
+
+import pytest
+import pandas as pd
+from edcellence_tqm.core import ADLIIndicators, AssessmentEngine, LeTCIIndicators
+from edcellence_tqm.core.streaming import stream_assessments
+
+SAMPLE_CSV = Path(__file__).parent.parent / 'data' / 'examples' / 'sample_assessment_data.csv'
+
+
+@pytest.fixture(scope='module')
+def sample():
+    return pd.read_csv(SAMPLE_CSV, dtype={'item_id': str})
+
+
+def engine_assessment(frame, engine=None):
+    """Run compute_organizational_assessment on one department's rows."""
+    process_items, results_items = [], []
+    for row in frame.itertuples():
+        item = {'item_id': row.item_id, 'category': row.category, 'point_value': row.point_value}
+        if row.item_type == 'Process':
+            indicators = ADLIIndicators(row.approach, row.deployment, row.learning,
+                                        row.integration)
+            process_items.append(dict(item, adli=indicators))
+        else:
+            indicators = LeTCIIndicators(row.level, row.trend, row.comparison, row.integration)
+            results_items.append(dict(item, letci=indicators))
+    engine = engine or AssessmentEngine()
+    return engine.compute_organizational_assessment(process_items, results_items, {})
+
+
+def as_csv(frame) -> io.StringIO:
+    return io.StringIO(frame.to_csv(index=False))
+
+
+class TestStreamAssessments:
+    """Test chunked streaming assessment."""
+
+    @pytest.mark.parametrize('chunksize', [1, 7, 16, 1000])
+    def test_matches_engine(self, sample, chunksize):
+        """Every chunk size yields the engine's result per department, in file order."""
+        streamed = list(stream_assessments(SAMPLE_CSV, chunksize=chunksize))
+        assert [key for key, _ in streamed] == [
+            (department, '2024-02-01') for department in sample['department'].unique()
+        ]
+        for (department, _), result in streamed:
+            assert result == engine_assessment(sample[sample['department'] == department])
+
+    def test_engine_weights_and_cycles(self, sample):
+        """Engine weights apply and each assessment_date is its own group."""
+        later = sample.assign(assessment_date='2024-08-01', approach=sample['approach'] * 0.9)
+        frame = pd.concat([sample, later], ignore_index=True)
+        engine = AssessmentEngine(adli_weights={'A': 0.4, 'D': 0.3, 'L': 0.2, 'I': 0.1})
+
+        streamed = dict(stream_assessments(as_csv(frame), engine=engine, chunksize=10))
+        assert len(streamed) == 6
+        key = ('Business Admin', '2024-08-01')
+        rows = later[later['department'] == 'Business Admin']
+        assert streamed[key] == engine_assessment(rows, engine)
+
+        by_department = list(stream_assessments(as_csv(sample), group_by=['department']))
+        assert [key for key, _ in by_department] == list(sample['department'].unique())
+
+    def test_non_contiguous_groups(self, sample):
+        """Interleaved departments raise unless the file is buffered."""
+        shuffled = sample.sample(frac=1.0, random_state=3)
+        with pytest.raises(ValueError, match="not contiguous"):
+            list(stream_assessments(as_csv(shuffled), chunksize=8))
+
+        buffered = dict(stream_assessments(as_csv(shuffled), assume_sorted=False, chunksize=8))
+        for (department, _), result in buffered.items():
+            rows = shuffled[shuffled['department'] == department]
+            assert result == engine_assessment(rows)
+
+    @pytest.mark.parametrize('assume_sorted', [True, False])
+    def test_chunks_concatenated_once(self, sample, monkeypatch, assume_sorted):
+        """Buffered chunks are concatenated once per group (or file), not per chunk."""
+        calls = []
+
+        def counting_concat(objs, *args, **kwargs):
+            objs = list(objs)
+            calls.append(len(objs))
+            return concat(objs, *args, **kwargs)
+
+        concat = pd.concat
+        monkeypatch.setattr(pd, 'concat', counting_concat)
+        streamed = list(stream_assessments(SAMPLE_CSV, chunksize=1, assume_sorted=assume_sorted))
+        monkeypatch.undo()
+
+        n_groups = sample['department'].nunique()
+        assert len(calls) <= (n_groups if assume_sorted else 1)
+        assert sum(calls) <= len(sample) + n_groups
+        for (department, _), result in streamed:
+            assert result == engine_assessment(sample[sample['department'] == department])
+
+    @pytest.mark.parametrize('column, value, message', [
+        ('approach', 1.2, r"Data row 5: approach: indicator out of range \[0,1\], got 1.2"),
+        ('level', float('nan'), "Data row 5: level: missing indicator"),
+        ('item_type', 'Outcome', "Data row 5: item_type: unknown item type"),
+        ('point_value', 12.5, "Data row 5: point_value: point value must be a non-negative"),
+    ])
+    def test_validation_errors(self, sample, column, value, message):
+        """The first bad row is reported by its data row number."""
+        frame = sample.copy()
+        row = 5 if column != 'level' else frame.index[frame['item_type'] == 'Results'][0]
+        frame[column] = frame[column].astype(object)
+        frame.loc[row, column] = value
+        message = message.replace('Data row 5', f'Data row {row}')
+        with pytest.raises(ValueError, match=message):
+            list(stream_assessments(as_csv(frame), chunksize=4))
+
+    def test_missing_columns(self, sample):
+        """Files without the required columns are rejected."""
+        with pytest.raises(ValueError, match="Missing required columns"):
+            list(stream_assessments(as_csv(sample.drop(columns=['trend']))))
@@ -0,0 +1,144 @@
+"""
+Unit tests for deterministic summation.
+
+Tests verify:
+- Exact sums equal math.fsum and ignore term order
+- Grouped sums match per-group fsum on the vectorized and fallback paths
+- ExactAccumulator removal and merging
+- Scalar, incremental, bulk and parallel paths agree bit-for-bit
+  whatever the item order
+"""
+
+import math
+
+import pytest
+import numpy as np
+from edcellence_tqm.core import (
+    ADLIIndicators,
+    AssessmentEngine,
+    BulkItems,
+    LeTCIIndicators,
+    assess_departments,
+    assess_departments_parallel,
+    compute_category_score,
+)
+from edcellence_tqm.core.summation import (
+    ExactAccumulator,
+    exact_dot,
+    exact_sum,
+    grouped_exact_sum,
+)
+from edcellence_tqm.utils.synthetic import generate_assessment_columns
+
+
+def fsum_by_group(groups, values, n_groups):
+    return np.array([math.fsum(values[groups == g].tolist()) for g in range(n_groups)])
+
+
+class TestExactSums:
+    """Test the summation primitives."""
+
+    def test_exact_sum_order_independent(self):
+        """Any permutation gives the correctly rounded sum."""
+        rng = np.random.default_rng(1)
+        values = rng.random(5000) * 10.0 ** rng.integers(-3, 6, 5000)
+        expected = math.fsum(values.tolist())
+        for _ in range(3):
+            shuffled = rng.permutation(values)
+            assert exact_sum(shuffled) == expected
+            assert exact_sum(shuffled.tolist()) == expected
+        assert exact_sum([1e16, 1.0, -1e16]) == 1.0
+        assert exact_dot([0.1, 0.2], [3, 7]) == math.fsum([0.1 * 3, 0.2 * 7])
+
+    def test_grouped_matches_fsum(self):
+        """Vectorized limb sums equal math.fsum per group, empty groups are 0."""
+        rng = np.random.default_rng(2)
+        groups = rng.integers(0, 50, 20_000)
+        values = rng.random(20_000) * rng.integers(10, 120, 20_000) * 100
+        values[::7] *= -1
+        result = grouped_exact_sum(groups, values, 52)
+        assert np.array_equal(result, fsum_by_group(groups, values, 52))
+        order = rng.permutation(len(values))
+        assert np.array_equal(grouped_exact_sum(groups[order], values[order], 52), result)
+
+    def test_rounding_ties(self):
+        """Exact totals halfway between two floats round to even, as fsum does."""
+        cases = [[2.0 ** 53, 1.0], [2.0 ** 53 + 2, 1.0], [-2.0 ** 53, -1.0],
+                 [2.0 ** 60, -1.0], [3.0, -3.0], [0.1, 0.2, 0.3]]
+        for values in cases:
+            total = grouped_exact_sum(np.zeros(len(values), dtype=np.int64), values, 1)[0]
+            assert total == math.fsum(values), values
+
+    @pytest.mark.parametrize('values', [
+        [1e300, 1e-300, 1.0, -1e300],  # wider than the limb window
+        [1.0, 5e-324, 2.0, 3.0],  # underflows when scaled
+        [1.0, np.inf, 2.0, 3.0],  # non-finite
+    ])
+    def test_fallback(self, values):
+        """Inputs outside the limb window fall back to math.fsum."""
+        groups = np.array([0, 0, 1, 1])
+        values = np.array(values)
+        assert np.array_equal(grouped_exact_sum(groups, values, 2),
+                              fsum_by_group(groups, values, 2))
+
+    def test_accumulator(self):
+        """Removal restores the exact sum; merges equal a single accumulator."""
+        values = [0.1, 1e17, 0.2, -1e17, 0.3]
+        total = ExactAccumulator(values)
+        assert total.value() == math.fsum(values)
+        total.add(-0.2)
+        assert total.value() == math.fsum([0.1, 0.3])
+        left, right = ExactAccumulator(values[:2]), ExactAccumulator(values[2:])
+        assert left.merge(right).value() == math.fsum(values)
+
+
+class TestPathAgreement:
+    """Test that every aggregation path gives identical bits."""
+
+    def test_item_order_does_not_change_results(self):
+        """Shuffled bulk inputs and parallel shards give identical scores."""
+        columns = generate_assessment_columns(60, seed=4)
+        items = BulkItems.from_arrays(**columns)
+        serial = assess_departments(items)
+
+        order = np.random.default_rng(0).permutation(len(items))
+        shuffled = BulkItems.from_arrays(**{name: value[order]
+                                            for name, value in columns.items()})
+        other = assess_departments(shuffled)
+        mapping = [shuffled.departments.tolist().index(d) for d in items.departments]
+        np.testing.assert_array_equal(other.organizational_score[mapping],
+                                      serial.organizational_score)
+        np.testing.assert_array_equal(other.category_scores[mapping], serial.category_scores)
+        np.testing.assert_array_equal(other.ihi[mapping], serial.ihi)
+
+        parallel = assess_departments_parallel(items, n_workers=2, chunk_size=7,
+                                               min_parallel_items=0)
+        np.testing.assert_array_equal(parallel.category_scores, serial.category_scores)
+
+    def test_scalar_incremental_and_bulk_agree(self):
+        """compute_category_score, the running totals and the bulk path match exactly."""
+        columns = generate_assessment_columns(1, seed=9)
+        items = BulkItems.from_arrays(**columns)
+        bulk = assess_departments(items)
+        scores = bulk.item_score
+        k = items.categories.index('Results')
+        rows = np.flatnonzero(items.category == k)
+
+        scalar = compute_category_score(scores[rows].tolist(), items.point_value[rows].tolist())
+        reversed_scalar = compute_category_score(scores[rows][::-1].tolist(),
+                                                 items.point_value[rows][::-1].tolist())
+        assert scalar == reversed_scalar == bulk.category_scores[0, k]
+
+        engine = AssessmentEngine()
+        for row in np.random.default_rng(3).permutation(len(items)).tolist():
+            values = items.indicators[row].tolist()
+            if items.item_type[row] == 0:
+                engine.add_process_item(str(row), ADLIIndicators(*values),
+                                        int(items.point_value[row]),
+                                        category=items.categories[items.category[row]])
+            else:
+                engine.add_results_item(str(row), LeTCIIndicators(*values),
+                                        int(items.point_value[row]),
+                                        category=items.categories[items.category[row]])
+        assert engine.compute_category_scores()['Results'] == bulk.category_scores[0, k]
+        assert engine.compute_ihi() == bulk.ihi[0]
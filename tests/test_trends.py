@@ -0,0 +1,105 @@
+"""
+Unit tests for LeTCI level and trend derivation.
+
+Tests verify:
+- Rolling least-squares and Theil-Sen slopes match per-window references
+- Level and trend indicator normalization against baseline and target
+- derive_letci fills results rows of a long-format frame
+- TrendTracker running sums agree with the batch slopes
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from scipy import stats
+from edcellence_tqm.core import MetricSeries, TrendTracker, derive_letci, rolling_slopes
+from edcellence_tqm.core.trends import level_indicators, trend_indicators
+
+
+@pytest.fixture(scope='module')
+def values():
+    rng = np.random.default_rng(4)
+    series = rng.normal(0, 1, size=(30, 25)).cumsum(axis=1)
+    series[rng.random(series.shape) < 0.2] = np.nan
+    return series
+
+
+class TestSlopes:
+    """Test vectorized window slopes."""
+
+    def test_ols_matches_polyfit(self, values):
+        """Each slope equals a least-squares fit of the window's measurements."""
+        slopes = rolling_slopes(values, window=5, min_periods=3)
+        for s, t in [(0, 4), (3, 10), (7, 24), (12, 2)]:
+            x = np.arange(max(0, t - 4), t + 1)
+            y = values[s, x]
+            keep = ~np.isnan(y)
+            if keep.sum() >= 3:
+                assert slopes[s, t] == pytest.approx(np.polyfit(x[keep], y[keep], 1)[0])
+            else:
+                assert np.isnan(slopes[s, t])
+
+    def test_theil_sen_matches_scipy(self, values):
+        """Theil-Sen slopes equal scipy's estimator on each window."""
+        slopes = rolling_slopes(values, window=6, method='theil_sen', min_periods=3)
+        for s, t in [(1, 8), (5, 20), (9, 24)]:
+            x = np.arange(t - 5, t + 1)
+            y = values[s, x]
+            keep = ~np.isnan(y)
+            assert slopes[s, t] == pytest.approx(stats.theilslopes(y[keep], x[keep])[0])
+
+    def test_invalid_arguments(self, values):
+        """Unknown methods and impossible windows are rejected."""
+        with pytest.raises(ValueError, match="method"):
+            rolling_slopes(values, method='lowess')
+        with pytest.raises(ValueError, match="min_periods"):
+            rolling_slopes(values, window=3, min_periods=4)
+
+
+class TestIndicators:
+    """Test level/trend normalization and frame derivation."""
+
+    def test_normalization(self):
+        """Levels span baseline..target; flat trends score 0.5."""
+        assert level_indicators([50, 75, 110], 50, 100).tolist() == [0.0, 0.5, 1.0]
+        assert level_indicators([20, 15], 30, 10).tolist() == [0.5, 0.75]  # lower is better
+        trend = trend_indicators([0.0, 2.5, -5.0, 10.0], 50, 100, full_credit_rate=0.1)
+        assert trend.tolist() == [0.5, 0.75, 0.0, 1.0]
+
+    def test_derive_letci(self):
+        """Results rows get level and trend; unmeasured rows are untouched."""
+        frame = pd.DataFrame({
+            'department': ['A'] * 4 + ['B'] * 4 + ['A'],
+            'item_id': ['7.1'] * 8 + ['1.1'],
+            'assessment_date': [1, 2, 3, 4] * 2 + [4],
+            'metric_value': [60, 62, 64, 66, 90, 88, 86, 84, np.nan],
+            'trend': [np.nan] * 8 + [0.3],
+        })
+        result = derive_letci(frame, {'7.1': (50, 100)}, window=3)
+        assert result['level'].tolist()[:4] == pytest.approx([0.2, 0.24, 0.28, 0.32])
+        assert result['metric_slope'].tolist()[2:4] == pytest.approx([2.0, 2.0])
+        assert result['trend'].tolist()[3] == pytest.approx(0.7)
+        assert result['trend'].tolist()[7] == pytest.approx(0.3)
+        assert np.isnan(result['trend'].tolist()[1]) and result['trend'].tolist()[8] == 0.3
+        with pytest.raises(ValueError, match="No \\(baseline, target\\)"):
+            derive_letci(frame, {'9.9': (0, 1)})
+
+    def test_duplicate_measurement(self):
+        """A cell measured twice is rejected."""
+        with pytest.raises(ValueError, match="measured once"):
+            MetricSeries.from_arrays(['A', 'A'], ['7.1', '7.1'], [1, 1], [1.0, 2.0])
+
+
+class TestTrendTracker:
+    """Test incremental slopes."""
+
+    @pytest.mark.parametrize('method', ['ols', 'theil_sen'])
+    def test_matches_batch(self, values, method):
+        """Updating one cycle at a time reproduces rolling_slopes."""
+        batch = rolling_slopes(values, window=5, method=method)
+        tracker = TrendTracker.from_values(values[:, :20], window=5, method=method)
+        np.testing.assert_allclose(tracker.slopes(), batch[:, 19], rtol=1e-12, atol=1e-12)
+        for t in range(20, 25):
+            np.testing.assert_allclose(tracker.update(values[:, t]), batch[:, t],
+                                       rtol=1e-12, atol=1e-12)
+        np.testing.assert_array_equal(tracker.windows(), values[:, 20:])
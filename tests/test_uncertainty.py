@@ -0,0 +1,135 @@
+"""
+Unit tests for Monte Carlo uncertainty propagation.
+
+Tests verify:
+- Samples reproduce assess_departments on the perturbed indicators
+- Results are identical for any chunk size or worker count
+- Noise-free runs collapse onto the baseline
+- Per-dimension and per-assessor noise models
+- Histogram intervals and input validation
+"""
+
+import pytest
+import numpy as np
+from edcellence_tqm.core import BulkItems, assess_departments, propagate_uncertainty
+from edcellence_tqm.core.uncertainty import _standard_normals
+from edcellence_tqm.utils.synthetic import generate_assessment_columns
+
+
+@pytest.fixture(scope='module')
+def columns():
+    return generate_assessment_columns(12, seed=5)
+
+
+@pytest.fixture(scope='module')
+def items(columns):
+    return BulkItems.from_arrays(**columns)
+
+
+class TestPropagateUncertainty:
+    """Test the chunked Monte Carlo engine."""
+
+    def test_samples_match_bulk_assessment(self, items):
+        """Moments and ranges equal brute-force assessments of perturbed tables."""
+        n_samples, sigma = 15, 0.08
+        result = propagate_uncertainty(items, n_samples, sigma=sigma, seed=11, chunk_size=4)
+
+        normals = _standard_normals(11, 0, n_samples, 4 * len(items))
+        scores, ihis = [], []
+        for z in normals:
+            perturbed = np.clip(items.indicators + sigma * z.reshape(-1, 4), 0, 1)
+            sample = BulkItems(**{**items.__dict__, 'indicators': perturbed})
+            assessed = assess_departments(sample)
+            scores.append(assessed.organizational_score)
+            ihis.append(assessed.ihi)
+        scores, ihis = np.array(scores), np.array(ihis)
+
+        np.testing.assert_allclose(result.score_mean, scores.mean(axis=0), atol=1e-9)
+        np.testing.assert_allclose(result.score_std, scores.std(axis=0), atol=1e-7)
+        np.testing.assert_allclose(result.ihi_mean, ihis.mean(axis=0), atol=1e-12)
+        np.testing.assert_allclose(result.score_range[:, 0], scores.min(axis=0), atol=1e-9)
+        np.testing.assert_allclose(result.score_range[:, 1], scores.max(axis=0), atol=1e-9)
+
+    def test_chunk_size_and_workers_independent(self, items):
+        """Same seed gives bit-identical results for any chunking or thread count."""
+        a = propagate_uncertainty(items, 300, seed=4, chunk_size=300)
+        b = propagate_uncertainty(items, 300, seed=4, chunk_size=7, n_workers=3)
+        for name in ('score_mean', 'score_std', 'ihi_mean', 'ihi_std', 'category_mean',
+                     'category_std', 'score_histogram', 'ihi_histogram',
+                     'category_histogram', 'level_counts', 'category_range'):
+            assert np.array_equal(getattr(a, name), getattr(b, name)), name
+
+        c = propagate_uncertainty(items, 300, seed=5, chunk_size=300)
+        assert not np.array_equal(a.score_mean, c.score_mean)
+
+    def test_noise_free_collapses_to_baseline(self, items):
+        """sigma = 0 reproduces the baseline with zero-width intervals."""
+        result = propagate_uncertainty(items, 20, sigma=0.0)
+        np.testing.assert_array_equal(result.score_mean, result.baseline_score)
+        np.testing.assert_array_equal(result.score_std, 0.0)
+        np.testing.assert_array_equal(result.score_interval()[:, 0], result.baseline_score)
+        np.testing.assert_array_equal(result.score_interval()[:, 1], result.baseline_score)
+        np.testing.assert_array_equal(result.category_mean, result.baseline_category)
+        levels = result.maturity_bands.classify(result.baseline_score)
+        expected = (result.maturity_bands.levels[None, :] == levels[:, None]).astype(float)
+        np.testing.assert_array_equal(result.level_probability(), expected)
+
+    def test_intervals_bracket_distribution(self, items):
+        """Percentile intervals are ordered, within range and within one bin of the mean."""
+        result = propagate_uncertainty(items, 2000, sigma=0.05, seed=2, percentiles=(5, 50, 95))
+        interval = result.score_interval()
+        assert np.all(np.diff(interval, axis=1) >= 0)
+        assert np.all(interval[:, 0] >= result.score_range[:, 0])
+        assert np.all(interval[:, 2] <= result.score_range[:, 1])
+        # Roughly symmetric noise: median close to the mean
+        np.testing.assert_allclose(interval[:, 1], result.score_mean, atol=0.5)
+        assert result.score_histogram.sum(axis=1).tolist() == [2000] * len(result)
+        assert result.category_interval().shape == (len(result), len(result.categories), 3)
+
+        ci = result.ihi_confidence_intervals()
+        assert len(ci) == len(result)
+        assert all(0 <= low <= mean <= high <= 1
+                   for (low, high), mean in zip(ci, result.ihi_mean))
+        frame = result.to_frame()
+        assert {'score_lower', 'score_upper', 'ihi_lower', 'ihi_upper'} <= set(frame.columns)
+
+    def test_per_dimension_noise(self, items):
+        """Only the named dimensions are perturbed."""
+        no_integration = propagate_uncertainty(items, 50, sigma={'A': 0.1, 'Lv': 0.1})
+        np.testing.assert_array_equal(no_integration.ihi_std, 0.0)
+        assert np.all(no_integration.score_std > 0)
+
+        integration_only = propagate_uncertainty(items, 50, sigma={'I': 0.1})
+        assert np.all(integration_only.ihi_std > 0)
+
+    def test_per_assessor_noise(self, items, columns):
+        """Assessor overrides and shared shifts only affect that assessor's items."""
+        assessor = np.where(columns['department'] < 'D00006', 'strict', 'lenient')
+        result = propagate_uncertainty(
+            items, 100, sigma=0.0, assessor=assessor,
+            assessor_sigma={'strict': 0.05}, assessor_shift={'lenient': 0.03}
+        )
+        assert np.all(result.score_std > 0)
+
+        shifted = propagate_uncertainty(
+            items, 100, sigma=0.0, assessor=assessor, assessor_shift={'lenient': 0.03}
+        )
+        lenient = items.departments >= 'D00006'
+        np.testing.assert_array_equal(shifted.score_std[~lenient], 0.0)
+        assert np.all(shifted.score_std[lenient] > 0)
+
+    def test_validation(self, items):
+        """Invalid options raise ValueError."""
+        with pytest.raises(ValueError, match="chunk_size must be positive"):
+            propagate_uncertainty(items, 10, chunk_size=0)
+        with pytest.raises(ValueError, match="non-negative"):
+            propagate_uncertainty(items, 10, sigma=-0.1)
+        with pytest.raises(ValueError, match="Unknown indicator dimensions"):
+            propagate_uncertainty(items, 10, sigma={'X': 0.1})
+        with pytest.raises(ValueError, match="require assessor labels"):
+            propagate_uncertainty(items, 10, assessor_shift=0.1)
+        with pytest.raises(ValueError, match="Unknown assessor"):
+            propagate_uncertainty(items, 10, assessor=['a'] * len(items),
+                                  assessor_sigma={'b': 0.1})
+        with pytest.raises(ValueError, match="Unknown metric"):
+            propagate_uncertainty(items, 10)._quantiles('gap', None)
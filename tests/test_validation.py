@@ -0,0 +1,123 @@
+"""
+Unit tests for bulk input validation.
+
+Tests verify:
+- Every violation is reported with row, column and reason
+- Missing dimensions follow the item type's columns
+- Long-format frames and the sample CSV validate
+- Trusted construction matches validated construction
+"""
+
+from pathlib import Path
+
+import pytest
+import numpy as np
+import pandas as pd
+from edcellence_tqm.core import ADLIIndicators, AssessmentEngine, LeTCIIndicators
+from edcellence_tqm.core.validation import (
+    REASONS,
+    ValidationError,
+    assessment_items,
+    indicator_objects,
+    validate_arrays,
+    validate_frame,
+)
+
+SAMPLE_CSV = Path(__file__).parent.parent / 'data' / 'examples' / 'sample_assessment_data.csv'
+
+
+class TestValidateArrays:
+    """Test column-wise validation."""
+
+    def test_reports_every_violation(self):
+        """All bad values are reported, sorted by row, without raising."""
+        report = validate_arrays(
+            item_type=['Process', 'Results', 'Outcome', 'process', 'Results'],
+            indicators=[[0.8, 0.7, None, 0.6],
+                        [0.5, 1.2, 0.4, -0.3],
+                        [0.5, 0.5, 0.5, 0.5],
+                        [0.1, 0.2, 0.3, 0.4],
+                        [0.5, 0.5, 0.5, 0.5]],
+            point_value=[70, 80, 40, 12.5, None],
+            deployment_gap=[0.1, np.nan, 0.2, 1.5, 0.0],
+        )
+        assert not report.ok
+        assert report.rows.tolist() == [0, 1, 1, 2, 3, 3, 4]
+        assert report.to_frame()['column'].tolist() == [
+            'learning', 'integration', 'trend', 'item_type', 'point_value',
+            'deployment_gap', 'point_value']
+        assert report.counts() == {
+            'unknown item type': 1, 'missing indicator': 1,
+            'indicator out of range [0,1]': 2, 'missing point value': 1,
+            'point value must be a non-negative integer': 1,
+            'deployment gap out of range [0,1]': 1,
+        }
+        assert report.invalid_rows.tolist() == [0, 1, 2, 3, 4]
+        assert report.messages(2) == [
+            'Data row 0: learning: missing indicator',
+            'Data row 1: integration: indicator out of range [0,1], got -0.3',
+        ]
+
+    def test_clean_batch(self):
+        """A valid batch has an empty report."""
+        rng = np.random.default_rng(0)
+        report = validate_arrays(rng.integers(0, 2, 1000), rng.random((1000, 4)),
+                                 rng.integers(10, 120, 1000))
+        assert report.ok and len(report) == 0
+        assert report.valid_mask.all()
+        report.raise_if_invalid()
+
+    def test_raise_if_invalid(self):
+        """ValidationError is a ValueError carrying the report."""
+        report = validate_arrays(['Process'] * 8, np.full((8, 4), 2.0), [10] * 8)
+        with pytest.raises(ValueError, match="32 invalid value") as info:
+            report.raise_if_invalid(limit=2)
+        assert isinstance(info.value, ValidationError)
+        assert info.value.report is report
+        assert "and 30 more" in str(info.value)
+
+    def test_shape_mismatch(self):
+        """Misaligned columns raise ValueError."""
+        with pytest.raises(ValueError, match="Indicators must have shape"):
+            validate_arrays(['Process'] * 2, np.zeros((2, 3)), [10, 10])
+        with pytest.raises(ValueError, match="point values"):
+            validate_arrays(['Process'] * 2, np.zeros((2, 4)), [10])
+
+
+class TestValidateFrame:
+    """Test long-format frame validation and trusted construction."""
+
+    def test_sample_csv_is_valid(self):
+        """The shipped sample data passes."""
+        assert validate_frame(pd.read_csv(SAMPLE_CSV)).ok
+
+    def test_missing_dimension_columns(self):
+        """Absent or blank columns are missing only for their item type."""
+        frame = pd.read_csv(SAMPLE_CSV).drop(columns=['trend'])
+        frame.loc[2, 'learning'] = None
+        report = validate_frame(frame)
+        results_rows = np.flatnonzero(frame['item_type'] == 'Results')
+        assert report.rows.tolist() == [2] + results_rows.tolist()
+        assert set(report.reasons.tolist()) == {REASONS.index('missing indicator')}
+
+    def test_trusted_objects_match(self):
+        """Trusted objects equal validated ones; bad batches are rejected."""
+        item_type = ['Process', 'Results']
+        values = [[0.8, 0.7, 0.6, 0.5], [0.4, 0.3, 0.2, 0.1]]
+        trusted = indicator_objects(item_type, values)
+        assert trusted == [ADLIIndicators(0.8, 0.7, 0.6, 0.5), LeTCIIndicators(0.4, 0.3, 0.2, 0.1)]
+        assert indicator_objects(item_type, values, trusted=False) == trusted
+
+        with pytest.raises(ValidationError):
+            indicator_objects(item_type, [[0.8, 0.7, 0.6, 1.5], [0.4, 0.3, 0.2, 0.1]])
+
+    def test_assessment_items(self):
+        """Frame rows become engine inputs with the same assessment either way."""
+        frame = pd.read_csv(SAMPLE_CSV, dtype={'item_id': str})
+        department = frame[frame['department'] == 'Engineering']
+        trusted = assessment_items(department)
+        checked = assessment_items(department, trusted=False)
+        assert trusted == checked
+        engine = AssessmentEngine()
+        result = engine.compute_organizational_assessment(*trusted, {})
+        assert result['metadata']['process_items_count'] == 12
@@ -0,0 +1,123 @@
+"""
+Unit tests for WeightProfile (validated, immutable weight sets).
+
+Tests verify:
+- Construction-time validation and canonical dimension order
+- Loading the lookup weight tables from scripts/schema_simplified.sql
+- Identical scores from profiles and plain weight dicts
+- Hashing, immutability and pickling
+"""
+
+import pickle
+
+import pytest
+import numpy as np
+from edcellence_tqm.core import (
+    ADLIIndicators,
+    AssessmentEngine,
+    DEFAULT_ADLI_PROFILE,
+    DEFAULT_CATEGORY_PROFILE,
+    DEFAULT_LETCI_PROFILE,
+    LeTCIIndicators,
+    WeightProfile,
+    as_weight_profile,
+    compute_adli_score,
+    compute_adli_scores_batch,
+    compute_letci_score,
+    compute_organizational_score,
+)
+from edcellence_tqm.core.adli_letci import DEFAULT_CATEGORY_WEIGHTS
+
+
+class TestWeightProfileValidation:
+    """Test validation performed when a profile is built."""
+
+    def test_dict_reordered_to_canonical(self):
+        """ADLI dicts in any key order map to A, D, L, I."""
+        profile = WeightProfile.from_dict('adli', {'I': 0.1, 'L': 0.2, 'D': 0.3, 'A': 0.4})
+        assert profile.dimensions == ('A', 'D', 'L', 'I')
+        assert profile.vector.tolist() == [0.4, 0.3, 0.2, 0.1]
+        assert profile['L'] == 0.2
+
+    def test_invalid_weights_rejected(self):
+        """Bad sums, missing or unknown dimensions and wrong kinds raise ValueError."""
+        with pytest.raises(ValueError, match="must sum to 1.0"):
+            WeightProfile.from_dict('adli', {'A': 0.3, 'D': 0.3, 'L': 0.3, 'I': 0.3})
+        with pytest.raises(ValueError, match="Missing weights"):
+            WeightProfile.from_dict('letci', {'Lv': 0.5, 'Tr': 0.5})
+        with pytest.raises(ValueError, match="Unexpected"):
+            WeightProfile.from_dict('adli', {'A': 0.3, 'D': 0.3, 'L': 0.2, 'I': 0.1, 'X': 0.1})
+        with pytest.raises(ValueError, match="Category weights must sum"):
+            WeightProfile.from_dict('category', {'Leadership': 0.5, 'Results': 0.6})
+        with pytest.raises(ValueError, match="Expected a 'letci'"):
+            as_weight_profile(DEFAULT_ADLI_PROFILE, 'letci')
+
+    def test_immutable_hashable_and_picklable(self):
+        """Profiles are frozen, hash by value and survive pickling."""
+        profile = WeightProfile.from_vector('letci', [0.40, 0.25, 0.25, 0.10])
+        assert profile == DEFAULT_LETCI_PROFILE
+        assert len({profile, DEFAULT_LETCI_PROFILE}) == 1
+        with pytest.raises(AttributeError):
+            profile.weights = (0.25,) * 4
+        with pytest.raises(ValueError):
+            profile.vector[0] = 1.0
+
+        restored = pickle.loads(pickle.dumps(profile))
+        assert restored == profile
+        assert not restored.vector.flags.writeable
+
+
+class TestWeightProfileSchema:
+    """Test loading profiles from the schema lookup tables."""
+
+    @pytest.mark.parametrize('kind, default', [
+        ('adli', DEFAULT_ADLI_PROFILE),
+        ('letci', DEFAULT_LETCI_PROFILE),
+        ('category', DEFAULT_CATEGORY_PROFILE),
+    ])
+    def test_schema_matches_defaults(self, kind, default):
+        """The shipped lookup tables hold the module default weights."""
+        assert WeightProfile.from_schema(kind) == default
+
+    def test_lookup_rows_with_alternate_column(self):
+        """Rows from a cursor can select another weight column."""
+        rows = [
+            {'dimension_name': 'Approach', 'nist_weight': 0.25},
+            {'dimension_name': 'Deployment', 'nist_weight': 0.25},
+            {'dimension_name': 'Learning', 'nist_weight': 0.25},
+            {'dimension_name': 'Integration', 'nist_weight': 0.25},
+        ]
+        profile = WeightProfile.from_lookup_rows('adli', rows, column='nist_weight')
+        assert profile.to_dict() == {'A': 0.25, 'D': 0.25, 'L': 0.25, 'I': 0.25}
+
+
+class TestWeightProfileScoring:
+    """Test that every scoring path accepts profiles."""
+
+    def test_scalar_scores_match_dicts(self):
+        """Profiles and equivalent dicts give bit-identical scores."""
+        rng = np.random.default_rng(7)
+        adli = {'A': 0.25, 'D': 0.35, 'L': 0.15, 'I': 0.25}
+        profile = WeightProfile.from_dict('adli', adli)
+        for row in rng.random((50, 4)).tolist():
+            indicators = ADLIIndicators(*row)
+            assert compute_adli_score(indicators, profile) == compute_adli_score(indicators, adli)
+            letci = LeTCIIndicators(*row)
+            assert compute_letci_score(letci, DEFAULT_LETCI_PROFILE) == compute_letci_score(letci)
+
+        scores = {name: 50.0 + i for i, name in enumerate(DEFAULT_CATEGORY_WEIGHTS)}
+        assert (compute_organizational_score(scores, DEFAULT_CATEGORY_PROFILE)
+                == compute_organizational_score(scores, dict(DEFAULT_CATEGORY_WEIGHTS)))
+
+    def test_batch_and_engine_accept_profiles(self):
+        """Batch scoring and AssessmentEngine take profiles directly."""
+        matrix = np.random.default_rng(3).random((20, 4))
+        profile = WeightProfile.from_vector('adli', [0.25, 0.35, 0.15, 0.25])
+        np.testing.assert_array_equal(
+            compute_adli_scores_batch(matrix, profile),
+            compute_adli_scores_batch(matrix, profile.to_dict())
+        )
+
+        engine = AssessmentEngine(adli_weights=profile.to_dict())
+        assert engine.adli_weights == profile
+        assert engine.letci_weights is DEFAULT_LETCI_PROFILE